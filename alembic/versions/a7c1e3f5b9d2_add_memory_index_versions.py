@@ -0,0 +1,38 @@
+"""add memory_index_versions
+
+Revision ID: a7c1e3f5b9d2
+Revises: 822cd9402ce6
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "a7c1e3f5b9d2"
+down_revision: str | Sequence[str] | None = "822cd9402ce6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Track a shared per-project version of the memory chunk index."""
+    op.create_table(
+        "memory_index_versions",
+        sa.Column("project_id", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the memory index version table."""
+    op.drop_table("memory_index_versions")
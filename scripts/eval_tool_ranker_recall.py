@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Offline recall eval for the embedding tool ranker over recorded sessions.
+
+Each input line is a JSON object describing one recorded turn::
+
+    {"conversation_id": "...", "user_message": "...",
+     "tools": [{"name": "mcp__github__create_issue", "description": "..."}],
+     "used_tools": ["mcp__github__create_issue"]}
+
+Usage:
+    uv run python scripts/eval_tool_ranker_recall.py sessions.jsonl
+    uv run python scripts/eval_tool_ranker_recall.py sessions.jsonl --max-tools 20 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+
+def _ensure_project_root_on_path() -> None:
+    project_root = Path(__file__).parent.parent
+    project_root_str = str(project_root)
+    if project_root_str not in sys.path:
+        sys.path.insert(0, project_root_str)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure recall of used tools under embedding-ranked tool selection.",
+    )
+    parser.add_argument("sessions", type=Path, help="JSONL file of recorded turns.")
+    parser.add_argument(
+        "--max-tools",
+        type=int,
+        nargs="+",
+        default=[30],
+        help="Selection budgets to evaluate (default: %(default)s).",
+    )
+    parser.add_argument("--tenant-id", help="Tenant whose embedding provider to use.")
+    return parser
+
+
+async def _run() -> int:
+    _ensure_project_root_on_path()
+
+    from src.infrastructure.agent.core.tool_embedding_ranker import (
+        EmbeddingToolRanker,
+        ToolRecallCase,
+        evaluate_tool_recall,
+    )
+    from src.infrastructure.llm.provider_factory import get_ai_service_factory
+
+    args = _build_parser().parse_args()
+    with args.sessions.open(encoding="utf-8") as handle:
+        cases = [ToolRecallCase.from_record(json.loads(line)) for line in handle if line.strip()]
+
+    factory = get_ai_service_factory()
+    provider_config = await factory.resolve_embedding_provider(args.tenant_id)
+    ranker = EmbeddingToolRanker(factory.create_embedding_service(provider_config))
+
+    print(f"[tool-ranker-recall] sessions={args.sessions} cases={len(cases)}")
+    print(f"[tool-ranker-recall] embedding_model={ranker.model_key}")
+    for max_tools in args.max_tools:
+        report = await evaluate_tool_recall(cases, ranker, max_tools=max_tools)
+        print(f"[tool-ranker-recall] {json.dumps(report.to_dict(), ensure_ascii=False)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(_run()))
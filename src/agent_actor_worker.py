@@ -1,7 +1,8 @@
 """Ray Actor worker entry point for Agent execution.
 
 This worker must connect to a Ray cluster and create the HITL router actor.
-It retries with exponential backoff until the cluster is available.
+It retries with exponential backoff until the cluster is available, then
+periodically hibernates idle project agent actors.
 """
 
 import asyncio
@@ -49,7 +50,10 @@ async def _cleanup_stale_actors() -> None:
 
 async def main() -> None:
     from src.infrastructure.adapters.secondary.ray.client import init_ray_if_needed
-    from src.infrastructure.agent.actor.actor_manager import ensure_router_actor
+    from src.infrastructure.agent.actor.actor_manager import (
+        ensure_router_actor,
+        run_actor_hibernation_loop,
+    )
 
     backoff_seconds = 2
     max_backoff = 30
@@ -107,7 +111,8 @@ async def main() -> None:
             await asyncio.sleep(backoff_seconds)
             backoff_seconds = min(backoff_seconds * 2, max_backoff)
 
-    await asyncio.Event().wait()
+    # Keep running and hibernate project actors that sit idle.
+    await run_actor_hibernation_loop()
 
 
 if __name__ == "__main__":
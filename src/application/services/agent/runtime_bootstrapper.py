@@ -522,11 +522,14 @@ class AgentRuntimeBootstrapper:
         )
 
         if actor is not None:
-            from src.infrastructure.adapters.secondary.ray.client import await_ray
 
             async def _fire_and_forget_ray() -> None:
+                from src.infrastructure.agent.actor.actor_manager import chat_with_actor
+
                 try:
-                    await await_ray(actor.chat.remote(chat_request))
+                    # Retries once on a fresh actor if the cached one was
+                    # hibernated or died.
+                    await chat_with_actor(actor, chat_request, config)
                 except Exception as e:
                     logger.error(
                         "[AgentService] Actor chat failed: conversation=%s error=%s",
@@ -0,0 +1,210 @@
+"""Shared pacing for streaming card updates.
+
+IM platforms rate-limit card patches per bot app, not per conversation, so
+every streaming reply served by the same app draws from one budget:
+
+- Each app (channel config) owns a token bucket refilled at
+  ``CARD_UPDATE_RATE`` updates per second.
+- When tokens are scarce, the waiting stream with the largest unseen delta
+  (characters produced since its last successful update) is served first.
+- Per-stream intervals stretch with the number of concurrent streams on the
+  app, so idle chats stay snappy and busy apps stop over-patching.
+- Final flushes never wait: they may overdraw the bucket (bounded by the
+  burst size), and the debt is repaid by interim updates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CARD_UPDATE_RATE = 5.0  # card updates per second per bot app
+CARD_UPDATE_BURST = 10  # tokens available after an idle period
+CARD_UPDATE_MAX_INTERVAL = 5.0  # upper bound for a stream's update interval
+
+
+@dataclass(eq=False)
+class CardUpdateTicket:
+    """Registration of one streaming card with the scheduler."""
+
+    app_key: str
+    min_interval: float
+    size: Callable[[], int]
+    sent_chars: int = 0
+    last_sent_at: float = 0.0
+
+    def unseen(self) -> int:
+        """Characters produced since the last successful update."""
+        return max(0, self.size() - self.sent_chars)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    ticket: CardUpdateTicket
+    future: asyncio.Future[None]
+
+
+@dataclass(eq=False)
+class _AppBudget:
+    """Token bucket and waiting streams for one bot app."""
+
+    tokens: float
+    refilled_at: float
+    streams: int = 0
+    waiters: list[_Waiter] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+    stats: dict[str, int] = field(
+        default_factory=lambda: {"updates": 0, "finals": 0, "waits": 0, "aborted": 0}
+    )
+
+
+class CardUpdateScheduler:
+    """Token-bucket budget for streaming card updates, shared per bot app."""
+
+    def __init__(
+        self,
+        rate_per_second: float = CARD_UPDATE_RATE,
+        burst: int = CARD_UPDATE_BURST,
+        max_interval: float = CARD_UPDATE_MAX_INTERVAL,
+    ) -> None:
+        self._rate = rate_per_second
+        self._burst = burst
+        self._max_interval = max_interval
+        self._apps: dict[str, _AppBudget] = {}
+
+    def open_stream(
+        self, app_key: str, *, min_interval: float, size: Callable[[], int]
+    ) -> CardUpdateTicket:
+        """Register a streaming card; ``size`` reports its current display length."""
+        budget = self._apps.get(app_key)
+        if budget is None:
+            budget = _AppBudget(tokens=float(self._burst), refilled_at=time.monotonic())
+            self._apps[app_key] = budget
+        budget.streams += 1
+        return CardUpdateTicket(app_key=app_key, min_interval=min_interval, size=size)
+
+    def close_stream(self, ticket: CardUpdateTicket) -> None:
+        """Unregister a streaming card, dropping the app budget once idle."""
+        budget = self._apps.get(ticket.app_key)
+        if budget is None:
+            return
+        budget.streams = max(0, budget.streams - 1)
+        if budget.streams == 0 and not budget.waiters:
+            if budget.timer:
+                budget.timer.cancel()
+            del self._apps[ticket.app_key]
+
+    def interval_for(self, ticket: CardUpdateTicket) -> float:
+        """Minimum spacing between updates, stretched by concurrent streams."""
+        budget = self._apps.get(ticket.app_key)
+        streams = budget.streams if budget else 1
+        shared = streams / self._rate if self._rate > 0 else 0.0
+        return min(max(ticket.min_interval, shared), max(self._max_interval, ticket.min_interval))
+
+    def time_until_due(self, ticket: CardUpdateTicket) -> float:
+        """Seconds until the stream's next interim update may be sent."""
+        return ticket.last_sent_at + self.interval_for(ticket) - time.monotonic()
+
+    async def acquire(
+        self, ticket: CardUpdateTicket, *, abort: asyncio.Event | None = None
+    ) -> bool:
+        """Wait for an update token; returns False if ``abort`` fires first."""
+        budget = self._apps[ticket.app_key]
+        waiter = _Waiter(ticket, asyncio.get_running_loop().create_future())
+        budget.waiters.append(waiter)
+        self._dispatch(ticket.app_key)
+        if not waiter.future.done():
+            budget.stats["waits"] += 1
+
+        try:
+            if abort is None:
+                await waiter.future
+                return True
+            abort_wait = asyncio.ensure_future(abort.wait())
+            try:
+                await asyncio.wait({waiter.future, abort_wait}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                abort_wait.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await abort_wait
+            if waiter.future.done() and not waiter.future.cancelled():
+                return True
+            budget.stats["aborted"] += 1
+            return False
+        finally:
+            if waiter in budget.waiters:
+                budget.waiters.remove(waiter)
+                waiter.future.cancel()
+
+    def acquire_final(self, ticket: CardUpdateTicket) -> None:
+        """Take a token for a final flush without waiting, overdrawing if needed."""
+        budget = self._apps.get(ticket.app_key)
+        if budget is None:
+            return
+        self._refill(budget)
+        budget.tokens = max(budget.tokens - 1, -float(self._burst))
+        budget.stats["finals"] += 1
+
+    def record_sent(self, ticket: CardUpdateTicket, chars: int) -> None:
+        """Mark a successful update covering the first ``chars`` characters."""
+        ticket.sent_chars = chars
+        ticket.last_sent_at = time.monotonic()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return per-app token levels, stream counts and update counters."""
+        stats: dict[str, Any] = {}
+        for app_key, budget in self._apps.items():
+            self._refill(budget)
+            stats[app_key] = {
+                **budget.stats,
+                "tokens": round(budget.tokens, 2),
+                "streams": budget.streams,
+                "waiting": len(budget.waiters),
+            }
+        return stats
+
+    def _refill(self, budget: _AppBudget) -> None:
+        now = time.monotonic()
+        budget.tokens = min(
+            float(self._burst), budget.tokens + (now - budget.refilled_at) * self._rate
+        )
+        budget.refilled_at = now
+
+    def _dispatch(self, app_key: str) -> None:
+        """Hand out available tokens, largest unseen delta first."""
+        budget = self._apps.get(app_key)
+        if budget is None:
+            return
+        if budget.timer:
+            budget.timer.cancel()
+        budget.timer = None
+        budget.waiters = [w for w in budget.waiters if not w.future.done()]
+        self._refill(budget)
+        while budget.waiters and budget.tokens >= 1:
+            waiter = max(budget.waiters, key=lambda w: w.ticket.unseen())
+            budget.waiters.remove(waiter)
+            budget.tokens -= 1
+            budget.stats["updates"] += 1
+            waiter.future.set_result(None)
+        if budget.waiters and budget.timer is None and self._rate > 0:
+            delay = (1 - budget.tokens) / self._rate
+            budget.timer = asyncio.get_running_loop().call_later(delay, self._dispatch, app_key)
+
+
+# Singleton instance
+_card_update_scheduler: CardUpdateScheduler | None = None
+
+
+def get_card_update_scheduler() -> CardUpdateScheduler:
+    """Get the process-wide card update scheduler."""
+    global _card_update_scheduler
+    if _card_update_scheduler is None:
+        _card_update_scheduler = CardUpdateScheduler()
+    return _card_update_scheduler
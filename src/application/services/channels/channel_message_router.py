@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import contextlib
 import logging
 import math
 import re
@@ -15,11 +16,17 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 from src.application.services.channels._session import with_session
+from src.application.services.channels.card_update_scheduler import (
+    CardUpdateTicket,
+    get_card_update_scheduler,
+)
 from src.domain.model.channels.message import ChannelAdapter, ChatType, Message, MessageType
 from src.infrastructure.adapters.secondary.common.base_repository import refresh_select_statement
 from src.infrastructure.i18n import gettext as _
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.application.services.channels.media_import_service import MediaImportService
@@ -30,6 +37,11 @@ logger = logging.getLogger(__name__)
 # LRU cache max size for session key -> conversation mapping
 _MAX_CACHE_SIZE = 10_000
 
+# Minimum seconds between interim streaming card updates; the shared
+# card update scheduler stretches these when many chats stream at once.
+_CARDKIT_UPDATE_INTERVAL = 0.5
+_LEGACY_CARD_UPDATE_INTERVAL = 1.5
+
 
 class _SlidingWindowRateLimiter:
     """Per-key sliding window rate limiter."""
@@ -915,7 +927,7 @@ class ChannelMessageRouter:
             )
 
         # Finalize
-        stream_state.stream_done = True
+        stream_state.mark_done()
         response = stream_state.final_content or stream_state.accumulated_text
 
         await self._await_card_updater(_card_updater_task)
@@ -944,6 +956,7 @@ class ChannelMessageRouter:
         handler_name = _EVENT_HANDLERS.get(event_type or "")
         if handler_name:
             getattr(state, handler_name)(event_data)
+            state.changed.set()
 
     async def _await_card_updater(self, task: asyncio.Task[None] | None) -> None:
         """Wait for the card updater task to complete."""
@@ -1057,20 +1070,23 @@ class ChannelMessageRouter:
 
         self._register_card_state(conversation_id, cardkit_state)
 
-        last_snapshot = ""
-        while not stream_state.stream_done:
-            await asyncio.sleep(0.5)
-            display = self._compute_display_text(stream_state)
-            if display != last_snapshot and display.strip():
-                assert cardkit_mgr is not None
-                ok = await cardkit_mgr.update_text(cardkit_state, display)
-                if ok:
-                    last_snapshot = display
-
-        final_display = stream_state.final_content or stream_state.accumulated_text
-        finish_text = final_display if final_display.strip() else last_snapshot
         assert cardkit_mgr is not None
-        await cardkit_mgr.finish_streaming(cardkit_state, finish_text)
+        mgr = cardkit_mgr
+        scheduler = get_card_update_scheduler()
+        ticket = self._open_card_stream(
+            message, streaming_adapter, stream_state, _CARDKIT_UPDATE_INTERVAL
+        )
+        try:
+            last_snapshot = await self._stream_card_updates(
+                stream_state, ticket, lambda text: mgr.update_text(cardkit_state, text)
+            )
+
+            final_display = stream_state.final_content or stream_state.accumulated_text
+            finish_text = final_display if final_display.strip() else last_snapshot
+            scheduler.acquire_final(ticket)
+            await mgr.finish_streaming(cardkit_state, finish_text)
+        finally:
+            scheduler.close_stream(ticket)
         self._unregister_card_state(conversation_id)
 
     async def _run_legacy_card_updater(
@@ -1086,23 +1102,76 @@ class ChannelMessageRouter:
             return
 
         stream_state.card_msg_id = card_msg_id
-        last_snapshot = ""
+        scheduler = get_card_update_scheduler()
+        ticket = self._open_card_stream(
+            message, streaming_adapter, stream_state, _LEGACY_CARD_UPDATE_INTERVAL
+        )
+        try:
+            await self._stream_card_updates(
+                stream_state,
+                ticket,
+                lambda text: self._patch_streaming_card(
+                    streaming_adapter, card_msg_id, text, loading=True
+                ),
+            )
+
+            final_display = stream_state.final_content or stream_state.accumulated_text
+            if final_display.strip():
+                scheduler.acquire_final(ticket)
+                await self._patch_streaming_card(
+                    streaming_adapter, card_msg_id, final_display, loading=False
+                )
+        finally:
+            scheduler.close_stream(ticket)
 
+    def _open_card_stream(
+        self,
+        message: Message,
+        streaming_adapter: ChannelAdapter,
+        stream_state: _AgentStreamState,
+        min_interval: float,
+    ) -> CardUpdateTicket:
+        """Register a streaming card with the budget of its bot app."""
+        app_key = self._extract_channel_config_id(message) or f"adapter-{id(streaming_adapter)}"
+        return get_card_update_scheduler().open_stream(
+            app_key,
+            min_interval=min_interval,
+            size=lambda: len(self._compute_display_text(stream_state)),
+        )
+
+    async def _stream_card_updates(
+        self,
+        stream_state: _AgentStreamState,
+        ticket: CardUpdateTicket,
+        push: Callable[[str], Awaitable[bool]],
+    ) -> str:
+        """Push interim card updates as text arrives; returns the last text shown.
+
+        The loop sleeps until the stream state changes, waits out the stream's
+        adaptive interval (cut short when the stream finishes), then competes
+        for a token from the shared app budget.  Text that keeps arriving in
+        the meantime is folded into the same update.
+        """
+        scheduler = get_card_update_scheduler()
+        last_snapshot = ""
         while not stream_state.stream_done:
-            await asyncio.sleep(1.5)
+            await stream_state.changed.wait()
+            stream_state.changed.clear()
+            delay = scheduler.time_until_due(ticket)
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stream_state.done.wait(), timeout=delay)
+            if stream_state.stream_done:
+                break
+            if self._compute_display_text(stream_state) == last_snapshot:
+                continue
+            if not await scheduler.acquire(ticket, abort=stream_state.done):
+                break
             display = self._compute_display_text(stream_state)
-            if display != last_snapshot and display.strip():
-                ok = await self._patch_streaming_card(
-                    streaming_adapter, card_msg_id, display, loading=True
-                )
-                if ok:
-                    last_snapshot = display
-
-        final_display = stream_state.final_content or stream_state.accumulated_text
-        if final_display.strip():
-            await self._patch_streaming_card(
-                streaming_adapter, card_msg_id, final_display, loading=False
-            )
+            if display != last_snapshot and display.strip() and await push(display):
+                last_snapshot = display
+                scheduler.record_sent(ticket, len(display))
+        return last_snapshot
 
     @staticmethod
     def _compute_display_text(stream_state: _AgentStreamState) -> str:
@@ -1669,6 +1738,15 @@ class ChannelMessageRouter:
                 type(e).__name__,
             )
 
+    @staticmethod
+    def _notify_outbox_retry(outbox_id: str) -> None:
+        """Wake the outbox retry worker so the failed message is scheduled now."""
+        from src.infrastructure.adapters.primary.web.startup import get_channel_manager
+
+        channel_manager = get_channel_manager()
+        if channel_manager:
+            channel_manager.notify_outbox_retry(outbox_id)
+
     async def _mark_outbox_failed(self, outbox_id: str, error_message: str) -> None:
         """Mark outbox record as failed/dead-letter."""
         try:
@@ -1681,6 +1759,8 @@ class ChannelMessageRouter:
                 updated = await repo.mark_failed(outbox_id, error_message)
                 if updated:
                     await session.commit()
+            if updated:
+                self._notify_outbox_retry(outbox_id)
         except Exception as e:
             logger.warning(
                 "[MessageRouter] Failed to mark outbox failed: error_type=%s",
@@ -2050,7 +2130,9 @@ class _AgentStreamState:
         "card_msg_id",
         "card_status",
         "card_stream_state",
+        "changed",
         "delta_text",
+        "done",
         "error_message",
         "final_content",
         "stream_done",
@@ -2065,6 +2147,14 @@ class _AgentStreamState:
         self.stream_done: bool = False
         self.card_msg_id: str | None = None
         self.card_stream_state: Any = None
+        # Wake the card updater on new text and on stream completion.
+        self.changed = asyncio.Event()
+        self.done = asyncio.Event()
+
+    def mark_done(self) -> None:
+        self.stream_done = True
+        self.done.set()
+        self.changed.set()
 
     def _handle_text_delta(self, event_data: dict[str, Any]) -> None:
         delta = event_data.get("delta", "")
@@ -3,21 +3,36 @@ File system skill loader.
 
 Loads skills from the file system by scanning directories and parsing
 SKILL.md files. Combines scanning and parsing functionality.
+
+Parsed frontmatter is shared through the process-wide SkillCatalog, so only
+SKILL.md files that changed since the last load are re-parsed, and scanning
+and parsing run in a worker thread instead of on the event loop.
 """
 
+import asyncio
 import logging
 import uuid
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from src.domain.model.agent.skill import Skill, SkillScope, SkillStatus
 from src.domain.model.agent.skill_source import SkillSource
-from src.infrastructure.skill.filesystem_scanner import FileSystemSkillScanner, SkillFileInfo
+from src.infrastructure.skill.filesystem_scanner import (
+    FileSystemSkillScanner,
+    ScanResult,
+    SkillFileInfo,
+)
 from src.infrastructure.skill.markdown_parser import (
     MarkdownParseError,
     MarkdownParser,
     SkillMarkdown,
 )
+from src.infrastructure.skill.skill_catalog import (
+    SkillCatalog,
+    SkillCatalogEntry,
+    get_skill_catalog,
+)
 from src.infrastructure.skill.validator import (
     AgentSkillsValidator,
     AllowedTool,
@@ -35,12 +50,14 @@ class LoadedSkill:
     Attributes:
         skill: The Skill domain entity
         file_info: Information about the source file
-        markdown: Parsed markdown content
+        markdown: Parsed markdown content (frontmatter only in lazy mode)
+        catalog_entry: Catalog entry used to load the body on demand
     """
 
     skill: Skill
     file_info: SkillFileInfo
     markdown: SkillMarkdown
+    catalog_entry: SkillCatalogEntry | None = None
 
 
 @dataclass
@@ -95,6 +112,8 @@ class FileSystemSkillLoader:
         parser: MarkdownParser | None = None,
         include_system: bool = True,
         strict_mode: bool = False,
+        lazy_content: bool = False,
+        catalog: SkillCatalog | None = None,
     ) -> None:
         """
         Initialize the loader.
@@ -107,6 +126,10 @@ class FileSystemSkillLoader:
             parser: Custom parser instance (optional)
             include_system: Whether to include system/builtin skills (default: True)
             strict_mode: If True, reject skills that don't comply with AgentSkills.io spec
+            lazy_content: If True, leave Skill.full_content unset and read skill
+                bodies on first load_skill_content() call
+            catalog: Skill catalog to use (defaults to the process-wide catalog,
+                or a private one when a custom parser is given)
         """
         self.base_path = Path(base_path).resolve()
         self.tenant_id = tenant_id
@@ -116,6 +139,13 @@ class FileSystemSkillLoader:
         self.include_system = include_system
         self.strict_mode = strict_mode
         self.validator = AgentSkillsValidator(strict=strict_mode)
+        self.lazy_content = lazy_content
+        if catalog is not None:
+            self.catalog = catalog
+        elif parser is not None:
+            self.catalog = SkillCatalog(parser=parser)
+        else:
+            self.catalog = get_skill_catalog()
 
         # Cache for loaded skills (by scope)
         self._cache: dict[str, LoadedSkill] = {}
@@ -163,32 +193,23 @@ class FileSystemSkillLoader:
             include_system if include_system is not None else self.include_system
         )
 
-        # Scan for SKILL.md files
-        scan_result = self.scanner.scan(self.base_path, include_system=should_include_system)
-        result.errors.extend(scan_result.errors)
+        # Scan for SKILL.md files and parse changed ones off the event loop
+        loaded_skills, errors = await asyncio.to_thread(
+            self._scan_and_load,
+            lambda: self.scanner.scan(self.base_path, include_system=should_include_system),
+        )
+        result.errors.extend(errors)
 
-        # Parse each file and create Skill entities.
         # Use a dict keyed by name so later sources (project) override earlier
         # ones (system/global), preventing duplicates in the result list.
         loaded_by_name: dict[str, LoadedSkill] = {}
-        for file_info in scan_result.skills:
-            try:
-                loaded = self._load_skill_file(file_info)
-                if loaded:
-                    loaded_by_name[loaded.skill.name] = loaded
-                    # Cache in appropriate cache based on scope
-                    if file_info.is_system:
-                        self._system_cache[loaded.skill.name] = loaded
-                    else:
-                        self._cache[loaded.skill.name] = loaded
-            except MarkdownParseError as e:
-                error_msg = f"Failed to parse {file_info.file_path}: {e}"
-                logger.warning(error_msg)
-                result.errors.append(error_msg)
-            except Exception as e:
-                error_msg = f"Unexpected error loading {file_info.file_path}: {e}"
-                logger.error(error_msg, exc_info=True)
-                result.errors.append(error_msg)
+        for loaded in loaded_skills:
+            loaded_by_name[loaded.skill.name] = loaded
+            # Cache in appropriate cache based on scope
+            if loaded.file_info.is_system:
+                self._system_cache[loaded.skill.name] = loaded
+            else:
+                self._cache[loaded.skill.name] = loaded
         result.skills = list(loaded_by_name.values())
 
         self._cache_valid = True
@@ -220,24 +241,14 @@ class FileSystemSkillLoader:
         result = LoadResult(skills=[], errors=[])
 
         # Scan only system skills directory
-        scan_result = self.scanner.scan_system_only()
-        result.errors.extend(scan_result.errors)
+        loaded_skills, errors = await asyncio.to_thread(
+            self._scan_and_load, self.scanner.scan_system_only
+        )
+        result.errors.extend(errors)
 
-        # Parse each file and create Skill entities
-        for file_info in scan_result.skills:
-            try:
-                loaded = self._load_skill_file(file_info)
-                if loaded:
-                    result.skills.append(loaded)
-                    self._system_cache[loaded.skill.name] = loaded
-            except MarkdownParseError as e:
-                error_msg = f"Failed to parse {file_info.file_path}: {e}"
-                logger.warning(error_msg)
-                result.errors.append(error_msg)
-            except Exception as e:
-                error_msg = f"Unexpected error loading {file_info.file_path}: {e}"
-                logger.error(error_msg, exc_info=True)
-                result.errors.append(error_msg)
+        for loaded in loaded_skills:
+            result.skills.append(loaded)
+            self._system_cache[loaded.skill.name] = loaded
 
         self._system_cache_valid = True
         logger.info(
@@ -268,6 +279,34 @@ class FileSystemSkillLoader:
 
         return LoadResult(skills=filtered_skills, errors=all_result.errors)
 
+    def _scan_and_load(self, scan: Callable[[], ScanResult]) -> tuple[list[LoadedSkill], list[str]]:
+        """
+        Scan for SKILL.md files and load each one. Runs in a worker thread.
+
+        Args:
+            scan: Callable performing the directory scan
+
+        Returns:
+            Tuple of (loaded skills in scan order, error messages)
+        """
+        scan_result = scan()
+        errors = list(scan_result.errors)
+        loaded_skills: list[LoadedSkill] = []
+        for file_info in scan_result.skills:
+            try:
+                loaded = self._load_skill_file(file_info)
+                if loaded:
+                    loaded_skills.append(loaded)
+            except MarkdownParseError as e:
+                error_msg = f"Failed to parse {file_info.file_path}: {e}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+            except Exception as e:
+                error_msg = f"Unexpected error loading {file_info.file_path}: {e}"
+                logger.error(error_msg, exc_info=True)
+                errors.append(error_msg)
+        return loaded_skills, errors
+
     def _load_skill_file(self, file_info: SkillFileInfo) -> LoadedSkill | None:
         """
         Load a single skill from a file.
@@ -288,8 +327,11 @@ class FileSystemSkillLoader:
                 logger.error(f"Skill {file_info.skill_id} failed validation: {result.format()}")
                 raise SkillValidationError(file_info.skill_id, result.errors)
 
-        # Parse the markdown file
-        markdown = self.parser.parse_file(str(file_info.file_path))
+        # Frontmatter comes from the catalog (re-parsed only if the file changed)
+        entry = self.catalog.lookup(file_info.file_path, keep_body=not self.lazy_content)
+        markdown = entry.header if self.lazy_content else entry.markdown()
+        if markdown is None:
+            return None
 
         # Convert to Skill entity
         skill = self._create_skill_from_markdown(markdown, file_info)
@@ -298,6 +340,7 @@ class FileSystemSkillLoader:
             skill=skill,
             file_info=file_info,
             markdown=markdown,
+            catalog_entry=entry,
         )
 
     def _create_skill_from_markdown(
@@ -341,7 +384,7 @@ class FileSystemSkillLoader:
             },
             source=SkillSource.FILESYSTEM,
             file_path=str(file_info.file_path),
-            full_content=markdown.content,
+            full_content=None if self.lazy_content else markdown.content,
             agent_modes=markdown.agent,  # Now a List[str] from MarkdownParser
             scope=scope,
             is_system_skill=is_system_skill,
@@ -372,33 +415,62 @@ class FileSystemSkillLoader:
         Returns:
             Full markdown content or None if not found
         """
-        # Check system cache first
-        if skill_name in self._system_cache:
-            return self._system_cache[skill_name].markdown.content
+        try:
+            # Check system cache first
+            if skill_name in self._system_cache:
+                return await self._load_body(self._system_cache[skill_name])
 
-        # Check regular cache
-        if skill_name in self._cache:
-            return self._cache[skill_name].markdown.content
+            # Check regular cache
+            if skill_name in self._cache:
+                return await self._load_body(self._cache[skill_name])
 
-        # Try to find and load the skill
-        file_info = self.scanner.find_skill(self.base_path, skill_name)
-        if not file_info:
-            return None
+            # Try to find and load the skill
+            file_info = await asyncio.to_thread(self.scanner.find_skill, self.base_path, skill_name)
+            if not file_info:
+                return None
 
-        try:
-            loaded = self._load_skill_file(file_info)
+            loaded = await asyncio.to_thread(self._load_skill_file, file_info)
             if loaded:
                 # Cache in appropriate cache
                 if file_info.is_system:
                     self._system_cache[skill_name] = loaded
                 else:
                     self._cache[skill_name] = loaded
-                return loaded.markdown.content
+                return await self._load_body(loaded)
         except Exception as e:
             logger.warning(f"Failed to load skill content for {skill_name}: {e}")
 
         return None
 
+    async def resolve_content(self, skill: Skill) -> Skill:
+        """
+        Return ``skill`` with ``full_content`` set, reading a lazy body from disk.
+
+        Skills that already carry content, or that did not come from a
+        SKILL.md file, are returned unchanged; cached skills are never mutated.
+        """
+        if skill.full_content is not None or not skill.file_path:
+            return skill
+        if skill.source != SkillSource.FILESYSTEM:
+            return skill
+        try:
+            entry = await asyncio.to_thread(self.catalog.lookup, Path(skill.file_path))
+            body = await asyncio.to_thread(entry.load_body)
+        except MarkdownParseError as e:
+            logger.warning(f"Failed to load skill content for {skill.name}: {e}")
+            return skill
+        return replace(skill, full_content=body)
+
+    @staticmethod
+    async def _load_body(loaded: LoadedSkill) -> str:
+        """Return the skill body, reading it from disk on first use in lazy mode."""
+        entry = loaded.catalog_entry
+        if entry is None:
+            return loaded.markdown.content
+        if entry.body_loaded:
+            return entry.load_body()
+        return await asyncio.to_thread(entry.load_body)
+
     async def get_skill_metadata(self, skill_name: str) -> Skill | None:
         """
         Get skill metadata (Tier 1/2) without full content.
@@ -2,15 +2,25 @@
 
 Handles chunking, embedding, and indexing of memories,
 conversations, and episodes into the memory_chunks table.
+
+Indexing is a pipeline: chunks are produced lazily, embedded in batches, and
+up to ``INDEX_MAX_IN_FLIGHT_BATCHES`` batches are embedding while the oldest is
+written, so large documents never sit fully in memory and embedding overlaps
+with database writes. Writes stay sequential because they share one session.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING, Any, cast
 
-from src.infrastructure.memory.chunker import TextChunk, chunk_text
+from src.infrastructure.memory.chunker import TextChunk, iter_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +30,25 @@ if TYPE_CHECKING:
     )
     from src.infrastructure.graph.embedding.embedding_service import EmbeddingService
 
+INDEX_EMBED_BATCH_SIZE = 64  # chunks per embedding request and save_batch
+INDEX_MAX_IN_FLIGHT_BATCHES = 3  # embedded-but-unsaved batches (backpressure)
+
+
+@dataclass(frozen=True)
+class IndexProgress:
+    """Snapshot reported after each batch of chunks is saved."""
+
+    source_type: str
+    chunks_seen: int
+    chunks_saved: int
+    batches_saved: int
+
+
+def _batched(chunks: Iterable[TextChunk], size: int) -> Iterator[list[TextChunk]]:
+    iterator = iter(chunks)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
 
 class MemoryIndexService:
     """Manages the lifecycle of memory chunk indexing.
@@ -32,9 +61,16 @@ class MemoryIndexService:
         self,
         chunk_repo: SqlChunkRepository,
         embedding_service: EmbeddingService | None,
+        *,
+        batch_size: int = INDEX_EMBED_BATCH_SIZE,
+        max_in_flight_batches: int = INDEX_MAX_IN_FLIGHT_BATCHES,
+        on_progress: Callable[[IndexProgress], None] | None = None,
     ) -> None:
         self._chunk_repo = chunk_repo
         self._embedding = embedding_service
+        self._batch_size = max(1, batch_size)
+        self._max_in_flight = max(1, max_in_flight_batches)
+        self._on_progress = on_progress
 
     async def index_memory(
         self,
@@ -63,7 +99,7 @@ class MemoryIndexService:
         # Delete existing chunks for this memory (re-index)
         await self._chunk_repo.delete_by_source("memory", memory_id, project_id)
 
-        chunks = chunk_text(content, max_tokens=max_tokens)
+        chunks = iter_chunks(content, max_tokens=max_tokens)
         return await self._index_chunks(
             chunks,
             "memory",
@@ -110,7 +146,7 @@ class MemoryIndexService:
         # Delete existing chunks (re-index)
         await self._chunk_repo.delete_by_source("conversation", conversation_id, project_id)
 
-        chunks = chunk_text(text, max_tokens=max_tokens)
+        chunks = iter_chunks(text, max_tokens=max_tokens)
         return await self._index_chunks(
             chunks, "conversation", conversation_id, project_id, "other"
         )
@@ -138,73 +174,92 @@ class MemoryIndexService:
 
         await self._chunk_repo.delete_by_source("episode", episode_id, project_id)
 
-        chunks = chunk_text(content, max_tokens=max_tokens)
+        chunks = iter_chunks(content, max_tokens=max_tokens)
         return await self._index_chunks(chunks, "episode", episode_id, project_id, "other")
 
     async def _index_chunks(
         self,
-        chunks: list[TextChunk],
+        chunks: Iterable[TextChunk],
         source_type: str,
         source_id: str,
         project_id: str,
         category: str,
         metadata: dict[str, Any] | None = None,
     ) -> int:
-        """Common chunk indexing logic with batch operations."""
-        if not chunks:
-            return 0
+        """Common chunk indexing pipeline: dedup, embed and save in batches."""
+        seen = 0
+        saved = 0
+        batches_saved = 0
+        in_flight: deque[tuple[list[TextChunk], asyncio.Task[list[list[float] | None]]]] = deque()
+
+        def counted(source: Iterable[TextChunk]) -> Iterator[TextChunk]:
+            nonlocal seen
+            for chunk in source:
+                seen += 1
+                yield chunk
+
+        async def save_oldest() -> None:
+            nonlocal saved, batches_saved
+            batch, embedding_task = in_flight.popleft()
+            embeddings = await embedding_task
+            db_chunks = self._build_chunk_models(
+                batch,
+                embeddings,
+                project_id,
+                source_type,
+                source_id,
+                category,
+                extra_metadata=metadata,
+            )
+            await self._save_chunks(db_chunks)
+            saved += len(db_chunks)
+            batches_saved += 1
+            if self._on_progress is not None:
+                self._on_progress(IndexProgress(source_type, seen, saved, batches_saved))
 
-        new_chunks = await self._dedup_chunks(chunks, project_id)
-        if not new_chunks:
+        unique = self._dedup_stream(counted(chunks))
+        try:
+            for batch in _batched(unique, self._batch_size):
+                in_flight.append((batch, asyncio.create_task(self._embed_chunks(batch))))
+                if len(in_flight) >= self._max_in_flight:
+                    await save_oldest()
+            while in_flight:
+                await save_oldest()
+        finally:
+            for _, embedding_task in in_flight:
+                embedding_task.cancel()
+
+        if seen and not saved:
             logger.info(
                 "All chunks already exist source_type=%s chunk_count=%d",
                 source_type,
-                len(chunks),
+                seen,
             )
             return 0
+        if saved:
+            logger.info(
+                "Indexed chunks source_type=%s created_count=%d total_count=%d",
+                source_type,
+                saved,
+                seen,
+            )
+        return saved
 
-        embeddings = await self._embed_chunks(new_chunks)
-        db_chunks = self._build_chunk_models(
-            new_chunks,
-            embeddings,
-            project_id,
-            source_type,
-            source_id,
-            category,
-            extra_metadata=metadata,
-        )
-        await self._save_chunks(db_chunks)
-
-        created = len(db_chunks)
-        logger.info(
-            "Indexed chunks source_type=%s created_count=%d total_count=%d",
-            source_type,
-            created,
-            len(chunks),
-        )
-        return created
-
-    async def _dedup_chunks(
-        self,
-        chunks: list[TextChunk],
-        project_id: str,
-    ) -> list[TextChunk]:
-        """Filter duplicate chunks within a single source payload.
+    @staticmethod
+    def _dedup_stream(chunks: Iterable[TextChunk]) -> Iterator[TextChunk]:
+        """Drop chunks repeating earlier content within a single source payload.
 
         We intentionally do not deduplicate across other sources in the same
         project because `memory_chunks` are scoped by `source_type/source_id`.
         Cross-source dedup would make one memory lose its searchable chunks if
         another memory happened to contain identical text.
         """
-        _ = project_id
         seen_hashes: set[str] = set()
-        unique_chunks: list[TextChunk] = []
         for chunk in chunks:
             if chunk.content_hash in seen_hashes:
                 continue
             seen_hashes.add(chunk.content_hash)
-            unique_chunks.append(chunk)
-        return unique_chunks
+            yield chunk
 
     async def _embed_chunks(
         self,
@@ -92,6 +92,7 @@ class SkillService:
             tenant_id=tenant_id,
             project_id=project_id,
             include_system=include_system,
+            lazy_content=True,
         )
         return cls(
             skill_repository=skill_repository,
@@ -192,8 +193,16 @@ class SkillService:
                 skip_database=skip_database,
             )
 
+        if tier >= 3:
+            return [await self._with_content(skill) for skill in skills_by_name.values()]
         return list(skills_by_name.values())
 
+    async def _with_content(self, skill: Skill) -> Skill:
+        """Fill in the body of a lazily loaded file system skill (Tier 3)."""
+        if self._fs_loader is None:
+            return skill
+        return await self._fs_loader.resolve_content(skill)
+
     async def _load_system_skills(
         self,
         tenant_id: str,
@@ -432,9 +441,7 @@ class SkillService:
             await self.initialize()
 
         candidates = [
-            skill
-            for skill in self._fs_loader.get_cached_skills()
-            if skill.name == skill_name
+            skill for skill in self._fs_loader.get_cached_skills() if skill.name == skill_name
         ]
         if project_id:
             for skill in candidates:
@@ -501,7 +508,7 @@ class SkillService:
         """
         fs_skill = await self._get_filesystem_skill_by_name(skill_name, project_id)
         if fs_skill:
-            return fs_skill
+            return await self._with_content(fs_skill)
 
         return await self._get_persisted_skill_by_name(tenant_id, skill_name, project_id)
 
@@ -579,7 +586,7 @@ class SkillService:
         synced_count = 0
 
         for loaded in result.skills:
-            skill = loaded.skill
+            skill = await self._with_content(loaded.skill)
 
             # Check if exists in database
             existing = await self._skill_repo.get_by_name(tenant_id, skill.name)
@@ -202,6 +202,11 @@ class Settings(BaseSettings):
         ge=1,
         description="Maximum reflexion iterations for graph entity extraction.",
     )
+    graph_joint_extraction_enabled: bool = Field(
+        default=False,
+        alias="GRAPH_JOINT_EXTRACTION_ENABLED",
+        description="Extract graph entities and relationships with a single LLM call.",
+    )
 
     # LLM Timeout & Concurrency Settings
     llm_timeout: int = Field(
@@ -218,6 +223,8 @@ class Settings(BaseSettings):
     )  # Max retries for failed requests
     llm_cache_enabled: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
     llm_cache_ttl: int = Field(default=3600, alias="LLM_CACHE_TTL")
+    # Provider-side prompt caching: cache breakpoints on stable prefixes
+    llm_prompt_cache_enabled: bool = Field(default=True, alias="LLM_PROMPT_CACHE_ENABLED")
 
     # Agent Event & Artifact Settings
     agent_emit_thoughts: bool = Field(default=True, alias="AGENT_EMIT_THOUGHTS")
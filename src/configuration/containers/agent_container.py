@@ -397,6 +397,7 @@ class AgentContainer:
             tenant_id="",
             project_id=None,
             scanner=scanner,
+            lazy_content=True,
         )
 
         self._skill_service_instance = SkillService(
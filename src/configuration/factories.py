@@ -135,6 +135,7 @@ async def create_native_graph_adapter(
         embedding_service=embedding_service,
         enable_reflexion=settings.graph_reflexion_enabled,
         reflexion_max_iterations=settings.graph_reflexion_max_iterations,
+        joint_extraction=settings.graph_joint_extraction_enabled,
         auto_clear_embeddings=settings.auto_clear_mismatched_embeddings,
         reranker=reranker,
     )
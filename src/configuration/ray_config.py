@@ -18,6 +18,19 @@ class RaySettings(BaseSettings):
         default=30.0,
         alias="RAY_FAILURE_COOLDOWN_SECONDS",
     )
+    # Process-local cache of project agent actor handles (avoids a GCS lookup
+    # per request).
+    ray_actor_handle_ttl_seconds: float = Field(default=30.0, alias="RAY_ACTOR_HANDLE_TTL_SECONDS")
+    # Project agent actors idle longer than this are snapshotted and killed;
+    # they are re-created on the next request.  0 disables hibernation.
+    ray_actor_idle_hibernate_seconds: float = Field(
+        default=1800.0,
+        alias="RAY_ACTOR_IDLE_HIBERNATE_SECONDS",
+    )
+    ray_actor_hibernate_interval_seconds: float = Field(
+        default=60.0,
+        alias="RAY_ACTOR_HIBERNATE_INTERVAL_SECONDS",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
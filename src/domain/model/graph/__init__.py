@@ -12,9 +12,12 @@ application services consume from the store layer.
 """
 
 from src.domain.model.graph.dtos import (
+    EXPORT_SECTIONS,
     GraphCommunityDTO,
     GraphEntityDTO,
+    GraphExportCursor,
     GraphExportDTO,
+    GraphExportPage,
     GraphGraphDataDTO,
     GraphNodeDTO,
     GraphRelationshipDTO,
@@ -23,9 +26,12 @@ from src.domain.model.graph.dtos import (
 )
 
 __all__ = [
+    "EXPORT_SECTIONS",
     "GraphCommunityDTO",
     "GraphEntityDTO",
+    "GraphExportCursor",
     "GraphExportDTO",
+    "GraphExportPage",
     "GraphGraphDataDTO",
     "GraphNodeDTO",
     "GraphRelationshipDTO",
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
+# Export sections in streaming order.
+EXPORT_SECTIONS = ("episodes", "entities", "relationships", "communities")
+
 
 @dataclass(frozen=True)
 class GraphSearchHit:
@@ -164,3 +170,48 @@ class GraphExportDTO:
             "relationships": list(self.relationships),
             "communities": list(self.communities),
         }
+
+
+@dataclass(frozen=True)
+class GraphExportCursor:
+    """Resume point of a streaming export.
+
+    ``section`` is the export section being read and ``after`` is the last key
+    already exported from it (None = start of the section). Sections before
+    ``section`` in :data:`EXPORT_SECTIONS` are complete.
+    """
+
+    section: str = EXPORT_SECTIONS[0]
+    after: str | None = None
+
+    def encode(self) -> str:
+        """Opaque URL-safe token for clients to send back on resume."""
+        raw = json.dumps({"section": self.section, "after": self.after}).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> GraphExportCursor:
+        """Parse a token from :meth:`encode`; raise ValueError if it is malformed."""
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise ValueError("Malformed export cursor") from e
+        if not isinstance(data, dict):
+            raise ValueError("Malformed export cursor")
+        section, after = data.get("section"), data.get("after")
+        if section not in EXPORT_SECTIONS or not (after is None or isinstance(after, str)):
+            raise ValueError("Malformed export cursor")
+        return cls(section=section, after=after)
+
+
+@dataclass(frozen=True)
+class GraphExportPage:
+    """One page of a streaming export.
+
+    ``rows`` have the same shape as the matching :class:`GraphExportDTO` list;
+    ``cursor`` resumes the export right after this page.
+    """
+
+    section: str
+    rows: list[dict[str, Any]]
+    cursor: GraphExportCursor
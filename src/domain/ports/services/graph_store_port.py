@@ -20,17 +20,42 @@ collapse the raw-Cypher bypasses previously scattered across routers.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from src.domain.model.graph.dtos import (
+    EXPORT_SECTIONS,
     GraphCommunityDTO,
     GraphEntityDTO,
+    GraphExportCursor,
     GraphExportDTO,
+    GraphExportPage,
     GraphGraphDataDTO,
     GraphSearchHit,
 )
 from src.domain.model.memory.episode import Episode
 
+EXPORT_PAGE_SIZE = 1000  # rows per streamed export page
+
+
+def export_sections(
+    *,
+    include_episodes: bool,
+    include_entities: bool,
+    include_relationships: bool,
+    include_communities: bool,
+    cursor: GraphExportCursor | None = None,
+) -> list[str]:
+    """Sections a streaming export still has to read, in :data:`EXPORT_SECTIONS` order."""
+    included = {
+        "episodes": include_episodes,
+        "entities": include_entities,
+        "relationships": include_relationships,
+        "communities": include_communities,
+    }
+    start = EXPORT_SECTIONS.index(cursor.section) if cursor else 0
+    return [section for section in EXPORT_SECTIONS[start:] if included[section]]
+
 
 class GraphStorePort(ABC):
     """Pluggable graph backend port."""
@@ -145,6 +170,66 @@ class GraphStorePort(ABC):
     ) -> GraphExportDTO:
         """Export graph data as a typed envelope."""
 
+    async def iter_data_export(
+        self,
+        *,
+        tenant_id: str | None = None,
+        project_id: str | None = None,
+        include_episodes: bool = True,
+        include_entities: bool = True,
+        include_relationships: bool = True,
+        include_communities: bool = True,
+        cursor: GraphExportCursor | None = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[GraphExportPage]:
+        """Stream graph data page by page, resuming after ``cursor`` if given.
+
+        Optional override; the default pages the materialized ``data_export``
+        result keyed by ``uuid`` (``edge_id`` for relationships). Backends
+        should page in the database instead so memory stays bounded.
+        """
+        export = await self.data_export(
+            tenant_id=tenant_id,
+            project_id=project_id,
+            include_episodes=include_episodes,
+            include_entities=include_entities,
+            include_relationships=include_relationships,
+            include_communities=include_communities,
+        )
+        sections = export_sections(
+            include_episodes=include_episodes,
+            include_entities=include_entities,
+            include_relationships=include_relationships,
+            include_communities=include_communities,
+            cursor=cursor,
+        )
+        for section in sections:
+            key_field = "edge_id" if section == "relationships" else "uuid"
+            after = cursor.after if cursor and cursor.section == section else None
+            rows = sorted(
+                (
+                    row
+                    for row in getattr(export, section)
+                    if after is None or str(row.get(key_field, "")) > after
+                ),
+                key=lambda row: str(row.get(key_field, "")),
+            )
+            for start in range(0, len(rows), page_size):
+                page = rows[start : start + page_size]
+                yield GraphExportPage(
+                    section=section,
+                    rows=page,
+                    cursor=GraphExportCursor(section, str(page[-1].get(key_field, ""))),
+                )
+
+    def validate_export_cursor(self, cursor: GraphExportCursor) -> None:
+        """Raise ValueError if :meth:`iter_data_export` cannot resume from ``cursor``.
+
+        Optional override for backends whose resume keys have a structure, so
+        callers can reject a bad cursor before streaming starts.
+        """
+        _ = cursor
+
     @abstractmethod
     async def count_nodes(
         self,
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Protocol
 
-from src.domain.model.workspace_plan import Plan
+from src.domain.model.workspace_plan import Plan, PlanStatus
 
 
 class PlanRepositoryPort(Protocol):
@@ -14,4 +15,8 @@ class PlanRepositoryPort(Protocol):
         """Return the active plan for a workspace, or None."""
         ...
 
+    async def list_workspace_ids(self, statuses: Collection[PlanStatus]) -> list[str]:
+        """Return workspaces whose current plan is in one of ``statuses``."""
+        ...
+
     async def delete(self, plan_id: str) -> None: ...
@@ -1,14 +1,19 @@
 """Data export and management API routes."""
 
+import json
 import logging
+import zlib
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Use Cases & DI Container
+from src.domain.model.graph.dtos import GraphExportCursor
 from src.domain.ports.services.graph_store_port import GraphStorePort
 from src.infrastructure.adapters.primary.web.dependencies import (
     get_current_user,
@@ -177,6 +182,58 @@ def _normalize_cleanup_days(value: Any) -> int:
     return days
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize datetime and Neo4j temporal values; fall back to ``str``."""
+    isoformat = getattr(value, "isoformat", None)
+    if callable(isoformat):
+        return isoformat()
+    return str(value)
+
+
+def _ndjson_line(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, default=_json_default, separators=(",", ":")) + "\n").encode()
+
+
+async def _export_ndjson(
+    graph_store: GraphStorePort,
+    header: dict[str, Any],
+    cursor: GraphExportCursor | None,
+    compress: bool,
+    **options: Any,
+) -> AsyncIterator[bytes]:
+    """Render ``iter_data_export`` pages as NDJSON, one chunk per page.
+
+    Lines are ``{"type": "export", ...}`` first, then ``{"type": <section>,
+    "data": row}`` per row and ``{"type": "cursor", "cursor": token}`` after
+    each page, and ``{"type": "end"}`` last. A client that loses the stream
+    resumes by sending the last cursor token it received. With ``compress``
+    every chunk is gzip-flushed so it can be decoded as it arrives.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # 31 = gzip container
+
+    def encode(data: bytes, final: bool = False) -> bytes:
+        if compressor is None:
+            return data
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return compressor.compress(data) + compressor.flush(flush_mode)
+
+    yield encode(_ndjson_line({"type": "export", **header}))
+    last_cursor = cursor.encode() if cursor else None
+    try:
+        async for page in graph_store.iter_data_export(cursor=cursor, **options):
+            last_cursor = page.cursor.encode()
+            lines = [_ndjson_line({"type": page.section, "data": row}) for row in page.rows]
+            lines.append(_ndjson_line({"type": "cursor", "cursor": last_cursor}))
+            yield encode(b"".join(lines))
+    except Exception as e:
+        # Headers are already sent; report in-band so the client can resume.
+        logger.error("Failed to stream data export: error_type=%s", type(e).__name__)
+        error = {"type": "error", "detail": _("Failed to export data"), "cursor": last_cursor}
+        yield encode(_ndjson_line(error), final=True)
+        return
+    yield encode(_ndjson_line({"type": "end"}), final=True)
+
+
 # --- Endpoints ---
 
 
@@ -221,6 +278,71 @@ async def export_data(
         raise HTTPException(status_code=500, detail=_("Failed to export data")) from e
 
 
+@router.post("/export/stream", response_class=StreamingResponse, response_model=None)
+async def stream_export_data(
+    tenant_id: str | None = Body(None, description="Filter by tenant ID"),
+    project_id: str | None = Body(None, description="Filter by project ID"),
+    include_episodes: bool = Body(True, description="Include episode data"),
+    include_entities: bool = Body(True, description="Include entity data"),
+    include_relationships: bool = Body(True, description="Include relationship data"),
+    include_communities: bool = Body(True, description="Include community data"),
+    cursor: str | None = Body(None, description="Resume after this cursor token"),
+    gzip: bool = Body(False, description="Gzip-compress the stream"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    graph_store: GraphStorePort | None = Depends(get_graph_store),
+) -> StreamingResponse:
+    """
+    Stream graph data as NDJSON, paged in the graph backend.
+
+    Unlike ``/export`` the project is never held in memory. Each page is
+    followed by a cursor line; send its token back as ``cursor`` to resume.
+    """
+    try:
+        resume_from = GraphExportCursor.decode(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=_("Invalid export cursor")
+        ) from None
+    effective_tenant_id, effective_project_id = await _resolve_graph_export_scope(
+        tenant_id,
+        project_id,
+        db,
+        current_user,
+    )
+    if graph_store is None:
+        raise HTTPException(status_code=503, detail=_("Graph backend unavailable"))
+    if resume_from is not None:
+        try:
+            graph_store.validate_export_cursor(resume_from)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=_("Invalid export cursor")
+            ) from None
+
+    header = {
+        "exported_at": datetime.now(UTC).isoformat(),
+        "tenant_id": effective_tenant_id,
+        "project_id": effective_project_id,
+    }
+    return StreamingResponse(
+        _export_ndjson(
+            graph_store,
+            header,
+            resume_from,
+            gzip,
+            tenant_id=effective_tenant_id,
+            project_id=effective_project_id,
+            include_episodes=include_episodes,
+            include_entities=include_entities,
+            include_relationships=include_relationships,
+            include_communities=include_communities,
+        ),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "gzip"} if gzip else None,
+    )
+
+
 @router.get("/stats")
 async def get_graph_stats(
     tenant_id: str | None = Query(None, description="Filter by tenant ID"),
@@ -5,9 +5,17 @@ Solves the backpressure problem where LLM produces events faster than
 WebSocket can send them.
 
 Design:
-- Single unified queue with configurable size
+- Single ordered queue with configurable size; events are never reordered
 - Asynchronous sender: Non-blocking event enqueue, dedicated sender task
-- Drop oldest strategy when queue is full
+- Coalescing: consecutive text/thought deltas for the same message are merged
+  into one event while they wait in the queue
+- Framing: clients that opt in (``frames=batch``) receive several queued
+  events as one JSON array frame, waiting at most ``max_frame_delay`` for more
+  deltas to arrive; everyone else gets one JSON object per frame
+- Drop policy: when the queue is full only coalescible deltas are dropped
+  (oldest first); control, tool, terminal and HITL events are always kept
+- Serialize once: broadcasts pass a pre-encoded JSON text shared by every
+  subscriber's queue; frames are assembled from it without re-encoding
 - Timeout protection: WebSocket send has 5s timeout
 """
 
@@ -16,14 +24,36 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
+from src.infrastructure.telemetry.metrics import record_histogram_value
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from starlette.websockets import WebSocket
 
+# Streaming deltas whose ``data["delta"]`` strings can be concatenated. These
+# are also the only events the dispatcher may drop under backpressure, since
+# the following text_end/thought event carries the full content.
+COALESCIBLE_EVENT_TYPES = frozenset({"text_delta", "thought_delta"})
+
+# Events per frame for connections that opted in to JSON-array frames.
+BATCH_FRAME_EVENTS = 32
+
+
+def encode_event(event: dict[str, Any]) -> str:
+    """Serialize an event to compact JSON text.
+
+    Used once per broadcast so every subscriber sends the same string.
+    Values orjson cannot encode natively fall back to ``str()``.
+    """
+    return orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 @dataclass
 class DispatcherConfig:
@@ -39,6 +69,15 @@ class DispatcherConfig:
     max_retries: int = 3
     retry_delay: float = 0.1  # seconds
 
+    # Framing: events per WebSocket frame (1 sends single JSON objects, the
+    # only shape older clients parse) and the longest a queued delta may wait
+    # for more events to share its frame.
+    max_frame_events: int = 1
+    max_frame_delay: float = 0.01  # seconds
+
+    # Merge consecutive text/thought deltas while they wait in the queue
+    coalesce_deltas: bool = True
+
 
 @dataclass
 class QueuedEvent:
@@ -46,12 +85,48 @@ class QueuedEvent:
 
     data: dict[str, Any]
     enqueue_time: float = field(default_factory=lambda: asyncio.get_event_loop().time())
-    retry_count: int = 0
+    coalesced: int = 0  # Number of later deltas merged into ``data``
+    encoded: str | None = None  # JSON text of ``data``, shared across subscribers
+
+    def json_text(self) -> str:
+        if self.encoded is None:
+            self.encoded = encode_event(self.data)
+        return self.encoded
+
+    @property
+    def event_type(self) -> str:
+        return str(self.data.get("type") or "")
+
+    @property
+    def coalescible(self) -> bool:
+        return self.event_type in COALESCIBLE_EVENT_TYPES
+
+
+def _same_delta_stream(first: dict[str, Any], second: dict[str, Any]) -> bool:
+    """Whether two delta events belong to the same stream and can be merged."""
+    if first.get("type") != second.get("type"):
+        return False
+    if first.get("conversation_id") != second.get("conversation_id"):
+        return False
+    first_data, second_data = first.get("data"), second.get("data")
+    if not isinstance(first_data, dict) or not isinstance(second_data, dict):
+        return False
+    if first_data.keys() != second_data.keys():
+        return False
+    return (
+        all(
+            isinstance(first_data[k], str) and isinstance(second_data[k], str)
+            if k == "delta"
+            else first_data[k] == second_data[k]
+            for k in first_data
+        )
+        and "delta" in first_data
+    )
 
 
 class EventDispatcher:
     """
-    Async event dispatcher with single queue.
+    Async event dispatcher with a single coalescing queue.
 
     Usage:
         dispatcher = EventDispatcher(session_id, websocket, config)
@@ -74,8 +149,9 @@ class EventDispatcher:
         self.websocket = websocket
         self.config = config or DispatcherConfig()
 
-        # Single queue
-        self.queue: asyncio.Queue[QueuedEvent] = asyncio.Queue(maxsize=self.config.queue_size)
+        # Single ordered queue; a deque so the tail can absorb new deltas
+        self.queue: deque[QueuedEvent] = deque()
+        self._wakeup = asyncio.Event()
 
         # Sender task
         self.sender_task: asyncio.Task[None] | None = None
@@ -85,10 +161,15 @@ class EventDispatcher:
         self.stats = {
             "enqueued": 0,
             "sent": 0,
+            "frames": 0,
+            "coalesced": 0,
             "dropped": 0,
             "retried": 0,
             "failed": 0,
         }
+        self._max_queue_depth = 0
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
 
     async def start(self) -> None:
         """Start the sender loop."""
@@ -117,105 +198,192 @@ class EventDispatcher:
             f"[Dispatcher] Stopped for session {self.session_id[:8]}... Stats: {self.stats}"
         )
 
-    async def enqueue(self, event: dict[str, Any]) -> bool:
+    async def enqueue(self, event: dict[str, Any], encoded: str | None = None) -> bool:
         """
         Enqueue an event for sending.
 
+        Args:
+            event: Event dict; never mutated
+            encoded: Optional pre-serialized JSON text of ``event`` (see
+                ``encode_event``), sent as-is unless the event gets coalesced
+
         Returns:
-            bool: True if enqueued, False if dropped
+            bool: True if enqueued (or merged into a queued delta), False if dropped
         """
-        queued = QueuedEvent(data=event)
-
-        try:
-            # Try to put without blocking
-            self.queue.put_nowait(queued)
+        if self._coalesce_into_tail(event):
             self.stats["enqueued"] += 1
+            self.stats["coalesced"] += 1
             return True
-        except asyncio.QueueFull:
-            # Queue full - drop oldest to make room
-            try:
-                self.queue.get_nowait()
-                self.queue.put_nowait(queued)
-                self.stats["dropped"] += 1
-                self.stats["enqueued"] += 1
+
+        queued = QueuedEvent(data=event, encoded=encoded)
+        if len(self.queue) >= self.config.queue_size and not self._make_room(queued):
+            self.stats["dropped"] += 1
+            return False
+
+        self.queue.append(queued)
+        self.stats["enqueued"] += 1
+        self._max_queue_depth = max(self._max_queue_depth, len(self.queue))
+        self._wakeup.set()
+        return True
+
+    def _coalesce_into_tail(self, event: dict[str, Any]) -> bool:
+        """Merge a text/thought delta into the matching delta at the queue tail."""
+        if not self.config.coalesce_deltas or not self.queue:
+            return False
+        if event.get("type") not in COALESCIBLE_EVENT_TYPES:
+            return False
+        tail = self.queue[-1]
+        if not _same_delta_stream(tail.data, event):
+            return False
+
+        if tail.coalesced == 0:
+            # The original dict may be shared with other sessions' dispatchers.
+            tail.data = {**tail.data, "data": dict(tail.data["data"])}
+        tail.encoded = None
+        tail.data["data"]["delta"] += event["data"]["delta"]
+        # The merged event stands in for the newest delta in stream cursors.
+        for cursor_key in ("seq", "timestamp", "event_time_us", "event_counter"):
+            if cursor_key in event:
+                tail.data[cursor_key] = event[cursor_key]
+        tail.coalesced += 1
+        return True
+
+    def _make_room(self, incoming: QueuedEvent) -> bool:
+        """Drop the oldest queued delta to make room; False if ``incoming`` must be dropped."""
+        for index, queued in enumerate(self.queue):
+            if queued.coalescible:
+                del self.queue[index]
+                self.stats["dropped"] += 1 + queued.coalesced
                 return True
-            except asyncio.QueueEmpty:
-                self.stats["dropped"] += 1
-                return False
+        # Nothing droppable queued: never lose a control/terminal event, but
+        # a delta can be dropped itself.
+        return not incoming.coalescible
 
     async def _sender_loop(self) -> None:
         """Main sender loop."""
         while self.running:
             try:
-                # Wait for event with timeout
-                try:
-                    event = await asyncio.wait_for(self.queue.get(), timeout=0.1)
-                    await self._send_event(event)
-                except TimeoutError:
-                    # No events, continue loop
-                    pass
+                if not self.queue:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=0.1)
+                    except TimeoutError:
+                        # No events, continue loop
+                        continue
+                await self._wait_for_frame()
+                frame = self._take_frame()
+                if frame:
+                    await self._send_frame(frame)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"[Dispatcher] Sender loop error: {e}", exc_info=True)
                 await asyncio.sleep(0.1)
 
-    async def _send_event(self, event: QueuedEvent) -> bool:
-        """Send an event with timeout and retry."""
-        try:
-            async with asyncio.timeout(self.config.send_timeout):
-                await self.websocket.send_json(event.data)
-            self.stats["sent"] += 1
-            return True
-        except TimeoutError:
-            # Delta events are ephemeral - drop on timeout instead of retrying
-            event_type = event.data.get("type", "")
-            if "delta" in event_type:
-                self.stats["failed"] += 1
-                return False
-            return await self._retry_or_fail(event, f"Send timeout for {self.session_id[:8]}...")
-        except Exception as e:
-            # WebSocket already closed - no point retrying
-            if "websocket.close" in str(e) or "already completed" in str(e):
-                logger.debug(
-                    f"[Dispatcher] WebSocket closed for {self.session_id[:8]}..., "
-                    f"dropping event type={event.data.get('type')}"
+    async def _wait_for_frame(self) -> None:
+        """Give a lone delta up to ``max_frame_delay`` to gather company."""
+        if self.config.max_frame_events <= 1 or self.config.max_frame_delay <= 0:
+            return
+        if len(self.queue) >= self.config.max_frame_events:
+            return
+        if not all(queued.coalescible for queued in self.queue):
+            # Control/terminal events go out without added latency.
+            return
+        loop = asyncio.get_running_loop()
+        remaining = self.config.max_frame_delay - (loop.time() - self.queue[0].enqueue_time)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def _take_frame(self) -> list[QueuedEvent]:
+        """Pop up to ``max_frame_events`` events from the head of the queue."""
+        limit = max(1, self.config.max_frame_events)
+        frame: list[QueuedEvent] = []
+        while self.queue and len(frame) < limit:
+            frame.append(self.queue.popleft())
+        return frame
+
+    async def _send_frame(self, frame: list[QueuedEvent]) -> bool:
+        """Send a frame of events with timeout and retry.
+
+        A single event is sent as a JSON object, several as a JSON array,
+        both built from each event's (possibly shared) JSON text.
+        """
+        if len(frame) == 1:
+            payload = frame[0].json_text()
+        else:
+            payload = "[" + ",".join(q.json_text() for q in frame) + "]"
+        types = ",".join(sorted({q.event_type for q in frame}))
+        attempt = 0
+        while True:
+            warn_msg = ""
+            try:
+                async with asyncio.timeout(self.config.send_timeout):
+                    await self.websocket.send_text(payload)
+                self._record_sent(frame)
+                return True
+            except TimeoutError:
+                # Delta events are ephemeral - drop on timeout instead of retrying
+                if all("delta" in q.event_type for q in frame):
+                    self.stats["failed"] += len(frame)
+                    return False
+                warn_msg = f"Send timeout for {self.session_id[:8]}..."
+            except Exception as e:
+                # WebSocket already closed - no point retrying
+                if "websocket.close" in str(e) or "already completed" in str(e):
+                    logger.debug(
+                        f"[Dispatcher] WebSocket closed for {self.session_id[:8]}..., "
+                        f"dropping event type={types}"
+                    )
+                    self.stats["failed"] += len(frame)
+                    return False
+                logger.warning(
+                    f"[Dispatcher] Send failed for {self.session_id[:8]}...: "
+                    f"type={types}, error={type(e).__name__}: {e}"
                 )
-                self.stats["failed"] += 1
+
+            if attempt >= self.config.max_retries:
+                if warn_msg:
+                    logger.warning(f"[Dispatcher] {warn_msg}: type={types}")
+                self.stats["failed"] += len(frame)
                 return False
-            logger.warning(
-                f"[Dispatcher] Send failed for {self.session_id[:8]}...: "
-                f"type={event.data.get('type')}, error={type(e).__name__}: {e}"
-            )
-            return await self._retry_or_fail(event)
-
-    async def _retry_or_fail(self, event: QueuedEvent, warn_msg: str = "") -> bool:
-        """Retry sending an event or record failure."""
-        if event.retry_count < self.config.max_retries:
-            event.retry_count += 1
+            attempt += 1
             self.stats["retried"] += 1
-            await asyncio.sleep(self.config.retry_delay * event.retry_count)
-            return await self._send_event(event)
-        if warn_msg:
-            event_type = event.data.get("type", "")
-            logger.warning(f"[Dispatcher] {warn_msg}: type={event_type}")
-        self.stats["failed"] += 1
-        return False
+            await asyncio.sleep(self.config.retry_delay * attempt)
+
+    def _record_sent(self, frame: list[QueuedEvent]) -> None:
+        """Update send counters and latency (oldest event in the frame)."""
+        now = asyncio.get_running_loop().time()
+        latency_ms = (now - min(q.enqueue_time for q in frame)) * 1000.0
+        self.stats["sent"] += len(frame)
+        self.stats["frames"] += 1
+        self._latency_total_ms += latency_ms
+        self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+        record_histogram_value(
+            "websocket_event_send_latency_ms",
+            "Time from WebSocket event enqueue to frame send completion",
+            latency_ms,
+        )
 
     async def _flush_remaining(self) -> None:
         """Flush remaining events before shutdown."""
-        while not self.queue.empty():
+        while self.queue:
             try:
-                event = self.queue.get_nowait()
-                await self._send_event(event)
+                await self._send_frame(self._take_frame())
             except Exception:
                 break
 
     def get_stats(self) -> dict[str, Any]:
         """Get dispatcher statistics."""
+        frames = self.stats["frames"]
+        enqueued = self.stats["enqueued"]
         return {
             **self.stats,
-            "queue_size": self.queue.qsize(),
+            "queue_size": len(self.queue),
+            "max_queue_depth": self._max_queue_depth,
+            "coalesce_ratio": self.stats["coalesced"] / enqueued if enqueued else 0.0,
+            "events_per_frame": self.stats["sent"] / frames if frames else 0.0,
+            "avg_send_latency_ms": self._latency_total_ms / frames if frames else 0.0,
+            "max_send_latency_ms": self._latency_max_ms,
         }
 
 
@@ -18,7 +18,10 @@ from typing import Any
 from fastapi import WebSocket
 
 from src.infrastructure.adapters.primary.web.routers.event_dispatcher import (
+    BATCH_FRAME_EVENTS,
+    DispatcherConfig,
     DispatcherManager,
+    encode_event,
     get_dispatcher_manager,
 )
 
@@ -58,6 +61,8 @@ class ConnectionManager:
         self.project_subscriptions: dict[str, dict[str, set[str]]] = {}
         # session_id -> set of subscribed project_ids for lifecycle state
         self.session_project_subscriptions: dict[str, set[tuple[str, str]]] = {}
+        # session_ids whose client accepts JSON-array frames of several events
+        self.batch_frame_sessions: set[str] = set()
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
         # Strong references to in-flight cleanup tasks scheduled from sync
@@ -74,8 +79,13 @@ class ConnectionManager:
         websocket: WebSocket,
         *,
         subprotocol: str | None = None,
+        batch_frames: bool = False,
     ) -> None:
-        """Accept and register a new WebSocket connection for a session."""
+        """Accept and register a new WebSocket connection for a session.
+
+        ``batch_frames`` is set when the client asked for several events per
+        frame as a JSON array; otherwise each event is its own JSON object.
+        """
         await websocket.accept(subprotocol=subprotocol)
         async with self._lock:
             # Register the new session connection
@@ -83,6 +93,10 @@ class ConnectionManager:
             self.session_users[session_id] = user_id
             self.subscriptions[session_id] = set()
             self.bridge_tasks[session_id] = {}
+            if batch_frames:
+                self.batch_frame_sessions.add(session_id)
+            else:
+                self.batch_frame_sessions.discard(session_id)
 
             # Track user's sessions
             if user_id not in self.user_sessions:
@@ -110,6 +124,7 @@ class ConnectionManager:
             self._remove_user_session(user_id, session_id)
             self.active_connections.pop(session_id, None)
             self.session_users.pop(session_id, None)
+            self.batch_frame_sessions.discard(session_id)
 
         # Await cancellation outside the lock. ``return_exceptions=True``
         # ensures one misbehaving task does not break cleanup of others;
@@ -265,7 +280,8 @@ class ConnectionManager:
         Broadcast a message to all sessions subscribed to a conversation.
 
         Uses EventDispatcher for async, non-blocking event delivery with
-        backpressure handling and priority queuing.
+        backpressure handling and priority queuing. The message is serialized
+        once and the JSON text is shared by every subscriber's queue.
         """
         # Snapshot subscriber set + their websockets under the lock to avoid
         # "set changed size during iteration" when concurrent disconnect /
@@ -279,11 +295,19 @@ class ConnectionManager:
             }
 
         enqueued_count = 0
+        encoded: str | None = None
         for session_id, ws in ws_by_session.items():
             if ws is None:
                 continue
-            dispatcher = await self.dispatcher_manager.get_dispatcher(session_id, ws)
-            if await dispatcher.enqueue(message):
+            if encoded is None:
+                encoded = encode_event(message)
+            config = (
+                DispatcherConfig(max_frame_events=BATCH_FRAME_EVENTS)
+                if session_id in self.batch_frame_sessions
+                else None
+            )
+            dispatcher = await self.dispatcher_manager.get_dispatcher(session_id, ws, config)
+            if await dispatcher.enqueue(message, encoded=encoded):
                 enqueued_count += 1
 
         return enqueued_count
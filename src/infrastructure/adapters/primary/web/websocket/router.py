@@ -57,6 +57,9 @@ async def agent_websocket_endpoint(
     websocket: WebSocket,
     token: str | None = Query(None, description="Legacy API key query parameter"),
     session_id: str | None = Query(None, description="Client session ID for multi-tab support"),
+    frames: str | None = Query(
+        None, description="'batch' to receive several events per frame as a JSON array"
+    ),
 ) -> None:
     """
     WebSocket endpoint for agent chat.
@@ -65,6 +68,8 @@ async def agent_websocket_endpoint(
     - token: Legacy API key query parameter (optional; WebSocket subprotocol preferred)
     - session_id: Client-generated session ID for multi-tab support
       (optional, auto-generated if not provided)
+    - frames: 'batch' to accept frames carrying a JSON array of events
+      (optional; by default every frame is a single JSON object)
 
     Protocol:
 
@@ -164,6 +169,7 @@ async def agent_websocket_endpoint(
         session_id,
         websocket,
         subprotocol=select_websocket_auth_subprotocol(websocket),
+        batch_frames=frames == "batch",
     )
 
     # Get DI container
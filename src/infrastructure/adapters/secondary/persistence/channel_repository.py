@@ -1,5 +1,6 @@
 """Channel configuration repository."""
 
+import random
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
@@ -259,6 +260,19 @@ class ChannelSessionBindingRepository:
             raise
 
 
+OUTBOX_BACKOFF_CAP_SECONDS = 300
+
+
+def outbox_retry_backoff(attempt_count: int) -> float:
+    """Exponential retry delay with jitter for the given attempt number.
+
+    Jitter spreads retries of messages that failed together (e.g. during a
+    channel outage) so they do not all hit the adapter at the same instant.
+    """
+    backoff = min(2**attempt_count, OUTBOX_BACKOFF_CAP_SECONDS)
+    return backoff * random.uniform(0.5, 1.0)
+
+
 class ChannelOutboxRepository:
     """Repository for outbound delivery queue records."""
 
@@ -323,7 +337,7 @@ class ChannelOutboxRepository:
         move_to_dead_letter = next_attempt_count >= int(max_attempts)
         next_retry_at = None
         if not move_to_dead_letter:
-            backoff_seconds = min(2**next_attempt_count, 300)
+            backoff_seconds = outbox_retry_backoff(next_attempt_count)
             next_retry_at = datetime.now(UTC) + timedelta(seconds=backoff_seconds)
 
         result = await self._session.execute(
@@ -345,21 +359,55 @@ class ChannelOutboxRepository:
         await self._session.flush()
         return cast(CursorResult[Any], result).rowcount > 0
 
-    async def list_pending_retry(self, limit: int = 20) -> list[ChannelOutboxModel]:
-        """List outbox messages eligible for retry.
+    async def list_retry_schedule(
+        self, limit: int = 500, outbox_ids: list[str] | None = None
+    ) -> list[tuple[str, datetime]]:
+        """List ``(id, next_retry_at)`` of failed messages, soonest first.
 
-        Returns failed messages whose next_retry_at has passed.
+        Includes messages whose retry time has not arrived yet so callers can
+        schedule them without polling. Messages without a ``next_retry_at``
+        are not scheduled for retry. ``outbox_ids`` restricts the listing to
+        those messages.
         """
-        now = datetime.now(UTC)
+        query = select(ChannelOutboxModel.id, ChannelOutboxModel.next_retry_at).where(
+            ChannelOutboxModel.status == "failed",
+            ChannelOutboxModel.next_retry_at.is_not(None),
+        )
+        if outbox_ids is not None:
+            if not outbox_ids:
+                return []
+            query = query.where(ChannelOutboxModel.id.in_(outbox_ids))
         result = await self._session.execute(
             refresh_select_statement(
-                select(ChannelOutboxModel)
-                .where(
+                query.order_by(ChannelOutboxModel.next_retry_at.asc()).limit(limit)
+            )
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def list_failed_by_ids(self, outbox_ids: list[str]) -> list[ChannelOutboxModel]:
+        """Load failed outbox messages by ID (already sent/dead-lettered ones are skipped)."""
+        if not outbox_ids:
+            return []
+        result = await self._session.execute(
+            refresh_select_statement(
+                select(ChannelOutboxModel).where(
+                    ChannelOutboxModel.id.in_(outbox_ids),
                     ChannelOutboxModel.status == "failed",
-                    ChannelOutboxModel.next_retry_at <= now,
                 )
-                .order_by(ChannelOutboxModel.next_retry_at.asc())
-                .limit(limit)
             )
         )
         return list(result.scalars().all())
+
+    async def count_retry_backlog(self) -> int:
+        """Count failed messages still awaiting a retry."""
+        result = await self._session.execute(
+            refresh_select_statement(
+                select(func.count())
+                .select_from(ChannelOutboxModel)
+                .where(
+                    ChannelOutboxModel.status == "failed",
+                    ChannelOutboxModel.next_retry_at.is_not(None),
+                )
+            )
+        )
+        return int(result.scalar() or 0)
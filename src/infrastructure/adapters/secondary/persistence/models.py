@@ -2483,6 +2483,22 @@ class MemoryChunk(Base):
     )
 
 
+class MemoryIndexVersion(Base):
+    """Per-project version of the memory chunk index.
+
+    Incremented in the same transaction as every chunk write, so caches in any
+    process see the new version exactly when the write commits.
+    """
+
+    __tablename__ = "memory_index_versions"
+
+    project_id: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 class AuditLog(IdGeneratorMixin, Base):
     """Audit log for tracking sensitive operations."""
 
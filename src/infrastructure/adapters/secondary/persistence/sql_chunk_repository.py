@@ -3,18 +3,127 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any, cast
 
-from sqlalchemy import bindparam, delete, select, text
-from sqlalchemy.engine import CursorResult
+from sqlalchemy import bindparam, delete, event, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import CursorResult, Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
 from src.infrastructure.adapters.secondary.common.base_repository import refresh_select_statement
-from src.infrastructure.adapters.secondary.persistence.models import MemoryChunk
+from src.infrastructure.adapters.secondary.persistence.models import MemoryChunk, MemoryIndexVersion
+from src.infrastructure.memory.chunk_vector_cache import get_chunk_vector_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _cache_row(chunk: MemoryChunk) -> dict[str, Any]:
+    """Search-result shaped dict for the in-process vector cache."""
+    # Read loaded state only: server-side defaults are expired after flush and
+    # touching them would trigger a lazy load outside the async context.
+    loaded = inspect(chunk).dict
+    return {
+        "id": chunk.id,
+        "content": chunk.content,
+        "metadata": loaded.get("metadata_") or {},
+        "created_at": loaded.get("created_at") or datetime.now(UTC),
+        "category": loaded.get("category") or "other",
+        "source_type": chunk.source_type,
+        "source_id": chunk.source_id,
+        "embedding": chunk.embedding,
+    }
+
+
+class _PendingIndexWrites:
+    """Index versions bumped and vector cache mirrors queued by a transaction.
+
+    Kept in ``Session.info`` so a transaction that writes many chunks bumps
+    each project once, and its writes reach the in-process vector cache only
+    once they are committed.
+    """
+
+    def __init__(self) -> None:
+        self.versions: dict[str, int] = {}
+        self.mirrors: list[tuple[str, Callable[[], None]]] = []
+
+    def after_commit(self, _sync_session: Session) -> None:
+        for _project_id, mirror in self.mirrors:
+            try:
+                mirror()
+            except Exception as e:
+                logger.warning(
+                    "Failed to mirror chunk write into vector cache error_type=%s",
+                    type(e).__name__,
+                )
+        self.mirrors.clear()
+
+    def after_soft_rollback(self, _sync_session: Session, previous: SessionTransaction) -> None:
+        if not previous.nested:
+            return
+        # A rolled-back savepoint may have undone bumps and writes whose
+        # mirrors are queued; the next bump may reuse the same version, so
+        # those projects' indexes are dropped at commit instead.
+        self.versions.clear()
+        cache = get_chunk_vector_cache()
+        projects = dict.fromkeys(project_id for project_id, _ in self.mirrors)
+        self.mirrors = [
+            (project_id, partial(cache.invalidate, project_id)) for project_id in projects
+        ]
+
+    def after_transaction_end(
+        self, _sync_session: Session, transaction: SessionTransaction
+    ) -> None:
+        # Flushes run in subtransactions; only the outermost transaction ends
+        # the database transaction.
+        if transaction.parent is None:
+            self.versions.clear()
+            self.mirrors.clear()
+
+
+_PENDING_INDEX_WRITES_KEY = "memory_index_pending_writes"
+
+
+def _pending_index_writes(session: AsyncSession) -> _PendingIndexWrites:
+    sync_session = session.sync_session
+    pending = sync_session.info.get(_PENDING_INDEX_WRITES_KEY)
+    if pending is None:
+        pending = sync_session.info[_PENDING_INDEX_WRITES_KEY] = _PendingIndexWrites()
+        event.listen(sync_session, "after_commit", pending.after_commit)
+        event.listen(sync_session, "after_soft_rollback", pending.after_soft_rollback)
+        event.listen(sync_session, "after_transaction_end", pending.after_transaction_end)
+    return pending
+
+
+def _search_row(row: Row[Any]) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "content": row.content,
+        "metadata": row.metadata,
+        "score": float(row.score),
+        "created_at": row.created_at,
+        "category": row.category,
+        "source_type": row.source_type,
+        "source_id": row.source_id,
+    }
+
+
+def _tsquery_for(query: str, keywords: list[str] | None) -> tuple[str, str]:
+    """Pick the tsquery function and its argument for a search.
+
+    Prefers OR-joined keywords (better for CJK) over the raw query string.
+    """
+    safe_kws = [kw for kw in keywords or [] if kw.strip()]
+    if safe_kws:
+        # Build OR-joined tsquery string: 'kw1' | 'kw2' | ...
+        return "to_tsquery", " | ".join(safe_kws)
+    return "plainto_tsquery", query
+
+
 class SqlChunkRepository:
     """Repository for memory chunk CRUD and search operations."""
 
@@ -25,14 +134,72 @@ class SqlChunkRepository:
         """Persist a memory chunk."""
         self._session.add(chunk)
         await self._session.flush()
+        await self._mirror_saved_chunks([chunk])
         return chunk
 
     async def save_batch(self, chunks: list[MemoryChunk]) -> list[MemoryChunk]:
         """Persist multiple chunks in a single flush."""
         self._session.add_all(chunks)
         await self._session.flush()
+        await self._mirror_saved_chunks(chunks)
         return chunks
 
+    async def _mirror_saved_chunks(self, chunks: list[MemoryChunk]) -> None:
+        """Bump each project's index version and queue the chunks for the vector cache."""
+        by_project: dict[str, list[MemoryChunk]] = {}
+        for chunk in chunks:
+            by_project.setdefault(chunk.project_id, []).append(chunk)
+        cache = get_chunk_vector_cache()
+        for project_id, project_chunks in by_project.items():
+            version = await self._bump_index_version(project_id)
+            if not cache.is_tracking(project_id):
+                continue
+            rows = [_cache_row(chunk) for chunk in project_chunks]
+            self._queue_mirror(
+                project_id, partial(cache.upsert_chunks, project_id, rows, version=version)
+            )
+
+    def _queue_mirror(self, project_id: str, mirror: Callable[[], None]) -> None:
+        """Apply ``mirror`` to the vector cache once the current transaction commits."""
+        _pending_index_writes(self._session).mirrors.append((project_id, mirror))
+
+    async def get_index_version(self, project_id: str) -> int:
+        """Committed version of the project's chunk index (0 before any write)."""
+        result = await self._session.execute(
+            refresh_select_statement(
+                select(MemoryIndexVersion.version).where(
+                    MemoryIndexVersion.project_id == project_id
+                )
+            )
+        )
+        return int(result.scalar_one_or_none() or 0)
+
+    async def _bump_index_version(self, project_id: str) -> int:
+        """Increment the project's index version inside the current transaction.
+
+        The new version becomes visible to other sessions, and so to result
+        caches in every process, only when the chunk write commits.
+        """
+        bumped = _pending_index_writes(self._session).versions
+        version = bumped.get(project_id)
+        if version is not None:
+            return version
+        if self._session.get_bind().dialect.name == "sqlite":
+            statement = sqlite_insert(MemoryIndexVersion)
+        else:
+            statement = pg_insert(MemoryIndexVersion)
+        statement = (
+            statement.values(project_id=project_id, version=1)
+            .on_conflict_do_update(
+                index_elements=[MemoryIndexVersion.project_id],
+                set_={"version": MemoryIndexVersion.version + 1},
+            )
+            .returning(MemoryIndexVersion.version)
+        )
+        result = await self._session.execute(statement)
+        version = bumped[project_id] = int(result.scalar_one())
+        return version
+
     async def find_by_hash(self, content_hash: str, project_id: str) -> MemoryChunk | None:
         """Find a chunk by content hash within a project."""
         query = select(MemoryChunk).where(
@@ -77,7 +244,28 @@ class SqlChunkRepository:
             MemoryChunk.project_id == project_id,
         )
         result = await self._session.execute(refresh_select_statement(stmt))
-        return cast(CursorResult[Any], result).rowcount or 0
+        deleted = cast(CursorResult[Any], result).rowcount or 0
+        if deleted:
+            version = await self._bump_index_version(project_id)
+            cache = get_chunk_vector_cache()
+            self._queue_mirror(
+                project_id,
+                partial(cache.remove_source, project_id, source_type, source_id, version=version),
+            )
+        return deleted
+
+    async def list_embedded_chunks(self, project_id: str, limit: int) -> list[dict[str, Any]]:
+        """Load up to ``limit`` embedded chunks of a project for the vector cache."""
+        query = (
+            select(MemoryChunk)
+            .where(
+                MemoryChunk.project_id == project_id,
+                MemoryChunk.embedding.is_not(None),
+            )
+            .limit(limit)
+        )
+        result = await self._session.execute(refresh_select_statement(query))
+        return [_cache_row(chunk) for chunk in result.scalars().all()]
 
     async def vector_search(
         self,
@@ -111,26 +299,10 @@ class SqlChunkRepository:
             bindparam("qvec_sort", value=vec_str),
             bindparam("project_id", value=project_id),
             bindparam("limit", value=limit),
-            *(
-                [bindparam("category", value=category)]
-                if category
-                else []
-            ),
+            *([bindparam("category", value=category)] if category else []),
         )
         result = await self._session.execute(refresh_select_statement(sql))
-        return [
-            {
-                "id": row.id,
-                "content": row.content,
-                "metadata": row.metadata,
-                "score": float(row.score),
-                "created_at": row.created_at,
-                "category": row.category,
-                "source_type": row.source_type,
-                "source_id": row.source_id,
-            }
-            for row in result.fetchall()
-        ]
+        return [_search_row(row) for row in result.fetchall()]
 
     async def fts_search(
         self,
@@ -156,21 +328,8 @@ class SqlChunkRepository:
                       When None, uses plainto_tsquery('simple', query) as before.
         """
         category_clause = "AND category = :category" if category else ""
-
-        # Build tsquery expression: prefer OR-joined keywords for CJK support
-        if keywords:
-            # Sanitize keywords for to_tsquery: only keep alphanumeric and CJK chars
-            safe_kws = [kw for kw in keywords if kw.strip()]
-            if safe_kws:
-                tsquery_expr = "to_tsquery('simple', :query)"
-                # Build OR-joined tsquery string: 'kw1' | 'kw2' | ...
-                tsquery_value = " | ".join(safe_kws)
-            else:
-                tsquery_expr = "plainto_tsquery('simple', :query)"
-                tsquery_value = query
-        else:
-            tsquery_expr = "plainto_tsquery('simple', :query)"
-            tsquery_value = query
+        tsquery_fn, tsquery_value = _tsquery_for(query, keywords)
+        tsquery_expr = f"{tsquery_fn}('simple', :query)"
 
         sql = text(f"""
             SELECT id, content, metadata, created_at, category,
@@ -197,52 +356,156 @@ class SqlChunkRepository:
 
         # Fallback to ILIKE for CJK/short queries where tsvector fails
         if not rows:
-            # Use pre-extracted keywords if available, else naive split
-            fb_keywords = keywords if keywords else [k.strip() for k in query.split() if len(k.strip()) >= 2]
-            if not fb_keywords:
-                fb_keywords = [query.strip()]
-            # Build OR-based ILIKE conditions for each keyword
-            conditions = " OR ".join(f"content ILIKE :kw{i}" for i in range(len(fb_keywords)))
-            fb_params: dict[str, Any] = {f"kw{i}": f"%{kw}%" for i, kw in enumerate(fb_keywords)}
-            fb_params["project_id"] = project_id
-            fb_params["limit"] = limit
-            fb_category_clause = "AND category = :category" if category else ""
-            if category:
-                fb_params["category"] = category
-            # Compute score as ratio of matched keywords to total keywords
-            keyword_count = len(fb_keywords)
-            match_cases = " + ".join(
-                f"CASE WHEN content ILIKE :kw{i} THEN 1 ELSE 0 END"
-                for i in range(keyword_count)
-            )
-            fb_params["kw_total"] = float(keyword_count)
-            fallback_sql = text(f"""
+            return await self._keyword_fallback_search(query, project_id, limit, category, keywords)
+
+        return [_search_row(row) for row in rows]
+
+    async def _keyword_fallback_search(
+        self,
+        query: str,
+        project_id: str,
+        limit: int,
+        category: str | None,
+        keywords: list[str] | None,
+    ) -> list[dict[str, Any]]:
+        """ILIKE keyword matching, scored by the share of keywords matched."""
+        # Use pre-extracted keywords if available, else naive split
+        fb_keywords = (
+            keywords if keywords else [k.strip() for k in query.split() if len(k.strip()) >= 2]
+        )
+        if not fb_keywords:
+            fb_keywords = [query.strip()]
+        # Build OR-based ILIKE conditions for each keyword
+        conditions = " OR ".join(f"content ILIKE :kw{i}" for i in range(len(fb_keywords)))
+        fb_params: dict[str, Any] = {f"kw{i}": f"%{kw}%" for i, kw in enumerate(fb_keywords)}
+        fb_params["project_id"] = project_id
+        fb_params["limit"] = limit
+        fb_category_clause = "AND category = :category" if category else ""
+        if category:
+            fb_params["category"] = category
+        # Compute score as ratio of matched keywords to total keywords
+        keyword_count = len(fb_keywords)
+        match_cases = " + ".join(
+            f"CASE WHEN content ILIKE :kw{i} THEN 1 ELSE 0 END" for i in range(keyword_count)
+        )
+        fb_params["kw_total"] = float(keyword_count)
+        fallback_sql = text(f"""
+            SELECT id, content, metadata, created_at, category,
+                   source_type, source_id,
+                   ({match_cases}) / :kw_total AS score
+            FROM memory_chunks
+            WHERE project_id = :project_id
+              AND ({conditions})
+              {fb_category_clause}
+            ORDER BY score DESC, created_at DESC
+            LIMIT :limit
+        """)
+        result = await self._session.execute(refresh_select_statement(fallback_sql), fb_params)
+        return [_search_row(row) for row in result.fetchall()]
+
+    async def vector_search_many(
+        self,
+        query_embeddings: list[list[float]],
+        project_id: str,
+        limit: int = 10,
+        category: str | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run several vector searches in one statement.
+
+        Query vectors are joined LATERALly against ``memory_chunks``, so each
+        keeps its own ``ORDER BY ... LIMIT`` (and pgvector index use) while the
+        whole batch costs one round trip. Results are returned per query, in
+        input order.
+        """
+        if not query_embeddings:
+            return []
+        values = ", ".join(
+            f"({i}, CAST(:qvec_{i} AS vector))" for i in range(len(query_embeddings))
+        )
+        category_clause = "AND category = :category" if category else ""
+        sql = text(f"""
+            SELECT q.query_index, c.id, c.content, c.metadata, c.created_at, c.category,
+                   c.source_type, c.source_id, c.score
+            FROM (VALUES {values}) AS q(query_index, qvec)
+            CROSS JOIN LATERAL (
                 SELECT id, content, metadata, created_at, category,
                        source_type, source_id,
-                       ({match_cases}) / :kw_total AS score
+                       1 - (embedding <=> q.qvec) AS score
                 FROM memory_chunks
                 WHERE project_id = :project_id
-                  AND ({conditions})
-                  {fb_category_clause}
-                ORDER BY score DESC, created_at DESC
+                  AND embedding IS NOT NULL
+                  AND vector_dims(embedding) = vector_dims(q.qvec)
+                  {category_clause}
+                ORDER BY embedding <=> q.qvec
                 LIMIT :limit
-            """)
-            result = await self._session.execute(refresh_select_statement(fallback_sql), fb_params)
-            rows = result.fetchall()
+            ) AS c
+            ORDER BY q.query_index, c.score DESC
+        """)
+        params: dict[str, Any] = {
+            f"qvec_{i}": str(embedding) for i, embedding in enumerate(query_embeddings)
+        }
+        params.update(project_id=project_id, limit=limit)
+        if category:
+            params["category"] = category
+        result = await self._session.execute(refresh_select_statement(sql), params)
+        grouped: list[list[dict[str, Any]]] = [[] for _ in query_embeddings]
+        for row in result.fetchall():
+            grouped[row.query_index].append(_search_row(row))
+        return grouped
 
-        return [
-            {
-                "id": row.id,
-                "content": row.content,
-                "metadata": row.metadata,
-                "score": float(row.score),
-                "created_at": row.created_at,
-                "category": row.category,
-                "source_type": row.source_type,
-                "source_id": row.source_id,
-            }
-            for row in rows
-        ]
+    async def fts_search_many(
+        self,
+        queries: list[str],
+        project_id: str,
+        limit: int = 10,
+        category: str | None = None,
+        keywords: list[list[str] | None] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run several full-text searches in one statement.
+
+        Semantics match :meth:`fts_search` per query; queries whose tsquery
+        matches nothing fall back to ILIKE keyword matching individually.
+        """
+        if not queries:
+            return []
+        per_query_keywords = keywords or [None] * len(queries)
+        values: list[str] = []
+        params: dict[str, Any] = {"project_id": project_id, "limit": limit}
+        for i, (query, query_keywords) in enumerate(zip(queries, per_query_keywords, strict=True)):
+            tsquery_fn, tsquery_value = _tsquery_for(query, query_keywords)
+            values.append(f"({i}, {tsquery_fn}('simple', :query_{i}))")
+            params[f"query_{i}"] = tsquery_value
+        category_clause = "AND category = :category" if category else ""
+        if category:
+            params["category"] = category
+        sql = text(f"""
+            SELECT q.query_index, c.id, c.content, c.metadata, c.created_at, c.category,
+                   c.source_type, c.source_id, c.score
+            FROM (VALUES {", ".join(values)}) AS q(query_index, tsq)
+            CROSS JOIN LATERAL (
+                SELECT id, content, metadata, created_at, category,
+                       source_type, source_id,
+                       ts_rank_cd(to_tsvector('simple', content), q.tsq) AS score
+                FROM memory_chunks
+                WHERE project_id = :project_id
+                  AND to_tsvector('simple', content) @@ q.tsq
+                  {category_clause}
+                ORDER BY score DESC
+                LIMIT :limit
+            ) AS c
+            ORDER BY q.query_index, c.score DESC
+        """)
+        result = await self._session.execute(refresh_select_statement(sql), params)
+        grouped: list[list[dict[str, Any]]] = [[] for _ in queries]
+        for row in result.fetchall():
+            grouped[row.query_index].append(_search_row(row))
+
+        for i, rows in enumerate(grouped):
+            if not rows:
+                grouped[i] = await self._keyword_fallback_search(
+                    queries[i], project_id, limit, category, per_query_keywords[i]
+                )
+        return grouped
 
     async def find_similar(
         self,
@@ -283,3 +546,45 @@ class SqlChunkRepository:
             }
             for row in result.fetchall()
         ]
+
+    async def find_similar_many(
+        self,
+        embeddings: list[list[float]],
+        project_id: str,
+        threshold: float = 0.95,
+        limit: int = 1,
+    ) -> list[list[dict[str, Any]]]:
+        """Batched :meth:`find_similar`: one statement for several embeddings.
+
+        Results are returned per embedding, in input order.
+        """
+        if not embeddings:
+            return []
+        values = ", ".join(f"({i}, CAST(:qvec_{i} AS vector))" for i in range(len(embeddings)))
+        sql = text(f"""
+            SELECT q.query_index, c.id, c.content, c.similarity
+            FROM (VALUES {values}) AS q(query_index, qvec)
+            CROSS JOIN LATERAL (
+                SELECT id, content,
+                       1 - (embedding <=> q.qvec) AS similarity
+                FROM memory_chunks
+                WHERE project_id = :project_id
+                  AND embedding IS NOT NULL
+                  AND vector_dims(embedding) = vector_dims(q.qvec)
+                  AND 1 - (embedding <=> q.qvec) >= :threshold
+                ORDER BY embedding <=> q.qvec
+                LIMIT :limit
+            ) AS c
+            ORDER BY q.query_index, c.similarity DESC
+        """)
+        params: dict[str, Any] = {
+            f"qvec_{i}": str(embedding) for i, embedding in enumerate(embeddings)
+        }
+        params.update(project_id=project_id, threshold=threshold, limit=limit)
+        result = await self._session.execute(refresh_select_statement(sql), params)
+        grouped: list[list[dict[str, Any]]] = [[] for _ in embeddings]
+        for row in result.fetchall():
+            grouped[row.query_index].append(
+                {"id": row.id, "content": row.content, "similarity": float(row.similarity)}
+            )
+        return grouped
@@ -1,8 +1,22 @@
-"""Actor manager utilities for Ray-based agent runtime."""
+"""Actor manager utilities for Ray-based agent runtime.
+
+Project agent actor handles are cached per process for
+``ray_actor_handle_ttl_seconds`` so hot paths skip the GCS lookup done by
+``ray.get_actor``.  Idle actors are hibernated by ``hibernate_idle_actors``
+(run periodically from the actor worker): each actor snapshots itself, is
+killed, and is re-created by ``get_or_create_actor`` on the next request.
+The idle threshold is kept at least twice the handle TTL, so a cached handle
+never outlives the actor it points to unless the actor died on its own;
+callers that see an actor call fail should ``invalidate_actor_handle``, or
+use ``chat_with_actor``, which does that and retries once on a fresh actor.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import ray
@@ -15,12 +29,29 @@ from src.infrastructure.adapters.secondary.ray.client import (
     mark_ray_unavailable,
 )
 from src.infrastructure.agent.actor.hitl_router_actor import HITLStreamRouterActor
-from src.infrastructure.agent.actor.project_agent_actor import ProjectAgentActor
-from src.infrastructure.agent.actor.types import ProjectAgentActorConfig
+from src.infrastructure.agent.actor.project_agent_actor import (
+    ACTOR_HIBERNATING_MESSAGE,
+    ProjectAgentActor,
+)
+from src.infrastructure.agent.actor.types import ProjectAgentActorConfig, ProjectChatRequest
 
 logger = logging.getLogger(__name__)
 
 ROUTER_ACTOR_NAME = "hitl-router"
+PROJECT_ACTOR_PREFIX = "agent:"
+_MAX_HIBERNATION_SNAPSHOTS = 1000
+
+# actor_id -> (handle, expires_at monotonic)
+_actor_handles: dict[str, tuple[Any, float]] = {}
+_hibernation_snapshots: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_actor_stats: dict[str, int] = {
+    "handle_hits": 0,
+    "handle_misses": 0,
+    "cold_starts": 0,
+    "hibernations": 0,
+    "live_actors": 0,
+}
+_live_gauge_registered = False
 
 
 async def ensure_router_actor(*, mark_unavailable_on_failure: bool = True) -> Any | None:
@@ -73,22 +104,29 @@ async def get_or_create_actor(
     if not await init_ray_if_needed():
         return None
 
-    settings = get_ray_settings()
     actor_id = ProjectAgentActor.actor_id(tenant_id, project_id, agent_mode)
+    cached = _cached_handle(actor_id)
+    if cached is not None:
+        return cached
 
+    settings = get_ray_settings()
     try:
         try:
             actor = ray.get_actor(actor_id, namespace=settings.ray_namespace)
         except ValueError:
+            started = time.perf_counter()
             actor = ProjectAgentActor.options(  # type: ignore[attr-defined]
                 name=actor_id,
                 namespace=settings.ray_namespace,
                 lifetime="detached",
             ).remote()
             await await_ray(actor.initialize.remote(config, False))
+            _record_cold_start(actor_id, (time.perf_counter() - started) * 1000)
 
+        _cache_handle(actor_id, actor)
         return actor
     except Exception as e:
+        invalidate_actor_handle(actor_id)
         logger.warning(
             "[ActorManager] Ray runtime error in get_or_create_actor: %s. "
             "Falling back to local execution.",
@@ -107,11 +145,16 @@ async def get_actor_if_exists(
     if not is_ray_available():
         return None
 
-    settings = get_ray_settings()
     actor_id = ProjectAgentActor.actor_id(tenant_id, project_id, agent_mode)
+    cached = _cached_handle(actor_id)
+    if cached is not None:
+        return cached
 
+    settings = get_ray_settings()
     try:
-        return ray.get_actor(actor_id, namespace=settings.ray_namespace)
+        actor = ray.get_actor(actor_id, namespace=settings.ray_namespace)
+        _cache_handle(actor_id, actor)
+        return actor
     except ValueError:
         return None
     except Exception as e:
@@ -138,3 +181,204 @@ async def register_project(tenant_id: str, project_id: str) -> None:
     except Exception as e:
         logger.warning("[ActorManager] Failed to register project: %s", e)
         mark_ray_unavailable()
+
+
+def invalidate_actor_handle(actor_id: str | None = None) -> None:
+    """Drop a cached actor handle (or all of them), e.g. after the actor died."""
+    if actor_id is None:
+        _actor_handles.clear()
+    else:
+        _actor_handles.pop(actor_id, None)
+
+
+def is_stale_actor_error(error: BaseException) -> bool:
+    """Whether an actor call failed because the actor was hibernated or died."""
+    return isinstance(error, ray.exceptions.RayActorError) or (
+        ACTOR_HIBERNATING_MESSAGE in str(error)
+    )
+
+
+async def chat_with_actor(
+    actor: Any,
+    request: ProjectChatRequest,
+    config: ProjectAgentActorConfig,
+) -> Any:
+    """Start a chat on a project actor, retrying once on a fresh actor.
+
+    A cached handle can point at an actor that was hibernated or died since
+    it was cached; the handle is then dropped and the actor re-resolved via
+    ``get_or_create_actor`` before the single retry.
+    """
+    actor_id = ProjectAgentActor.actor_id(config.tenant_id, config.project_id, config.agent_mode)
+    try:
+        return await await_ray(actor.chat.remote(request))
+    except Exception as e:
+        invalidate_actor_handle(actor_id)
+        if not is_stale_actor_error(e):
+            raise
+        logger.info(
+            "[ActorManager] Actor %s went away (error_type=%s); retrying on a fresh actor",
+            actor_id,
+            type(e).__name__,
+        )
+    fresh = await get_or_create_actor(
+        config.tenant_id, config.project_id, config.agent_mode, config
+    )
+    if fresh is None:
+        raise RuntimeError(f"Project actor {actor_id} is unavailable")
+    try:
+        return await await_ray(fresh.chat.remote(request))
+    except Exception:
+        invalidate_actor_handle(actor_id)
+        raise
+
+
+def get_actor_manager_stats() -> dict[str, Any]:
+    """Return handle cache, cold start and hibernation counters."""
+    return {
+        **_actor_stats,
+        "cached_handles": len(_actor_handles),
+        "hibernated_snapshots": len(_hibernation_snapshots),
+    }
+
+
+def get_hibernation_snapshot(actor_id: str) -> dict[str, Any] | None:
+    """Return the snapshot taken when an actor was last hibernated."""
+    return _hibernation_snapshots.get(actor_id)
+
+
+def _hibernate_threshold_seconds(settings: Any) -> float:
+    """Idle threshold, never below twice the handle TTL (0 disables)."""
+    threshold = float(settings.ray_actor_idle_hibernate_seconds)
+    if threshold <= 0:
+        return 0.0
+    return max(threshold, 2 * float(settings.ray_actor_handle_ttl_seconds))
+
+
+async def hibernate_idle_actors(idle_threshold_seconds: float | None = None) -> int:
+    """Snapshot and kill project agent actors idle beyond the threshold.
+
+    Returns the number of actors hibernated.
+    """
+    if not is_ray_available():
+        return 0
+
+    settings = get_ray_settings()
+    threshold = (
+        idle_threshold_seconds
+        if idle_threshold_seconds is not None
+        else _hibernate_threshold_seconds(settings)
+    )
+    if threshold <= 0:
+        return 0
+
+    try:
+        named = ray.util.list_named_actors(all_namespaces=True)
+    except Exception as e:
+        logger.warning("[ActorManager] Failed to list actors for hibernation: %s", e)
+        return 0
+
+    actor_ids = [
+        entry["name"]
+        for entry in named
+        if entry.get("namespace") == settings.ray_namespace
+        and entry.get("name", "").startswith(PROJECT_ACTOR_PREFIX)
+    ]
+    hibernated = 0
+    for actor_id in actor_ids:
+        try:
+            actor = ray.get_actor(actor_id, namespace=settings.ray_namespace)
+            snapshot = await await_ray(actor.hibernate.remote(threshold))
+            if snapshot is None:
+                continue
+            ray.kill(actor, no_restart=True)
+        except Exception as e:
+            logger.warning("[ActorManager] Failed to hibernate actor %s: %s", actor_id, e)
+            continue
+        invalidate_actor_handle(actor_id)
+        _hibernation_snapshots[actor_id] = snapshot
+        _hibernation_snapshots.move_to_end(actor_id)
+        while len(_hibernation_snapshots) > _MAX_HIBERNATION_SNAPSHOTS:
+            _hibernation_snapshots.popitem(last=False)
+        hibernated += 1
+        logger.info(
+            "[ActorManager] Hibernated actor %s after %.0fs idle",
+            actor_id,
+            snapshot.get("idle_seconds", 0.0),
+        )
+
+    _actor_stats["hibernations"] += hibernated
+    _actor_stats["live_actors"] = len(actor_ids) - hibernated
+    _register_live_actor_gauge()
+    if hibernated:
+        from src.infrastructure.telemetry.metrics import increment_counter
+
+        increment_counter(
+            "ray_project_actor_hibernations_total",
+            "Project agent actors hibernated after idling",
+            amount=hibernated,
+        )
+    return hibernated
+
+
+async def run_actor_hibernation_loop() -> None:
+    """Periodically hibernate idle project agent actors (runs until cancelled)."""
+    settings = get_ray_settings()
+    interval = max(1.0, float(settings.ray_actor_hibernate_interval_seconds))
+    if _hibernate_threshold_seconds(settings) <= 0:
+        logger.info("[ActorManager] Actor hibernation disabled")
+        await asyncio.Event().wait()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await hibernate_idle_actors()
+        except Exception as e:
+            logger.warning("[ActorManager] Hibernation sweep failed: %s", e)
+
+
+def _cached_handle(actor_id: str) -> Any | None:
+    entry = _actor_handles.get(actor_id)
+    if entry is not None:
+        handle, expires_at = entry
+        if time.monotonic() < expires_at:
+            _actor_stats["handle_hits"] += 1
+            return handle
+        del _actor_handles[actor_id]
+    _actor_stats["handle_misses"] += 1
+    return None
+
+
+def _cache_handle(actor_id: str, handle: Any) -> None:
+    ttl = float(get_ray_settings().ray_actor_handle_ttl_seconds)
+    if ttl > 0:
+        _actor_handles[actor_id] = (handle, time.monotonic() + ttl)
+
+
+def _record_cold_start(actor_id: str, elapsed_ms: float) -> None:
+    from src.infrastructure.telemetry.metrics import record_histogram_value
+
+    _actor_stats["cold_starts"] += 1
+    logger.info("[ActorManager] Cold-started actor %s in %.0fms", actor_id, elapsed_ms)
+    record_histogram_value(
+        "ray_project_actor_cold_start_ms",
+        "Time to create and initialize a project agent actor",
+        elapsed_ms,
+    )
+
+
+def _register_live_actor_gauge() -> None:
+    """Expose the live actor count seen by the last sweep as a gauge (once)."""
+    global _live_gauge_registered
+    if _live_gauge_registered:
+        return
+    _live_gauge_registered = True
+
+    from opentelemetry.metrics import Observation
+
+    from src.infrastructure.telemetry.metrics import create_gauge
+
+    create_gauge(
+        "ray_project_actors_live",
+        "Project agent actors alive at the last hibernation sweep",
+        [lambda _options: [Observation(_actor_stats["live_actors"])]],  # type: ignore[list-item]
+    )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -37,6 +38,10 @@ from src.infrastructure.llm.initializer import initialize_default_llm_providers
 
 logger = logging.getLogger(__name__)
 
+# Raised by calls that reach an actor after it was hibernated; the caller
+# should drop its handle and get a fresh actor.
+ACTOR_HIBERNATING_MESSAGE = "Actor is hibernating"
+
 
 @ray.remote(max_restarts=5, max_task_retries=3, max_concurrency=10)  # type: ignore[call-overload]
 class ProjectAgentActor:
@@ -56,6 +61,8 @@ class ProjectAgentActor:
         self._conversation_locks: dict[str, asyncio.Lock] = {}
         self._current_conversation_id: str | None = None
         self._current_message_id: str | None = None
+        self._last_activity = time.monotonic()
+        self._hibernating = False
 
     @staticmethod
     def actor_id(tenant_id: str, project_id: str, agent_mode: str) -> str:
@@ -65,6 +72,7 @@ class ProjectAgentActor:
         self, config: ProjectAgentActorConfig, force_refresh: bool = False
     ) -> dict[str, Any]:
         """Initialize the ProjectReActAgent instance."""
+        self._touch()
         async with self._init_lock:
             await self._bootstrap_runtime()
             self._config = config
@@ -118,6 +126,7 @@ class ProjectAgentActor:
 
     async def chat(self, request: ProjectChatRequest) -> dict[str, Any]:
         """Start a chat execution in the background."""
+        self._touch()
         if not self._agent:
             if not self._config:
                 raise RuntimeError("Actor config not set")
@@ -142,6 +151,7 @@ class ProjectAgentActor:
         message_id: str | None = None,
     ) -> dict[str, Any]:
         """Continue a paused chat after HITL response."""
+        self._touch()
         if not self._agent:
             if not self._config:
                 raise RuntimeError("Actor config not set")
@@ -199,7 +209,11 @@ class ProjectAgentActor:
         return cancelled
 
     async def status(self) -> ProjectAgentStatus:
-        """Return current actor status."""
+        """Return current actor status.
+
+        Does not count as activity, so status polling never keeps an otherwise
+        idle actor from hibernating.
+        """
         agent_status = self._agent.get_status() if self._agent else None
         now = datetime.now(UTC)
         uptime_seconds = (now - self._created_at).total_seconds()
@@ -245,6 +259,36 @@ class ProjectAgentActor:
             self._agent = None
         return True
 
+    async def hibernate(self, idle_threshold_seconds: float) -> dict[str, Any] | None:
+        """Snapshot and stop the agent if idle beyond the threshold.
+
+        Returns the snapshot, after which the caller kills the actor, or None
+        when the actor is busy or was used recently.  Conversation and HITL
+        state already live in Postgres/Redis, so the snapshot only records the
+        config and counters needed to describe the actor that went away.
+        """
+        idle_seconds = time.monotonic() - self._last_activity
+        busy = any(not task.done() for task in self._tasks.values())
+        if busy or idle_seconds < idle_threshold_seconds:
+            return None
+
+        self._hibernating = True
+        agent_status = self._agent.get_status() if self._agent else None
+        snapshot = {
+            "config": self._config,
+            "idle_seconds": idle_seconds,
+            "created_at": self._created_at.isoformat(),
+            "total_chats": agent_status.total_chats if agent_status else 0,
+            "failed_chats": agent_status.failed_chats if agent_status else 0,
+        }
+        await self.shutdown()
+        return snapshot
+
+    def _touch(self) -> None:
+        if self._hibernating:
+            raise RuntimeError(f"{ACTOR_HIBERNATING_MESSAGE}; retry to get a fresh actor")
+        self._last_activity = time.monotonic()
+
     async def _run_chat(
         self,
         request: ProjectChatRequest,
@@ -36,6 +36,7 @@ from src.infrastructure.agent.context.compression_engine import (
     ContextCompressionEngine,
 )
 from src.infrastructure.agent.context.compression_state import CompressionLevel
+from src.infrastructure.llm.prompt_cache import count_cached_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -631,12 +632,13 @@ Summary:"""
         cache_read = 0
         cache_write = 0
 
-        for msg in messages:
+        # A prompt-cache breakpoint (message- or block-level ``cache_control``)
+        # caches the whole prefix up to it, not just the marked message.
+        cached_prefix = count_cached_prefix(messages)
+        for index, msg in enumerate(messages):
             msg_tokens = self.estimate_message_tokens(msg)
             total += msg_tokens
-
-            # Check for cached tokens (e.g., from Anthropic's prompt caching)
-            if msg.get("cache_control"):
+            if index < cached_prefix:
                 cache_read += msg_tokens
 
         return TokenCount(
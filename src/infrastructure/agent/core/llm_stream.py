@@ -632,6 +632,23 @@ class LLMStream:
         kwargs = self.config.to_litellm_kwargs()
         kwargs["messages"] = messages
 
+        # Canonicalize the prefix and place prompt-cache breakpoints
+        from src.configuration.config import get_settings
+        from src.infrastructure.llm.prompt_cache import (
+            get_prompt_cache_planner,
+            supports_cache_breakpoints,
+        )
+
+        cache_plan = get_prompt_cache_planner().plan(
+            messages,
+            kwargs.get("tools"),
+            breakpoints_enabled=get_settings().llm_prompt_cache_enabled
+            and supports_cache_breakpoints(self.config.get_provider(), kwargs["model"]),
+        )
+        kwargs["messages"] = cache_plan.messages
+        if cache_plan.tools:
+            kwargs["tools"] = cache_plan.tools
+
         # Clamp max_tokens to model-specific limits
         from src.infrastructure.llm.model_registry import clamp_max_tokens as _clamp_max_tokens
 
@@ -1099,6 +1116,7 @@ class LLMStream:
         Handles different provider formats:
         - OpenAI: prompt_tokens, completion_tokens
         - Anthropic: input_tokens, output_tokens, cache_read_input_tokens
+        - OpenAI: prompt_tokens_details.cached_tokens (automatic prefix caching)
         - Claude extended thinking: reasoning_tokens
 
         Args:
@@ -1138,6 +1156,13 @@ class LLMStream:
         if hasattr(usage, "cache_creation_input_tokens"):
             result["cache_write_tokens"] = getattr(usage, "cache_creation_input_tokens", 0) or 0
 
+        # OpenAI-style automatic prefix caching
+        if not result["cache_read_tokens"]:
+            prompt_details = getattr(usage, "prompt_tokens_details", None)
+            cached = getattr(prompt_details, "cached_tokens", None) if prompt_details else None
+            if isinstance(cached, int) and cached > 0:
+                result["cache_read_tokens"] = cached
+
         return result
 
 
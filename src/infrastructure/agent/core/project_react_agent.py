@@ -884,6 +884,21 @@ class ProjectReActAgent:
                 f"{execution_time_ms:.1f}ms, events={event_count}"
             )
 
+    def _prefetch_memory_recall(self, user_message: str) -> None:
+        """Speculatively start memory recall for an accepted message."""
+        memory_runtime = getattr(self._react_agent, "_memory_runtime", None)
+        prefetch = getattr(memory_runtime, "prefetch_recall", None)
+        if prefetch is None:
+            return
+        try:
+            prefetch(user_message=user_message, project_id=self.config.project_id)
+        except Exception as e:
+            logger.debug(
+                "ProjectReActAgent[%s]: Memory recall prefetch failed error_type=%s",
+                self.project_key,
+                type(e).__name__,
+            )
+
     async def execute_chat(  # noqa: PLR0913
         self,
         conversation_id: str,
@@ -937,6 +952,10 @@ class ProjectReActAgent:
             yield guard_error
             return
 
+        # Start memory recall now so it overlaps session setup (routing, skill
+        # loading, tool selection) instead of delaying the first token.
+        self._prefetch_memory_recall(user_message)
+
         start_time = time.time()
         effective_tenant_id = tenant_id or self.config.tenant_id
         notifier = get_websocket_notifier()
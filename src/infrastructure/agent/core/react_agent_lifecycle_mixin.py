@@ -57,6 +57,8 @@ class _LifecycleAgent(Protocol):
     _tool_selection_pipeline: Any
     _tool_selection_max_tools: Any
     _tool_selection_semantic_backend: Any
+    _tool_embedding_ranker: Any
+    _graph_service: Any
     _router_mode_tool_count_threshold: Any
     _tool_policy_layers: Any
     _last_tool_selection_trace: Any
@@ -95,6 +97,7 @@ class _LifecycleAgent(Protocol):
     _use_dynamic_tools: Any
 
     def _get_current_tools(self, *args: Any, **kwargs: Any) -> Any: ...
+    def _build_tool_embedding_ranker(self, backend: str) -> Any: ...
     def _get_subagent_observability_stats(self, *args: Any, **kwargs: Any) -> Any: ...
     def _execute_subagent(self, *args: Any, **kwargs: Any) -> Any: ...
     def _launch_subagent_session(self, *args: Any, **kwargs: Any) -> Any: ...
@@ -123,12 +126,24 @@ class LifecycleMixin:
         if normalized_backend not in {"keyword", "token_vector", "embedding_vector"}:
             normalized_backend = "token_vector"
         self._tool_selection_semantic_backend = normalized_backend
+        self._tool_embedding_ranker = self._build_tool_embedding_ranker(normalized_backend)
         self._router_mode_tool_count_threshold = max(1, int(router_mode_tool_count_threshold))
         self._tool_policy_layers = normalize_policy_layers(
             {"policy_layers": dict(tool_policy_layers or {})}
         )
         self._last_tool_selection_trace: tuple[Any, ...] = ()
 
+    def _build_tool_embedding_ranker(self: _LifecycleAgent, backend: str) -> Any:
+        """Create the embedding tool ranker when the graph service has an embedder."""
+        if backend != "embedding_vector":
+            return None
+        embedding_service = getattr(getattr(self, "_graph_service", None), "embedder", None)
+        if embedding_service is None or not getattr(embedding_service, "embedding_dim", 0):
+            return None
+        from .tool_embedding_ranker import EmbeddingToolRanker
+
+        return EmbeddingToolRanker(embedding_service)
+
     def _init_memory_hooks(
         self: _LifecycleAgent,
         *,
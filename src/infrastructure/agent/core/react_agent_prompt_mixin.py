@@ -50,6 +50,10 @@ class _PromptAgent(Protocol):
     _tool_policy_layers: dict[str, dict[str, Any]]
     _tool_selection_max_tools: int
     _tool_selection_semantic_backend: str
+    _tool_embedding_ranker: Any
+    _use_dynamic_tools: bool
+    _tool_provider: Any
+    raw_tools: dict[str, Any]
     _stream_memory_context: Any
 
     def _get_current_tools(
@@ -132,6 +136,8 @@ class PromptMixin:
             if isinstance(trace_id, str) and trace_id:
                 metadata["trace_id"] = trace_id
             metadata["routing_metadata"] = dict(routing_metadata)
+        if self._tool_embedding_ranker is not None:
+            metadata["embedding_ranker"] = self._tool_embedding_ranker
         if self._tool_policy_layers:
             metadata["policy_layers"] = policy_context.to_mapping()
         return ToolSelectionContext(
@@ -141,6 +147,30 @@ class PromptMixin:
             policy_context=policy_context,
         )
 
+    async def _prepare_tool_embedding_ranker(
+        self: _PromptAgent,
+        selection_context: ToolSelectionContext,
+    ) -> None:
+        """Embed the user turn and any new tool schemas before selection runs.
+
+        Only user MCP tools are subject to semantic pruning, and only when the
+        toolset exceeds the selection budget, so other turns skip embedding.
+        """
+        ranker = self._tool_embedding_ranker
+        if ranker is None:
+            return
+        if self._use_dynamic_tools and self._tool_provider is not None:
+            raw_tools = self._tool_provider()
+        else:
+            raw_tools = self.raw_tools
+        if len(raw_tools) <= self._tool_selection_max_tools:
+            return
+        candidates = {name: tool for name, tool in raw_tools.items() if name.startswith("mcp__")}
+        if not candidates:
+            return
+        user_message = str(selection_context.metadata.get("user_message") or "")
+        await ranker.prepare(candidates, user_message)
+
     async def _build_system_prompt(  # noqa: PLR0913
         self: _PromptAgent,
         user_query: str,
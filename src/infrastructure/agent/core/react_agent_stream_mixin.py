@@ -274,6 +274,10 @@ class _StreamAgent(Protocol):
         deny_tools: list[str] | None = ...,
     ) -> ToolSelectionContext: ...
 
+    async def _prepare_tool_embedding_ranker(
+        self, selection_context: ToolSelectionContext
+    ) -> None: ...
+
     def _extract_sandbox_id_from_tools(self) -> str | None: ...
 
     def _convert_domain_event(
@@ -1694,6 +1698,9 @@ class StreamMixin:
                 f"injecting into selection context for pipeline pinning"
             )
 
+        # Phase 6c: Warm the embedding tool ranker (selection itself is sync)
+        await self._prepare_tool_embedding_ranker(selection_context)
+
         # Phase 7: Memory runtime prompt augmentation
         memory_context, hook_events = await self._apply_before_prompt_build_hook(
             processed_user_message=processed_user_message,
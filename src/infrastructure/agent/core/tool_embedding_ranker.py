@@ -0,0 +1,387 @@
+"""Embedding-backed semantic tool ranker.
+
+Implements the ``embedding_vector`` backend of
+:class:`~src.infrastructure.agent.core.tool_selector.SemanticToolRanker`.
+Tool ``name + description`` texts are embedded once per tool-schema version
+and kept in a process-wide cache, so new sessions over the same MCP servers
+reuse the vectors. Each turn only embeds the latest user message; ranking
+is a single NumPy matrix-vector product over unit-normalized vectors.
+
+Embedding is async while ``rank_tools`` is synchronous (it runs inside the
+selection pipeline), so callers warm the ranker with :meth:`prepare` before
+selecting tools. A ranker that was not prepared for the current query
+falls back to the deterministic score order.
+
+:func:`evaluate_tool_recall` replays recorded turns offline and reports how
+many of the tools the agent actually used survived selection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.infrastructure.agent.core.tool_selector import (
+    CORE_TOOLS,
+    ToolSelectionContext,
+    ToolSelector,
+)
+
+if TYPE_CHECKING:
+    from src.infrastructure.graph.embedding.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on text sent to the embedder per tool / per query.
+_MAX_TOOL_TEXT_CHARS = 1000
+_MAX_QUERY_CHARS = 2000
+
+
+def tool_schema_version(name: str, tool: Any) -> str:  # noqa: ANN401
+    """Stable hash of the parts of a tool schema that affect its embedding.
+
+    Includes the parameters schema so a server upgrade that changes a tool's
+    signature (but keeps its name) re-embeds it.
+    """
+    payload = json.dumps(
+        {
+            "name": name,
+            "description": _tool_description(tool),
+            "parameters": _tool_parameters(tool),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def tool_embedding_text(name: str, tool: Any) -> str:  # noqa: ANN401
+    """Text embedded for a tool: a readable name plus its description."""
+    readable_name = name.replace("__", " ").replace("_", " ").strip()
+    description = _tool_description(tool)
+    text = f"{readable_name}: {description}" if description else readable_name
+    return text[:_MAX_TOOL_TEXT_CHARS]
+
+
+def latest_user_turn(context: ToolSelectionContext) -> str:
+    """Return the latest user message the selection is made for."""
+    for message in reversed(context.conversation_history):
+        if message.get("role") == "user":
+            content = str(message.get("content") or "").strip()
+            if content:
+                return content[:_MAX_QUERY_CHARS]
+    metadata = context.metadata if isinstance(context.metadata, Mapping) else {}
+    return str(metadata.get("user_message") or "").strip()[:_MAX_QUERY_CHARS]
+
+
+def _tool_description(tool: Any) -> str:  # noqa: ANN401
+    return str(getattr(tool, "description", "") or "").strip()
+
+
+def _tool_parameters(tool: Any) -> Any:  # noqa: ANN401
+    parameters = getattr(tool, "parameters", None)
+    if parameters is None and hasattr(tool, "get_parameters_schema"):
+        try:
+            parameters = tool.get_parameters_schema()
+        except Exception:
+            parameters = None
+    return parameters
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray | None:
+    array = np.asarray(vector, dtype=np.float32)
+    if array.ndim != 1 or array.size == 0:
+        return None
+    norm = float(np.linalg.norm(array))
+    if norm == 0.0 or not np.isfinite(norm):
+        return None
+    return array / norm
+
+
+def _embedding_model_key(embedding_service: Any) -> str:  # noqa: ANN401
+    """Identify the embedding space so vectors from different models never mix."""
+    embedder = getattr(embedding_service, "_embedder", embedding_service)
+    config = getattr(embedder, "config", None)
+    model = (
+        getattr(config, "embedding_model", None)
+        or getattr(embedder, "model", None)
+        or type(embedder).__qualname__
+    )
+    dim = getattr(embedding_service, "embedding_dim", 0)
+    return f"{model}:{dim}"
+
+
+class ToolVectorCache:
+    """Process-wide LRU of unit tool vectors keyed by (model, schema version)."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self._max_entries = max(1, max_entries)
+        self._vectors: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def get(self, model_key: str, version: str) -> np.ndarray | None:
+        vector = self._vectors.get((model_key, version))
+        if vector is None:
+            self.misses += 1
+            return None
+        self._vectors.move_to_end((model_key, version))
+        self.hits += 1
+        return vector
+
+    def put(self, model_key: str, version: str, vector: np.ndarray) -> None:
+        self._vectors[(model_key, version)] = vector
+        self._vectors.move_to_end((model_key, version))
+        while len(self._vectors) > self._max_entries:
+            self._vectors.popitem(last=False)
+
+    def clear(self) -> None:
+        self._vectors.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class EmbeddingToolRanker:
+    """Rank tools by cosine similarity between tool and user-turn embeddings."""
+
+    name = "embedding_vector"
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        *,
+        cache: ToolVectorCache | None = None,
+        max_cached_queries: int = 32,
+    ) -> None:
+        self._embedding_service = embedding_service
+        self._cache = cache if cache is not None else get_tool_vector_cache()
+        self._model_key = _embedding_model_key(embedding_service)
+        self._max_cached_queries = max(1, max_cached_queries)
+        self._query_vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    @property
+    def model_key(self) -> str:
+        return self._model_key
+
+    async def prepare(self, tools: Mapping[str, Any], query: str) -> bool:
+        """Embed uncached tool schemas and the query.
+
+        Returns:
+            True when :meth:`rank_tools` can rank ``query`` by similarity.
+        """
+        query = query.strip()[:_MAX_QUERY_CHARS]
+        if not query:
+            return False
+        try:
+            await self._embed_missing_tools(tools)
+            if query not in self._query_vectors:
+                vector = _normalize(await self._embedding_service.embed_text(query))
+                if vector is None:
+                    return False
+                self._query_vectors[query] = vector
+                while len(self._query_vectors) > self._max_cached_queries:
+                    self._query_vectors.popitem(last=False)
+            else:
+                self._query_vectors.move_to_end(query)
+        except Exception as exc:
+            logger.warning(
+                "Tool embedding warmup failed, using deterministic ranking error_type=%s",
+                type(exc).__name__,
+            )
+            return False
+        return True
+
+    async def _embed_missing_tools(self, tools: Mapping[str, Any]) -> None:
+        missing: dict[str, str] = {}
+        texts: list[str] = []
+        for name, tool in tools.items():
+            version = tool_schema_version(name, tool)
+            if version in missing or self._cache.get(self._model_key, version) is not None:
+                continue
+            missing[version] = name
+            texts.append(tool_embedding_text(name, tool))
+        if not texts:
+            return
+        vectors = await self._embedding_service.embed_batch(texts)
+        for version, raw_vector in zip(missing, vectors, strict=False):
+            vector = _normalize(raw_vector)
+            if vector is not None:
+                self._cache.put(self._model_key, version, vector)
+        logger.debug("Embedded %d tool schemas for %s", len(texts), self._model_key)
+
+    def rank_tools(
+        self,
+        tools: dict[str, Any],
+        context: ToolSelectionContext,
+        *,
+        score_fallback: Callable[[Any], float],
+    ) -> list[str]:
+        fallback_scores = {name: score_fallback(tool) for name, tool in tools.items()}
+        query_vector = self._query_vectors.get(latest_user_turn(context))
+
+        names: list[str] = []
+        vectors: list[np.ndarray] = []
+        if query_vector is not None:
+            for name, tool in tools.items():
+                vector = self._cache.get(self._model_key, tool_schema_version(name, tool))
+                if vector is not None and vector.shape == query_vector.shape:
+                    names.append(name)
+                    vectors.append(vector)
+
+        similarities: dict[str, float] = {}
+        if vectors and query_vector is not None:
+            scores = np.stack(vectors) @ query_vector
+            similarities = dict(zip(names, scores.tolist(), strict=True))
+
+        order = {name: index for index, name in enumerate(tools)}
+        # Embedded tools rank by similarity; the rest follow in fallback order.
+        return sorted(
+            tools,
+            key=lambda name: (
+                name not in similarities,
+                -similarities.get(name, 0.0),
+                -fallback_scores[name],
+                order[name],
+            ),
+        )
+
+
+_tool_vector_cache: ToolVectorCache | None = None
+
+
+def get_tool_vector_cache() -> ToolVectorCache:
+    """Return the process-wide tool vector cache."""
+    global _tool_vector_cache
+    if _tool_vector_cache is None:
+        _tool_vector_cache = ToolVectorCache()
+    return _tool_vector_cache
+
+
+@dataclass(frozen=True)
+class ToolRecallCase:
+    """One recorded turn: the user message, offered tools and tools used."""
+
+    query: str
+    tools: Mapping[str, str]
+    used_tools: tuple[str, ...]
+    conversation_id: str | None = None
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> ToolRecallCase:
+        """Build a case from a recorded-session JSON object.
+
+        Expected keys: ``user_message``, ``tools`` (list of
+        ``{"name", "description"}`` or a name -> description mapping) and
+        ``used_tools`` (list of tool names).
+        """
+        raw_tools = record.get("tools") or {}
+        if isinstance(raw_tools, Mapping):
+            tools = {str(name): str(desc or "") for name, desc in raw_tools.items()}
+        else:
+            tools = {
+                str(item["name"]): str(item.get("description") or "")
+                for item in raw_tools
+                if isinstance(item, Mapping) and item.get("name")
+            }
+        return cls(
+            query=str(record.get("user_message") or ""),
+            tools=tools,
+            used_tools=tuple(str(name) for name in record.get("used_tools") or ()),
+            conversation_id=record.get("conversation_id"),
+        )
+
+
+@dataclass(frozen=True)
+class ToolRecallReport:
+    """Recall of used tools under a selection budget."""
+
+    cases: int
+    max_tools: int
+    recall: float
+    baseline_recall: float
+    mean_selected: float
+    misses: Mapping[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cases": self.cases,
+            "max_tools": self.max_tools,
+            "recall": round(self.recall, 4),
+            "baseline_recall": round(self.baseline_recall, 4),
+            "mean_selected": round(self.mean_selected, 2),
+            "misses": dict(self.misses),
+        }
+
+
+async def evaluate_tool_recall(
+    cases: Iterable[ToolRecallCase],
+    ranker: EmbeddingToolRanker,
+    *,
+    max_tools: int = 30,
+    always_include: set[str] | None = None,
+) -> ToolRecallReport:
+    """Replay recorded turns and measure recall of the tools actually used.
+
+    Recall is micro-averaged: used tools kept by the selector divided by all
+    used tools. ``baseline_recall`` is the same metric for the deterministic
+    ranker, so the report shows what the embeddings buy at this budget.
+    """
+    selector = ToolSelector()
+    include = set(always_include if always_include is not None else CORE_TOOLS)
+    total_used = kept = baseline_kept = selected_total = count = 0
+    misses: dict[str, int] = {}
+
+    for case in cases:
+        used = {name for name in case.used_tools if name in case.tools}
+        if not used:
+            continue
+        tools = {
+            name: SimpleNamespace(name=name, description=description, parameters=None)
+            for name, description in case.tools.items()
+        }
+        await ranker.prepare(tools, case.query)
+        history = [{"role": "user", "content": case.query}]
+        selected = selector.select_tools(
+            tools,
+            ToolSelectionContext(
+                conversation_history=history,
+                max_tools=max_tools,
+                always_include=include,
+                metadata={"semantic_backend": "embedding_vector", "embedding_ranker": ranker},
+            ),
+        )
+        baseline = selector.select_tools(
+            tools,
+            ToolSelectionContext(
+                conversation_history=history,
+                max_tools=max_tools,
+                always_include=include,
+            ),
+        )
+        count += 1
+        total_used += len(used)
+        kept += len(used & set(selected))
+        baseline_kept += len(used & set(baseline))
+        selected_total += len(selected)
+        for name in used - set(selected):
+            misses[name] = misses.get(name, 0) + 1
+
+    return ToolRecallReport(
+        cases=count,
+        max_tools=max_tools,
+        recall=kept / total_used if total_used else 0.0,
+        baseline_recall=baseline_kept / total_used if total_used else 0.0,
+        mean_selected=selected_total / count if count else 0.0,
+        misses=dict(sorted(misses.items(), key=lambda item: (-item[1], item[0]))),
+    )
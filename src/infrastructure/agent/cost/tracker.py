@@ -31,6 +31,11 @@ class TokenUsage:
         """Total tokens including cache operations."""
         return self.total + self.cache_read + self.cache_write
 
+    @property
+    def uncached_input(self) -> int:
+        """Input tokens not served from the provider prompt cache."""
+        return max(self.input - self.cache_read, 0)
+
     def to_dict(self) -> dict[str, int]:
         """Convert to dictionary."""
         return {
@@ -363,6 +368,26 @@ class CostTracker:
             "call_count": self.call_count,
             "average_cost_per_call": avg_cost,
             "total_tokens": self.total_tokens.to_dict(),
+            "prompt_cache": self.get_prompt_cache_summary(),
+        }
+
+    def get_prompt_cache_summary(self) -> dict[str, Any]:
+        """
+        Get cached vs. uncached input tokens for the session.
+
+        ``input`` is the provider-reported prompt size, which includes the
+        tokens served from the prompt cache (``cache_read``).
+
+        Returns:
+            Summary dict with cached/uncached input tokens and hit ratio
+        """
+        tokens = self.total_tokens
+        hit_ratio = tokens.cache_read / tokens.input if tokens.input > 0 else 0.0
+        return {
+            "cached_input_tokens": tokens.cache_read,
+            "uncached_input_tokens": tokens.uncached_input,
+            "cache_write_tokens": tokens.cache_write,
+            "cache_hit_ratio": round(min(hit_ratio, 1.0), 4),
         }
 
     def reset(self) -> None:
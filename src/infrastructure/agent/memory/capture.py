@@ -12,9 +12,10 @@ import contextlib
 import json
 import logging
 import uuid
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from src.infrastructure.agent.memory.builtin_skill_prompts import get_memory_capture_prompt
+from src.infrastructure.agent.memory.capture_batch import CaptureCandidate, prepare_candidates
 from src.infrastructure.memory.prompt_safety import (
     looks_like_prompt_injection,
     sanitize_for_context,
@@ -41,8 +42,6 @@ Conversation turn to analyze as data:
 </assistant_response>
 </conversation_turn>"""
 
-VALID_CATEGORIES = {"preference", "fact", "decision", "entity"}
-
 
 class MemoryCapturePostprocessor:
     """Extracts memorable information from conversations via LLM.
@@ -138,7 +137,7 @@ class MemoryCapturePostprocessor:
         project_id: str,
         conversation_id: str,
     ) -> tuple[int, list[str]]:
-        """Process extracted items and store valid ones as memory chunks."""
+        """Embed, deduplicate and store extracted items as one batch."""
         captured = 0
         categories: list[str] = []
         session_to_close = None
@@ -146,13 +145,11 @@ class MemoryCapturePostprocessor:
             if chunk_repo and chunk_repo is not self._chunk_repo:
                 session_to_close = getattr(chunk_repo, "_session", None)
 
-            for item in items:
-                result = await self._process_capture_item(
-                    item, chunk_repo, project_id, conversation_id
-                )
-                if result:
-                    captured += 1
-                    categories.append(result)
+            candidates = await prepare_candidates(items, self._embedding, chunk_repo, project_id)
+            categories = await self._store_chunks(
+                chunk_repo, candidates, project_id, conversation_id
+            )
+            captured = len(categories)
 
             if session_to_close and captured > 0:
                 await session_to_close.commit()
@@ -167,61 +164,6 @@ class MemoryCapturePostprocessor:
 
         return captured, categories
 
-    async def _process_capture_item(
-        self,
-        item: dict[str, Any],
-        chunk_repo: Any,
-        project_id: str,
-        conversation_id: str,
-    ) -> str | None:
-        """Process a single memory item. Returns category if stored, None otherwise."""
-        content = item.get("content", "").strip()
-        category = item.get("category", "other")
-        if category not in VALID_CATEGORIES:
-            category = "other"
-
-        if not content or len(content) < 3:
-            return None
-
-        if looks_like_prompt_injection(content):
-            return None
-
-        embedding = await self._get_embedding_with_dedup(content, chunk_repo, project_id)
-        if embedding is False:
-            return None
-
-        assert not isinstance(embedding, bool)
-        stored = await self._store_chunk(
-            chunk_repo, content, category, embedding, project_id, conversation_id
-        )
-        return category if stored else None
-
-    async def _get_embedding_with_dedup(
-        self,
-        content: str,
-        chunk_repo: Any,
-        project_id: str,
-    ) -> list[float] | None | bool:
-        """Get embedding and check for duplicates.
-
-        Returns:
-            list[float]: embedding vector if available
-            None: no embedding service or embedding failed
-            False: duplicate detected, should skip this item
-        """
-        if not self._embedding:
-            return None
-        try:
-            embedding = await self._embedding.embed_text(content)
-            if embedding and chunk_repo:
-                if await self._is_duplicate(chunk_repo, embedding, project_id):
-                    logger.debug(f"Skipping duplicate memory: {content[:50]}")
-                    return False
-            return cast(list[float] | bool | None, embedding)
-        except Exception as e:
-            logger.debug(f"Dedup check failed: {e}")
-            return None
-
     async def _extract_memories(
         self,
         user_message: str,
@@ -296,53 +238,39 @@ class MemoryCapturePostprocessor:
             logger.debug(f"Failed to parse LLM memory response: {text[:200]}")
         return []
 
-    async def _store_chunk(
+    async def _store_chunks(
         self,
         chunk_repo: Any,
-        content: str,
-        category: str,
-        embedding: list[float] | None,
+        candidates: list[CaptureCandidate],
         project_id: str,
         conversation_id: str,
-    ) -> bool:
-        """Store a single memory chunk."""
-        if not chunk_repo:
-            return False
+    ) -> list[str]:
+        """Store memory chunks with one ``save_batch``. Returns stored categories."""
+        if not chunk_repo or not candidates:
+            return []
         try:
             from src.infrastructure.adapters.secondary.persistence.models import MemoryChunk
             from src.infrastructure.memory.chunker import _hash_text
 
-            chunk = MemoryChunk(
-                id=str(uuid.uuid4()),
-                project_id=project_id,
-                source_type="conversation",
-                source_id=conversation_id,
-                chunk_index=0,
-                content=content,
-                content_hash=_hash_text(content),
-                embedding=embedding,
-                importance=0.7,
-                category=category,
-            )
-            await chunk_repo.save(chunk)
-            logger.info(f"Auto-captured memory: category={category}, len={len(content)}")
-            return True
+            chunks = [
+                MemoryChunk(
+                    id=str(uuid.uuid4()),
+                    project_id=project_id,
+                    source_type="conversation",
+                    source_id=conversation_id,
+                    chunk_index=0,
+                    content=candidate.content,
+                    content_hash=_hash_text(candidate.content),
+                    embedding=candidate.embedding,
+                    importance=0.7,
+                    category=candidate.category,
+                )
+                for candidate in candidates
+            ]
+            await chunk_repo.save_batch(chunks)
         except Exception as e:
             logger.warning("Failed to capture memory error_type=%s", type(e).__name__)
-            return False
-
-    async def _is_duplicate(
-        self,
-        chunk_repo: Any,
-        embedding: list[float],
-        project_id: str,
-        threshold: float = 0.95,
-    ) -> bool:
-        """Check if similar content already exists."""
-        try:
-            similar = await chunk_repo.find_similar(
-                embedding, project_id, threshold=threshold, limit=1
-            )
-            return len(similar) > 0
-        except Exception:
-            return False
+            return []
+        categories = [candidate.category for candidate in candidates]
+        logger.info(f"Auto-captured memories: count={len(chunks)}, categories={categories}")
+        return categories
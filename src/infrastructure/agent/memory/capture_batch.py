@@ -0,0 +1,126 @@
+"""Batch preparation of LLM-extracted memory items.
+
+Shared by auto-capture (:mod:`capture`) and pre-compaction flush
+(:mod:`flush`). A batch of extracted items is validated, embedded with one
+``embed_batch_safe`` call, checked against existing chunks with one
+``find_similar_many`` query, and deduplicated against itself with a
+similarity matrix, so storing N items costs one embedding request, one
+duplicate query and one ``save_batch`` instead of N of each.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.infrastructure.memory.chunker import _hash_text
+from src.infrastructure.memory.prompt_safety import looks_like_prompt_injection
+
+if TYPE_CHECKING:
+    from src.infrastructure.graph.embedding.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+VALID_CATEGORIES = {"preference", "fact", "decision", "entity"}
+DUPLICATE_THRESHOLD = 0.95  # cosine similarity at which two memories are the same
+
+
+@dataclass
+class CaptureCandidate:
+    """A validated memory item awaiting storage."""
+
+    content: str
+    category: str
+    embedding: list[float] | None = None
+
+
+def valid_candidates(items: list[dict[str, Any]]) -> list[CaptureCandidate]:
+    """Drop empty, too-short and injection-like items; normalize categories."""
+    candidates: list[CaptureCandidate] = []
+    for item in items:
+        content = str(item.get("content") or "").strip()
+        if len(content) < 3 or looks_like_prompt_injection(content):
+            continue
+        category = item.get("category", "other")
+        if category not in VALID_CATEGORIES:
+            category = "other"
+        candidates.append(CaptureCandidate(content=content, category=category))
+    return candidates
+
+
+def duplicates_within_batch(
+    embeddings: list[list[float] | None],
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> set[int]:
+    """Indices of embeddings that repeat an earlier one in the same batch.
+
+    Vectors are compared per dimension with one cosine similarity matrix; the
+    first occurrence of each near-duplicate group is kept.
+    """
+    by_dim: dict[int, list[int]] = {}
+    for index, embedding in enumerate(embeddings):
+        if embedding:
+            by_dim.setdefault(len(embedding), []).append(index)
+
+    duplicates: set[int] = set()
+    for indices in by_dim.values():
+        if len(indices) < 2:
+            continue
+        matrix = np.asarray([embeddings[i] for i in indices], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms > 0, norms, 1.0)
+        similar = np.triu(matrix @ matrix.T >= threshold, k=1)
+        kept = np.ones(len(indices), dtype=bool)
+        for row in range(len(indices)):
+            if kept[row]:
+                kept &= ~similar[row]
+        duplicates.update(i for i, keep in zip(indices, kept, strict=True) if not keep)
+    return duplicates
+
+
+async def prepare_candidates(
+    items: list[dict[str, Any]],
+    embedding_service: EmbeddingService | None,
+    chunk_repo: Any,  # noqa: ANN401
+    project_id: str,
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> list[CaptureCandidate]:
+    """Validate, embed and deduplicate a batch of extracted memory items.
+
+    Items without an embedding (no service, or embedding failed) are kept and
+    only deduplicated by exact content. A failed duplicate query keeps every
+    item, matching the previous per-item behaviour.
+    """
+    candidates: list[CaptureCandidate] = []
+    seen_hashes: set[str] = set()
+    for candidate in valid_candidates(items):
+        content_hash = _hash_text(candidate.content)
+        if content_hash not in seen_hashes:
+            seen_hashes.add(content_hash)
+            candidates.append(candidate)
+    if not candidates or embedding_service is None:
+        return candidates
+
+    embeddings = await embedding_service.embed_batch_safe([c.content for c in candidates])
+    for candidate, embedding in zip(candidates, embeddings, strict=True):
+        candidate.embedding = list(embedding) if embedding else None
+
+    duplicates = duplicates_within_batch([c.embedding for c in candidates], threshold)
+    embedded = [
+        i for i, c in enumerate(candidates) if c.embedding is not None and i not in duplicates
+    ]
+    if embedded and chunk_repo:
+        try:
+            matches = await chunk_repo.find_similar_many(
+                [candidates[i].embedding for i in embedded], project_id, threshold=threshold
+            )
+            duplicates.update(i for i, found in zip(embedded, matches, strict=True) if found)
+        except Exception as e:
+            logger.debug("Batch duplicate check failed error_type=%s", type(e).__name__)
+
+    if duplicates:
+        logger.debug("Skipping duplicate memories count=%d", len(duplicates))
+    return [c for i, c in enumerate(candidates) if i not in duplicates]
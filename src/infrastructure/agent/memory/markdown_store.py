@@ -19,15 +19,28 @@ Markdown file format::
     ---
 
     {content}
+
+Recall and listing are served from a per-project inverted index (token ->
+files, plus a date-sorted entry list) that is built lazily, kept current by
+:meth:`MarkdownMemoryStore.capture` / :meth:`MarkdownMemoryStore.delete`, and
+persisted as ``{base_dir}/{project_id}/.memory_index.json``. Before each use
+the index compares the recorded modification times of the project and
+conversation directories with the disk and re-reads only directories whose
+files were added or removed (memory files are write-once).
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
 import contextlib
 import hashlib
 import json
 import logging
+import os
+import re
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -35,6 +48,10 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+INDEX_FILE_NAME = ".memory_index.json"
+_INDEX_VERSION = 1
+_TOKEN_RE = re.compile(r"\w+")
+
 
 @dataclass(frozen=True)
 class MemoryEntry:
@@ -57,12 +74,198 @@ class MemoryEntry:
     created_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
 
 
+def _entry_to_json(entry: MemoryEntry, project_dir: Path) -> dict[str, Any]:
+    return {
+        "path": Path(entry.file_path).relative_to(project_dir).as_posix(),
+        "project_id": entry.project_id,
+        "conversation_id": entry.conversation_id,
+        "content": entry.content,
+        "metadata": entry.metadata,
+        "created_at": entry.created_at.isoformat(),
+    }
+
+
+def _entry_from_json(data: dict[str, Any], project_dir: Path) -> MemoryEntry:
+    return MemoryEntry(
+        file_path=str(project_dir / data["path"]),
+        project_id=data["project_id"],
+        conversation_id=data["conversation_id"],
+        content=data["content"],
+        metadata=data["metadata"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+class _ProjectIndex:
+    """Inverted index over one project's memory files.
+
+    Matching keeps the store's substring semantics: every word of the query
+    must occur inside some indexed word of the entry (the posting-list
+    intersection), and the surviving candidates are confirmed with a
+    substring test against the cached lowercase text instead of disk reads.
+    """
+
+    def __init__(self, project_dir: Path) -> None:
+        self.project_dir = project_dir
+        self.project_mtime: int | None = None
+        self.dir_mtimes: dict[str, int | None] = {}
+        self._entries: dict[str, MemoryEntry] = {}
+        self._texts: dict[str, tuple[str, str]] = {}
+        self._by_dir: dict[str, set[str]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._by_date: list[tuple[float, str]] = []
+
+    # --- maintenance -----------------------------------------------------
+
+    def add(self, entry: MemoryEntry) -> None:
+        path = entry.file_path
+        if path in self._entries:
+            self.remove(path)
+        content_lower = entry.content.lower()
+        meta_lower = json.dumps(entry.metadata, ensure_ascii=False).lower()
+        self._entries[path] = entry
+        self._texts[path] = (content_lower, meta_lower)
+        self._by_dir.setdefault(Path(path).parent.name, set()).add(path)
+        for token in set(_TOKEN_RE.findall(content_lower)) | set(_TOKEN_RE.findall(meta_lower)):
+            self._postings.setdefault(token, set()).add(path)
+        bisect.insort(self._by_date, (entry.created_at.timestamp(), path))
+
+    def remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        content_lower, meta_lower = self._texts.pop(path)
+        self._by_dir.get(Path(path).parent.name, set()).discard(path)
+        for token in set(_TOKEN_RE.findall(content_lower)) | set(_TOKEN_RE.findall(meta_lower)):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(path)
+                if not postings:
+                    del self._postings[token]
+        key = (entry.created_at.timestamp(), path)
+        position = bisect.bisect_left(self._by_date, key)
+        if position < len(self._by_date) and self._by_date[position] == key:
+            del self._by_date[position]
+
+    def _drop_dir(self, name: str) -> None:
+        for path in list(self._by_dir.pop(name, set())):
+            self.remove(path)
+        self.dir_mtimes.pop(name, None)
+
+    def refresh(self, parse: Callable[[Path], MemoryEntry | None]) -> bool:
+        """Re-read directories whose mtime changed; returns True if anything did."""
+        changed = False
+        try:
+            project_mtime = self.project_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            changed = bool(self._entries)
+            for name in list(self.dir_mtimes):
+                self._drop_dir(name)
+            self.project_mtime = None
+            return changed
+        if project_mtime != self.project_mtime:
+            self.project_mtime = project_mtime
+            with os.scandir(self.project_dir) as it:
+                names = {e.name for e in it if e.is_dir(follow_symlinks=False)}
+            for name in set(self.dir_mtimes) - names:
+                self._drop_dir(name)
+                changed = True
+            for name in names - set(self.dir_mtimes):
+                self.dir_mtimes[name] = None
+        for name, recorded in list(self.dir_mtimes.items()):
+            conv_dir = self.project_dir / name
+            try:
+                mtime = conv_dir.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._drop_dir(name)
+                changed = True
+                continue
+            if mtime == recorded:
+                continue
+            # Record the mtime before listing: a file added meanwhile bumps it again.
+            self.dir_mtimes[name] = mtime
+            on_disk = {str(md_file) for md_file in conv_dir.glob("*.md")}
+            known = set(self._by_dir.get(name, set()))
+            for path in known - on_disk:
+                self.remove(path)
+            for path in sorted(on_disk - known):
+                entry = parse(Path(path))
+                if entry is not None:
+                    self.add(entry)
+            changed = True
+        return changed
+
+    # --- queries ---------------------------------------------------------
+
+    def newest_first(self) -> list[MemoryEntry]:
+        return [self._entries[path] for _, path in reversed(self._by_date)]
+
+    def search(self, query: str, limit: int) -> list[MemoryEntry]:
+        query_lower = query.lower()
+        candidates: set[str] | None = None
+        for token in sorted(set(_TOKEN_RE.findall(query_lower)), key=len, reverse=True):
+            matching: set[str] = set()
+            for term, postings in self._postings.items():
+                if token in term:
+                    matching |= postings
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+        results: list[MemoryEntry] = []
+        for _, path in reversed(self._by_date):
+            if len(results) >= limit:
+                break
+            if candidates is not None and path not in candidates:
+                continue
+            content_lower, meta_lower = self._texts[path]
+            if query_lower in content_lower or query_lower in meta_lower:
+                results.append(self._entries[path])
+        return results
+
+    # --- persistence -----------------------------------------------------
+
+    def save(self) -> None:
+        data = {
+            "version": _INDEX_VERSION,
+            "project_mtime": self.project_mtime,
+            "dir_mtimes": self.dir_mtimes,
+            "entries": [_entry_to_json(e, self.project_dir) for e in self._entries.values()],
+        }
+        index_path = self.project_dir / INDEX_FILE_NAME
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.debug(f"Failed to persist memory index {index_path}: {e}")
+
+    @classmethod
+    def load(cls, project_dir: Path) -> _ProjectIndex:
+        """Load the persisted index, or return an empty one to be built by refresh."""
+        index = cls(project_dir)
+        try:
+            data = json.loads((project_dir / INDEX_FILE_NAME).read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_VERSION:
+                return index
+            for item in data["entries"]:
+                index.add(_entry_from_json(item, project_dir))
+            index.project_mtime = data["project_mtime"]
+            index.dir_mtimes = dict(data["dir_mtimes"])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable memory index in {project_dir}: {e}")
+            index = cls(project_dir)
+        return index
+
+
 class MarkdownMemoryStore:
     """File-based memory store using markdown files with YAML frontmatter.
 
     Stores each memory as an individual ``.md`` file organised by project
-    and conversation. Retrieval is done via simple keyword matching against
-    file contents -- no external search engine required.
+    and conversation. Retrieval is done via case-insensitive keyword matching
+    served from a per-project inverted index -- no external search engine
+    required.
 
     Args:
         base_dir: Root directory for storing markdown memory files.
@@ -70,6 +273,8 @@ class MarkdownMemoryStore:
 
     def __init__(self, base_dir: str | Path) -> None:
         self._base_dir = Path(base_dir).resolve()
+        self._indexes: dict[str, _ProjectIndex] = {}
+        self._index_lock = threading.Lock()
         logger.info(f"MarkdownMemoryStore initialized (base_dir={self._base_dir})")
 
     async def capture(
@@ -110,6 +315,15 @@ class MarkdownMemoryStore:
         )
 
         await asyncio.to_thread(self._write_file, dir_path, file_path, md_content)
+        entry = MemoryEntry(
+            file_path=str(file_path),
+            project_id=project_id,
+            conversation_id=conversation_id,
+            content=content.strip(),
+            metadata=dict(metadata or {}),
+            created_at=now,
+        )
+        await asyncio.to_thread(self._index_update, project_id, entry.file_path, entry)
         logger.info(f"Memory captured: {file_path}")
         return str(file_path)
 
@@ -137,9 +351,7 @@ class MarkdownMemoryStore:
         if not project_dir.exists():
             return []
 
-        entries = await asyncio.to_thread(self._scan_and_filter, project_dir, query)
-        entries.sort(key=lambda e: e.created_at, reverse=True)
-        return entries[:limit]
+        return await asyncio.to_thread(self._indexed_search, project_id, project_dir, query, limit)
 
     async def list_entries(self, project_id: str) -> list[MemoryEntry]:
         """List all memory entries for a project.
@@ -157,9 +369,7 @@ class MarkdownMemoryStore:
         if not project_dir.exists():
             return []
 
-        entries = await asyncio.to_thread(self._scan_all, project_dir)
-        entries.sort(key=lambda e: e.created_at, reverse=True)
-        return entries
+        return await asyncio.to_thread(self._indexed_entries, project_id, project_dir)
 
     async def delete(self, file_path: str) -> bool:
         """Delete a memory file from disk.
@@ -182,6 +392,8 @@ class MarkdownMemoryStore:
                 logger.debug(f"Memory file not found for deletion: {file_path}")
                 return False
             await asyncio.to_thread(target.unlink)
+            project_id = target.relative_to(self._base_dir).parts[0]
+            await asyncio.to_thread(self._index_update, project_id, str(target), None)
             logger.info(f"Memory deleted: {file_path}")
             return True
         except FileNotFoundError:
@@ -309,44 +521,44 @@ class MarkdownMemoryStore:
             created_at=created_at,
         )
 
-    @classmethod
-    def _scan_all(cls, project_dir: Path) -> list[MemoryEntry]:
-        """Scan all markdown files under a project directory (blocking I/O)."""
-        entries: list[MemoryEntry] = []
+    # --- index access (blocking; called via asyncio.to_thread) -----------
+
+    def _load_index(self, project_id: str, project_dir: Path) -> _ProjectIndex:
+        """Return the project's index, refreshed against the disk (lock held)."""
+        index = self._indexes.get(project_id)
+        if index is None:
+            index = _ProjectIndex.load(project_dir)
+            self._indexes[project_id] = index
         try:
-            for md_file in project_dir.rglob("*.md"):
-                entry = cls._parse_markdown(md_file)
-                if entry is not None:
-                    entries.append(entry)
+            if index.refresh(self._parse_markdown):
+                index.save()
         except FileNotFoundError:
             logger.debug(f"Project directory vanished during scan: {project_dir}")
         except Exception as e:
             logger.warning(f"Error scanning project directory {project_dir}: {e}")
-        return entries
+        return index
 
-    @classmethod
-    def _scan_and_filter(cls, project_dir: Path, query: str) -> list[MemoryEntry]:
-        """Scan markdown files and filter by case-insensitive keyword match.
+    def _indexed_search(
+        self, project_id: str, project_dir: Path, query: str, limit: int
+    ) -> list[MemoryEntry]:
+        with self._index_lock:
+            return self._load_index(project_id, project_dir).search(query, limit)
+
+    def _indexed_entries(self, project_id: str, project_dir: Path) -> list[MemoryEntry]:
+        with self._index_lock:
+            return self._load_index(project_id, project_dir).newest_first()
 
-        Searches both the body content and the metadata for the query string.
+    def _index_update(self, project_id: str, file_path: str, entry: MemoryEntry | None) -> None:
+        """Apply a capture (``entry``) or delete (``None``) to a loaded index.
+
+        Directory mtimes are left untouched, so the next refresh also picks up
+        files other writers added to the same directory in the meantime.
         """
-        query_lower = query.lower()
-        entries: list[MemoryEntry] = []
-        try:
-            for md_file in project_dir.rglob("*.md"):
-                entry = cls._parse_markdown(md_file)
-                if entry is None:
-                    continue
-                # Case-insensitive substring search in content
-                if query_lower in entry.content.lower():
-                    entries.append(entry)
-                    continue
-                # Also search in metadata values
-                meta_str = json.dumps(entry.metadata, ensure_ascii=False).lower()
-                if query_lower in meta_str:
-                    entries.append(entry)
-        except FileNotFoundError:
-            logger.debug(f"Project directory vanished during search: {project_dir}")
-        except Exception as e:
-            logger.warning(f"Error searching project directory {project_dir}: {e}")
-        return entries
+        with self._index_lock:
+            index = self._indexes.get(project_id)
+            if index is None:
+                return
+            if entry is None:
+                index.remove(file_path)
+            else:
+                index.add(entry)
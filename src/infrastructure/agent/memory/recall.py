@@ -2,12 +2,20 @@
 
 Searches memory chunks and knowledge graph before the agent processes
 a user message, injecting relevant context into the system prompt.
+
+Both sources are searched concurrently under one deadline. Recall can also be
+started speculatively when a message is accepted (see :class:`RecallPrefetcher`)
+so that it overlaps agent session setup instead of adding to time-to-first-token.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 from src.infrastructure.memory.prompt_safety import (
@@ -18,6 +26,8 @@ from src.infrastructure.memory.prompt_safety import (
 logger = logging.getLogger(__name__)
 
 _MAX_CONTEXT_CHARS = 4000
+RECALL_DEADLINE_SECONDS = 3.0  # shared budget for the chunk and graph searches
+PREFETCH_TTL_SECONDS = 60.0  # unclaimed speculative recalls are cancelled after this
 _WORKSPACE_BINDING_RE = re.compile(
     r"\[workspace-task-binding\](?P<body>.*?)\[/workspace-task-binding\]",
     re.DOTALL,
@@ -30,6 +40,15 @@ _SECRET_KEY_VALUE_RE = re.compile(
 _BEARER_TOKEN_RE = re.compile(r"(?i)\bbearer\s+[A-Za-z0-9._-]{16,}\b")
 
 
+@dataclass(frozen=True)
+class RecallOutcome:
+    """Result of one recall, independent of the preprocessor's ``last_*`` state."""
+
+    memory_context: str | None = None
+    results: list[dict[str, Any]] = field(default_factory=list)
+    search_ms: int = 0
+
+
 class MemoryRecallPreprocessor:
     """Searches memory before agent processing and formats context.
 
@@ -41,9 +60,11 @@ class MemoryRecallPreprocessor:
         self,
         chunk_search: Any = None,
         graph_search: Any = None,
+        deadline_seconds: float = RECALL_DEADLINE_SECONDS,
     ) -> None:
         self._chunk_search = chunk_search
         self._graph_search = graph_search
+        self._deadline_seconds = deadline_seconds
         # Tracking for event emission
         self.last_results: list[dict[str, Any]] = []
         self.last_search_ms: int = 0
@@ -64,28 +85,26 @@ class MemoryRecallPreprocessor:
         Returns:
             Formatted memory context string, or None if no results.
         """
-        import time
+        outcome = await self.recall_outcome(query, project_id, max_results)
+        self.last_results = outcome.results
+        self.last_search_ms = outcome.search_ms
+        return outcome.memory_context
 
+    async def recall_outcome(
+        self,
+        query: str,
+        project_id: str,
+        max_results: int = 3,
+    ) -> RecallOutcome:
+        """Search memory without touching ``last_*``; safe to run concurrently."""
         if not query or not query.strip():
-            self.last_results = []
-            self.last_search_ms = 0
-            return None
+            return RecallOutcome()
 
         start = time.monotonic()
-        all_results: list[dict[str, Any]] = []
-
-        # Search chunk index (PostgreSQL)
-        chunk_results = await self._search_chunks(query, project_id, max_results)
-        all_results.extend(chunk_results)
-
-        # Search knowledge graph (Neo4j)
-        graph_results = await self._search_graph(query, project_id, max_results)
-        all_results.extend(graph_results)
+        all_results = await self._search_sources(query, project_id, max_results)
 
         if not all_results:
-            self.last_results = []
-            self.last_search_ms = int((time.monotonic() - start) * 1000)
-            return None
+            return RecallOutcome(search_ms=int((time.monotonic() - start) * 1000))
 
         # Filter prompt injections
         safe_results = [r for r in all_results if not looks_like_prompt_injection(r["content"])]
@@ -102,9 +121,7 @@ class MemoryRecallPreprocessor:
             ]
 
         if not safe_results:
-            self.last_results = []
-            self.last_search_ms = int((time.monotonic() - start) * 1000)
-            return None
+            return RecallOutcome(search_ms=int((time.monotonic() - start) * 1000))
 
         # Redact before deduplicating so prompt context and emitted events never
         # expose recalled credentials.
@@ -113,11 +130,36 @@ class MemoryRecallPreprocessor:
         # Sort by score and deduplicate
         unique_results = self._deduplicate_results(redacted_results)
 
-        # Track for event emission
-        self.last_results = unique_results
-        self.last_search_ms = int((time.monotonic() - start) * 1000)
+        return RecallOutcome(
+            memory_context=self._format_context(unique_results),
+            results=unique_results,
+            search_ms=int((time.monotonic() - start) * 1000),
+        )
+
+    async def _search_sources(
+        self, query: str, project_id: str, max_results: int
+    ) -> list[dict[str, Any]]:
+        """Search chunks (PostgreSQL) and graph (Neo4j) concurrently under one deadline.
 
-        return self._format_context(unique_results)
+        A source still running at the deadline is cancelled and contributes
+        nothing; the other source's results are still used.
+        """
+        chunk_task = asyncio.create_task(self._search_chunks(query, project_id, max_results))
+        graph_task = asyncio.create_task(self._search_graph(query, project_id, max_results))
+        done, pending = await asyncio.wait({chunk_task, graph_task}, timeout=self._deadline_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(
+                "Memory recall deadline exceeded pending_sources=%d deadline_s=%.1f",
+                len(pending),
+                self._deadline_seconds,
+            )
+        results: list[dict[str, Any]] = []
+        for task in (chunk_task, graph_task):
+            if task in done:
+                results.extend(task.result())
+        return results
 
     async def _search_chunks(
         self, query: str, project_id: str, max_results: int
@@ -234,6 +276,53 @@ class MemoryRecallPreprocessor:
         return "\n".join(lines)
 
 
+class RecallPrefetcher:
+    """Speculative recalls started at message ingress, claimed once by the prompt build.
+
+    Recall depends only on ``(project_id, query)``, so that pair is the key: a
+    prefetch is used only when the turn ends up recalling exactly the message
+    it was started for. Unclaimed prefetches (the turn skipped recall, or
+    rewrote the query) are cancelled after ``ttl`` seconds.
+    """
+
+    def __init__(self, ttl: float = PREFETCH_TTL_SECONDS) -> None:
+        self._ttl = ttl
+        self._pending: dict[Hashable, tuple[float, asyncio.Task[RecallOutcome]]] = {}
+        self._stats = {"started": 0, "claimed": 0, "discarded": 0}
+
+    def start(self, key: Hashable, recall: Callable[[], Awaitable[RecallOutcome]]) -> None:
+        """Start ``recall`` in the background unless one is already pending for ``key``."""
+        self._discard_expired()
+        if key in self._pending:
+            return
+
+        async def _run() -> RecallOutcome:
+            return await recall()
+
+        self._pending[key] = (time.monotonic(), asyncio.create_task(_run()))
+        self._stats["started"] += 1
+
+    def claim(self, key: Hashable) -> tuple[float, asyncio.Task[RecallOutcome]] | None:
+        """Take the pending prefetch for ``key`` as ``(started_at, task)``, if any."""
+        self._discard_expired()
+        claimed = self._pending.pop(key, None)
+        if claimed is not None:
+            self._stats["claimed"] += 1
+        return claimed
+
+    def _discard_expired(self) -> None:
+        now = time.monotonic()
+        for key, (started_at, task) in list(self._pending.items()):
+            if now - started_at > self._ttl:
+                del self._pending[key]
+                task.cancel()
+                self._stats["discarded"] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Return started/claimed/discarded counters and the pending count."""
+        return {**self._stats, "pending": len(self._pending)}
+
+
 def _extract_workspace_binding_id(text: str) -> str | None:
     """Extract the explicit workspace binding id from a workspace task prompt."""
     if "[workspace-task-binding]" not in text:
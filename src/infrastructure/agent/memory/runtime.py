@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
@@ -15,6 +16,7 @@ from src.domain.events.agent_events import AgentMemoryCapturedEvent, AgentMemory
 
 if TYPE_CHECKING:
     from src.domain.llm_providers.llm_types import LLMClient
+    from src.infrastructure.agent.memory.recall import RecallOutcome
     from src.infrastructure.graph.embedding.embedding_service import EmbeddingService
 
 
@@ -34,6 +36,13 @@ class MemoryRecallService(Protocol):
         max_results: int = 3,
     ) -> str | None: ...
 
+    async def recall_outcome(
+        self,
+        query: str,
+        project_id: str,
+        max_results: int = 3,
+    ) -> RecallOutcome: ...
+
 
 class MemoryCaptureService(Protocol):
     last_categories: list[str]
@@ -116,6 +125,9 @@ class DefaultMemoryRuntime:
         self._embedding_service = getattr(graph_service, "embedder", None)
         self._cached_embedding = self._build_cached_embedding()
         self._memory_recall: MemoryRecallService | None = self._build_memory_recall()
+        from src.infrastructure.agent.memory.recall import RecallPrefetcher
+
+        self._recall_prefetcher = RecallPrefetcher()
         self._memory_capture: MemoryCaptureService | None = self._build_memory_capture()
         self._memory_flush: MemoryFlushRuntimeService | None = self._build_memory_flush()
 
@@ -188,6 +200,20 @@ class DefaultMemoryRuntime:
             logger.debug("Memory runtime flush unavailable: %s", exc)
             return None
 
+    def prefetch_recall(self, *, user_message: str, project_id: str) -> None:
+        """Start recall for an accepted message so it overlaps agent session setup.
+
+        The result is picked up by :meth:`recall_for_prompt` for the same
+        message; if the turn never asks for it, it is discarded.
+        """
+        if self._memory_recall is None or not user_message.strip():
+            return
+        recall = self._memory_recall
+        self._recall_prefetcher.start(
+            (project_id, user_message),
+            lambda: recall.recall_outcome(user_message, project_id),
+        )
+
     async def recall_for_prompt(
         self,
         *,
@@ -198,20 +224,53 @@ class DefaultMemoryRuntime:
         if self._memory_recall is None:
             return MemoryRuntimeResult()
 
-        memory_context = await self._memory_recall.recall(user_message, project_id)
-        if not memory_context or not self._memory_recall.last_results:
+        outcome = await self._claim_prefetched_recall(user_message, project_id)
+        if outcome is None:
+            outcome = await self._memory_recall.recall_outcome(user_message, project_id)
+        memory_context = outcome.memory_context
+        if not memory_context or not outcome.results:
             return MemoryRuntimeResult(memory_context=memory_context)
 
         emitted_event = AgentMemoryRecalledEvent(
-            memories=self._memory_recall.last_results,
-            count=len(self._memory_recall.last_results),
-            search_ms=self._memory_recall.last_search_ms,
+            memories=outcome.results,
+            count=len(outcome.results),
+            search_ms=outcome.search_ms,
         ).to_event_dict()
         return MemoryRuntimeResult(
             memory_context=memory_context,
             emitted_events=[cast(dict[str, Any], emitted_event)],
         )
 
+    async def _claim_prefetched_recall(
+        self, user_message: str, project_id: str
+    ) -> RecallOutcome | None:
+        """Await the prefetched recall for this message, if one was started."""
+        claimed = self._recall_prefetcher.claim((project_id, user_message))
+        if claimed is None:
+            return None
+        started_at, task = claimed
+        claimed_at = time.monotonic()
+        try:
+            outcome = await task
+        except Exception as exc:
+            logger.debug("Prefetched memory recall failed error_type=%s", type(exc).__name__)
+            return None
+        from src.infrastructure.telemetry.metrics import record_histogram_value
+
+        # Recall time the prompt build did not wait for, i.e. TTFT saved.
+        saved_ms = min(outcome.search_ms, int((claimed_at - started_at) * 1000))
+        record_histogram_value(
+            "memory_recall_prefetch_saved_ms",
+            "Recall latency hidden behind agent session setup (time-to-first-token saved)",
+            saved_ms,
+        )
+        logger.debug(
+            "[MemoryRuntime] Used prefetched recall search_ms=%d saved_ms=%d",
+            outcome.search_ms,
+            saved_ms,
+        )
+        return outcome
+
     async def flush_on_context_overflow(
         self,
         *,
@@ -11,9 +11,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import hashlib
 import inspect
+import json
 import logging
+import time
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from threading import RLock
@@ -126,6 +130,14 @@ HOOK_DEFAULT_DESCRIPTION_BY_NAME: dict[str, str] = {
 }
 
 
+# Families whose handler results are discarded; handlers in consecutive runs of
+# these families cannot observe each other and are dispatched concurrently.
+OBSERVE_ONLY_HOOK_FAMILIES: frozenset[str] = frozenset({"observational", "side_effect"})
+
+# Upper bound on cached dispatch plans (hook name x override fingerprint).
+_MAX_HOOK_DISPATCH_PLANS = 512
+
+
 def _normalize_hook_name(value: str) -> str:
     """Normalize a hook name for storage and comparison."""
     return (value or "").strip().lower()
@@ -293,6 +305,44 @@ class _ResolvedHookEntry:
     handler: PluginHookHandler | None = None
 
 
+@dataclass(frozen=True)
+class _HookDispatchPlan:
+    """Compiled, priority-ordered hook entries grouped into execution stages.
+
+    Each stage is either a single mutating entry or a run of consecutive
+    observe-only entries that may execute concurrently.
+    """
+
+    stages: tuple[tuple[_ResolvedHookEntry, ...], ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.stages
+
+
+@dataclass
+class HookDispatchStats:
+    """Dispatch latency for one hook name, covering all of its handlers."""
+
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+
+_EMPTY_DISPATCH_PLAN = _HookDispatchPlan()
+
+
 class AgentPluginRegistry:
     """Registry for plugin-provided capabilities."""
 
@@ -315,6 +365,9 @@ class AgentPluginRegistry:
         self._sandbox_tool_factories: dict[str, list[PluginToolFactory]] = {}
         self._subagent_resolver_factories: dict[str, SubAgentResolverFactory] = {}
         self._plugin_contracts: dict[str, PluginCapabilityContracts] = {}
+        self._hook_version = 0
+        self._hook_dispatch_plans: dict[tuple[str, int, str], _HookDispatchPlan] = {}
+        self._hook_dispatch_stats: dict[str, HookDispatchStats] = {}
 
     def register_plugin_contracts(
         self,
@@ -400,6 +453,8 @@ class AgentPluginRegistry:
                     removed.append("lifecycle_hook")
                 if not lifecycle_handlers:
                     del self._lifecycle_hooks[event_name]
+            if "hook" in removed:
+                self._invalidate_hook_dispatch_plans()
         return removed
 
     def _unregister_plugin_named_capabilities(self, plugin_name: str) -> list[str]:
@@ -653,6 +708,13 @@ class AgentPluginRegistry:
                 default_settings=dict(default_settings or {}),
                 settings_schema=dict(settings_schema or {}),
             )
+            self._invalidate_hook_dispatch_plans()
+
+    def _invalidate_hook_dispatch_plans(self) -> None:
+        """Drop compiled dispatch plans after a hook registration change."""
+        with self._lock:
+            self._hook_version += 1
+            self._hook_dispatch_plans.clear()
 
     def register_command(
         self,
@@ -917,7 +979,8 @@ class AgentPluginRegistry:
     ) -> dict[str, Any]:
         """Build the runtime payload passed to one hook entry."""
         hook_payload = dict(current_payload)
-        hook_payload["hook_settings"] = entry.effective_settings
+        # Copy: entries are cached in dispatch plans and shared across calls.
+        hook_payload["hook_settings"] = dict(entry.effective_settings)
         hook_payload["hook_identity"] = {
             "plugin_name": entry.plugin_name,
             "hook_name": normalized_name,
@@ -1053,12 +1116,118 @@ class AgentPluginRegistry:
         payload: Mapping[str, Any] | None = None,
         runtime_overrides: list[Mapping[str, Any]] | None = None,
     ) -> HookDispatchResult:
-        """Invoke named hook handlers and return the mutated payload."""
+        """Invoke named hook handlers and return the mutated payload.
+
+        Handlers run from a compiled dispatch plan cached per hook name,
+        registry hook version and runtime-override fingerprint. Hooks with no
+        handlers return the caller's payload without copying it.
+        """
         normalized_name = _normalize_hook_name(hook_name)
-        if not normalized_name:
-            return HookDispatchResult(payload=dict(payload or {}))
+        plan = (
+            self._get_hook_dispatch_plan(normalized_name, runtime_overrides)
+            if normalized_name
+            else _EMPTY_DISPATCH_PLAN
+        )
+        if plan.is_empty:
+            return HookDispatchResult(
+                payload=payload if isinstance(payload, dict) else dict(payload or {})
+            )
 
+        started_at = time.perf_counter()
+        current_payload = dict(payload or {})
+        tenant_id = (
+            str(current_payload.get("tenant_id")) if current_payload.get("tenant_id") else None
+        )
+        diagnostics: list[PluginDiagnostic] = []
+        for stage in plan.stages:
+            runnable: list[_ResolvedHookEntry] = []
+            for entry in stage:
+                if not self._is_plugin_enabled(entry.plugin_name, tenant_id=tenant_id):
+                    diagnostics.append(
+                        PluginDiagnostic(
+                            plugin_name=entry.plugin_name,
+                            code="plugin_disabled",
+                            message=f"Skipped disabled plugin: {entry.plugin_name}",
+                            level="info",
+                        )
+                    )
+                    continue
+                if entry.enabled:
+                    runnable.append(entry)
+            if not runnable:
+                continue
+
+            if len(runnable) == 1:
+                outcomes = [
+                    await self._run_hook_entry(runnable[0], current_payload, normalized_name)
+                ]
+            else:
+                # Observe-only stage: results are discarded, so order is irrelevant.
+                outcomes = await asyncio.gather(
+                    *(
+                        self._run_hook_entry(entry, current_payload, normalized_name)
+                        for entry in runnable
+                    )
+                )
+            for entry, (result, diagnostic) in zip(runnable, outcomes, strict=True):
+                if diagnostic is not None:
+                    diagnostics.append(diagnostic)
+                    continue
+                current_payload = self._apply_hook_result_by_family(
+                    current_payload,
+                    result,
+                    hook_family=entry.hook_family,
+                )
+
+        self._record_hook_dispatch_latency(
+            normalized_name,
+            (time.perf_counter() - started_at) * 1000.0,
+        )
+        return HookDispatchResult(payload=current_payload, diagnostics=diagnostics)
+
+    async def _run_hook_entry(
+        self,
+        entry: _ResolvedHookEntry,
+        current_payload: dict[str, Any],
+        normalized_name: str,
+    ) -> tuple[Mapping[str, Any] | None, PluginDiagnostic | None]:
+        """Execute one entry, converting failures into a diagnostic."""
+        hook_payload = self._build_hook_payload(
+            current_payload=current_payload,
+            normalized_name=normalized_name,
+            entry=entry,
+        )
+        try:
+            return await self._execute_hook_entry(entry, hook_payload), None
+        except Exception as exc:
+            return None, PluginDiagnostic(
+                plugin_name=entry.plugin_name,
+                code="hook_handler_failed",
+                message=f"{normalized_name}: {exc}",
+                level="error",
+            )
+
+    def _get_hook_dispatch_plan(
+        self,
+        normalized_name: str,
+        runtime_overrides: list[Mapping[str, Any]] | None,
+    ) -> _HookDispatchPlan:
+        """Return the cached dispatch plan for a hook, compiling it on a miss."""
+        relevant_overrides = [
+            raw_override
+            for raw_override in runtime_overrides or ()
+            if _normalize_hook_name(str(raw_override.get("hook_name", ""))) == normalized_name
+        ]
+        with self._lock:
+            if not relevant_overrides and not self._hook_handlers.get(normalized_name):
+                return _EMPTY_DISPATCH_PLAN
+            version = self._hook_version
+        fingerprint = _override_fingerprint(relevant_overrides)
+        cache_key = (normalized_name, version, fingerprint)
         with self._lock:
+            cached_plan = self._hook_dispatch_plans.get(cache_key)
+            if cached_plan is not None:
+                return cached_plan
             raw_handlers = dict(self._hook_handlers.get(normalized_name, {}))
             raw_metadata = {
                 plugin_name: self._hook_metadata.get((plugin_name, normalized_name))
@@ -1067,7 +1236,7 @@ class AgentPluginRegistry:
 
         override_map, custom_entries = self._collect_runtime_overrides(
             normalized_name,
-            runtime_overrides,
+            relevant_overrides,
         )
         ordered_entries = self._resolve_hook_entries(
             normalized_name=normalized_name,
@@ -1076,50 +1245,43 @@ class AgentPluginRegistry:
             override_map=override_map,
             custom_entries=custom_entries,
         )
-
-        current_payload = dict(payload or {})
-        tenant_id = (
-            str(current_payload.get("tenant_id")) if current_payload.get("tenant_id") else None
-        )
-        diagnostics: list[PluginDiagnostic] = []
-        for entry in ordered_entries:
-            plugin_name = entry.plugin_name
-            if not self._is_plugin_enabled(plugin_name, tenant_id=tenant_id):
-                diagnostics.append(
-                    PluginDiagnostic(
-                        plugin_name=plugin_name,
-                        code="plugin_disabled",
-                        message=f"Skipped disabled plugin: {plugin_name}",
-                        level="info",
-                    )
-                )
-                continue
-            if not entry.enabled:
-                continue
-
-            hook_payload = self._build_hook_payload(
-                current_payload=current_payload,
-                normalized_name=normalized_name,
-                entry=entry,
+        plan = _HookDispatchPlan(stages=_group_dispatch_stages(ordered_entries))
+        with self._lock:
+            # A registration may have raced the compile; only cache current plans.
+            if version == self._hook_version:
+                if len(self._hook_dispatch_plans) >= _MAX_HOOK_DISPATCH_PLANS:
+                    self._hook_dispatch_plans.pop(next(iter(self._hook_dispatch_plans)))
+                self._hook_dispatch_plans[cache_key] = plan
+        return plan
+
+    def _record_hook_dispatch_latency(self, normalized_name: str, elapsed_ms: float) -> None:
+        with self._lock:
+            stats = self._hook_dispatch_stats.get(normalized_name)
+            if stats is None:
+                stats = self._hook_dispatch_stats[normalized_name] = HookDispatchStats()
+            stats.record(elapsed_ms)
+        with contextlib.suppress(Exception):
+            from src.infrastructure.telemetry.metrics import record_histogram_value
+
+            record_histogram_value(
+                "agent_plugin_hook_dispatch_ms",
+                "Latency of one plugin hook dispatch across all of its handlers.",
+                elapsed_ms,
+                attributes={"hook_name": normalized_name},
             )
-            try:
-                result = await self._execute_hook_entry(entry, hook_payload)
-                current_payload = self._apply_hook_result_by_family(
-                    current_payload,
-                    result,
-                    hook_family=entry.hook_family,
-                )
-            except Exception as exc:
-                diagnostics.append(
-                    PluginDiagnostic(
-                        plugin_name=plugin_name,
-                        code="hook_handler_failed",
-                        message=f"{normalized_name}: {exc}",
-                        level="error",
-                    )
-                )
 
-        return HookDispatchResult(payload=current_payload, diagnostics=diagnostics)
+    def get_hook_dispatch_stats(self) -> dict[str, HookDispatchStats]:
+        """Return per-hook dispatch latency for hooks that had handlers to run."""
+        with self._lock:
+            return {
+                hook_name: HookDispatchStats(
+                    calls=stats.calls,
+                    total_ms=stats.total_ms,
+                    max_ms=stats.max_ms,
+                    last_ms=stats.last_ms,
+                )
+                for hook_name, stats in self._hook_dispatch_stats.items()
+            }
 
     async def notify_hook(
         self,
@@ -1503,6 +1665,8 @@ class AgentPluginRegistry:
             self._sandbox_tool_factories.clear()
             self._subagent_resolver_factories.clear()
             self._plugin_contracts.clear()
+            self._hook_dispatch_stats.clear()
+            self._invalidate_hook_dispatch_plans()
 
     def register_config_schema(
         self,
@@ -1586,6 +1750,41 @@ class AgentPluginRegistry:
 _global_plugin_registry = AgentPluginRegistry()
 
 
+def _override_fingerprint(overrides: Sequence[Mapping[str, Any]]) -> str:
+    """Digest runtime overrides so equal override sets share a dispatch plan."""
+    if not overrides:
+        return ""
+    encoded = json.dumps(
+        [dict(override) for override in overrides],
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha1(encoded.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _group_dispatch_stages(
+    entries: Sequence[_ResolvedHookEntry],
+) -> tuple[tuple[_ResolvedHookEntry, ...], ...]:
+    """Group priority-ordered entries into sequential execution stages.
+
+    Consecutive observe-only entries share a stage; every other entry runs
+    alone so mutations stay ordered by priority.
+    """
+    stages: list[tuple[_ResolvedHookEntry, ...]] = []
+    observe_run: list[_ResolvedHookEntry] = []
+    for entry in entries:
+        if entry.hook_family in OBSERVE_ONLY_HOOK_FAMILIES:
+            observe_run.append(entry)
+            continue
+        if observe_run:
+            stages.append(tuple(observe_run))
+            observe_run = []
+        stages.append((entry,))
+    if observe_run:
+        stages.append(tuple(observe_run))
+    return tuple(stages)
+
+
 def _normalize_contract_map(
     contracts: Mapping[str, Sequence[str]],
 ) -> dict[str, tuple[str, ...]]:
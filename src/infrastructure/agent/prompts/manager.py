@@ -10,6 +10,9 @@ Key features:
 - Environment context injection
 - Custom rules loading (.memstack/AGENTS.md, CLAUDE.md)
 - File-based prompt templates with caching
+- Stable-prefix ordering: per-turn sections (memory, environment, workspace
+  state) are emitted after :data:`PROMPT_CACHE_BOUNDARY` so providers can
+  cache everything before it
 """
 
 import logging
@@ -20,6 +23,7 @@ from pathlib import Path
 from typing import Any, ClassVar, cast
 
 from src.infrastructure.agent.prompts.persona import AgentPersona, PersonaSource, PromptReport
+from src.infrastructure.llm.prompt_cache import PROMPT_CACHE_BOUNDARY
 from src.infrastructure.memory.prompt_safety import (
     looks_like_prompt_injection,
     sanitize_for_context,
@@ -160,10 +164,12 @@ class SystemPromptManager:
         4. Tools section
         5. Skills section (skipped when forced skill is active)
         6. Non-forced skill recommendation (confidence-based match)
-        7. Environment context
-        8. Mode reminder (Plan/Build)
-        9. Max steps warning (if applicable)
-        10. Custom rules (.memstack/AGENTS.md)
+        7. Mode reminder (Plan/Build)
+        8. Custom rules (.memstack/AGENTS.md)
+        --- prompt-cache boundary (everything above is stable across turns) ---
+        9. Memory context, heartbeat, workspace context
+        10. Environment context
+        11. Max steps warning (if applicable)
         Args:
             context: The prompt context containing all dynamic information.
             subagent: Optional SubAgent instance. If provided with a
@@ -197,19 +203,14 @@ class SystemPromptManager:
                 "</agent-definition>"
             )
 
-        # 3.7. Heartbeat section (periodic self-check prompt)
-        heartbeat_section = self._build_heartbeat_section(context)
-        if heartbeat_section:
-            sections.append(heartbeat_section)
-
         # 4-6.5. Tools, skills, subagents sections
         self._build_capability_sections(sections, context, is_forced_skill)
-        # 7. Environment context
-        env_context = self._build_environment_context(context)
-        sections.append(env_context)
-        # 7.5-10. Workspace, mode, max steps, custom rules
+        # 7-8. Workspace guidelines, mode, custom rules
         await self._build_trailing_sections(sections, context)
 
+        # 9-11. Per-turn sections after the cache boundary
+        volatile_sections = await self._build_volatile_sections(context)
+
         # Add trailing skill reminder for forced skills (recency bias)
         if is_forced_skill and context.matched_skill:
             skill_name = context.matched_skill.get("name", "")
@@ -225,9 +226,9 @@ class SystemPromptManager:
                 )
                 + "\n</skill-reminder>"
             )
-            sections.append(reminder)
+            volatile_sections.append(reminder)
 
-        prompt = "\n\n".join(filter(None, sections))
+        prompt = self._join_with_cache_boundary(sections, volatile_sections)
 
         # Build diagnostic report
         report = PromptReport(
@@ -268,8 +269,6 @@ class SystemPromptManager:
             if behavioral:
                 sections.append(behavioral)
 
-        if context.memory_context:
-            sections.append(context.memory_context)
         if is_forced_skill:
             skill_injection = self._build_skill_recommendation(context.matched_skill)
             if skill_injection:
@@ -404,9 +403,7 @@ class SystemPromptManager:
         sections: list[str],
         context: PromptContext,
     ) -> None:
-        """Build workspace guidelines, mode reminder, max steps warning, and custom rules."""
-        if context.workspace_context:
-            sections.append(context.workspace_context)
+        """Build workspace guidelines, mode reminder, and custom rules."""
         if context.workspace_authority_active:
             sections.append(
                 "# Workspace Authority Contract\n\n"
@@ -439,12 +436,44 @@ class SystemPromptManager:
         custom_rules = await self._load_custom_rules()
         if mode_reminder:
             sections.append(mode_reminder)
+        if custom_rules:
+            sections.append(custom_rules)
+
+    async def _build_volatile_sections(
+        self,
+        context: PromptContext,
+        include_recall: bool = True,
+    ) -> list[str]:
+        """Build sections that change between turns (memory, environment, step state).
+
+        These are kept after the stable sections so the provider prompt cache
+        can reuse the stable prefix across turns. ``include_recall`` adds the
+        memory and heartbeat sections, which SubAgent prompts do not carry.
+        """
+        sections: list[str] = []
+        if include_recall:
+            if context.memory_context:
+                sections.append(context.memory_context)
+            heartbeat_section = self._build_heartbeat_section(context)
+            if heartbeat_section:
+                sections.append(heartbeat_section)
+        if context.workspace_context:
+            sections.append(context.workspace_context)
+        sections.append(self._build_environment_context(context))
         if context.is_last_step:
             max_steps_warning = await self._load_file("reminders/max_steps.txt")
             if max_steps_warning:
                 sections.append(max_steps_warning)
-        if custom_rules:
-            sections.append(custom_rules)
+        return sections
+
+    @staticmethod
+    def _join_with_cache_boundary(stable: list[str], volatile: list[str]) -> str:
+        """Join stable and volatile sections around the prompt-cache boundary."""
+        stable_text = "\n\n".join(filter(None, stable))
+        volatile_text = "\n\n".join(filter(None, volatile))
+        if stable_text and volatile_text:
+            return f"{stable_text}{PROMPT_CACHE_BOUNDARY}{volatile_text}"
+        return stable_text or volatile_text
 
     async def _wrap_subagent_prompt(
         self,
@@ -466,14 +495,13 @@ class SystemPromptManager:
         """
         sections: list[str] = [subagent_prompt]
 
-        # Add environment context so SubAgent knows workspace, time, step count
-        env_context = self._build_environment_context(context)
-        sections.append(env_context)
-
         # Add trailing sections (workspace guidelines, mode reminder, custom rules)
         await self._build_trailing_sections(sections, context)
 
-        return "\n\n".join(filter(None, sections))
+        # Environment context so SubAgent knows workspace, time, step count
+        volatile_sections = await self._build_volatile_sections(context, include_recall=False)
+
+        return self._join_with_cache_boundary(sections, volatile_sections)
 
     async def _load_base_prompt(self, provider: ModelProvider) -> str:
         """
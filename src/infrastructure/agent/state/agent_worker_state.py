@@ -3547,6 +3547,7 @@ async def get_or_create_skill_loader_tool(  # noqa: C901
                 tenant_id=tenant_id,
                 project_id=project_id,
                 scanner=scanner,
+                lazy_content=True,
             )
 
             # Create SkillService with short-lived DB sessions so DB-persisted evolved
@@ -8,6 +8,7 @@ Submodules:
 * :mod:`progress`   — :class:`ProgressProjectorPort`
 * :mod:`blackboard` — in-memory / redis-backed :class:`BlackboardPort`
 * :mod:`supervisor` — async single-writer :class:`WorkspaceSupervisorPort`
+* :mod:`tick_scheduler` — shared tick workers and workspace shard ring
 * :mod:`repository` — in-memory and SQL :class:`PlanRepositoryPort` impls
 * :mod:`outbox_handlers` — job handlers for durable plan progression
 * :mod:`outbox_worker` — durable worker loop for plan outbox jobs
@@ -41,6 +42,10 @@ from src.infrastructure.agent.workspace_plan.run_controller import (
     WorkspaceRunTickResult,
 )
 from src.infrastructure.agent.workspace_plan.supervisor import WorkspaceSupervisor
+from src.infrastructure.agent.workspace_plan.tick_scheduler import (
+    WorkspaceShardRing,
+    WorkspaceTickScheduler,
+)
 from src.infrastructure.agent.workspace_plan.verifier import (
     AcceptanceCriterionVerifier,
     CmdCriterionRunner,
@@ -68,7 +73,9 @@ __all__ = [
     "WorkspaceRunContract",
     "WorkspaceRunController",
     "WorkspaceRunTickResult",
+    "WorkspaceShardRing",
     "WorkspaceSupervisor",
+    "WorkspaceTickScheduler",
     "build_default_orchestrator",
     "build_sql_orchestrator",
     "make_supervisor_tick_handler",
@@ -27,6 +27,7 @@ from src.infrastructure.agent.workspace_plan.planner import LLMGoalPlanner, Task
 from src.infrastructure.agent.workspace_plan.progress import ProgressProjector
 from src.infrastructure.agent.workspace_plan.repository import InMemoryPlanRepository
 from src.infrastructure.agent.workspace_plan.supervisor import WorkspaceSupervisor
+from src.infrastructure.agent.workspace_plan.tick_scheduler import WorkspaceShardRing
 from src.infrastructure.agent.workspace_plan.verifier import AcceptanceCriterionVerifier
 
 
@@ -79,6 +80,9 @@ def build_default_orchestrator(
         supervisor_decision_provider=supervisor_decision_provider,
         heartbeat_seconds=cfg.heartbeat_seconds,
         max_dispatches_per_tick=cfg.max_dispatches_per_tick,
+        max_concurrent_ticks=cfg.max_concurrent_ticks,
+        shard_ring=WorkspaceShardRing(cfg.supervisor_shards) if cfg.supervisor_shards else None,
+        shard_id=cfg.supervisor_shard_id,
     )
     return WorkspaceOrchestrator(
         planner=planner,
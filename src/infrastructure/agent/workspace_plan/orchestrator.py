@@ -45,6 +45,10 @@ class OrchestratorConfig:
     max_planning_depth: int = 2
     max_subtasks: int = 8
     max_dispatches_per_tick: int = 2
+    max_concurrent_ticks: int = 8
+    # Comma-separated shard ids; empty means this process owns every workspace.
+    supervisor_shards: tuple[str, ...] = ()
+    supervisor_shard_id: str | None = None
 
     @classmethod
     def from_env(cls) -> OrchestratorConfig:
@@ -55,6 +59,13 @@ class OrchestratorConfig:
             max_planning_depth=int(os.getenv("WORKSPACE_V2_MAX_DEPTH", "2")),
             max_subtasks=int(os.getenv("WORKSPACE_V2_MAX_SUBTASKS", "8")),
             max_dispatches_per_tick=int(os.getenv("WORKSPACE_V2_MAX_DISPATCHES_PER_TICK", "2")),
+            max_concurrent_ticks=int(os.getenv("WORKSPACE_V2_MAX_CONCURRENT_TICKS", "8")),
+            supervisor_shards=tuple(
+                shard.strip()
+                for shard in os.getenv("WORKSPACE_V2_SUPERVISOR_SHARDS", "").split(",")
+                if shard.strip()
+            ),
+            supervisor_shard_id=os.getenv("WORKSPACE_V2_SUPERVISOR_SHARD_ID") or None,
         )
 
 
@@ -186,7 +197,7 @@ class WorkspaceOrchestrator:
         # Kick supervisor so it verifies ASAP rather than waiting for heartbeat.
         kick = getattr(self._supervisor, "kick", None)
         if callable(kick):
-            _ = kick(workspace_id)
+            _ = kick(workspace_id, node_id)
 
     async def current_progress(self, workspace_id: str) -> GoalProgress | None:
         plan = await self._repo.get_by_workspace(workspace_id)
@@ -7,7 +7,9 @@ workspace.
 
 from __future__ import annotations
 
-from src.domain.model.workspace_plan import Plan
+from collections.abc import Collection
+
+from src.domain.model.workspace_plan import Plan, PlanStatus
 from src.domain.ports.services.plan_repository_port import PlanRepositoryPort
 
 
@@ -31,6 +33,13 @@ class InMemoryPlanRepository(PlanRepositoryPort):
             return None
         return self._by_id.get(plan_id)
 
+    async def list_workspace_ids(self, statuses: Collection[PlanStatus]) -> list[str]:
+        return [
+            workspace_id
+            for workspace_id, plan_id in self._workspace_to_plan.items()
+            if self._by_id[plan_id].status in statuses
+        ]
+
     async def delete(self, plan_id: str) -> None:
         plan = self._by_id.pop(plan_id, None)
         if plan is not None:
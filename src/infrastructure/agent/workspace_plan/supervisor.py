@@ -2,10 +2,21 @@
 
 Design:
 
-* one asyncio task per ``workspace_id``, single-writer on the plan
+* single-writer per ``workspace_id``: workspaces are multiplexed over a bounded
+  worker set by :class:`~.tick_scheduler.WorkspaceTickScheduler`, which never
+  services one workspace from two workers at once
 * tick loop: ``(progress_ready_nodes → allocate → dispatch → verify → project)``
 * event-driven: a :class:`WorkspaceSupervisor.kick` call triggers an immediate
   out-of-band tick on top of the ``heartbeat_seconds`` timer
+* dirty tracking: kicks mark nodes dirty; a settled plan with no dirty node
+  and no retry coming due is not even loaded, apart from a periodic resync that
+  fingerprints every node to catch writes nobody kicked for. A tick then runs
+  its per-node passes only over the dirty nodes, their transitive dependents
+  and the nodes still waiting to be verified or dispatched
+* sharding: with a :class:`~.tick_scheduler.WorkspaceShardRing`, a supervisor
+  only ticks workspaces its shard owns and periodically claims owned
+  workspaces from the plan repository, so goals started on another shard
+  still end up supervised by their owner
 * idempotent: every step is safe to re-run; callers can always call :meth:`tick`
 
 Ray-actor wrapper is provided by :class:`RaySupervisor` — a thin shell that
@@ -23,9 +34,10 @@ import contextlib
 import logging
 import os
 import re
+import time
 import uuid
-from collections.abc import Awaitable, Callable, Mapping
-from dataclasses import replace
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -84,6 +96,10 @@ from src.infrastructure.agent.workspace_plan.planner import (
     _iteration_phase_for_sequence,
     _planner_node_metadata,
 )
+from src.infrastructure.agent.workspace_plan.tick_scheduler import (
+    WorkspaceShardRing,
+    WorkspaceTickScheduler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +120,12 @@ _PIPELINE_CRITERION_KINDS = {
     CriterionKind.DEPLOYMENT_HEALTH,
     CriterionKind.PREVIEW_E2E,
 }
+# Settled plans (nothing ready, nothing to verify) are revisited this many
+# heartbeats apart; kicks and due retries still wake them immediately.
+_IDLE_HEARTBEAT_MULTIPLIER = 6
+# Every this many skipped visits a settled plan is loaded and fingerprinted
+# anyway, to pick up writes that arrived without a kick (e.g. on another shard).
+_QUIET_VISITS_PER_RESYNC = 3
 _SCRUM_ARTIFACT_BY_PHASE = {
     "research": "product_discovery",
     "plan": "sprint_backlog",
@@ -133,10 +155,25 @@ PlanEventSink = Callable[[str, PlanNode, str, dict[str, Any]], Awaitable[None]]
 TransactionCheckpoint = Callable[[], Awaitable[None]]
 """Persists and releases any transaction held by the caller before slow side effects."""
 
+NodeFingerprint = tuple[object, ...]
+
+
+@dataclass
+class _WorkspaceTickState:
+    """What the supervisor saw at the end of a workspace's last tick."""
+
+    fingerprints: dict[PlanNodeId, NodeFingerprint] = field(default_factory=dict)
+    settled: bool = False
+    dirty: set[PlanNodeId] = field(default_factory=set)
+    full_scan: bool = True
+    pending: frozenset[PlanNodeId] = frozenset()
+    wake_at: datetime | None = None
+    quiet_visits: int = 0
+
 
 class WorkspaceSupervisor(WorkspaceSupervisorPort):
     """Async single-writer supervisor. One instance per process is fine — it
-    keeps per-workspace state in ``self._tasks`` indexed by ``workspace_id``.
+    keeps per-workspace state in ``self._tick_states`` indexed by ``workspace_id``.
     """
 
     def __init__(  # noqa: PLR0913
@@ -157,10 +194,16 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
         transaction_checkpoint: TransactionCheckpoint | None = None,
         heartbeat_seconds: float = 10.0,
         max_dispatches_per_tick: int = 2,
+        max_concurrent_ticks: int = 8,
+        shard_ring: WorkspaceShardRing | None = None,
+        shard_id: str | None = None,
     ) -> None:
         if max_dispatches_per_tick <= 0:
             msg = f"max_dispatches_per_tick must be > 0, got {max_dispatches_per_tick}"
             raise ValueError(msg)
+        if shard_ring is not None and shard_id not in shard_ring.shard_ids:
+            msg = f"shard_id {shard_id!r} is not part of the shard ring"
+            raise ValueError(msg)
         self._repo = plan_repo
         self._allocator = allocator
         self._verifier = verifier
@@ -177,83 +220,288 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
         self._heartbeat = heartbeat_seconds
         self._max_dispatches_per_tick = max_dispatches_per_tick
 
-        self._tasks: dict[str, asyncio.Task[None]] = {}
-        self._kick: dict[str, asyncio.Event] = {}
-        self._stop_flags: dict[str, asyncio.Event] = {}
+        self._shard_ring = shard_ring
+        self._shard_id = shard_id
+        self._scheduler = WorkspaceTickScheduler(
+            self._service_workspace, max_workers=max_concurrent_ticks
+        )
+        self._tick_states: dict[str, _WorkspaceTickState] = {}
+        self._claim_task: asyncio.Task[None] | None = None
+        self._tick_stats: dict[str, float] = {
+            "ticks": 0,
+            "quiet_ticks": 0,
+            "skipped_loads": 0,
+            "foreign_kicks": 0,
+            "nodes_touched": 0,
+            "tick_ms_total": 0.0,
+            "tick_ms_max": 0.0,
+        }
 
     # --- lifecycle ------------------------------------------------------
 
     async def start(self, workspace_id: str) -> None:
-        if workspace_id in self._tasks and not self._tasks[workspace_id].done():
+        if self._shard_ring is not None:
+            self.start_claiming()
+        if self._scheduler.is_registered(workspace_id):
             return
-        stop = asyncio.Event()
-        kick = asyncio.Event()
-        self._stop_flags[workspace_id] = stop
-        self._kick[workspace_id] = kick
-        self._tasks[workspace_id] = asyncio.create_task(
-            self._run(workspace_id, stop, kick),
-            name=f"workspace-supervisor:{workspace_id}",
-        )
+        if not self.owns_workspace(workspace_id):
+            logger.debug(
+                "supervisor shard %s leaves workspace %s to its owner %s",
+                self._shard_id,
+                workspace_id,
+                self._workspace_owner(workspace_id),
+            )
+            return
+        self._tick_states[workspace_id] = _WorkspaceTickState()
+        self._scheduler.register(workspace_id)
         logger.info("supervisor started for workspace %s", workspace_id)
 
     async def stop(self, workspace_id: str) -> None:
-        stop = self._stop_flags.get(workspace_id)
-        task = self._tasks.get(workspace_id)
-        if stop is not None:
-            stop.set()
-        kick = self._kick.get(workspace_id)
-        if kick is not None:
-            kick.set()
-        if task is not None:
-            try:
-                await asyncio.wait_for(task, timeout=5.0)
-            except (TimeoutError, asyncio.CancelledError):
-                task.cancel()
-        self._tasks.pop(workspace_id, None)
-        self._stop_flags.pop(workspace_id, None)
-        self._kick.pop(workspace_id, None)
+        await self._scheduler.unregister(workspace_id)
+        self._tick_states.pop(workspace_id, None)
         logger.info("supervisor stopped for workspace %s", workspace_id)
 
+    async def close(self) -> None:
+        """Stop claiming, every workspace and the shared scheduler workers."""
+        if self._claim_task is not None:
+            self._claim_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._claim_task
+            self._claim_task = None
+        for workspace_id in list(self._tick_states):
+            await self.stop(workspace_id)
+        await self._scheduler.close()
+
     async def is_running(self, workspace_id: str) -> bool:
-        task = self._tasks.get(workspace_id)
-        return task is not None and not task.done()
+        return self._scheduler.is_registered(workspace_id)
 
-    def kick(self, workspace_id: str) -> None:
-        """Event-driven wake: ask the supervisor to tick now, out of band."""
-        kick = self._kick.get(workspace_id)
-        if kick is not None:
-            kick.set()
+    def owns_workspace(self, workspace_id: str) -> bool:
+        """Whether this supervisor's shard is responsible for the workspace."""
+        if self._shard_ring is None:
+            return True
+        return self._shard_ring.owner(workspace_id) == self._shard_id
 
-    # --- core loop -----------------------------------------------------
+    def _workspace_owner(self, workspace_id: str) -> str | None:
+        return self._shard_ring.owner(workspace_id) if self._shard_ring else None
+
+    def start_claiming(self) -> None:
+        """Start the periodic loop that claims this shard's workspaces.
 
-    async def _run(self, workspace_id: str, stop: asyncio.Event, kick: asyncio.Event) -> None:
-        while not stop.is_set():
+        Idempotent; a no-op without a shard ring. Call it once at process
+        boot so a shard picks up goals that were started on another shard.
+        """
+        if self._shard_ring is None:
+            return
+        if self._claim_task is not None and not self._claim_task.done():
+            return
+        self._claim_task = asyncio.create_task(
+            self._claim_loop(), name=f"workspace-supervisor-claim-{self._shard_id}"
+        )
+
+    async def claim_owned_workspaces(self) -> list[str]:
+        """Start every draft or active workspace this shard owns but does not run yet."""
+        if self._shard_ring is None:
+            return []
+        workspace_ids = await self._repo.list_workspace_ids((PlanStatus.DRAFT, PlanStatus.ACTIVE))
+        claimed: list[str] = []
+        for workspace_id in workspace_ids:
+            if self._scheduler.is_registered(workspace_id) or not self.owns_workspace(workspace_id):
+                continue
+            await self.start(workspace_id)
+            claimed.append(workspace_id)
+        if claimed:
+            logger.info("supervisor shard %s claimed %d workspaces", self._shard_id, len(claimed))
+        return claimed
+
+    async def _claim_loop(self) -> None:
+        while True:
             try:
-                report = await self.tick(workspace_id)
-                if report.errors:
-                    logger.warning(
-                        "workspace %s tick errors: %s",
-                        workspace_id,
-                        report.errors,
-                    )
+                await self.claim_owned_workspaces()
             except Exception as exc:
-                logger.exception("supervisor tick failed: %s", exc)
-            with contextlib.suppress(TimeoutError):
-                await asyncio.wait_for(kick.wait(), timeout=self._heartbeat)
-            kick.clear()
+                logger.warning(
+                    "supervisor shard %s failed to claim workspaces: error_type=%s",
+                    self._shard_id,
+                    type(exc).__name__,
+                )
+            await asyncio.sleep(self._heartbeat)
+
+    def kick(self, workspace_id: str, node_id: str | None = None) -> None:
+        """Event-driven wake: ask the supervisor to tick now, out of band.
+
+        ``node_id`` names the node that changed; without it the next tick
+        scans the whole plan. Kicks for a workspace owned by another shard
+        cannot be forwarded; its owner picks the change up on its next resync.
+        """
+        state = self._tick_states.get(workspace_id)
+        if state is None:
+            if not self.owns_workspace(workspace_id):
+                self._tick_stats["foreign_kicks"] += 1
+                logger.debug(
+                    "supervisor shard %s ignores kick for workspace %s owned by %s",
+                    self._shard_id,
+                    workspace_id,
+                    self._workspace_owner(workspace_id),
+                )
+            return
+        if node_id is None:
+            state.full_scan = True
+        else:
+            state.dirty.add(PlanNodeId(node_id))
+        self._scheduler.wake(workspace_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Tick counters, timings and scheduler occupancy."""
+        ticks = self._tick_stats["ticks"]
+        return {
+            **self._tick_stats,
+            "avg_tick_ms": self._tick_stats["tick_ms_total"] / ticks if ticks else 0.0,
+            "settled_workspaces": sum(1 for s in self._tick_states.values() if s.settled),
+            "shard_id": self._shard_id,
+            "scheduler": self._scheduler.get_stats(),
+        }
 
-    async def tick(self, workspace_id: str) -> TickReport:  # noqa: C901, PLR0912, PLR0915
+    # --- core loop -----------------------------------------------------
+
+    async def _service_workspace(self, workspace_id: str) -> float:
+        """One scheduled visit; returns seconds until the next visit.
+
+        A settled plan with no dirty node and no retry due is not loaded at
+        all, except every ``_QUIET_VISITS_PER_RESYNC`` visits. A loaded plan
+        adds nodes whose fingerprint changed to the dirty set and ticks only
+        the nodes that set can affect; the first visit and kicks without a
+        node id tick the whole plan.
+        """
+        state = self._tick_states.setdefault(workspace_id, _WorkspaceTickState())
+        started = time.perf_counter()
+        try:
+            retry_due = state.wake_at is not None and state.wake_at <= datetime.now(UTC)
+            if (
+                state.settled
+                and not state.dirty
+                and not state.full_scan
+                and not retry_due
+                and state.quiet_visits + 1 < _QUIET_VISITS_PER_RESYNC
+            ):
+                state.quiet_visits += 1
+                self._tick_stats["skipped_loads"] += 1
+                self._record_tick(started, nodes_touched=0, quiet=True)
+                return self._next_visit_delay(state)
+
+            state.quiet_visits = 0
+            plan = await self._repo.get_by_workspace(workspace_id)
+            if plan is None or plan.status not in (PlanStatus.ACTIVE, PlanStatus.DRAFT):
+                state.settled = False
+                return self._heartbeat
+
+            dirty = state.dirty | _dirty_node_ids(state.fingerprints, _plan_fingerprints(plan))
+            full_scan = state.full_scan
+            state.dirty, state.full_scan = set(), False
+            if state.settled and not dirty and not full_scan and not retry_due:
+                self._record_tick(started, nodes_touched=0, quiet=True)
+                return self._next_visit_delay(state)
+
+            scope = None if full_scan else _tick_scope(plan, dirty | state.pending)
+            report = await self._tick_plan(workspace_id, plan, scope=scope)
+            self._record_tick(
+                started,
+                nodes_touched=len(plan.nodes) if scope is None else len(scope),
+                quiet=False,
+            )
+            if report.errors:
+                logger.warning(
+                    "workspace %s tick errors: %s",
+                    workspace_id,
+                    report.errors,
+                )
+        except Exception as exc:
+            state.settled = False
+            state.full_scan = True
+            logger.exception("supervisor tick failed: %s", exc)
+            return self._heartbeat
+        return self._next_visit_delay(state)
+
+    def _next_visit_delay(self, state: _WorkspaceTickState) -> float:
+        if not state.settled:
+            return self._heartbeat
+        delay = self._heartbeat * _IDLE_HEARTBEAT_MULTIPLIER
+        if state.wake_at is not None:
+            delay = min(delay, (state.wake_at - datetime.now(UTC)).total_seconds())
+        return max(0.0, delay)
+
+    def _remember_tick(
+        self,
+        workspace_id: str,
+        plan: Plan,
+        *,
+        errors: list[str],
+        progress_complete: bool,
+    ) -> None:
+        """Record node fingerprints and whether the plan needs no further ticks.
+
+        A plan is settled when the tick succeeded, it is not complete, and no
+        ready or reported node is due; the earliest future retry becomes the
+        workspace's wake-up time. Ready and reported nodes stay in the next
+        tick's scope until they move on, and a tick with errors is followed by
+        a full one.
+        """
+        state = self._tick_states.get(workspace_id)
+        if state is None:
+            return
+        now = datetime.now(UTC)
+        reported = [n for n in plan.nodes.values() if n.execution is TaskExecution.REPORTED]
+        waiting = [*plan.ready_nodes(), *reported]
+        retry_times = [_node_retry_not_before(node) for node in waiting]
+        state.fingerprints = _plan_fingerprints(plan)
+        state.pending = frozenset(node.node_id for node in waiting)
+        state.full_scan = state.full_scan or bool(errors)
+        state.wake_at = min((at for at in retry_times if at > now), default=None)
+        state.settled = not errors and not progress_complete and all(at > now for at in retry_times)
+
+    def _record_tick(self, started: float, *, nodes_touched: int, quiet: bool) -> None:
+        from src.infrastructure.telemetry.metrics import record_histogram_value
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats = self._tick_stats
+        stats["ticks"] += 1
+        stats["quiet_ticks"] += int(quiet)
+        stats["nodes_touched"] += nodes_touched
+        stats["tick_ms_total"] += elapsed_ms
+        stats["tick_ms_max"] = max(stats["tick_ms_max"], elapsed_ms)
+        attributes = {"quiet": quiet}
+        record_histogram_value(
+            "workspace_supervisor_tick_ms",
+            "Duration of a scheduled workspace supervisor tick",
+            elapsed_ms,
+            attributes,
+        )
+        record_histogram_value(
+            "workspace_supervisor_nodes_touched",
+            "Plan nodes a workspace supervisor tick ran its per-node passes over",
+            nodes_touched,
+            attributes,
+        )
+
+    async def tick(self, workspace_id: str) -> TickReport:
         plan = await self._repo.get_by_workspace(workspace_id)
         if plan is None or plan.status not in (PlanStatus.ACTIVE, PlanStatus.DRAFT):
             return TickReport(workspace_id=workspace_id)
+        return await self._tick_plan(workspace_id, plan)
 
+    async def _tick_plan(  # noqa: C901, PLR0912, PLR0915
+        self,
+        workspace_id: str,
+        plan: Plan,
+        *,
+        scope: Collection[PlanNodeId] | None = None,
+    ) -> TickReport:
+        """Run one tick; ``scope`` limits the per-node passes to those nodes."""
         errors: list[str] = []
         allocs_made = 0
         verifies_ran = 0
         nodes_done = 0
         nodes_blocked = 0
 
-        reopened_pipeline_nodes = _reopen_done_nodes_with_failed_pipeline(plan)
+        reopened_pipeline_nodes = _reopen_done_nodes_with_failed_pipeline(plan, scope)
         for node in reopened_pipeline_nodes:
             await self._emit_event(
                 errors,
@@ -267,7 +515,7 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
                     "summary": "done node reopened because required pipeline failed",
                 },
             )
-        reopened_worktree_nodes = _reopen_done_nodes_with_failed_worktree_integration(plan)
+        reopened_worktree_nodes = _reopen_done_nodes_with_failed_worktree_integration(plan, scope)
         for node in reopened_worktree_nodes:
             await self._emit_event(
                 errors,
@@ -289,7 +537,7 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
             )
 
         # --- 1. verify any REPORTED nodes ------------------------------
-        reported = [n for n in plan.nodes.values() if n.execution is TaskExecution.REPORTED]
+        reported = [n for n in _scoped_nodes(plan, scope) if n.execution is TaskExecution.REPORTED]
         for node in reported:
             try:
                 if (
@@ -687,7 +935,7 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
             except Exception as exc:
                 errors.append(f"verify({node.id}): {exc}")
 
-        accepted_via_repair = _accept_ready_nodes_with_completed_repair_alternatives(plan)
+        accepted_via_repair = _accept_ready_nodes_with_completed_repair_alternatives(plan, scope)
         for accepted_node, repair_alternative in accepted_via_repair:
             await self._emit_event(
                 errors,
@@ -704,7 +952,7 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
             )
         nodes_done += len(accepted_via_repair)
 
-        invalidated_dependents = _invalidate_nodes_with_unmet_dependencies(plan)
+        invalidated_dependents = _invalidate_nodes_with_unmet_dependencies(plan, scope)
         for invalidated_node in invalidated_dependents:
             await self._emit_event(
                 errors,
@@ -730,7 +978,11 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
             )
 
         # --- 2. allocate ready nodes -----------------------------------
-        repaired_phase_barriers = _repair_pending_iteration_phase_barriers(plan)
+        # Barriers are written when nodes are appended; only full ticks repair
+        # plans persisted before that.
+        repaired_phase_barriers = (
+            0 if scope is not None else _repair_pending_iteration_phase_barriers(plan)
+        )
         if repaired_phase_barriers:
             await self._emit_event(
                 errors,
@@ -742,7 +994,10 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
                     "node_count": repaired_phase_barriers,
                 },
             )
-        ready_candidates = _ready_nodes_due(plan.ready_nodes(), now=datetime.now(UTC))
+        ready_nodes = plan.ready_nodes()
+        if scope is not None:
+            ready_nodes = [node for node in ready_nodes if node.node_id in scope]
+        ready_candidates = _ready_nodes_due(ready_nodes, now=datetime.now(UTC))
         ready_candidates, deferred_by_dependency_projection = (
             _select_ready_nodes_with_integrated_dependencies(ready_candidates, plan)
         )
@@ -786,6 +1041,7 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
                 },
             )
         if ready_to_dispatch and not await self._checkpoint_before_dispatch(plan, errors):
+            self._remember_tick(workspace_id, plan, errors=errors, progress_complete=False)
             return TickReport(
                 workspace_id=workspace_id,
                 allocations_made=allocs_made,
@@ -845,6 +1101,12 @@ class WorkspaceSupervisor(WorkspaceSupervisorPort):
             except Exception as exc:
                 errors.append(f"progress_sink: {exc}")
 
+        self._remember_tick(
+            workspace_id,
+            plan,
+            errors=errors,
+            progress_complete=progress.is_complete,
+        )
         return TickReport(
             workspace_id=workspace_id,
             allocations_made=allocs_made,
@@ -2002,7 +2264,9 @@ def _repair_pending_iteration_phase_barriers(plan: Plan) -> int:
     return repaired
 
 
-def _invalidate_nodes_with_unmet_dependencies(plan: Plan) -> list[PlanNode]:
+def _invalidate_nodes_with_unmet_dependencies(
+    plan: Plan, scope: Collection[PlanNodeId] | None = None
+) -> list[PlanNode]:
     """Reset already-active downstream nodes when a dependency regresses.
 
     ``Plan.ready_nodes()`` prevents future dispatch before dependencies are done, but a
@@ -2013,7 +2277,7 @@ def _invalidate_nodes_with_unmet_dependencies(plan: Plan) -> list[PlanNode]:
 
     now = datetime.now(UTC)
     invalidated: list[PlanNode] = []
-    for node in list(plan.nodes.values()):
+    for node in _scoped_nodes(plan, scope):
         if node.kind not in {PlanNodeKind.TASK, PlanNodeKind.VERIFY} or not node.depends_on:
             continue
         missing = tuple(_dependency_blocking_ids(plan, node))
@@ -2066,10 +2330,12 @@ def _select_ready_nodes_with_integrated_dependencies(
     return ready, deferred
 
 
-def _reopen_done_nodes_with_failed_pipeline(plan: Plan) -> list[PlanNode]:
+def _reopen_done_nodes_with_failed_pipeline(
+    plan: Plan, scope: Collection[PlanNodeId] | None = None
+) -> list[PlanNode]:
     reopened: list[PlanNode] = []
     now = datetime.now(UTC)
-    for node in list(plan.nodes.values()):
+    for node in _scoped_nodes(plan, scope):
         if node.intent is not TaskIntent.DONE or node.execution is not TaskExecution.IDLE:
             continue
         if not _node_requires_pipeline_gate(node):
@@ -2095,10 +2361,12 @@ def _reopen_done_nodes_with_failed_pipeline(plan: Plan) -> list[PlanNode]:
     return reopened
 
 
-def _reopen_done_nodes_with_failed_worktree_integration(plan: Plan) -> list[PlanNode]:
+def _reopen_done_nodes_with_failed_worktree_integration(
+    plan: Plan, scope: Collection[PlanNodeId] | None = None
+) -> list[PlanNode]:
     reopened: list[PlanNode] = []
     now = datetime.now(UTC)
-    for node in list(plan.nodes.values()):
+    for node in _scoped_nodes(plan, scope):
         if node.intent is not TaskIntent.DONE or node.execution is not TaskExecution.IDLE:
             continue
         if not _done_node_needs_worktree_integration_retry(node):
@@ -2765,9 +3033,10 @@ def _completed_repair_alternative_superseding_reported_repair(
 
 def _accept_ready_nodes_with_completed_repair_alternatives(
     plan: Plan,
+    scope: Collection[PlanNodeId] | None = None,
 ) -> list[tuple[PlanNode, PlanNode]]:
     accepted: list[tuple[PlanNode, PlanNode]] = []
-    for node in list(plan.nodes.values()):
+    for node in _scoped_nodes(plan, scope):
         if node.kind not in {PlanNodeKind.TASK, PlanNodeKind.VERIFY}:
             continue
         if node.intent not in {TaskIntent.TODO, TaskIntent.BLOCKED}:
@@ -3721,6 +3990,64 @@ def _verification_retry_scheduled_payload(
     return payload
 
 
+def _node_fingerprint(node: PlanNode) -> NodeFingerprint:
+    return (
+        node.intent,
+        node.execution,
+        node.current_attempt_id,
+        node.assignee_agent_id,
+        node.updated_at,
+        node.depends_on,
+        hash(repr(node.metadata)),
+    )
+
+
+def _plan_fingerprints(plan: Plan) -> dict[PlanNodeId, NodeFingerprint]:
+    return {node_id: _node_fingerprint(node) for node_id, node in plan.nodes.items()}
+
+
+def _dirty_node_ids(
+    previous: Mapping[PlanNodeId, NodeFingerprint],
+    current: Mapping[PlanNodeId, NodeFingerprint],
+) -> set[PlanNodeId]:
+    """Nodes added, removed or changed between two fingerprint snapshots."""
+    dirty = {node_id for node_id, fp in current.items() if previous.get(node_id) != fp}
+    dirty.update(node_id for node_id in previous if node_id not in current)
+    return dirty
+
+
+def _scoped_nodes(plan: Plan, scope: Collection[PlanNodeId] | None) -> list[PlanNode]:
+    """Snapshot of the plan's nodes in plan order, limited to ``scope`` if given."""
+    if scope is None:
+        return list(plan.nodes.values())
+    return [node for node_id, node in plan.nodes.items() if node_id in scope]
+
+
+def _tick_scope(plan: Plan, dirty: Collection[PlanNodeId]) -> set[PlanNodeId]:
+    """Nodes a change to ``dirty`` can affect.
+
+    That is the dirty nodes, their transitive dependents (repair nodes are
+    dependencies of the node they block) and the original node of every
+    repair alternative in scope.
+    """
+    dependents: dict[PlanNodeId, list[PlanNodeId]] = {}
+    for node in plan.nodes.values():
+        for dep in node.depends_on:
+            dependents.setdefault(dep, []).append(node.node_id)
+    scope: set[PlanNodeId] = set()
+    stack = [node_id for node_id in dirty if node_id in plan.nodes]
+    while stack:
+        node_id = stack.pop()
+        if node_id in scope:
+            continue
+        scope.add(node_id)
+        stack.extend(dependents.get(node_id, ()))
+        repair_for = plan.nodes[node_id].metadata.get("repair_for_node_id")
+        if isinstance(repair_for, str) and PlanNodeId(repair_for) in plan.nodes:
+            stack.append(PlanNodeId(repair_for))
+    return scope
+
+
 def _ready_nodes_due(ready_nodes: list[PlanNode], *, now: datetime) -> list[PlanNode]:
     return [node for node in ready_nodes if _node_retry_not_before(node) <= now]
 
@@ -0,0 +1,189 @@
+"""Shared tick scheduling for :class:`WorkspaceSupervisor`.
+
+* :class:`WorkspaceTickScheduler` multiplexes any number of workspaces over a
+  bounded set of worker tasks. Each workspace sits on a timer heap; a worker
+  services it and reports how long to wait before the next visit. A workspace
+  is never serviced by two workers at once, which preserves the supervisor's
+  single-writer guarantee.
+* :class:`WorkspaceShardRing` assigns workspaces to supervisor processes by
+  consistent hashing, so adding or removing a process only moves roughly
+  ``1/N`` of the workspaces.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TickService = Callable[[str], Awaitable[float]]
+"""Services one workspace and returns the delay (seconds) until its next visit."""
+
+_DEFAULT_VIRTUAL_NODES = 64
+_ERROR_RETRY_SECONDS = 1.0
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class WorkspaceShardRing:
+    """Consistent-hash ring mapping ``workspace_id`` to a supervisor shard."""
+
+    def __init__(
+        self, shard_ids: Iterable[str], *, virtual_nodes: int = _DEFAULT_VIRTUAL_NODES
+    ) -> None:
+        ids = sorted({shard_id for shard_id in shard_ids if shard_id})
+        if not ids:
+            msg = "WorkspaceShardRing needs at least one shard id"
+            raise ValueError(msg)
+        if virtual_nodes <= 0:
+            msg = f"virtual_nodes must be > 0, got {virtual_nodes}"
+            raise ValueError(msg)
+        self._shard_ids = tuple(ids)
+        points = sorted(
+            (_ring_hash(f"{shard_id}#{index}"), shard_id)
+            for shard_id in ids
+            for index in range(virtual_nodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [shard_id for _, shard_id in points]
+
+    @property
+    def shard_ids(self) -> tuple[str, ...]:
+        return self._shard_ids
+
+    def owner(self, workspace_id: str) -> str:
+        index = bisect.bisect(self._hashes, _ring_hash(workspace_id)) % len(self._hashes)
+        return self._owners[index]
+
+
+class WorkspaceTickScheduler:
+    """Runs workspace ticks on a timer heap served by a bounded worker set."""
+
+    def __init__(self, service: TickService, *, max_workers: int = 8) -> None:
+        if max_workers <= 0:
+            msg = f"max_workers must be > 0, got {max_workers}"
+            raise ValueError(msg)
+        self._service = service
+        self._max_workers = max_workers
+        # Timer heap of (due loop time, sequence, workspace_id); ``_due`` holds
+        # the live due time per workspace so superseded entries are skipped.
+        self._heap: list[tuple[float, int, str]] = []
+        self._due: dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._registered: set[str] = set()
+        self._active: dict[str, asyncio.Event] = {}
+        self._rerun: set[str] = set()
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def register(self, workspace_id: str) -> None:
+        """Start servicing a workspace (idempotent); the first visit is immediate."""
+        if workspace_id in self._registered:
+            return
+        self._registered.add(workspace_id)
+        self._ensure_started()
+        self.wake(workspace_id)
+
+    async def unregister(self, workspace_id: str, *, timeout: float = 5.0) -> None:
+        """Stop servicing a workspace, waiting for an in-progress visit to end."""
+        self._registered.discard(workspace_id)
+        self._due.pop(workspace_id, None)
+        self._rerun.discard(workspace_id)
+        done = self._active.get(workspace_id)
+        if done is not None:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(done.wait(), timeout=timeout)
+
+    def is_registered(self, workspace_id: str) -> bool:
+        return workspace_id in self._registered
+
+    def wake(self, workspace_id: str, delay: float = 0.0) -> None:
+        """Visit a workspace after ``delay`` seconds (sooner visits win)."""
+        if workspace_id not in self._registered:
+            return
+        if workspace_id in self._active:
+            if delay <= 0:
+                self._rerun.add(workspace_id)
+            return
+        self._schedule(workspace_id, asyncio.get_running_loop().time() + max(0.0, delay))
+
+    async def close(self) -> None:
+        """Cancel the timer and worker tasks."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "workspaces": len(self._registered),
+            "scheduled": len(self._due),
+            "active": len(self._active),
+            "queued": self._ready.qsize(),
+            "workers": self._max_workers,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._timer_loop(), name="workspace-tick-timer"))
+        self._tasks.extend(
+            asyncio.create_task(self._worker_loop(), name=f"workspace-tick-worker-{index}")
+            for index in range(self._max_workers)
+        )
+
+    def _schedule(self, workspace_id: str, due: float) -> None:
+        current = self._due.get(workspace_id)
+        if current is not None and current <= due:
+            return
+        self._due[workspace_id] = due
+        heapq.heappush(self._heap, (due, next(self._sequence), workspace_id))
+        self._wakeup.set()
+
+    async def _timer_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Clear before scanning so a schedule() during the scan is not lost.
+            self._wakeup.clear()
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                due, _, workspace_id = heapq.heappop(self._heap)
+                if self._due.get(workspace_id) != due:
+                    continue  # Superseded by an earlier wake
+                del self._due[workspace_id]
+                if workspace_id in self._registered and workspace_id not in self._active:
+                    self._active[workspace_id] = asyncio.Event()
+                    self._ready.put_nowait(workspace_id)
+            timeout = self._heap[0][0] - now if self._heap else None
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    async def _worker_loop(self) -> None:
+        while True:
+            workspace_id = await self._ready.get()
+            delay = _ERROR_RETRY_SECONDS
+            try:
+                delay = await self._service(workspace_id)
+            except Exception:
+                logger.exception("workspace tick service failed for %s", workspace_id)
+            finally:
+                done = self._active.pop(workspace_id, None)
+                if done is not None:
+                    done.set()
+            if workspace_id in self._rerun:
+                self._rerun.discard(workspace_id)
+                delay = 0.0
+            self.wake(workspace_id, delay)
@@ -779,6 +779,17 @@ class ChannelConnectionManager:
         """
         return [conn.to_dict() for conn in self._connections.values()]
 
+    def notify_outbox_retry(self, outbox_id: str | None = None) -> None:
+        """Wake the outbox retry worker after an outbound send failed."""
+        if self._outbox_worker:
+            self._outbox_worker.notify(outbox_id)
+
+    def get_outbox_stats(self) -> dict[str, Any] | None:
+        """Get outbox retry backlog and drain rate, or None if the worker is not running."""
+        if self._outbox_worker:
+            return self._outbox_worker.get_stats()
+        return None
+
     def set_message_router(self, router: Callable[[Message], None]) -> None:
         """Set the message router callback.
 
@@ -1,19 +1,35 @@
 """Outbox retry worker for reliable channel message delivery.
 
-This background task polls the outbox table for failed messages whose
-next_retry_at has passed, and attempts to resend them via the appropriate
-channel adapter.
+This background task retries failed outbox messages via the appropriate
+channel adapter:
+
+- Retries are scheduled on an in-memory timer heap keyed by ``next_retry_at``
+  (exponential backoff with jitter, see ``outbox_retry_backoff``), so the
+  worker sleeps until the next message is due instead of polling blindly.
+- ``notify(outbox_id)`` wakes the worker immediately, e.g. right after a send
+  fails, and schedules just that message; a slow safety poll re-reads the
+  whole schedule to cover other writers.
+- Deliveries run concurrently, capped globally and per channel config, so a
+  single slow adapter cannot stall other channels.
+- Status updates are committed in batches by a separate committer task, each
+  row in its own SAVEPOINT so one bad row cannot roll back the others.
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import logging
+import time
+from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.infrastructure.adapters.secondary.persistence.channel_models import ChannelOutboxModel
@@ -23,8 +39,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-OUTBOX_POLL_INTERVAL = 30  # seconds between polls
-OUTBOX_BATCH_SIZE = 20  # max messages per poll cycle
+OUTBOX_POLL_INTERVAL = 30  # seconds between safety polls of the schedule
+OUTBOX_BATCH_SIZE = 50  # max messages loaded per dispatch round
+OUTBOX_SCHEDULE_LIMIT = 500  # max scheduled retries tracked in memory
+OUTBOX_MAX_CONCURRENCY = 32  # concurrent deliveries across all channels
+OUTBOX_CHANNEL_CONCURRENCY = 4  # concurrent deliveries per channel config
+OUTBOX_COMMIT_BATCH_SIZE = 20  # status updates per commit
+OUTBOX_COMMIT_INTERVAL = 0.5  # seconds to wait for a commit batch to fill
+OUTBOX_DRAIN_WINDOW = 60.0  # seconds covered by the drain rate
+
+
+@dataclass(frozen=True)
+class _DeliveryResult:
+    """Outcome of one retry attempt, waiting to be committed."""
+
+    outbox_id: str
+    sent_message_id: str | None = None
+    error: str | None = None
 
 
 class OutboxRetryWorker:
@@ -34,100 +65,328 @@ class OutboxRetryWorker:
         self,
         session_factory: Callable[..., Any],
         get_connection_fn: Callable[[str], Any],
+        *,
+        poll_interval: float = OUTBOX_POLL_INTERVAL,
+        max_concurrency: int = OUTBOX_MAX_CONCURRENCY,
+        per_channel_concurrency: int = OUTBOX_CHANNEL_CONCURRENCY,
     ) -> None:
         self._session_factory = session_factory
         self._get_connection = get_connection_fn
+        self._poll_interval = poll_interval
+        self._per_channel_concurrency = per_channel_concurrency
         self._task: asyncio.Task[None] | None = None
+        self._commit_task: asyncio.Task[None] | None = None
         self._running = False
 
+        # Timer heap of (due timestamp, outbox_id) plus the due time per ID so
+        # rescheduled entries can be recognised as stale when popped.
+        self._schedule: list[tuple[float, str]] = []
+        self._scheduled: dict[str, float] = {}
+        self._in_flight: set[str] = set()
+        self._delivery_tasks: set[asyncio.Task[None]] = set()
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._channel_limits: dict[str, asyncio.Semaphore] = {}
+        self._results: asyncio.Queue[_DeliveryResult] = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._needs_refresh = True
+        self._notified_ids: set[str] = set()
+        self._last_refresh = 0.0
+
+        self._backlog = 0
+        self._sent_times: deque[float] = deque()
+        self._stats = {"sent": 0, "failed": 0, "commits": 0}
+
     def start(self) -> None:
         """Start the background retry loop."""
         if self._running:
             return
         self._running = True
         self._task = asyncio.create_task(self._poll_loop())
+        self._commit_task = asyncio.create_task(self._commit_loop())
         logger.info("[OutboxWorker] Started")
 
     async def stop(self) -> None:
-        """Stop the background retry loop."""
+        """Stop the background retry loop, committing finished deliveries."""
         self._running = False
-        if self._task and not self._task.done():
-            self._task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._task
+        for task in (self._task, self._commit_task, *self._delivery_tasks):
+            if task and not task.done():
+                task.cancel()
+        for task in (self._task, self._commit_task, *self._delivery_tasks):
+            if task:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        await self._flush_results()
         logger.info("[OutboxWorker] Stopped")
 
+    def notify(self, outbox_id: str | None = None) -> None:
+        """Wake the worker to schedule a newly failed message.
+
+        Without ``outbox_id`` the whole retry schedule is re-read.
+        """
+        if outbox_id is None:
+            self._needs_refresh = True
+        else:
+            self._notified_ids.add(outbox_id)
+        self._wakeup.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return backlog size, drain rate and delivery counters."""
+        self._trim_drain_window()
+        return {
+            **self._stats,
+            "backlog": self._backlog,
+            "scheduled": len(self._scheduled),
+            "in_flight": len(self._in_flight),
+            "pending_commit": self._results.qsize(),
+            "drain_rate_per_sec": len(self._sent_times) / OUTBOX_DRAIN_WINDOW,
+        }
+
     async def _poll_loop(self) -> None:
-        """Main polling loop."""
+        """Main scheduling loop: dispatch due retries, then sleep until the next one."""
         while self._running:
             try:
-                await asyncio.sleep(OUTBOX_POLL_INTERVAL)
                 await self._process_batch()
+                await self._wait_for_work()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("[OutboxWorker] Poll error error_type=%s", type(e).__name__)
+                await asyncio.sleep(1)
+
+    async def _wait_for_work(self) -> None:
+        """Sleep until the next retry is due, a notification, or the safety poll."""
+        if self._needs_refresh or self._notified_ids:
+            return
+        timeout = self._poll_interval - (time.monotonic() - self._last_refresh)
+        if self._schedule:
+            timeout = min(timeout, self._schedule[0][0] - time.time())
+        if timeout > 0:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        if time.monotonic() - self._last_refresh >= self._poll_interval:
+            self._needs_refresh = True
 
     async def _process_batch(self) -> None:
-        """Process a batch of retryable outbox messages."""
+        """Refresh the schedule if needed and start deliveries for due messages."""
         from src.infrastructure.adapters.secondary.persistence.channel_repository import (
             ChannelOutboxRepository,
         )
 
+        # Notifications arriving while this round runs keep the event set.
+        self._wakeup.clear()
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self._notified_ids.clear()
+            async with self._session_factory() as session:
+                repo = ChannelOutboxRepository(session)
+                schedule = await repo.list_retry_schedule(limit=OUTBOX_SCHEDULE_LIMIT)
+                self._backlog = await repo.count_retry_backlog()
+            self._last_refresh = time.monotonic()
+            for outbox_id, next_retry_at in schedule:
+                self._schedule_retry(outbox_id, next_retry_at)
+        elif self._notified_ids:
+            notified = list(self._notified_ids)
+            self._notified_ids.clear()
+            async with self._session_factory() as session:
+                schedule = await ChannelOutboxRepository(session).list_retry_schedule(
+                    outbox_ids=notified
+                )
+            for outbox_id, next_retry_at in schedule:
+                if outbox_id not in self._scheduled:
+                    self._backlog += 1
+                self._schedule_retry(outbox_id, next_retry_at)
+
+        due_ids = self._pop_due(OUTBOX_BATCH_SIZE)
+        if not due_ids:
+            return
+
         async with self._session_factory() as session:
-            repo = ChannelOutboxRepository(session)
-            items = await repo.list_pending_retry(limit=OUTBOX_BATCH_SIZE)
+            items = await ChannelOutboxRepository(session).list_failed_by_ids(due_ids)
 
-            if not items:
-                return
+        logger.info(f"[OutboxWorker] Dispatching {len(items)} retryable messages")
+        for item in items:
+            self._in_flight.add(item.id)
+            task = asyncio.create_task(self._deliver_with_limits(item))
+            self._delivery_tasks.add(task)
+            task.add_done_callback(self._delivery_tasks.discard)
+        if len(due_ids) == OUTBOX_BATCH_SIZE:
+            self._wakeup.set()  # More may be due; run another round right away
 
-            logger.info(f"[OutboxWorker] Processing {len(items)} retryable messages")
+    def _schedule_retry(self, outbox_id: str, next_retry_at: datetime) -> None:
+        if outbox_id in self._in_flight:
+            return
+        due = next_retry_at.timestamp()
+        if self._scheduled.get(outbox_id) == due:
+            return
+        self._scheduled[outbox_id] = due
+        heapq.heappush(self._schedule, (due, outbox_id))
 
-            for item in items:
-                await self._retry_item(item, repo, session)
+    def _pop_due(self, limit: int) -> list[str]:
+        """Pop up to ``limit`` IDs whose retry time has passed."""
+        now = time.time()
+        due_ids: list[str] = []
+        while self._schedule and len(due_ids) < limit and self._schedule[0][0] <= now:
+            due, outbox_id = heapq.heappop(self._schedule)
+            if self._scheduled.get(outbox_id) != due:
+                continue  # Superseded by a later reschedule
+            del self._scheduled[outbox_id]
+            due_ids.append(outbox_id)
+        return due_ids
 
-    async def _retry_item(
-        self, item: ChannelOutboxModel, repo: ChannelOutboxRepository, session: AsyncSession
-    ) -> None:
-        """Retry a single outbox message."""
+    def _channel_limit(self, channel_config_id: str) -> asyncio.Semaphore:
+        limit = self._channel_limits.get(channel_config_id)
+        if limit is None:
+            limit = asyncio.Semaphore(self._per_channel_concurrency)
+            self._channel_limits[channel_config_id] = limit
+        return limit
+
+    async def _deliver_with_limits(self, item: ChannelOutboxModel) -> None:
+        """Deliver one message within the global and per-channel caps."""
+        try:
+            async with self._global_limit, self._channel_limit(item.channel_config_id):
+                result = await self._deliver(item)
+        except BaseException:
+            self._in_flight.discard(item.id)
+            raise
+        # Stays in flight until committed so a schedule refresh cannot resend it.
+        self._results.put_nowait(result)
+
+    async def _deliver(self, item: ChannelOutboxModel) -> _DeliveryResult:
+        """Send a single outbox message; never raises."""
         try:
             connection = self._get_connection(item.channel_config_id)
             if not connection:
-                await repo.mark_failed(item.id, "no active connection")
-                await session.commit()
-                return
+                return _DeliveryResult(item.id, error="no active connection")
 
             adapter = connection.adapter
             if not getattr(adapter, "connected", False):
-                await repo.mark_failed(item.id, "adapter disconnected")
-                await session.commit()
-                return
+                return _DeliveryResult(item.id, error="adapter disconnected")
 
             sent_message_id = await adapter.send_text(
                 item.chat_id,
                 item.content_text,
                 reply_to=item.reply_to_channel_message_id,
             )
-
-            await repo.mark_sent(item.id, sent_message_id)
-            await session.commit()
-            logger.info(
-                f"[OutboxWorker] Retried successfully: outbox_id={item.id}, "
-                f"sent_id={sent_message_id}"
+            return _DeliveryResult(item.id, sent_message_id=sent_message_id)
+        except Exception as e:
+            logger.warning(
+                "[OutboxWorker] Retry failed error_type=%s has_outbox_id=%s",
+                type(e).__name__,
+                bool(item.id),
             )
+            return _DeliveryResult(item.id, error=str(e))
 
-        except Exception as e:
+    async def _commit_loop(self) -> None:
+        """Commit delivery outcomes in batches."""
+        while self._running:
             try:
-                await repo.mark_failed(item.id, str(e))
-                await session.commit()
-            except Exception as commit_err:
-                logger.warning(
-                    "[OutboxWorker] Failed to update outbox status error_type=%s has_outbox_id=%s",
-                    type(commit_err).__name__,
-                    bool(item.id),
+                first = await self._results.get()
+                batch = [first]
+                deadline = time.monotonic() + OUTBOX_COMMIT_INTERVAL
+                while len(batch) < OUTBOX_COMMIT_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._results.get(), remaining))
+                    except TimeoutError:
+                        break
+                await self._commit_results(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("[OutboxWorker] Commit loop error error_type=%s", type(e).__name__)
+
+    async def _flush_results(self) -> None:
+        """Commit any outcomes still queued (used on shutdown)."""
+        batch: list[_DeliveryResult] = []
+        while not self._results.empty():
+            batch.append(self._results.get_nowait())
+        if batch:
+            await self._commit_results(batch)
+
+    async def _commit_results(self, batch: list[_DeliveryResult]) -> None:
+        """Apply a batch of outcomes in one transaction, one SAVEPOINT per row.
+
+        A row whose update fails is rolled back alone; the rest still commit.
+        Failed messages are then re-armed with their new ``next_retry_at``.
+        If the commit itself fails nothing is re-armed; the safety poll picks
+        the rows up again from their committed state.
+        """
+        from src.infrastructure.adapters.secondary.persistence.channel_repository import (
+            ChannelOutboxRepository,
+        )
+
+        applied: list[_DeliveryResult] = []
+        try:
+            async with self._session_factory() as session:
+                repo = ChannelOutboxRepository(session)
+                applied = await self._apply_results(session, repo, batch)
+                if not applied:
+                    return
+                retry_schedule = await repo.list_retry_schedule(
+                    outbox_ids=[r.outbox_id for r in applied if r.error is not None]
                 )
+                await session.commit()
+        except Exception as e:
             logger.warning(
-                "[OutboxWorker] Retry failed error_type=%s has_outbox_id=%s",
+                "[OutboxWorker] Failed to commit outbox status error_type=%s count=%s",
                 type(e).__name__,
-                bool(item.id),
+                len(applied),
             )
+            return
+        finally:
+            for result in batch:
+                self._in_flight.discard(result.outbox_id)
+
+        for outbox_id, next_retry_at in retry_schedule:
+            self._schedule_retry(outbox_id, next_retry_at)
+        if retry_schedule:
+            self._wakeup.set()  # Recompute the sleep for the re-armed retries
+        self._record_committed(applied, rearmed=len(retry_schedule))
+
+    @staticmethod
+    async def _apply_results(
+        session: AsyncSession, repo: ChannelOutboxRepository, batch: list[_DeliveryResult]
+    ) -> list[_DeliveryResult]:
+        """Write each outcome in its own SAVEPOINT; return the ones that applied."""
+        applied: list[_DeliveryResult] = []
+        for result in batch:
+            try:
+                async with session.begin_nested():
+                    if result.error is None:
+                        await repo.mark_sent(result.outbox_id, result.sent_message_id)
+                    else:
+                        await repo.mark_failed(result.outbox_id, result.error)
+            except Exception as e:
+                logger.warning(
+                    "[OutboxWorker] Failed to update outbox status error_type=%s",
+                    type(e).__name__,
+                )
+                continue
+            applied.append(result)
+        return applied
+
+    def _record_committed(self, applied: list[_DeliveryResult], *, rearmed: int) -> None:
+        """Update counters and the backlog after a successful commit."""
+        self._stats["commits"] += 1
+        now = time.monotonic()
+        failed = 0
+        for result in applied:
+            if result.error is None:
+                self._stats["sent"] += 1
+                self._sent_times.append(now)
+            else:
+                failed += 1
+        self._stats["failed"] += failed
+        # Sent and dead-lettered messages leave the backlog; re-armed ones stay.
+        self._backlog = max(0, self._backlog - (len(applied) - rearmed))
+        logger.info(
+            f"[OutboxWorker] Committed {len(applied)} retry outcomes "
+            f"(sent={len(applied) - failed}, failed={failed})"
+        )
+
+    def _trim_drain_window(self) -> None:
+        cutoff = time.monotonic() - OUTBOX_DRAIN_WINDOW
+        while self._sent_times and self._sent_times[0] < cutoff:
+            self._sent_times.popleft()
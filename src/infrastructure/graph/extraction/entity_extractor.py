@@ -3,6 +3,7 @@ Entity extractor using LLM for extracting entities from text.
 
 This module provides:
 - LLM-based entity extraction with structured output
+- Joint (single-pass) entity and relationship extraction
 - Entity deduplication using hash + vector similarity
 - Support for custom entity types
 """
@@ -19,8 +20,11 @@ from src.infrastructure.graph.embedding.embedding_service import EmbeddingServic
 from src.infrastructure.graph.extraction.entity_type_normalization import normalize_entity_type
 from src.infrastructure.graph.extraction.prompts import (
     ENTITY_EXTRACTION_SYSTEM_PROMPT,
+    JOINT_EXTRACTION_SYSTEM_PROMPT,
     build_entity_extraction_prompt,
+    build_joint_extraction_prompt,
 )
+from src.infrastructure.graph.extraction.relationship_extractor import RelationshipExtractor
 from src.infrastructure.graph.llm_response import extract_response_content
 from src.infrastructure.graph.schemas import EntityNode
 
@@ -144,6 +148,106 @@ class EntityExtractor:
         logger.info(f"Extracted {len(entity_nodes)} entities from content")
         return entity_nodes
 
+    async def extract_with_relationships(
+        self,
+        content: str,
+        entity_types: str | None = None,
+        entity_types_context: list[dict[str, Any]] | None = None,
+        entity_type_id_to_name: dict[int, str] | None = None,
+        relationship_types: str | None = None,
+        previous_context: str | None = None,
+        custom_instructions: str | None = None,
+        project_id: str | None = None,
+        tenant_id: str | None = None,
+        user_id: str | None = None,
+    ) -> tuple[list[EntityNode], list[dict[str, Any]]]:
+        """
+        Extract entities and the relationships between them with one LLM call.
+
+        Joint extraction trades the dedicated relationship prompt (which sees
+        the final, deduplicated entity list) for one fewer sequential LLM
+        round trip. Relationships are returned as raw dicts naming their
+        endpoints; turn them into edges once entity names resolve to UUIDs,
+        see :meth:`RelationshipExtractor.edges_from_extracted`.
+
+        Args:
+            content: Text to extract from
+            entity_types: Custom entity types description (legacy)
+            entity_types_context: Graphiti-compatible entity types with integer IDs
+            entity_type_id_to_name: Mapping from entity_type_id to type name
+            relationship_types: Custom relationship types description
+            previous_context: Optional context from previous messages
+            custom_instructions: Optional custom extraction instructions
+            project_id: Project ID for the extracted entities
+            tenant_id: Tenant ID for the extracted entities
+            user_id: User ID for the extracted entities
+
+        Returns:
+            Tuple of (entity nodes with embeddings, relationship dicts)
+        """
+        if not content or not content.strip():
+            logger.warning("Empty content provided for joint extraction")
+            return [], []
+
+        user_prompt = build_joint_extraction_prompt(
+            content=content,
+            entity_types=entity_types,
+            entity_types_context=entity_types_context,
+            relationship_types=relationship_types,
+            previous_context=previous_context,
+            custom_instructions=custom_instructions,
+        )
+
+        try:
+            extracted = await self._call_llm(
+                system_prompt=JOINT_EXTRACTION_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+            )
+        except Exception as e:
+            logger.error(
+                "LLM call failed during joint extraction error_type=%s",
+                type(e).__name__,
+            )
+            return [], []
+
+        try:
+            data = json.loads(extracted)
+        except json.JSONDecodeError as e:
+            # Salvage the entities; relationships cannot be trusted without them.
+            logger.warning(
+                "Failed to parse joint extraction response as JSON: "
+                "error_type=%s response_length=%s",
+                type(e).__name__,
+                len(extracted),
+            )
+            entities_data = self._extract_json_from_text(extracted)
+            relationships_data: list[dict[str, Any]] = []
+        else:
+            entities_data = self._extract_entities_from_parsed(data)
+            relationships_data = (
+                RelationshipExtractor._extract_relationships_from_parsed(data)
+                if isinstance(data, dict) and "relationships" in data
+                else []
+            )
+
+        if not entities_data:
+            logger.debug("No entities extracted from content")
+            return [], []
+
+        entity_nodes = await self._create_entity_nodes(
+            entities_data=entities_data,
+            entity_type_id_to_name=entity_type_id_to_name,
+            project_id=project_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+        )
+
+        logger.info(
+            f"Jointly extracted {len(entity_nodes)} entities and "
+            f"{len(relationships_data)} relationships from content"
+        )
+        return entity_nodes, relationships_data
+
     async def extract_with_dedup(
         self,
         content: str,
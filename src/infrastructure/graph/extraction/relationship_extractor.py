@@ -191,6 +191,53 @@ class RelationshipExtractor:
             episode_uuid=episode_uuid,
         )
 
+    def edges_from_extracted(
+        self,
+        relationships_data: list[dict[str, Any]],
+        entity_nodes: list[EntityNode],
+        name_aliases: dict[str, str] | None = None,
+        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        episode_uuid: str | None = None,
+    ) -> list[EntityEdge]:
+        """
+        Build EntityEdge objects from relationships extracted alongside entities.
+
+        Used by joint extraction, where relationships name entities as the LLM
+        extracted them. Names deduplicated into existing graph entities are
+        resolved through ``name_aliases``.
+
+        Args:
+            relationships_data: Relationship dicts with "from_entity"/"to_entity" names
+            entity_nodes: Entities the relationships may reference
+            name_aliases: Mapping from extracted entity name to the UUID it was
+                deduplicated into
+            edge_type_map: Mapping from (source_type, target_type) to allowed edge types
+            episode_uuid: UUID of the episode
+
+        Returns:
+            List of EntityEdge objects
+        """
+        if not relationships_data or not entity_nodes:
+            return []
+
+        entity_map = {node.name: node.uuid for node in entity_nodes}
+        entity_type_map = {node.name: node.entity_type for node in entity_nodes}
+        type_by_uuid = {node.uuid: node.entity_type for node in entity_nodes}
+        for name, uuid in (name_aliases or {}).items():
+            entity_map.setdefault(name, uuid)
+            entity_type_map.setdefault(name, type_by_uuid.get(uuid, "Entity"))
+
+        edges = self._create_entity_edges(
+            relationships_data=relationships_data,
+            entity_map=entity_map,
+            entity_type_map=entity_type_map,
+            edge_type_map=edge_type_map,
+            episode_uuid=episode_uuid,
+        )
+
+        logger.info(f"Built {len(edges)} relationships from joint extraction")
+        return edges
+
     async def _call_llm(
         self,
         system_prompt: str,
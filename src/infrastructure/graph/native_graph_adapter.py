@@ -10,8 +10,11 @@ This adapter provides a self-researched knowledge graph system that:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast, override
 from uuid import uuid4
@@ -19,14 +22,20 @@ from uuid import uuid4
 from src.domain.model.graph.dtos import (
     GraphCommunityDTO,
     GraphEntityDTO,
+    GraphExportCursor,
     GraphExportDTO,
+    GraphExportPage,
     GraphGraphDataDTO,
     GraphNodeDTO,
     GraphRelationshipDTO,
     GraphSearchHit,
 )
 from src.domain.model.memory.episode import Episode
-from src.domain.ports.services.graph_store_port import GraphStorePort
+from src.domain.ports.services.graph_store_port import (
+    EXPORT_PAGE_SIZE,
+    GraphStorePort,
+    export_sections,
+)
 from src.domain.ports.services.queue_port import QueuePort
 
 from .community.community_updater import CommunityUpdater
@@ -61,6 +70,9 @@ if TYPE_CHECKING:
 # Cache TTL for embedding dimension checks (seconds)
 EMBEDDING_DIM_CACHE_TTL = 10
 
+# Source node labels whose outgoing relationships are streamed, in export order
+EXPORT_RELATIONSHIP_SOURCE_LABELS = ("Episodic", "Entity", "Community")
+
 
 def _decode_attributes(value: Any) -> dict[str, Any]:  # noqa: ANN401
     """Decode a graph entity's ``attributes`` property into a dict.
@@ -136,6 +148,7 @@ class NativeGraphAdapter(GraphStorePort):
         reflexion_max_iterations: int = 2,
         auto_clear_embeddings: bool = True,
         reranker: BaseReranker | None = None,
+        joint_extraction: bool = False,
     ) -> None:
         """
         Initialize native graph adapter.
@@ -150,6 +163,10 @@ class NativeGraphAdapter(GraphStorePort):
             auto_clear_embeddings: Auto-clear embeddings on dimension mismatch
             reranker: Optional reranker capability (BaseReranker surface) used
                 by hybrid search; None (default) keeps the builtin ordering.
+            joint_extraction: Extract entities and relationships with a single
+                LLM call instead of separate entity and relationship passes.
+                Entities that only reflexion finds get a relationship pass
+                restricted to them.
         """
         self._neo4j_client = neo4j_client
         self._llm_client = llm_client
@@ -158,6 +175,7 @@ class NativeGraphAdapter(GraphStorePort):
         self._reranker = reranker
         self._enable_reflexion = enable_reflexion
         self._reflexion_max_iterations = reflexion_max_iterations
+        self._joint_extraction = joint_extraction
         self._auto_clear_embeddings = auto_clear_embeddings
         # Optional Redis client for CachedEmbeddingService
         self._redis_client: Any | None = None
@@ -305,6 +323,31 @@ class NativeGraphAdapter(GraphStorePort):
             )
         return self._community_updater
 
+    async def _read(self, method: str, query: str, /, **params: Any) -> Any:  # noqa: ANN401
+        """Run a read-only query on a cluster reader and time it per adapter method.
+
+        Records ``graph_read_latency_ms`` and ``graph_read_rows`` histograms
+        tagged with ``method`` so slow or oversized reads can be attributed.
+        """
+        from src.infrastructure.telemetry.metrics import record_histogram_value
+
+        started = time.perf_counter()
+        result = await self._neo4j_client.execute_read(query, **params)
+        attributes = {"method": method}
+        record_histogram_value(
+            "graph_read_latency_ms",
+            "Latency of read-only graph queries by adapter method",
+            (time.perf_counter() - started) * 1000,
+            attributes=attributes,
+        )
+        record_histogram_value(
+            "graph_read_rows",
+            "Rows returned by read-only graph queries by adapter method",
+            len(result.records),
+            attributes=attributes,
+        )
+        return result
+
     async def _check_embedding_dimension(self, force: bool = False) -> None:
         """
         Check embedding dimension compatibility.
@@ -603,51 +646,70 @@ class NativeGraphAdapter(GraphStorePort):
                 f"{len(edge_type_map)} edge type mappings"
             )
 
-            # 1. Extract entities with type context
+            # 1. Extract entities with type context (and, in joint mode, the
+            # relationships between them in the same LLM call)
             extractor = self._get_entity_extractor()
-            entities = await extractor.extract(
-                content=content,
-                entity_types_context=entity_types_context,
-                entity_type_id_to_name=entity_type_id_to_name,
-                project_id=project_id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-            )
-
-            # 2. Apply reflexion if enabled
-            if self._enable_reflexion and entities:
-                reflexion_checker = self._get_reflexion_checker()
-                missed_entities = await reflexion_checker.check_missed_entities(
+            relationships_data: list[dict[str, Any]] | None = None
+            if self._joint_extraction:
+                entities, relationships_data = await extractor.extract_with_relationships(
+                    content=content,
+                    entity_types_context=entity_types_context,
+                    entity_type_id_to_name=entity_type_id_to_name,
+                    project_id=project_id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                )
+            else:
+                entities = await extractor.extract(
                     content=content,
-                    extracted_entities=[e.model_dump() for e in entities],
                     entity_types_context=entity_types_context,
                     entity_type_id_to_name=entity_type_id_to_name,
                     project_id=project_id,
                     tenant_id=tenant_id,
                     user_id=user_id,
                 )
-                if missed_entities:
-                    logger.info(f"Reflexion found {len(missed_entities)} additional entities")
-                    entities.extend(missed_entities)
-
-            # 3. Filter excluded entity types (Graphiti-compatible)
-            if excluded_entity_types and entities:
-                excluded_set = set(excluded_entity_types)
-                original_count = len(entities)
-                entities = [e for e in entities if e.entity_type not in excluded_set]
-                filtered_count = original_count - len(entities)
-                if filtered_count > 0:
-                    logger.info(
-                        f"Filtered {filtered_count} entities with excluded types: "
-                        f"{excluded_entity_types}"
-                    )
 
-            # 4. Deduplicate against existing entities without re-extracting.
-            existing_entities = await self._get_existing_entities(project_id)
-            unique_entities, dedup_map = await extractor.deduplicate_entity_nodes(
-                new_entities=entities,
-                existing_entities=existing_entities,
+            # 2. Reflexion reviews the extraction while existing entities are
+            # loaded and the extracted ones are (3.) filtered and (4.)
+            # deduplicated, instead of holding up both.
+            reflexion_task = asyncio.create_task(
+                self._check_missed_entities(
+                    content=content,
+                    entities=entities,
+                    entity_types_context=entity_types_context,
+                    entity_type_id_to_name=entity_type_id_to_name,
+                    project_id=project_id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                )
             )
+            try:
+                existing_entities = await self._get_existing_entities(project_id)
+                unique_entities, dedup_map = await extractor.deduplicate_entity_nodes(
+                    new_entities=self._filter_excluded_entities(entities, excluded_entity_types),
+                    existing_entities=existing_entities,
+                )
+                missed_entities = await reflexion_task
+            finally:
+                reflexion_task.cancel()
+
+            # Missed entities get a second, smaller pass that also folds them
+            # into entities kept by the first one.
+            missed_entities = self._filter_excluded_entities(missed_entities, excluded_entity_types)
+            recovered_uuids: set[str] = set()
+            if missed_entities:
+                missed_unique, missed_map = await extractor.deduplicate_entity_nodes(
+                    new_entities=missed_entities,
+                    existing_entities=[*existing_entities, *unique_entities],
+                )
+                recovered_uuids = (
+                    ({entity.uuid for entity in missed_unique} | set(missed_map.values()))
+                    - {entity.uuid for entity in unique_entities}
+                    - set(dedup_map.values())
+                )
+                unique_entities = [*unique_entities, *missed_unique]
+                dedup_map.update(missed_map)
+
             final_entities = self._resolve_mentioned_entities(
                 unique_entities=unique_entities,
                 duplicate_map=dedup_map,
@@ -684,19 +746,40 @@ class NativeGraphAdapter(GraphStorePort):
                         "to_uuid": edge.target_uuid,
                         "relationship_type": "MENTIONS",
                         "properties": edge.to_neo4j_properties(),
+                        "from_label": "Episodic",
+                        "to_label": "Entity",
                     }
                     for edge in entity_edges
                 ]
             )
 
-            # 6. Extract relationships with edge type constraints
+            # 6. Extract relationships with edge type constraints (joint mode
+            # already has them, except for entities only reflexion found)
             relationship_extractor = self._get_relationship_extractor()
-            relationships = await relationship_extractor.extract_from_entity_nodes(
-                content=content,
-                entity_nodes=final_entities,
-                edge_type_map=edge_type_map if edge_type_map else None,
-                episode_uuid=episode_uuid,
-            )
+            if relationships_data is None:
+                relationships = await relationship_extractor.extract_from_entity_nodes(
+                    content=content,
+                    entity_nodes=final_entities,
+                    edge_type_map=edge_type_map if edge_type_map else None,
+                    episode_uuid=episode_uuid,
+                )
+            else:
+                relationships = relationship_extractor.edges_from_extracted(
+                    relationships_data,
+                    entity_nodes=final_entities,
+                    name_aliases=dedup_map,
+                    edge_type_map=edge_type_map if edge_type_map else None,
+                    episode_uuid=episode_uuid,
+                )
+                if recovered_uuids:
+                    relationships += await self._extract_recovered_relationships(
+                        content=content,
+                        entity_nodes=final_entities,
+                        recovered_uuids=recovered_uuids,
+                        known=relationships,
+                        edge_type_map=edge_type_map if edge_type_map else None,
+                        episode_uuid=episode_uuid,
+                    )
 
             # 7. Save relationships to Neo4j
             for rel in relationships:
@@ -746,6 +829,85 @@ class NativeGraphAdapter(GraphStorePort):
             await self._update_episode_status(episode_uuid, EpisodeStatus.FAILED)
             raise
 
+    async def _extract_recovered_relationships(
+        self,
+        *,
+        content: str,
+        entity_nodes: list[EntityNode],
+        recovered_uuids: set[str],
+        known: list[EntityEdge],
+        edge_type_map: dict[tuple[str, str], list[str]] | None,
+        episode_uuid: str,
+    ) -> list[EntityEdge]:
+        """Extract relationships of entities the joint call never saw.
+
+        Reflexion runs after the joint call, so the entities it recovers have
+        no relationships yet. One relationship pass over all entities, told
+        to report only those involving the recovered ones, fills the gap; its
+        output is filtered to them as well.
+        """
+        names = ", ".join(node.name for node in entity_nodes if node.uuid in recovered_uuids)
+        edges = await self._get_relationship_extractor().extract_from_entity_nodes(
+            content=content,
+            entity_nodes=entity_nodes,
+            edge_type_map=edge_type_map,
+            custom_instructions=(
+                f"Only extract relationships that involve at least one of these entities: {names}"
+            ),
+            episode_uuid=episode_uuid,
+        )
+        seen = {(edge.source_uuid, edge.relationship_type, edge.target_uuid) for edge in known}
+        return [
+            edge
+            for edge in edges
+            if (edge.source_uuid in recovered_uuids or edge.target_uuid in recovered_uuids)
+            and (edge.source_uuid, edge.relationship_type, edge.target_uuid) not in seen
+        ]
+
+    async def _check_missed_entities(
+        self,
+        *,
+        content: str,
+        entities: list[EntityNode],
+        entity_types_context: list[dict[str, Any]],
+        entity_type_id_to_name: dict[int, str],
+        project_id: str | None,
+        tenant_id: str | None,
+        user_id: str | None,
+    ) -> list[EntityNode]:
+        """Run the reflexion pass, if enabled, and return the entities it found."""
+        if not self._enable_reflexion or not entities:
+            return []
+        missed_entities = await self._get_reflexion_checker().check_missed_entities(
+            content=content,
+            extracted_entities=[e.model_dump() for e in entities],
+            entity_types_context=entity_types_context,
+            entity_type_id_to_name=entity_type_id_to_name,
+            project_id=project_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+        )
+        if missed_entities:
+            logger.info(f"Reflexion found {len(missed_entities)} additional entities")
+        return missed_entities
+
+    @staticmethod
+    def _filter_excluded_entities(
+        entities: list[EntityNode],
+        excluded_entity_types: list[str] | None,
+    ) -> list[EntityNode]:
+        """Drop entities whose type is excluded (Graphiti-compatible)."""
+        if not excluded_entity_types or not entities:
+            return entities
+        excluded_set = set(excluded_entity_types)
+        kept = [e for e in entities if e.entity_type not in excluded_set]
+        filtered_count = len(entities) - len(kept)
+        if filtered_count > 0:
+            logger.info(
+                f"Filtered {filtered_count} entities with excluded types: {excluded_entity_types}"
+            )
+        return kept
+
     async def _load_schema_context(self, project_id: str | None) -> dict[str, Any]:
         """Load project-specific graph schema context for extraction."""
         from src.infrastructure.adapters.secondary.schema.dynamic_schema import (
@@ -780,8 +942,8 @@ class NativeGraphAdapter(GraphStorePort):
             _validate_identifier(key, "property key")
 
         query = f"""
-            MATCH (from {{uuid: $from_uuid}})
-            MATCH (to {{uuid: $to_uuid}})
+            MATCH (from:Entity {{uuid: $from_uuid}})
+            MATCH (to:Entity {{uuid: $to_uuid}})
             MERGE (from)-[r:{relationship.relationship_type}]->(to)
             SET r.uuid = coalesce(r.uuid, $uuid),
                 r.relationship_type = $relationship_type,
@@ -1196,9 +1358,7 @@ class NativeGraphAdapter(GraphStorePort):
                 LIMIT $limit
             """
 
-            result = await self._neo4j_client.execute_query(
-                query, project_id=project_id, limit=limit
-            )
+            result = await self._read("get_graph_data", query, project_id=project_id, limit=limit)
 
             nodes = {}
             edges = []
@@ -1251,8 +1411,8 @@ class NativeGraphAdapter(GraphStorePort):
                 LIMIT $limit
             """
 
-            entity_result = await self._neo4j_client.execute_query(
-                entity_query, project_id=project_id, limit=limit
+            entity_result = await self._read(
+                "get_graph_data", entity_query, project_id=project_id, limit=limit
             )
 
             for record in entity_result.records:
@@ -1554,19 +1714,15 @@ class NativeGraphAdapter(GraphStorePort):
         limit: int = 50,
     ) -> list[GraphEntityDTO]:
         """Return entities directly related to ``entity_id`` (any edge type)."""
-        scope = ""
-        if project_id:
-            scope = "WHERE b.project_id = $project_id"
-        q = f"""
-            MATCH (a:Entity {{uuid: $entity_id}})-[r]-(b:Entity)
-            {scope}
+        q = """
+            MATCH (a:Entity {uuid: $entity_id})-[r]-(b:Entity)
+            WHERE $project_id IS NULL OR b.project_id = $project_id
             RETURN DISTINCT b
             LIMIT $limit
         """
-        params: dict[str, Any] = {"entity_id": entity_id, "limit": limit}
-        if project_id:
-            params["project_id"] = project_id
-        result = await self._neo4j_client.execute_query(q, **params)
+        result = await self._read(
+            "related_entities", q, entity_id=entity_id, project_id=project_id or None, limit=limit
+        )
         out: list[GraphEntityDTO] = []
         for record in result.records:
             node = record.get("b")
@@ -1601,19 +1757,14 @@ class NativeGraphAdapter(GraphStorePort):
         limit: int = 100,
     ) -> list[GraphCommunityDTO]:
         """Read communities, optionally scoped to a project."""
-        scope = ""
-        params: dict[str, Any] = {"limit": limit}
-        if project_id:
-            scope = "WHERE c.project_id = $project_id"
-            params["project_id"] = project_id
-        q = f"""
+        q = """
             MATCH (c:Community)
-            {scope}
+            WHERE $project_id IS NULL OR c.project_id = $project_id
             RETURN c
             ORDER BY c.member_count DESC
             LIMIT $limit
         """
-        result = await self._neo4j_client.execute_query(q, **params)
+        result = await self._read("community_read", q, project_id=project_id or None, limit=limit)
         out: list[GraphCommunityDTO] = []
         for record in result.records:
             node = record.get("c")
@@ -1680,12 +1831,12 @@ class NativeGraphAdapter(GraphStorePort):
 
     async def _export_episodes(self, params: dict[str, Any], scope: str) -> list[dict[str, Any]]:
         q = f"MATCH (e:Episodic) {scope} RETURN properties(e) as props ORDER BY e.created_at DESC"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("_export_episodes", q, **params)
         return [dict(r["props"]) for r in res.records if r.get("props") is not None]
 
     async def _export_entities(self, params: dict[str, Any], scope: str) -> list[dict[str, Any]]:
         q = f"MATCH (e:Entity) {scope} RETURN properties(e) as props, labels(e) as labels"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("_export_entities", q, **params)
         out: list[dict[str, Any]] = []
         for r in res.records:
             if r.get("props") is None:
@@ -1695,9 +1846,7 @@ class NativeGraphAdapter(GraphStorePort):
             out.append(props)
         return out
 
-    async def _export_relationships(
-        self, params: dict[str, Any], project_id: str | None, tenant_id: str | None
-    ) -> list[dict[str, Any]]:
+    def _export_relationship_scope(self, project_id: str | None, tenant_id: str | None) -> str:
         label_filter = (
             "('Entity' IN labels(a) OR 'Episodic' IN labels(a) OR 'Community' IN labels(a)) "
             "AND ('Entity' IN labels(b) OR 'Episodic' IN labels(b) OR 'Community' IN labels(b))"
@@ -1705,19 +1854,20 @@ class NativeGraphAdapter(GraphStorePort):
         if project_id:
             cond_a = self._project_node_scope_condition("a")
             cond_b = self._project_node_scope_condition("b")
-            scope = f"WHERE {label_filter} AND {cond_a} AND {cond_b}"
-        elif tenant_id:
-            scope = (
-                f"WHERE {label_filter} AND a.tenant_id = $tenant_id AND b.tenant_id = $tenant_id"
-            )
-        else:
-            scope = f"WHERE {label_filter}"
+            return f"WHERE {label_filter} AND {cond_a} AND {cond_b}"
+        if tenant_id:
+            return f"WHERE {label_filter} AND a.tenant_id = $tenant_id AND b.tenant_id = $tenant_id"
+        return f"WHERE {label_filter}"
+
+    async def _export_relationships(
+        self, params: dict[str, Any], project_id: str | None, tenant_id: str | None
+    ) -> list[dict[str, Any]]:
         q = (
             "MATCH (a)-[r]->(b) "
-            f"{scope} "
+            f"{self._export_relationship_scope(project_id, tenant_id)} "
             "RETURN properties(r) as props, type(r) as rel_type, elementId(r) as edge_id"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("_export_relationships", q, **params)
         return [
             {"edge_id": r["edge_id"], "type": r["rel_type"], "properties": dict(r["props"])}
             for r in res.records
@@ -1725,7 +1875,7 @@ class NativeGraphAdapter(GraphStorePort):
 
     async def _export_communities(self, params: dict[str, Any], scope: str) -> list[dict[str, Any]]:
         q = f"MATCH (c:Community) {scope} RETURN properties(c) as props"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("_export_communities", q, **params)
         return [dict(r["props"]) for r in res.records if r.get("props") is not None]
 
     async def data_export(
@@ -1778,6 +1928,206 @@ class NativeGraphAdapter(GraphStorePort):
             communities=communities,
         )
 
+    @staticmethod
+    def _export_keyset(scope: str, condition: str | None) -> str:
+        """Add a keyset predicate (None on a section's first page) to a scope clause."""
+        if condition is None:
+            return scope
+        return f"{scope} AND {condition}" if scope else f"WHERE {condition}"
+
+    def _export_page_query(
+        self, section: str, project_id: str | None, tenant_id: str | None, *, resume: bool
+    ) -> str:
+        """Cypher reading one keyset page of a node section, ordered by ``uuid``.
+
+        The first page and resumed pages are separate statements so the
+        ``uuid > $after`` predicate stays a plain index range seek.
+        """
+        if section == "entities":
+            label, var = "Entity", "e"
+            scope = self._export_entity_scope(var, project_id, tenant_id)
+        elif section == "episodes":
+            label, var = "Episodic", "e"
+            scope = self._export_scope(var, project_id, tenant_id)
+        else:
+            label, var = "Community", "c"
+            scope = self._export_scope(var, project_id, tenant_id)
+        keyset = f"{var}.uuid > $after" if resume else None
+        return (
+            f"MATCH ({var}:{label}) {self._export_keyset(scope, keyset)} "
+            f"WITH {var} ORDER BY {var}.uuid LIMIT $page_size "
+            f"RETURN {var}.uuid AS key, properties({var}) AS props, labels({var}) AS labels"
+        )
+
+    def _export_relationship_page_query(
+        self, label: str, project_id: str | None, tenant_id: str | None, *, resume: bool
+    ) -> str:
+        """Cypher reading one page of the relationships leaving ``label`` nodes.
+
+        Edges are ordered by ``(source uuid, edge id)`` and capped at
+        ``$page_size``, so a source with many edges spans several pages.
+        Resumed pages seek sources from ``$after_uuid`` and skip that source's
+        edges up to ``$after_edge``.
+        """
+        source_scope = self._export_entity_scope("a", project_id, tenant_id)
+        target_scope = (
+            "('Entity' IN labels(b) OR 'Episodic' IN labels(b) OR 'Community' IN labels(b))"
+        )
+        if project_id:
+            target_scope += f" AND {self._project_node_scope_condition('b')}"
+        elif tenant_id:
+            target_scope += " AND b.tenant_id = $tenant_id"
+        if resume:
+            source_scope = self._export_keyset(source_scope, "a.uuid >= $after_uuid")
+            target_scope += " AND (a.uuid > $after_uuid OR elementId(r) > $after_edge)"
+        return (
+            f"MATCH (a:{label}) {source_scope} "
+            f"MATCH (a)-[r]->(b) WHERE {target_scope} "
+            "WITH a, r ORDER BY a.uuid, elementId(r) LIMIT $page_size "
+            "RETURN a.uuid AS source, elementId(r) AS edge_id, type(r) AS rel_type, "
+            "properties(r) AS props"
+        )
+
+    @staticmethod
+    def _export_page_rows(section: str, records: list[Any]) -> list[dict[str, Any]]:
+        """Convert page records to the row shape of the matching ``GraphExportDTO`` list."""
+        if section == "relationships":
+            return [
+                {
+                    "edge_id": record["edge_id"],
+                    "type": record["rel_type"],
+                    "properties": dict(record["props"]),
+                }
+                for record in records
+            ]
+        rows = []
+        for record in records:
+            if record.get("props") is None:
+                continue
+            row = dict(record["props"])
+            if section == "entities":
+                row["labels"] = list(record.get("labels", []))
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _relationship_export_key(after: str | None) -> tuple[str, str, str] | None:
+        """Parse the ``[source label, source uuid, edge id]`` key of a relationships cursor."""
+        if after is None:
+            return None
+        try:
+            key = json.loads(after)
+        except ValueError:
+            key = None
+        if (
+            not isinstance(key, list)
+            or len(key) != 3
+            or key[0] not in EXPORT_RELATIONSHIP_SOURCE_LABELS
+            or not all(isinstance(part, str) for part in key)
+        ):
+            raise ValueError("Malformed export cursor")
+        return key[0], key[1], key[2]
+
+    @override
+    def validate_export_cursor(self, cursor: GraphExportCursor) -> None:
+        if cursor.section == "relationships":
+            self._relationship_export_key(cursor.after)
+
+    @override
+    async def iter_data_export(
+        self,
+        *,
+        tenant_id: str | None = None,
+        project_id: str | None = None,
+        include_episodes: bool = True,
+        include_entities: bool = True,
+        include_relationships: bool = True,
+        include_communities: bool = True,
+        cursor: GraphExportCursor | None = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[GraphExportPage]:
+        """Stream the export with keyset pagination.
+
+        Each page is one read of at most ``page_size`` rows, so memory is
+        bounded by the page instead of the project. Node sections are keyed
+        by ``uuid``; relationships are read per source label and keyed by
+        ``[source label, source uuid, edge id]``. A page resumes after the last
+        key of the previous one, which stays valid while the graph changes.
+        Scope matches ``data_export``.
+        """
+        sections = export_sections(
+            include_episodes=include_episodes,
+            include_entities=include_entities,
+            include_relationships=include_relationships,
+            include_communities=include_communities,
+            cursor=cursor,
+        )
+        scope = {"tenant_id": tenant_id, "project_id": project_id}
+        for section in sections:
+            after = cursor.after if cursor and cursor.section == section else None
+            if section == "relationships":
+                pages = self._iter_relationship_export(scope, after, page_size)
+            else:
+                pages = self._iter_node_export(section, scope, after, page_size)
+            async for page in pages:
+                yield page
+
+    async def _iter_node_export(
+        self, section: str, scope: dict[str, Any], after: str | None, page_size: int
+    ) -> AsyncIterator[GraphExportPage]:
+        first_page = self._export_page_query(section, **scope, resume=False)
+        next_page = self._export_page_query(section, **scope, resume=True)
+        while True:
+            res = await self._read(
+                "iter_data_export",
+                first_page if after is None else next_page,
+                **scope,
+                after=after,
+                page_size=page_size,
+            )
+            if not res.records:
+                return
+            after = str(res.records[-1]["key"])
+            yield GraphExportPage(
+                section=section,
+                rows=self._export_page_rows(section, res.records),
+                cursor=GraphExportCursor(section, after),
+            )
+            if len(res.records) < page_size:
+                return
+
+    async def _iter_relationship_export(
+        self, scope: dict[str, Any], after: str | None, page_size: int
+    ) -> AsyncIterator[GraphExportPage]:
+        resume_key = self._relationship_export_key(after)
+        labels = EXPORT_RELATIONSHIP_SOURCE_LABELS
+        if resume_key is not None:
+            labels = labels[labels.index(resume_key[0]) :]
+        for label in labels:
+            first_page = self._export_relationship_page_query(label, **scope, resume=False)
+            next_page = self._export_relationship_page_query(label, **scope, resume=True)
+            position = resume_key[1:] if resume_key and resume_key[0] == label else None
+            while True:
+                res = await self._read(
+                    "iter_data_export",
+                    first_page if position is None else next_page,
+                    **scope,
+                    after_uuid=position[0] if position else None,
+                    after_edge=position[1] if position else None,
+                    page_size=page_size,
+                )
+                if not res.records:
+                    break
+                last = res.records[-1]
+                position = (str(last["source"]), str(last["edge_id"]))
+                yield GraphExportPage(
+                    section="relationships",
+                    rows=self._export_page_rows("relationships", res.records),
+                    cursor=GraphExportCursor("relationships", json.dumps([label, *position])),
+                )
+                if len(res.records) < page_size:
+                    break
+
     async def count_nodes(
         self,
         project_id: str | None = None,
@@ -1800,7 +2150,7 @@ class NativeGraphAdapter(GraphStorePort):
             params["project_id"] = project_id
         elif tenant_id:
             params["tenant_id"] = tenant_id
-        result = await self._neo4j_client.execute_query(q, **params)
+        result = await self._read("count_nodes", q, **params)
         if result.records:
             return int(result.records[0].get("total", 0) or 0)
         return 0
@@ -1860,7 +2210,7 @@ class NativeGraphAdapter(GraphStorePort):
         async def _count(label: str, scope_fn: Any) -> int:  # noqa: ANN401
             sc = scope_fn("e")
             q = f"MATCH (e:{label}) {sc} RETURN count(e) AS count"
-            res = await self._neo4j_client.execute_query(q, **params)
+            res = await self._read("count_stats", q, **params)
             return int(res.records[0].get("count", 0) or 0) if res.records else 0
 
         def _entity_scope_clause(var: str) -> str:
@@ -1890,7 +2240,7 @@ class NativeGraphAdapter(GraphStorePort):
         else:
             scope = f"WHERE {label_filter}"
         rel_q = f"MATCH (a)-[r]->(b) {scope} RETURN count(r) AS count"
-        rel_res = await self._neo4j_client.execute_query(rel_q, **params)
+        rel_res = await self._read("count_stats", rel_q, **params)
         rel_count = int(rel_res.records[0].get("count", 0) or 0) if rel_res.records else 0
 
         return {
@@ -1919,21 +2269,11 @@ class NativeGraphAdapter(GraphStorePort):
         ``episodes`` router Cypher exactly (tenant/project/user filters, sort on
         created_at|valid_at|name, SKIP/LIMIT).
         """
-        conditions: list[str] = []
-        params: dict[str, Any] = {}
-        if tenant_id is not None:
-            conditions.append("e.tenant_id = $tenant_id")
-            params["tenant_id"] = tenant_id
-        if project_id:
-            conditions.append("e.project_id = $project_id")
-            params["project_id"] = project_id
-        elif project_ids is not None:
-            conditions.append("e.project_id IN $project_ids")
-            params["project_ids"] = project_ids
-        if user_id:
-            conditions.append("e.user_id = $user_id")
-            params["user_id"] = user_id
-        where_clause = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        conditions, params = self._scope_conditions("e", project_id, None, project_ids)
+        conditions.append("($user_id IS NULL OR e.user_id = $user_id)")
+        # An empty tenant_id still filters here, as it always has.
+        params.update(tenant_id=tenant_id, user_id=user_id or None)
+        where_clause = "WHERE " + " AND ".join(conditions)
         # sort field is structural (validated by caller against allowlist);
         # validate defensively to keep Cypher identifier-safe.
         _validate_identifier(sort_by)
@@ -1941,7 +2281,7 @@ class NativeGraphAdapter(GraphStorePort):
         order = "DESC" if sort_desc else "ASC"
 
         count_q = f"MATCH (e:Episodic) {where_clause} RETURN count(e) AS total"
-        count_res = await self._neo4j_client.execute_query(count_q, **params)
+        count_res = await self._read("list_episodes", count_q, **params)
         total = int(count_res.records[0].get("total", 0) or 0) if count_res.records else 0
 
         list_q = (
@@ -1951,7 +2291,7 @@ class NativeGraphAdapter(GraphStorePort):
         )
         params["offset"] = offset
         params["limit"] = limit
-        res = await self._neo4j_client.execute_query(list_q, **params)
+        res = await self._read("list_episodes", list_q, **params)
         episodes = [dict(r["props"]) for r in res.records if r.get("props") is not None]
         return {"episodes": episodes, "total": total}
 
@@ -1963,17 +2303,11 @@ class NativeGraphAdapter(GraphStorePort):
         project_ids: list[str] | None = None,
     ) -> dict[str, Any] | None:
         """Return a single episode's properties by name, or None if not found."""
-        conditions: list[str] = []
-        params: dict[str, Any] = {"name": name}
-        if tenant_id is not None:
-            conditions.append("e.tenant_id = $tenant_id")
-            params["tenant_id"] = tenant_id
-        if project_ids is not None:
-            conditions.append("e.project_id IN $project_ids")
-            params["project_ids"] = project_ids
-        where_clause = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        conditions, params = self._scope_conditions("e", None, None, project_ids)
+        params.update(name=name, tenant_id=tenant_id)
+        where_clause = "WHERE " + " AND ".join(conditions)
         q = f"MATCH (e:Episodic {{name: $name}}) {where_clause} RETURN properties(e) AS props"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_episode_by_name", q, **params)
         if not res.records:
             return None
         props = res.records[0].get("props")
@@ -2016,23 +2350,15 @@ class NativeGraphAdapter(GraphStorePort):
 
         Mirrors the previous ``recall`` router Cypher (time-window + scope filters).
         """
-        conditions: list[str] = ["e.created_at >= datetime($since_date)"]
-        params: dict[str, Any] = {"since_date": since_iso, "limit": limit}
-        if project_id:
-            conditions.append("e.project_id = $project_id")
-            params["project_id"] = project_id
-        elif project_ids is not None:
-            conditions.append("e.project_id IN $project_ids")
-            params["project_ids"] = project_ids
-        if tenant_id:
-            conditions.append("e.tenant_id = $tenant_id")
-            params["tenant_id"] = tenant_id
+        conditions, params = self._scope_conditions("e", project_id, tenant_id, project_ids)
+        conditions.insert(0, "e.created_at >= datetime($since_date)")
+        params.update(since_date=since_iso, limit=limit)
         where_clause = "WHERE " + " AND ".join(conditions)
         q = (
             f"MATCH (e:Episodic) {where_clause} "
             "RETURN properties(e) AS props ORDER BY e.created_at DESC LIMIT $limit"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("recall_recent_episodes", q, **params)
         return [dict(r["props"]) for r in res.records if r.get("props") is not None]
 
     async def ensure_episodic_node(
@@ -2099,7 +2425,7 @@ class NativeGraphAdapter(GraphStorePort):
             "MATCH (n:Entity) WHERE n.project_id IN $project_ids "
             "RETURN n.project_id AS project_id, count(n) AS cnt"
         )
-        res = await self._neo4j_client.execute_query(q, project_ids=project_ids)
+        res = await self._read("count_entities_by_project", q, project_ids=project_ids)
         out: dict[str, int] = {}
         for record in res.records:
             pid = record.get("project_id")
@@ -2121,8 +2447,8 @@ class NativeGraphAdapter(GraphStorePort):
             "AND n.valid_at >= $threshold RETURN count(n) AS active_count"
         )
         try:
-            res = await self._neo4j_client.execute_query(
-                q, project_id=project_id, threshold=since_iso
+            res = await self._read(
+                "count_active_nodes", q, project_id=project_id, threshold=since_iso
             )
             if res.records:
                 return int(res.records[0].get("active_count", 0) or 0)
@@ -2151,7 +2477,7 @@ class NativeGraphAdapter(GraphStorePort):
                    rel_count as mention_count,
                    n.summary as summary
         """
-        res = await self._neo4j_client.execute_query(q, project_id=project_id, limit=limit)
+        res = await self._read("trending_entities", q, project_id=project_id, limit=limit)
         return [
             {
                 "name": r.get("name", ""),
@@ -2174,23 +2500,27 @@ class NativeGraphAdapter(GraphStorePort):
         Returns (conditions, params). Mirrors the router-side scoping used by the
         enhanced-search endpoints. project_id wins; otherwise project_ids; tenant
         is additive.
+
+        The project condition drives the index lookup, so it stays a distinct
+        clause per scope kind. The tenant filter is always present and ignored
+        when ``$tenant_id`` is null, keeping the Cypher text (and its cached
+        plan) the same whether or not a tenant is given.
         """
         conditions: list[str] = []
-        params: dict[str, Any] = {}
+        params: dict[str, Any] = {"tenant_id": tenant_id or None}
         if project_id:
             conditions.append(f"{var}.project_id = $project_id")
             params["project_id"] = project_id
         elif project_ids is not None:
             conditions.append(f"{var}.project_id IN $project_ids")
             params["project_ids"] = project_ids
-        if tenant_id:
-            conditions.append(f"{var}.tenant_id = $tenant_id")
-            params["tenant_id"] = tenant_id
+        conditions.append(f"($tenant_id IS NULL OR {var}.tenant_id = $tenant_id)")
         return conditions, params
 
     async def get_entity_project_id(self, entity_uuid: str) -> str | None:
         """Return the project_id of an Entity node, or None if absent."""
-        res = await self._neo4j_client.execute_query(
+        res = await self._read(
+            "get_entity_project_id",
             "MATCH (start:Entity {uuid: $uuid}) RETURN properties(start) AS props",
             uuid=entity_uuid,
         )
@@ -2201,7 +2531,8 @@ class NativeGraphAdapter(GraphStorePort):
 
     async def get_community_project_id(self, community_uuid: str) -> str | None:
         """Return the project_id of a Community node, or None if absent."""
-        res = await self._neo4j_client.execute_query(
+        res = await self._read(
+            "get_community_project_id",
             "MATCH (c:Community {uuid: $uuid}) RETURN properties(c) AS props",
             uuid=community_uuid,
         )
@@ -2236,7 +2567,8 @@ class NativeGraphAdapter(GraphStorePort):
         RETURN DISTINCT related, properties(related) AS props, labels(related) AS labels
         LIMIT $limit
         """
-        res = await self._neo4j_client.execute_query(
+        res = await self._read(
+            "graph_traversal_search",
             q,
             uuid=start_entity_uuid,
             project_id=project_id,
@@ -2271,8 +2603,8 @@ class NativeGraphAdapter(GraphStorePort):
             WHERE e.project_id = $project_id
             RETURN properties(e) AS props
         """
-        res = await self._neo4j_client.execute_query(
-            entity_q, uuid=community_uuid, project_id=project_id
+        res = await self._read(
+            "community_search", entity_q, uuid=community_uuid, project_id=project_id
         )
         for r in res.records:
             props = dict(r["props"]) if r.get("props") else {}
@@ -2295,8 +2627,8 @@ class NativeGraphAdapter(GraphStorePort):
                 RETURN DISTINCT properties(ep) AS props
                 LIMIT $limit
             """
-            ep_res = await self._neo4j_client.execute_query(
-                ep_q, uuid=community_uuid, project_id=project_id, limit=limit
+            ep_res = await self._read(
+                "community_search", ep_q, uuid=community_uuid, project_id=project_id, limit=limit
             )
             for r in ep_res.records:
                 props = dict(r["props"]) if r.get("props") else {}
@@ -2327,25 +2659,25 @@ class NativeGraphAdapter(GraphStorePort):
         Reproduces the previous ``temporal`` search Cypher. Returns episode dicts.
         """
         conditions, params = self._scope_conditions("e", project_id, tenant_id, project_ids)
-        params["limit"] = limit
-        if query:
-            conditions.append(
-                "(toLower(coalesce(e.content, '') + ' ' + coalesce(e.name, '') "
-                "+ ' ' + coalesce(e.summary, '')) CONTAINS toLower($query))"
-            )
-            params["query"] = query
-        if since_iso:
-            conditions.append("e.created_at >= datetime($since)")
-            params["since"] = since_iso
-        if until_iso:
-            conditions.append("e.created_at <= datetime($until)")
-            params["until"] = until_iso
-        where_clause = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        conditions += [
+            "($search_query IS NULL OR toLower(coalesce(e.content, '') + ' ' "
+            "+ coalesce(e.name, '') + ' ' + coalesce(e.summary, '')) "
+            "CONTAINS toLower($search_query))",
+            "($since IS NULL OR e.created_at >= datetime($since))",
+            "($until IS NULL OR e.created_at <= datetime($until))",
+        ]
+        params.update(
+            search_query=query or None,
+            since=since_iso or None,
+            until=until_iso or None,
+            limit=limit,
+        )
+        where_clause = "WHERE " + " AND ".join(conditions)
         q = (
             f"MATCH (e:Episodic) {where_clause} "
             "RETURN properties(e) AS props ORDER BY e.created_at DESC LIMIT $limit"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("temporal_search", q, **params)
         out: list[dict[str, Any]] = []
         for r in res.records:
             props = dict(r["props"]) if r.get("props") else {}
@@ -2379,30 +2711,29 @@ class NativeGraphAdapter(GraphStorePort):
         (uuid/name/entity_type/summary/created_at + labels for type derivation).
         """
         conditions, params = self._scope_conditions("e", project_id, tenant_id, project_ids)
-        params["limit"] = limit
-        params["offset"] = offset
-        if query:
-            conditions.append(
-                "(toLower(coalesce(e.name, '') + ' ' + coalesce(e.summary, '') "
-                "+ ' ' + coalesce(e.entity_type, '')) CONTAINS toLower($query))"
-            )
-            params["query"] = query
-        if entity_types:
-            conditions.append("e.entity_type IN $entity_types")
-            params["entity_types"] = entity_types
-        if tags:
-            conditions.append("any(tag IN $tags WHERE tag IN coalesce(e.tags, []))")
-            params["tags"] = tags
-        if since_iso:
-            conditions.append("e.created_at >= datetime($since)")
-            params["since"] = since_iso
-        where_clause = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        conditions += [
+            "($search_query IS NULL OR toLower(coalesce(e.name, '') + ' ' "
+            "+ coalesce(e.summary, '') + ' ' + coalesce(e.entity_type, '')) "
+            "CONTAINS toLower($search_query))",
+            "($entity_types IS NULL OR e.entity_type IN $entity_types)",
+            "($tags IS NULL OR any(tag IN $tags WHERE tag IN coalesce(e.tags, [])))",
+            "($since IS NULL OR e.created_at >= datetime($since))",
+        ]
+        params.update(
+            search_query=query or None,
+            entity_types=entity_types or None,
+            tags=tags or None,
+            since=since_iso or None,
+            limit=limit,
+            offset=offset,
+        )
+        where_clause = "WHERE " + " AND ".join(conditions)
         q = (
             f"MATCH (e:Entity) {where_clause} "
             "RETURN properties(e) AS props, labels(e) AS labels "
             "SKIP $offset LIMIT $limit"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("faceted_search", q, **params)
         out: list[dict[str, Any]] = []
         for r in res.records:
             props = dict(r["props"]) if r.get("props") else {}
@@ -2463,13 +2794,14 @@ class NativeGraphAdapter(GraphStorePort):
         elif tenant_id and is_superuser:
             conditions.append("e.tenant_id = $tenant_id")
             params["tenant_id"] = tenant_id
-        if entity_type:
-            conditions.append("(e.entity_type = $entity_type OR $entity_type IN labels(e))")
-            params["entity_type"] = entity_type
-        where_clause = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+        conditions.append(
+            "($entity_type IS NULL OR e.entity_type = $entity_type OR $entity_type IN labels(e))"
+        )
+        params["entity_type"] = entity_type or None
+        where_clause = "WHERE " + " AND ".join(conditions)
 
         count_q = f"MATCH (e:Entity) {where_clause} RETURN count(e) AS total"
-        count_res = await self._neo4j_client.execute_query(count_q, **params)
+        count_res = await self._read("list_entities", count_q, **params)
         total = int(count_res.records[0].get("total", 0) or 0) if count_res.records else 0
 
         list_q = (
@@ -2477,7 +2809,7 @@ class NativeGraphAdapter(GraphStorePort):
             "RETURN properties(e) AS props, labels(e) AS labels "
             "ORDER BY e.created_at DESC SKIP $offset LIMIT $limit"
         )
-        res = await self._neo4j_client.execute_query(list_q, **params)
+        res = await self._read("list_entities", list_q, **params)
         entities = []
         for r in res.records:
             props = dict(r["props"]) if r.get("props") else {}
@@ -2520,13 +2852,12 @@ class NativeGraphAdapter(GraphStorePort):
         elif project_ids is not None:
             conditions.append("c.project_id IN $project_ids")
             params["project_ids"] = project_ids
-        if min_members is not None:
-            conditions.append("coalesce(c.member_count, 0) >= $min_members")
-            params["min_members"] = min_members
+        conditions.append("($min_members IS NULL OR coalesce(c.member_count, 0) >= $min_members)")
+        params["min_members"] = min_members
         where_clause = "WHERE " + " AND ".join(conditions)
 
         count_q = f"MATCH (c:Community) {where_clause} RETURN count(c) AS total"
-        count_res = await self._neo4j_client.execute_query(count_q, **params)
+        count_res = await self._read("list_communities", count_q, **params)
         total = int(count_res.records[0].get("total", 0) or 0) if count_res.records else 0
 
         list_q = (
@@ -2534,7 +2865,7 @@ class NativeGraphAdapter(GraphStorePort):
             "RETURN properties(c) AS props "
             "ORDER BY coalesce(c.member_count, 0) DESC SKIP $offset LIMIT $limit"
         )
-        res = await self._neo4j_client.execute_query(list_q, **params)
+        res = await self._read("list_communities", list_q, **params)
         communities = []
         for r in res.records:
             props = dict(r["props"]) if r.get("props") else {}
@@ -2587,12 +2918,13 @@ class NativeGraphAdapter(GraphStorePort):
             RETURN entity_type, entity_count
             ORDER BY entity_count DESC
         """
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_entity_types", q, **params)
         return [{"entity_type": r["entity_type"], "count": r["entity_count"]} for r in res.records]
 
     async def get_entity(self, entity_uuid: str) -> dict[str, Any] | None:
         """Return an entity's props + labels by uuid, or None if absent."""
-        res = await self._neo4j_client.execute_query(
+        res = await self._read(
+            "get_entity",
             "MATCH (e:Entity {uuid: $uuid}) RETURN properties(e) AS props, labels(e) AS labels",
             uuid=entity_uuid,
         )
@@ -2604,7 +2936,8 @@ class NativeGraphAdapter(GraphStorePort):
 
     async def get_community(self, community_uuid: str) -> dict[str, Any] | None:
         """Return a community's props by uuid, or None if absent."""
-        res = await self._neo4j_client.execute_query(
+        res = await self._read(
+            "get_community",
             "MATCH (c:Community {uuid: $uuid}) RETURN properties(c) AS props",
             uuid=community_uuid,
         )
@@ -2631,26 +2964,25 @@ class NativeGraphAdapter(GraphStorePort):
             "limit": limit,
             "project_id": project_id,
             "is_superuser": is_superuser,
+            "relationship_type": relationship_type or None,
         }
-        rel_filter = ""
-        if relationship_type:
-            rel_filter = "AND type(r) = $relationship_type"
-            params["relationship_type"] = relationship_type
 
-        count_q = f"""
-            MATCH (e:Entity {{uuid: $uuid}})
+        count_q = """
+            MATCH (e:Entity {uuid: $uuid})
             MATCH (e)-[r]-(related:Entity)
-            WHERE related IS NOT NULL {rel_filter}
+            WHERE related IS NOT NULL
+            AND ($relationship_type IS NULL OR type(r) = $relationship_type)
             AND ($is_superuser OR related.project_id = $project_id)
             RETURN count(r) AS total
         """
-        count_res = await self._neo4j_client.execute_query(count_q, **params)
+        count_res = await self._read("get_entity_relationships", count_q, **params)
         total = int(count_res.records[0].get("total", 0) or 0) if count_res.records else 0
 
-        q = f"""
-            MATCH (e:Entity {{uuid: $uuid}})
+        q = """
+            MATCH (e:Entity {uuid: $uuid})
             OPTIONAL MATCH (e)-[r]-(related:Entity)
-            WHERE related IS NOT NULL {rel_filter}
+            WHERE related IS NOT NULL
+            AND ($relationship_type IS NULL OR type(r) = $relationship_type)
             AND ($is_superuser OR related.project_id = $project_id)
             RETURN
                 elementId(r) AS edge_id,
@@ -2666,7 +2998,7 @@ class NativeGraphAdapter(GraphStorePort):
                 END AS direction
             LIMIT $limit
         """
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_entity_relationships", q, **params)
         relationships = []
         for r in res.records:
             edge_props = dict(r["edge_props"] or {})
@@ -2703,8 +3035,12 @@ class NativeGraphAdapter(GraphStorePort):
             WHERE $is_superuser OR e.project_id = $project_id
             RETURN count(e) AS total
         """
-        count_res = await self._neo4j_client.execute_query(
-            count_q, uuid=community_uuid, project_id=project_id, is_superuser=is_superuser
+        count_res = await self._read(
+            "get_community_members",
+            count_q,
+            uuid=community_uuid,
+            project_id=project_id,
+            is_superuser=is_superuser,
         )
         total = int(count_res.records[0].get("total", 0) or 0) if count_res.records else 0
 
@@ -2714,8 +3050,13 @@ class NativeGraphAdapter(GraphStorePort):
             RETURN properties(e) AS props
             LIMIT $limit
         """
-        res = await self._neo4j_client.execute_query(
-            q, uuid=community_uuid, project_id=project_id, is_superuser=is_superuser, limit=limit
+        res = await self._read(
+            "get_community_members",
+            q,
+            uuid=community_uuid,
+            project_id=project_id,
+            is_superuser=is_superuser,
+            limit=limit,
         )
         members = []
         for r in res.records:
@@ -2767,7 +3108,7 @@ class NativeGraphAdapter(GraphStorePort):
                 elementId(m) AS target_id, labels(m) AS target_labels, properties(m) AS target_props
             LIMIT $limit
         """
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_graph_visualization", q, **params)
         return [dict(r) for r in res.records]
 
     async def get_subgraph(
@@ -2821,7 +3162,8 @@ class NativeGraphAdapter(GraphStorePort):
                     null AS target_id, null AS target_labels, null AS target_props
                 LIMIT $limit
             """
-        res = await self._neo4j_client.execute_query(
+        res = await self._read(
+            "get_subgraph",
             query,
             node_uuids=node_uuids,
             project_id=project_id,
@@ -2959,7 +3301,7 @@ class NativeGraphAdapter(GraphStorePort):
         )
         where = f" WHERE {cond}" if cond else ""
         q = f"MATCH (n:{safe_label}){where} RETURN count(n) AS count"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("count_scoped_nodes", q, **params)
         return int(res.records[0].get("count", 0) or 0) if res.records else 0
 
     async def count_old_episodes(
@@ -2979,7 +3321,7 @@ class NativeGraphAdapter(GraphStorePort):
         params["cutoff_date"] = cutoff_iso
         where = "WHERE " + " AND ".join(conditions)
         q = f"MATCH (e:Episodic) {where} RETURN count(e) AS count"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("count_old_episodes", q, **params)
         return int(res.records[0].get("count", 0) or 0) if res.records else 0
 
     async def find_duplicate_entities(
@@ -3002,7 +3344,7 @@ class NativeGraphAdapter(GraphStorePort):
             RETURN name, entities
             LIMIT 100
         """
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("find_duplicate_entities", q, **params)
         return [
             {
                 "name": r["name"],
@@ -3029,7 +3371,7 @@ class NativeGraphAdapter(GraphStorePort):
         params["cutoff_date"] = cutoff_iso
         where = "WHERE " + " AND ".join(conditions)
         q = f"MATCH (a)-[r]->(b) {where} RETURN type(r) AS rel_type, count(r) AS count"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("find_stale_edges", q, **params)
         out: dict[str, int] = {}
         for r in res.records:
             out[r["rel_type"]] = int(r["count"])
@@ -3070,7 +3412,7 @@ class NativeGraphAdapter(GraphStorePort):
             conditions.append(cond)
         where = "WHERE " + " AND ".join(conditions)
         q = f"MATCH (n:Entity) {where} RETURN count(n) AS missing_count"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("count_missing_embeddings", q, **params)
         return int(res.records[0].get("missing_count", 0) or 0) if res.records else 0
 
     async def get_existing_embedding_dimension(
@@ -3089,7 +3431,7 @@ class NativeGraphAdapter(GraphStorePort):
             conditions.append(cond)
         where = "WHERE " + " AND ".join(conditions)
         q = f"MATCH (n:Entity) {where} WITH n LIMIT 1 RETURN n.embedding_dim AS dim"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_existing_embedding_dimension", q, **params)
         dim = int(res.records[0].get("dim", 0) or 0) if res.records else 0
         if dim:
             return dim
@@ -3099,7 +3441,7 @@ class NativeGraphAdapter(GraphStorePort):
             conditions.append(cond)
         where = "WHERE " + " AND ".join(conditions)
         q = f"MATCH (n:Entity) {where} WITH n LIMIT 1 RETURN size(n.name_embedding) AS dim"
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_existing_embedding_dimension", q, **params)
         dim = int(res.records[0].get("dim", 0) or 0) if res.records else 0
         return dim or None
 
@@ -3122,7 +3464,7 @@ class NativeGraphAdapter(GraphStorePort):
             "WITH coalesce(n.embedding_dim, size(n.name_embedding)) AS dim, "
             "count(n) AS count RETURN dim, count ORDER BY count DESC"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("detect_mixed_dimensions", q, **params)
         counts = {str(r["dim"]): int(r["count"]) for r in res.records}
         dimensions = [int(d) for d in counts]
         return {
@@ -3157,7 +3499,7 @@ class NativeGraphAdapter(GraphStorePort):
             "sum(CASE WHEN all(value IN n.name_embedding WHERE value = 0.0) "
             "THEN 1 ELSE 0 END) AS zero_vectors"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("validate_embeddings", q, **params)
         record = res.records[0] if res.records else {}
         mismatches = int(record.get("dimension_mismatches", 0) or 0)
         zero_vectors = int(record.get("zero_vectors", 0) or 0)
@@ -3277,7 +3619,7 @@ class NativeGraphAdapter(GraphStorePort):
             "RETURN count(n) AS total, n.embedding_dim AS dim "
             "ORDER BY total DESC LIMIT 5"
         )
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("get_embedding_dimension_distribution", q, **params)
         distribution: dict[str, int] = {}
         total = 0
         for record in res.records:
@@ -3298,7 +3640,8 @@ class NativeGraphAdapter(GraphStorePort):
         ``memories`` router consumes. Matches the previous inlined Cypher exactly.
         """
         try:
-            entity_records, _, _ = await self._neo4j_client.driver.execute_query(
+            entity_result = await self._read(
+                "get_memory_graph_context",
                 """
                 MATCH (episode:Episodic)
                 WHERE episode.memory_id = $memory_id OR episode.uuid = $memory_id
@@ -3324,11 +3667,12 @@ class NativeGraphAdapter(GraphStorePort):
                     "properties": _decode_attributes(record["attributes"]),
                     "confidence": 1.0,
                 }
-                for record in entity_records
+                for record in entity_result.records
                 if record["id"] is not None
             ]
 
-            relationship_records, _, _ = await self._neo4j_client.driver.execute_query(
+            relationship_result = await self._read(
+                "get_memory_graph_context",
                 """
                 MATCH (episode:Episodic)
                 WHERE episode.memory_id = $memory_id OR episode.uuid = $memory_id
@@ -3367,7 +3711,7 @@ class NativeGraphAdapter(GraphStorePort):
                     },
                     "confidence": record["weight"] if record["weight"] is not None else 1.0,
                 }
-                for record in relationship_records
+                for record in relationship_result.records
                 if record["source_id"] is not None and record["target_id"] is not None
             ]
             return entities, relationships
@@ -3395,7 +3739,7 @@ class NativeGraphAdapter(GraphStorePort):
             params["project_id"] = project_id
         elif tenant_id:
             params["tenant_id"] = tenant_id
-        res = await self._neo4j_client.execute_query(q, **params)
+        res = await self._read("count_episodes_by_age", q, **params)
         return int(res.records[0].get("count", 0) or 0) if res.records else 0
 
     async def delete_episodes_by_age(
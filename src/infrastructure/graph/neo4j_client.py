@@ -15,7 +15,7 @@ from contextlib import asynccontextmanager
 from types import TracebackType
 from typing import Any, cast
 
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, RoutingControl
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,21 @@ TRANSACTION_TIMEOUT = 30.0
 MAX_CONNECTION_POOL_SIZE = 100
 MAX_CONNECTION_LIFETIME = 3600
 
+# Shared label of Episodic and Entity nodes; uuid lookups that may hit either
+# kind match on it so they stay index-backed.
+NODE_LABEL = "Node"
+
+# (constraint name, label, plain uuid index name) of the uuid uniqueness
+# constraints that back MERGE and endpoint lookups. The plain index is the
+# legacy index the constraint replaces, and the fallback kept while duplicate
+# uuids prevent the constraint.
+UUID_CONSTRAINTS = (
+    ("episodic_uuid_unique", "Episodic", "episodic_uuid"),
+    ("entity_uuid_unique", "Entity", "entity_uuid"),
+    ("community_uuid_unique", "Community", "community_uuid"),
+    ("node_uuid_unique", NODE_LABEL, "node_uuid"),
+)
+
 
 def _validate_identifier(identifier: str, context: str = "identifier") -> None:
     """
@@ -205,6 +220,48 @@ class Neo4jClient:
             logger.error(f"Query timeout after {timeout}s: {query[:100]}...")
             raise TimeoutError(f"Neo4j query timeout after {timeout}s") from None
 
+    async def execute_read(
+        self,
+        query: str,
+        /,
+        timeout: float = TRANSACTION_TIMEOUT,
+        **parameters: Any,
+    ) -> Any:
+        """
+        Execute a read-only Cypher query routed to a reader.
+
+        In a cluster the driver sends the query to a follower or read replica
+        instead of the leader. The driver's default bookmark manager still
+        chains it after this driver's earlier writes, so reads observe them.
+        Parameters are passed to the driver as a dict, so a Cypher parameter
+        may be named ``query``.
+
+        Args:
+            query: Read-only Cypher query string
+            timeout: Query timeout in seconds
+            **parameters: Query parameters
+
+        Returns:
+            Query result (EagerResult with records, summary, keys)
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        assert self._driver is not None
+        try:
+            return await asyncio.wait_for(
+                self._driver.execute_query(
+                    query,
+                    parameters,
+                    routing_=RoutingControl.READ,
+                    database_=self.database,
+                ),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            logger.error(f"Query timeout after {timeout}s: {query[:100]}...")
+            raise TimeoutError(f"Neo4j query timeout after {timeout}s") from None
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[Any, None]:
         """
@@ -266,21 +323,32 @@ class Neo4jClient:
         to_uuid: str,
         relationship_type: str,
         properties: dict[str, Any] | None = None,
+        *,
+        from_label: str = NODE_LABEL,
+        to_label: str = NODE_LABEL,
     ) -> None:
         """
         Save (MERGE) an edge between two nodes.
 
+        Endpoints are matched by label and uuid so the lookup is a unique
+        index seek rather than a scan of every node in the database.
+
         Args:
             from_uuid: Source node UUID
             to_uuid: Target node UUID
             relationship_type: Relationship type (e.g., "MENTIONS", "RELATES_TO")
             properties: Relationship properties (optional)
+            from_label: Label of the source node (default: shared ``Node`` label)
+            to_label: Label of the target node (default: shared ``Node`` label)
 
         Raises:
-            ValueError: If relationship_type or property keys contain invalid characters
+            ValueError: If relationship_type, labels or property keys contain
+                invalid characters
         """
-        # Validate relationship type
+        # Validate relationship type and endpoint labels
         _validate_identifier(relationship_type, "relationship type")
+        _validate_identifier(from_label, "node label")
+        _validate_identifier(to_label, "node label")
 
         # Validate property keys if present
         if properties:
@@ -293,8 +361,8 @@ class Neo4jClient:
             props_str = f"SET {props_str}"
 
         query = f"""
-            MATCH (from {{uuid: $from_uuid}})
-            MATCH (to {{uuid: $to_uuid}})
+            MATCH (from:{from_label} {{uuid: $from_uuid}})
+            MATCH (to:{to_label} {{uuid: $to_uuid}})
             MERGE (from)-[r:{relationship_type}]->(to)
             {props_str}
         """
@@ -356,27 +424,32 @@ class Neo4jClient:
         Save (MERGE) many edges with one query per (type, property keys) group.
 
         Each item must provide ``from_uuid``, ``to_uuid``, ``relationship_type``
-        and optional ``properties``. Same round-trip savings as
+        and optional ``properties``, ``from_label`` and ``to_label`` (endpoint
+        labels, default ``Node``). Same round-trip savings as
         ``save_nodes_batch``.
 
         Args:
             edges: Items with keys "from_uuid", "to_uuid", "relationship_type"
-                and optional "properties".
+                and optional "properties", "from_label", "to_label".
 
         Raises:
-            ValueError: If relationship types or property keys are invalid
+            ValueError: If relationship types, labels or property keys are invalid
         """
         if not edges:
             return
 
-        groups: dict[tuple[str, tuple[str, ...]], list[dict[str, Any]]] = {}
+        groups: dict[tuple[str, str, str, tuple[str, ...]], list[dict[str, Any]]] = {}
         for edge in edges:
             relationship_type = str(edge["relationship_type"])
             _validate_identifier(relationship_type, "relationship type")
+            from_label = str(edge.get("from_label") or NODE_LABEL)
+            to_label = str(edge.get("to_label") or NODE_LABEL)
+            _validate_identifier(from_label, "node label")
+            _validate_identifier(to_label, "node label")
             properties = dict(edge.get("properties") or {})
             for key in properties:
                 _validate_identifier(key, "property key")
-            group_key = (relationship_type, tuple(properties.keys()))
+            group_key = (relationship_type, from_label, to_label, tuple(properties.keys()))
             groups.setdefault(group_key, []).append(
                 {
                     "from_uuid": edge["from_uuid"],
@@ -385,29 +458,31 @@ class Neo4jClient:
                 }
             )
 
-        for (relationship_type, property_keys), rows in groups.items():
+        for (relationship_type, from_label, to_label, property_keys), rows in groups.items():
             set_clause = "SET r += row.properties" if property_keys else ""
             query = f"""
                 UNWIND $rows AS row
-                MATCH (from {{uuid: row.from_uuid}})
-                MATCH (to {{uuid: row.to_uuid}})
+                MATCH (from:{from_label} {{uuid: row.from_uuid}})
+                MATCH (to:{to_label} {{uuid: row.to_uuid}})
                 MERGE (from)-[r:{relationship_type}]->(to)
                 {set_clause}
             """
             await self.execute_query(query, rows=rows)
 
-    async def delete_node(self, uuid: str) -> bool:
+    async def delete_node(self, uuid: str, label: str = NODE_LABEL) -> bool:
         """
         Delete a node by UUID (with DETACH to remove relationships).
 
         Args:
             uuid: Node UUID
+            label: Label of the node (default: shared ``Node`` label)
 
         Returns:
             True if a node was deleted
         """
-        query = """
-            MATCH (n {uuid: $uuid})
+        _validate_identifier(label, "node label")
+        query = f"""
+            MATCH (n:{label} {{uuid: $uuid}})
             DETACH DELETE n
             RETURN count(n) AS deleted
         """
@@ -440,7 +515,7 @@ class Neo4jClient:
             RETURN n
         """
 
-        result = await self.execute_query(query, uuid=uuid)
+        result = await self.execute_read(query, uuid=uuid)
         if result.records and len(result.records) > 0:
             node = result.records[0]["n"]
             return dict(node)
@@ -451,11 +526,14 @@ class Neo4jClient:
         Build standard indices for the knowledge graph.
 
         Creates indices for:
-        - Episodic nodes: uuid, project_id, created_at, memory_id
-        - Entity nodes: uuid, name, project_id, name_embedding (vector)
-        - Community nodes: uuid, project_id
+        - Episodic nodes: project_id, created_at, memory_id
+        - Entity nodes: name, project_id, name_embedding (vector)
+        - Community nodes: project_id
         - RELATES_TO relationships: uuid
 
+        and uuid uniqueness constraints (which carry their own index) on
+        Episodic, Entity, Community and the shared Node label.
+
         Args:
             delete_existing: If True, drop existing indices first
         """
@@ -464,16 +542,13 @@ class Neo4jClient:
         # Index definitions
         indices = [
             # Episodic indices
-            "CREATE INDEX episodic_uuid IF NOT EXISTS FOR (e:Episodic) ON (e.uuid)",
             "CREATE INDEX episodic_project IF NOT EXISTS FOR (e:Episodic) ON (e.project_id)",
             "CREATE INDEX episodic_created_at IF NOT EXISTS FOR (e:Episodic) ON (e.created_at)",
             "CREATE INDEX episodic_memory_id IF NOT EXISTS FOR (e:Episodic) ON (e.memory_id)",
             # Entity indices
-            "CREATE INDEX entity_uuid IF NOT EXISTS FOR (e:Entity) ON (e.uuid)",
             "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
             "CREATE INDEX entity_project IF NOT EXISTS FOR (e:Entity) ON (e.project_id)",
             # Community indices
-            "CREATE INDEX community_uuid IF NOT EXISTS FOR (c:Community) ON (c.uuid)",
             "CREATE INDEX community_project IF NOT EXISTS FOR (c:Community) ON (c.project_id)",
             # Fulltext index for content search
             """CREATE FULLTEXT INDEX episodic_content IF NOT EXISTS
@@ -483,11 +558,23 @@ class Neo4jClient:
         ]
 
         if delete_existing:
+            # Drop uuid constraints first; their backing indexes cannot be
+            # dropped with DROP INDEX.
+            for constraint_name, _label, _plain_index in UUID_CONSTRAINTS:
+                try:
+                    await self.execute_query(f"DROP CONSTRAINT {constraint_name} IF EXISTS")
+                except Exception as e:
+                    logger.warning(
+                        "Failed to drop constraint %s: error_type=%s",
+                        constraint_name,
+                        type(e).__name__,
+                    )
+
             # Drop existing indices
             drop_query = """
                 SHOW INDEXES YIELD name
                 WHERE name STARTS WITH 'episodic_' OR name STARTS WITH 'entity_'
-                    OR name STARTS WITH 'community_'
+                    OR name STARTS WITH 'community_' OR name = 'node_uuid'
                 RETURN name
             """
             result = await self.execute_query(drop_query)
@@ -513,8 +600,87 @@ class Neo4jClient:
                 if "EquivalentSchemaRuleAlreadyExists" not in str(e):
                     logger.warning(f"Failed to create index: {e}")
 
+        for constraint_name, label, plain_index in UUID_CONSTRAINTS:
+            await self._ensure_uuid_constraint(constraint_name, label, plain_index)
+
         logger.info("Neo4j indices built successfully")
 
+    async def _ensure_uuid_constraint(
+        self, constraint_name: str, label: str, plain_index: str
+    ) -> None:
+        """
+        Create a uuid uniqueness constraint, replacing a plain uuid index.
+
+        Nothing is changed when the constraint already exists. Otherwise the
+        label is probed for duplicate uuids first: while there are any the
+        constraint cannot be created, so the plain index is kept (or created)
+        and the duplicates are reported instead of dropping and rebuilding
+        the index on every boot. Neo4j refuses a constraint on a property
+        that already has a plain index, so the plain index is dropped only
+        right before the constraint is created, and restored if that fails.
+        """
+        try:
+            existing = await self.execute_query(
+                "SHOW CONSTRAINTS YIELD name WHERE name = $name RETURN name",
+                name=constraint_name,
+            )
+            if existing.records:
+                return
+            probe = await self.execute_query(
+                f"MATCH (n:{label}) WHERE n.uuid IS NOT NULL "
+                "WITH n.uuid AS uuid, count(*) AS copies WHERE copies > 1 "
+                "RETURN count(uuid) AS duplicates"
+            )
+            duplicates = int(probe.records[0]["duplicates"]) if probe.records else 0
+        except Exception as e:
+            logger.warning(
+                "Failed to inspect uuid constraint %s: error_type=%s",
+                constraint_name,
+                type(e).__name__,
+            )
+            return
+        if duplicates:
+            logger.warning(
+                "Keeping plain uuid index %s instead of constraint %s: "
+                "%d duplicated uuids on %s nodes",
+                plain_index,
+                constraint_name,
+                duplicates,
+                label,
+            )
+            await self._create_plain_uuid_index(plain_index, label)
+            return
+
+        constraint_query = (
+            f"CREATE CONSTRAINT {constraint_name} IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.uuid IS UNIQUE"
+        )
+        try:
+            await self.execute_query(f"DROP INDEX {plain_index} IF EXISTS")
+            await self.execute_query(constraint_query)
+        except Exception as e:
+            if "EquivalentSchemaRuleAlreadyExists" in str(e):
+                return
+            logger.warning(
+                "Failed to create uuid constraint %s: error_type=%s",
+                constraint_name,
+                type(e).__name__,
+            )
+            await self._create_plain_uuid_index(plain_index, label)
+
+    async def _create_plain_uuid_index(self, index_name: str, label: str) -> None:
+        """Create the plain uuid index that keeps lookups index-backed without a constraint."""
+        try:
+            await self.execute_query(
+                f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON (n.uuid)"
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to create uuid index %s: error_type=%s",
+                index_name,
+                type(e).__name__,
+            )
+
     async def create_vector_index(
         self,
         index_name: str,
@@ -655,31 +821,26 @@ class Neo4jClient:
         Returns:
             List of dicts with 'node' and 'score' keys
         """
-        project_filter = ""
-        if project_id:
-            project_filter = "WHERE node.project_id = $project_id OR $project_id IS NULL"
-
-        query = f"""
+        query = """
             CALL db.index.vector.queryNodes(
                 $index_name,
                 $limit,
                 $query_vector
             )
             YIELD node, score
-            {project_filter}
+            WHERE $project_id IS NULL OR node.project_id = $project_id
             RETURN node, score
             ORDER BY score DESC
         """
 
-        params = {
+        params: dict[str, Any] = {
             "index_name": index_name,
             "limit": limit,
             "query_vector": query_vector,
+            "project_id": project_id or None,
         }
-        if project_id:
-            params["project_id"] = project_id
 
-        result = await self.execute_query(query, **params)  # type: ignore[arg-type]
+        result = await self.execute_read(query, **params)
 
         return [
             {"node": dict(record["node"]), "score": record["score"]} for record in result.records
@@ -704,28 +865,23 @@ class Neo4jClient:
         Returns:
             List of dicts with 'node' and 'score' keys
         """
-        project_filter = ""
-        if project_id:
-            project_filter = "WHERE node.project_id = $project_id OR $project_id IS NULL"
-
-        query_str = f"""
+        query_str = """
             CALL db.index.fulltext.queryNodes($index_name, $search_query)
             YIELD node, score
-            {project_filter}
+            WHERE $project_id IS NULL OR node.project_id = $project_id
             RETURN node, score
             ORDER BY score DESC
             LIMIT $limit
         """
 
-        params = {
+        params: dict[str, Any] = {
             "index_name": index_name,
             "search_query": query,
             "limit": limit,
+            "project_id": project_id or None,
         }
-        if project_id:
-            params["project_id"] = project_id
 
-        result = await self.execute_query(query_str, **params)  # type: ignore[arg-type]
+        result = await self.execute_read(query_str, **params)
 
         return [
             {"node": dict(record["node"]), "score": record["score"]} for record in result.records
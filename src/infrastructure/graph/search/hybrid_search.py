@@ -8,20 +8,34 @@ This module provides:
 - MMR (Maximal Marginal Relevance) for diversity re-ranking
 - Temporal decay for recency-aware scoring
 - Query expansion with stop-word filtering for improved FTS
+- Fusion, decay and MMR computed by the shared columnar engine
+  (:mod:`src.infrastructure.memory.ranking`)
+- Optional reranking of an adaptive head of the fused list, with cached scores
 """
 
 import asyncio
 import logging
 from dataclasses import dataclass
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from src.infrastructure.graph.embedding.embedding_service import EmbeddingService
 from src.infrastructure.graph.neo4j_client import Neo4jClient
 from src.infrastructure.graph.schemas import HybridSearchResult, SearchResultItem
-from src.infrastructure.memory.mmr import mmr_rerank
+from src.infrastructure.graph.search.rerank_cache import (
+    RerankScoreCache,
+    get_rerank_score_cache,
+    reranker_model_id,
+)
 from src.infrastructure.memory.query_expansion import extract_keywords
-from src.infrastructure.memory.temporal_decay import apply_temporal_decay
+from src.infrastructure.memory.ranking import (
+    MMRStage,
+    RankingFrame,
+    RankingStage,
+    SortStage,
+    TemporalDecayStage,
+    rrf_fuse,
+    run_stages,
+)
 
 if TYPE_CHECKING:
     from src.domain.llm_providers.base import BaseReranker
@@ -41,8 +55,11 @@ MAX_FULLTEXT_QUERY_TERMS = 256
 class GraphSearchConfig:
     """Configuration for graph hybrid search enhancements.
 
-    Controls MMR diversity re-ranking, temporal decay, and query expansion.
-    All enhancements are opt-in via enable flags.
+    Controls MMR diversity re-ranking, temporal decay, query expansion and
+    reranker cost. All enhancements are opt-in via enable flags.
+
+    ``rerank_decisive_gap`` is the relative drop in fused score, at or after
+    the requested limit, below which candidates are not sent to the reranker.
     """
 
     enable_mmr: bool = True
@@ -50,32 +67,8 @@ class GraphSearchConfig:
     enable_temporal_decay: bool = True
     temporal_half_life_days: float = 30.0
     enable_query_expansion: bool = True
-
-
-def _item_to_dict(item: SearchResultItem) -> dict[str, Any]:
-    """Convert a SearchResultItem to a dict for MMR/temporal decay processing."""
-    return {
-        "uuid": item.uuid,
-        "type": item.type,
-        "name": item.name or "",
-        "content": item.content or item.summary or item.name or "",
-        "summary": item.summary or "",
-        "score": item.score,
-        "metadata": dict(item.metadata),
-    }
-
-
-def _dict_to_item(d: dict[str, Any]) -> SearchResultItem:
-    """Convert a processed dict back to a SearchResultItem."""
-    return SearchResultItem(
-        type=d["type"],
-        uuid=d["uuid"],
-        name=d.get("name"),
-        content=d.get("content") if d["type"] == "episode" else None,
-        summary=d.get("summary") if d["type"] == "entity" else None,
-        score=d.get("score", 0.0),
-        metadata=d.get("metadata", {}),
-    )
+    enable_rerank_cache: bool = True
+    rerank_decisive_gap: float = 0.3
 
 
 class HybridSearch:
@@ -110,6 +103,7 @@ class HybridSearch:
         keyword_weight: float = DEFAULT_KEYWORD_WEIGHT,
         search_config: GraphSearchConfig | None = None,
         reranker: "BaseReranker | None" = None,
+        rerank_cache: RerankScoreCache | None = None,
     ) -> None:
         """
         Initialize hybrid search.
@@ -127,6 +121,8 @@ class HybridSearch:
             reranker: Optional reranker capability (BaseReranker surface). When
                 provided, its scores replace the fused score for the final
                 ordering; when None (default) the pipeline is unchanged.
+            rerank_cache: Reranker score cache (default: the process-wide cache
+                when ``enable_rerank_cache`` is set)
         """
         self._neo4j_client = neo4j_client
         self._embedding_service = embedding_service
@@ -138,6 +134,9 @@ class HybridSearch:
         self._keyword_weight = keyword_weight
         self._search_config = search_config or GraphSearchConfig()
         self._reranker = reranker
+        self._rerank_cache = rerank_cache
+        if self._rerank_cache is None and self._search_config.enable_rerank_cache:
+            self._rerank_cache = get_rerank_score_cache()
 
     async def search(
         self,
@@ -172,7 +171,7 @@ class HybridSearch:
         all_results = combined_entities + episode_results
         all_results.sort(key=lambda x: x.score, reverse=True)
         all_results = self._apply_post_processing(all_results)
-        all_results = await self._apply_reranker(query, all_results)
+        all_results = await self._apply_reranker(query, all_results, limit)
         limited_results = all_results[:limit]
         return HybridSearchResult(
             items=limited_results,
@@ -266,45 +265,31 @@ class HybridSearch:
         if not items:
             return items
 
-        # Convert to dicts for processing
-        dicts = [_item_to_dict(item) for item in items]
-
-        # 1. Temporal decay
+        stages: list[RankingStage] = []
+        # 1. Temporal decay, re-sorted by decayed scores
         if self._search_config.enable_temporal_decay:
-            now = datetime.now(UTC)
-            for d in dicts:
-                created_at_str = d["metadata"].get("created_at")
-                if created_at_str:
-                    try:
-                        created_at = datetime.fromisoformat(created_at_str)
-                        d["score"] = apply_temporal_decay(
-                            d["score"],
-                            created_at,
-                            self._search_config.temporal_half_life_days,
-                            now,
-                        )
-                    except (ValueError, TypeError):
-                        pass  # Skip decay for items without valid timestamps
-
-            # Re-sort after decay
-            dicts.sort(key=lambda x: x.get("score", 0), reverse=True)
-
+            stages += [TemporalDecayStage(self._search_config.temporal_half_life_days), SortStage()]
         # 2. MMR re-ranking for diversity
-        if self._search_config.enable_mmr and len(dicts) > 1:
-            dicts = mmr_rerank(
-                dicts,
-                lambda_=self._search_config.mmr_lambda,
-                content_key="content",
-                score_key="score",
-            )
+        if self._search_config.enable_mmr:
+            stages.append(MMRStage(self._search_config.mmr_lambda))
+        if not stages:
+            return items
 
-        # Convert back to SearchResultItem
-        return [_dict_to_item(d) for d in dicts]
+        frame = run_stages(
+            RankingFrame.build(
+                (item.score for item in items),
+                texts=[item.content or item.summary or item.name or "" for item in items],
+                timestamps=[item.metadata.get("created_at") for item in items],
+            ),
+            stages,
+        )
+        return [items[row].model_copy(update={"score": score}) for row, score in frame.ranked()]
 
     async def _apply_reranker(
         self,
         query: str,
         items: list[SearchResultItem],
+        limit: int | None = None,
     ) -> list[SearchResultItem]:
         """Re-score results through an active reranker capability (R3a seam).
 
@@ -312,24 +297,119 @@ class HybridSearch:
         unchanged. When one is active, its scores replace the fused score
         for the final ordering; reranker failures fall back to the builtin
         ordering rather than failing the search.
+
+        Only the head of the fused list up to a decisive score gap (see
+        :meth:`_rerank_depth`) is reranked; the tail keeps its fused order
+        after the head. Passages already scored for this query are served
+        from the score cache and only the rest are sent to the reranker.
         """
         if self._reranker is None or len(items) < 2:
             return items
-        passages = [item.content or item.summary or item.name or "" for item in items]
+        depth = self._rerank_depth(items, limit)
+        head, tail = items[:depth], items[depth:]
+        passages = [item.content or item.summary or item.name or "" for item in head]
+        scores = await self._rerank_scores(self._reranker, query, passages)
+        if scores is None:
+            return items
+        reranked = [
+            item.model_copy(update={"score": score if score is not None else item.score})
+            for item, score in zip(head, scores, strict=True)
+        ]
+        reranked.sort(key=lambda x: x.score, reverse=True)
+        if tail:
+            self._record_rerank_savings(skipped=len(tail))
+        return reranked + tail
+
+    async def _rerank_scores(
+        self, reranker: "BaseReranker", query: str, passages: list[str]
+    ) -> list[float | None] | None:
+        """Reranker score per passage (None if unscored); None if the reranker failed."""
+        model = reranker_model_id(reranker)
+        cache = self._rerank_cache
+        scores: list[float | None] = (
+            cache.get_many(model, query, passages) if cache is not None else [None] * len(passages)
+        )
+        missing = list(dict.fromkeys(p for p, s in zip(passages, scores, strict=True) if s is None))
+        cached_count = len(passages) - sum(1 for s in scores if s is None)
+        if not missing:
+            self._record_rerank_savings(calls_avoided=1, cached=cached_count)
+            return scores
+        # A single passage has nothing to be ranked against, so rerank the whole head.
+        to_rank = missing if len(missing) > 1 else list(dict.fromkeys(passages))
+        # Rerankers that pad unscored passages with a neutral score report them.
+        rank_with_fallbacks = getattr(reranker, "rank_with_fallbacks", None)
+        fallbacks: set[str] = set()
         try:
-            ranked: list[tuple[str, float]] = await self._reranker.rank(query, passages)
+            if rank_with_fallbacks is not None:
+                ranked, fallbacks = await rank_with_fallbacks(query, to_rank)
+            else:
+                ranked = await reranker.rank(query, to_rank)
         except Exception:
             logger.warning("reranker capability failed; keeping fused ordering", exc_info=True)
-            return items
+            return None
         score_by_passage: dict[str, float] = {}
         for passage, score in ranked:
             score_by_passage.setdefault(passage, score)
-        reranked = [
-            item.model_copy(update={"score": score_by_passage.get(passage, item.score)})
-            for item, passage in zip(items, passages, strict=True)
+        # Identical scores for every passage are a provider fallback, not a ranking.
+        if cache is not None and len(set(score_by_passage.values())) > 1:
+            cache.put_many(
+                model,
+                query,
+                [
+                    (passage, score)
+                    for passage, score in score_by_passage.items()
+                    if passage not in fallbacks
+                ],
+            )
+        if to_rank is missing:
+            self._record_rerank_savings(cached=cached_count)
+        return [
+            score_by_passage.get(passage, score)
+            for passage, score in zip(passages, scores, strict=True)
         ]
-        reranked.sort(key=lambda x: x.score, reverse=True)
-        return reranked
+
+    def _rerank_depth(self, items: list[SearchResultItem], limit: int | None) -> int:
+        """Number of leading candidates worth sending to the reranker.
+
+        Candidates past the first position ``>= limit`` where the fused score
+        drops by at least ``rerank_decisive_gap`` (relative) are unlikely to be
+        promoted into the results, so they are not reranked. Without a
+        decisive gap every candidate is reranked.
+        """
+        gap = self._search_config.rerank_decisive_gap
+        if not limit or gap <= 0:
+            return len(items)
+        for depth in range(max(limit, 2), len(items)):
+            previous, current = items[depth - 1].score, items[depth].score
+            if previous > 0 and (previous - current) / previous >= gap:
+                return depth
+        return len(items)
+
+    @staticmethod
+    def _record_rerank_savings(
+        *, calls_avoided: int = 0, cached: int = 0, skipped: int = 0
+    ) -> None:
+        """Count reranker work avoided by the score cache and the adaptive depth."""
+        from src.infrastructure.telemetry.metrics import increment_counter
+
+        if calls_avoided:
+            increment_counter(
+                "graph_rerank_calls_avoided_total",
+                "Reranker calls skipped because every passage score was cached",
+                amount=calls_avoided,
+            )
+        if cached:
+            increment_counter(
+                "graph_rerank_passages_cached_total",
+                "Passages scored from the reranker score cache",
+                amount=cached,
+            )
+        if skipped:
+            increment_counter(
+                "graph_rerank_passages_skipped_total",
+                "Passages past a decisive fused-score gap that were not reranked",
+                amount=skipped,
+            )
 
     async def vector_search(
         self,
@@ -680,46 +760,27 @@ class HybridSearch:
         Returns:
             Combined and re-ranked results
         """
-        # Build score maps
-        scores: dict[str, float] = {}
-        items_map: dict[str, SearchResultItem] = {}
-
-        # Process vector results
-        for rank, item in enumerate(vector_results, start=1):
-            uuid = item.uuid
-            rrf_score = vector_weight * (1.0 / (self._rrf_k + rank))
-            scores[uuid] = scores.get(uuid, 0) + rrf_score
-            if uuid not in items_map:
-                items_map[uuid] = item
-
-        # Process keyword results
-        for rank, item in enumerate(keyword_results, start=1):
-            uuid = item.uuid
-            rrf_score = keyword_weight * (1.0 / (self._rrf_k + rank))
-            scores[uuid] = scores.get(uuid, 0) + rrf_score
-            if uuid not in items_map:
-                items_map[uuid] = item
-
-        # Create combined results with new scores
+        legs = (vector_results, keyword_results)
+        sources, scores = rrf_fuse(
+            [[item.uuid for item in leg] for leg in legs],
+            [vector_weight, keyword_weight],
+            k=self._rrf_k,
+        )
         combined: list[SearchResultItem] = []
-        for uuid, score in scores.items():
-            item = items_map[uuid]
-            # Merge metadata: prefer vector result's metadata, add rrf_score
-            merged_metadata = {**item.metadata, "rrf_score": score}
-            combined_item = SearchResultItem(
-                type=item.type,
-                uuid=item.uuid,
-                name=item.name,
-                content=item.content,
-                summary=item.summary,
-                score=score,
-                metadata=merged_metadata,
+        for (leg, position), score in zip(sources, scores.tolist(), strict=True):
+            item = legs[leg][position]
+            # Keep the first-seen (vector) result's metadata, add rrf_score
+            combined.append(
+                SearchResultItem(
+                    type=item.type,
+                    uuid=item.uuid,
+                    name=item.name,
+                    content=item.content,
+                    summary=item.summary,
+                    score=score,
+                    metadata={**item.metadata, "rrf_score": score},
+                )
             )
-            combined.append(combined_item)
-
-        # Sort by RRF score
-        combined.sort(key=lambda x: x.score, reverse=True)
-
         return combined
 
     def _escape_fulltext_query(self, query: str) -> str:
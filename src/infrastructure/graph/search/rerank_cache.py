@@ -0,0 +1,85 @@
+"""Score cache for reranker calls made by graph :class:`HybridSearch`.
+
+A reranker scores ``(query, passage)`` pairs independently of the rest of the
+candidate list, and repeated queries send mostly the same passages. Scores are
+cached per ``(reranker model, query hash, passage hash)`` so only passages that
+were never scored for the query are sent to the reranker; when every passage
+is cached the call is skipped entirely.
+
+Hashes keep memory per entry constant regardless of passage length. Entries
+are evicted least-recently-used first once ``RERANK_CACHE_SIZE`` is exceeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+RERANK_CACHE_SIZE = 50_000  # cached (query, passage) scores across all models
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def reranker_model_id(reranker: object) -> str:
+    """Stable identity of a reranker for cache keys: its model, else its class."""
+    model = getattr(reranker, "model", None)
+    if isinstance(model, str) and model:
+        return model
+    return f"{type(reranker).__module__}.{type(reranker).__qualname__}"
+
+
+class RerankScoreCache:
+    """LRU cache of reranker scores keyed by model, query and passage."""
+
+    def __init__(self, max_entries: int = RERANK_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get_many(self, model: str, query: str, passages: list[str]) -> list[float | None]:
+        """Cached score for each passage, or None where it was never scored."""
+        query_hash = _digest(query)
+        scores: list[float | None] = []
+        for passage in passages:
+            key = (model, query_hash, _digest(passage))
+            score = self._entries.get(key)
+            if score is None:
+                self._stats["misses"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+            scores.append(score)
+        return scores
+
+    def put_many(self, model: str, query: str, scored: list[tuple[str, float]]) -> None:
+        """Store ``(passage, score)`` pairs returned by the reranker."""
+        query_hash = _digest(query)
+        for passage, score in scored:
+            key = (model, query_hash, _digest(passage))
+            self._entries[key] = float(score)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached score."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the number of cached scores."""
+        return {**self._stats, "entries": len(self._entries)}
+
+
+# Singleton instance
+_rerank_score_cache: RerankScoreCache | None = None
+
+
+def get_rerank_score_cache() -> RerankScoreCache:
+    """Get the process-wide reranker score cache."""
+    global _rerank_score_cache
+    if _rerank_score_cache is None:
+        _rerank_score_cache = RerankScoreCache()
+    return _rerank_score_cache
@@ -36,11 +36,14 @@ Construction:
 
 The ``http_*`` kwargs default to ``None``; when omitted they are derived from
 the Bolt client's URI/database/credentials so the two transports always agree.
+
+SQL statements share one pooled keep-alive ``httpx.AsyncClient`` per store
+(closed by :meth:`ArcadeDBGraphStore.close`), and the lazily created fulltext
+schema is ensured once per database rather than before every query.
 """
 
 from __future__ import annotations
 
-import base64
 import logging
 from typing import Any
 from urllib.parse import urlparse
@@ -53,6 +56,19 @@ from src.infrastructure.graph.neo4j_client import Neo4jClient
 
 logger = logging.getLogger(__name__)
 
+HTTP_TIMEOUT = 30.0  # seconds per SQL statement
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+
+# vectorNeighbors() cannot filter by project, so project-scoped searches ask for
+# more neighbours and widen k by this factor until ``limit`` hits survive the
+# filter, the index is exhausted, or VECTOR_MAX_NEIGHBORS is reached.
+VECTOR_OVERSAMPLE_FACTOR = 4
+VECTOR_MAX_NEIGHBORS = 2000
+
+# (http_base_url, database) pairs whose fulltext property/index are known to exist.
+_fulltext_schema_ensured: set[tuple[str, str]] = set()
+
 
 class ArcadeDBGraphStore(NativeGraphAdapter):
     """ArcadeDB backend (Bolt + HTTP SQL) implementing ``GraphStorePort``.
@@ -82,6 +98,7 @@ class ArcadeDBGraphStore(NativeGraphAdapter):
         self._http_base_url = http_base_url or f"http://{host}:2480"
         self._http_database = http_database or neo4j_client.database
         self._http_auth = http_auth or (neo4j_client.user, neo4j_client.password)
+        self._http_client: httpx.AsyncClient | None = None
         # Embedding dimension drives the vector index dimension; fall back to
         # the embedding service's reported dimension, else 1536 (OpenAI text).
         self._vector_dim: int = getattr(self._embedding_service, "embedding_dim", None) or 1536
@@ -96,35 +113,50 @@ class ArcadeDBGraphStore(NativeGraphAdapter):
     # SQL-over-HTTP transport
     # ------------------------------------------------------------------
 
+    def _http(self) -> httpx.AsyncClient:
+        """Return the store's pooled HTTP client, creating it on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=self._http_base_url,
+                auth=self._http_auth,
+                timeout=HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client, then the Bolt connection."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        await super().close()
+
     async def _sql(self, command: str) -> Any:  # noqa: ANN401
         """Run a SQL command against ArcadeDB's HTTP API and return ``result``.
 
         Endpoint: ``POST /api/v1/command/{database}`` with JSON body
-        ``{"language":"sql","command":...}`` (Basic auth).
+        ``{"language":"sql","command":...}`` (Basic auth), sent over the
+        store's pooled keep-alive client.
 
         NOTE: ArcadeDB's HTTP command endpoint does NOT bind ``parameters``
         (named ``:x`` or positional ``?``) in this build — they are silently
         dropped. Dynamic values MUST be serialized into the command string as
         SQL literals. Use :meth:`_sql_vec_literal` for query vectors.
         """
-        url = f"{self._http_base_url}/api/v1/command/{self._http_database}"
         body: dict[str, Any] = {"language": "sql", "command": command}
-        token = base64.b64encode(f"{self._http_auth[0]}:{self._http_auth[1]}".encode()).decode()
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                url,
-                json=body,
-                headers={"Authorization": f"Basic {token}"},
-            )
-            payload: dict[str, Any] = {}
-            try:
-                payload = resp.json()
-            except Exception:
-                resp.raise_for_status()
-            if resp.is_error or "error" in payload:
-                detail = payload.get("detail") or payload.get("error") or resp.text
-                raise RuntimeError(f"ArcadeDB SQL error: {detail}")
-            return payload.get("result", [])
+        resp = await self._http().post(f"/api/v1/command/{self._http_database}", json=body)
+        payload: dict[str, Any] = {}
+        try:
+            payload = resp.json()
+        except Exception:
+            resp.raise_for_status()
+        if resp.is_error or "error" in payload:
+            detail = payload.get("detail") or payload.get("error") or resp.text
+            raise RuntimeError(f"ArcadeDB SQL error: {detail}")
+        return payload.get("result", [])
 
     @staticmethod
     def _sql_str_literal(text: str) -> str:
@@ -215,12 +247,29 @@ class ArcadeDBGraphStore(NativeGraphAdapter):
             SELECT expand(vectorNeighbors('Entity[name_embedding]', [v1,v2,...], k))
 
         Returns rows each carrying the matched ``record`` and a ``distance``.
+        The index spans all projects, so with ``project_id`` set ``k`` starts at
+        ``limit * VECTOR_OVERSAMPLE_FACTOR`` and is widened by that factor until
+        ``limit`` project hits are found, the index returns fewer than ``k`` rows,
+        or ``k`` reaches ``VECTOR_MAX_NEIGHBORS``.
         """
         vec_lit = self._sql_vec_literal(query_vector)
         lim = int(limit)
-        rows = await self._sql(
-            f"SELECT expand(vectorNeighbors('Entity[name_embedding]', {vec_lit}, {lim}))"
-        )
+        if lim <= 0:
+            return []
+        max_k = max(VECTOR_MAX_NEIGHBORS, lim)
+        k = lim if project_id is None else min(lim * VECTOR_OVERSAMPLE_FACTOR, max_k)
+        while True:
+            rows = await self._sql(
+                f"SELECT expand(vectorNeighbors('Entity[name_embedding]', {vec_lit}, {k}))"
+            )
+            hits = self._vector_hits(rows, project_id)
+            if len(hits) >= lim or len(rows) < k or k >= max_k:
+                return hits[:lim]
+            k = min(k * VECTOR_OVERSAMPLE_FACTOR, max_k)
+
+    @staticmethod
+    def _vector_hits(rows: list[Any], project_id: str | None) -> list[GraphSearchHit]:
+        """Convert ``vectorNeighbors`` rows into hits, keeping one project's records."""
         hits: list[GraphSearchHit] = []
         for row in rows:
             if not isinstance(row, dict):
@@ -240,6 +289,26 @@ class ArcadeDBGraphStore(NativeGraphAdapter):
     # Fulltext search (SQL SEARCH_INDEX function over HTTP)
     # ------------------------------------------------------------------
 
+    async def _ensure_fulltext_schema(self) -> None:
+        """Create the fulltext property + index once per database.
+
+        A failed attempt is not remembered, so the next search retries it.
+        """
+        key = (self._http_base_url, self._http_database)
+        if key in _fulltext_schema_ensured:
+            return
+        # ArcadeDB's Lucene fulltext index type is ``FULL_TEXT`` (NOT
+        # ``FULLTEXT`` / ``LSM_FULLTEXT``).
+        try:
+            await self._sql("CREATE PROPERTY Entity.name_summary IF NOT EXISTS STRING")
+            await self._sql(
+                "CREATE INDEX entity_name_summary IF NOT EXISTS ON Entity (name_summary) FULL_TEXT"
+            )
+        except Exception as e:
+            logger.debug("ArcadeDB fulltext index ensure skipped: %s", e)
+            return
+        _fulltext_schema_ensured.add(key)
+
     async def fulltext_search(
         self,
         query: str,
@@ -254,17 +323,9 @@ class ArcadeDBGraphStore(NativeGraphAdapter):
             SELECT expand(SEARCH_INDEX('Entity[name_summary]', 'text'))
 
         Requires a ``LSM_FULLTEXT`` index on ``Entity.name_summary`` (created
-        lazily here if missing).
+        lazily on the first search against each database).
         """
-        # Lazily ensure the fulltext index + property exist. ArcadeDB's Lucene
-        # fulltext index type is ``FULL_TEXT`` (NOT ``FULLTEXT`` / ``LSM_FULLTEXT``).
-        try:
-            await self._sql("CREATE PROPERTY Entity.name_summary IF NOT EXISTS STRING")
-            await self._sql(
-                "CREATE INDEX entity_name_summary IF NOT EXISTS ON Entity (name_summary) FULL_TEXT"
-            )
-        except Exception as e:
-            logger.debug("ArcadeDB fulltext index ensure skipped: %s", e)
+        await self._ensure_fulltext_schema()
 
         # SEARCH_INDEX takes the INDEX NAME (not 'Type[prop]') and a Lucene query.
         text_lit = self._sql_str_literal(query)
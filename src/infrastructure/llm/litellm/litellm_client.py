@@ -39,6 +39,10 @@ from src.infrastructure.llm.model_registry import (
     get_model_max_input_tokens,
 )
 from src.infrastructure.llm.param_resolver import resolve_llm_params
+from src.infrastructure.llm.prompt_cache import (
+    get_prompt_cache_planner,
+    supports_cache_breakpoints,
+)
 from src.infrastructure.llm.provider_credentials import from_decrypted_api_key
 from src.infrastructure.llm.resilience import (
     get_circuit_breaker_registry,
@@ -403,6 +407,16 @@ class LiteLLMClient(LLMClient):
             }
 
         settings = get_settings()
+        cache_plan = get_prompt_cache_planner().plan(
+            kwargs["messages"],
+            kwargs.get("tools"),
+            breakpoints_enabled=settings.llm_prompt_cache_enabled
+            and supports_cache_breakpoints(self.provider_config.provider_type.value, model),
+        )
+        kwargs["messages"] = cache_plan.messages
+        if cache_plan.tools:
+            kwargs["tools"] = cache_plan.tools
+
         kwargs["num_retries"] = settings.llm_max_retries
         return kwargs
 
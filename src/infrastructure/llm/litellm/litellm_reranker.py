@@ -124,6 +124,11 @@ class LiteLLMReranker(BaseReranker):
             f"model={self._model}, native={self._use_native_rerank}"
         )
 
+    @property
+    def model(self) -> str:
+        """Rerank model name (identifies cached rerank scores)."""
+        return self._model
+
     def _get_default_model(self, provider_type: ProviderType) -> str:
         """Get default rerank model for provider."""
         return DEFAULT_RERANK_MODELS.get(provider_type, "gpt-4o-mini")
@@ -165,18 +170,41 @@ class LiteLLMReranker(BaseReranker):
         Returns:
             List of (passage, score) tuples sorted by relevance (descending)
         """
+        ranked, _ = await self.rank_with_fallbacks(query, passages, top_n)
+        return ranked
+
+    async def rank_with_fallbacks(
+        self,
+        query: str,
+        passages: list[str],
+        top_n: int | None = None,
+    ) -> tuple[list[tuple[str, float]], set[str]]:
+        """
+        Rank passages and report which ones were not actually scored.
+
+        Passages the model returned no usable score for keep a neutral
+        fallback score in the ranking; callers caching scores must skip them.
+
+        Args:
+            query: Search query
+            passages: List of passages to rank
+            top_n: Optional limit on number of results
+
+        Returns:
+            Tuple of (ranked (passage, score) tuples, passages with fallback scores)
+        """
         if not passages:
-            return []
+            return [], set()
 
         if len(passages) == 1:
-            return [(passages[0], 1.0)]
+            return [(passages[0], 1.0)], {passages[0]}
 
         if top_n is None:
             top_n = len(passages)
 
         try:
             if self._use_native_rerank:
-                return await self._cohere_rerank(query, passages, top_n)
+                return await self._cohere_rerank(query, passages, top_n), set()
             else:
                 return await self._llm_rerank(query, passages, top_n)
         except RateLimitError:
@@ -184,7 +212,7 @@ class LiteLLMReranker(BaseReranker):
         except Exception as e:
             logger.error("Reranking failed error_type=%s", type(e).__name__)
             # Fallback to original order with neutral scores
-            return [(p, 0.5) for p in passages[:top_n]]
+            return [(p, 0.5) for p in passages[:top_n]], set(passages)
 
     async def _cohere_rerank(
         self,
@@ -242,7 +270,7 @@ class LiteLLMReranker(BaseReranker):
         query: str,
         passages: list[str],
         top_n: int,
-    ) -> list[tuple[str, float]]:
+    ) -> tuple[list[tuple[str, float]], set[str]]:
         """
         Rerank using LLM-based relevance scoring.
 
@@ -252,7 +280,7 @@ class LiteLLMReranker(BaseReranker):
             top_n: Number of results to return
 
         Returns:
-            Ranked results with scores
+            Tuple of (ranked results with scores, passages with fallback scores)
         """
         import litellm
 
@@ -312,7 +340,7 @@ class LiteLLMReranker(BaseReranker):
             message = response.choices[0].message
             # Handle both dict and object formats
             content = message.get("content") if isinstance(message, dict) else message.content
-            scores, _ = self._parse_rerank_response(content, len(passages))
+            scores, fallback_indices = self._parse_rerank_response(content, len(passages))
             if scores and all(score == 0.5 for score in scores):
                 logger.warning(
                     "Rerank response parsing degraded to neutral scores; "
@@ -339,11 +367,11 @@ class LiteLLMReranker(BaseReranker):
                         if isinstance(retry_message, dict)
                         else retry_message.content
                     )
-                    retry_scores, retry_padded = self._parse_rerank_response(
+                    retry_scores, retry_fallback_indices = self._parse_rerank_response(
                         retry_content, len(passages)
                     )
-                    if not retry_padded:
-                        scores = retry_scores
+                    if not retry_fallback_indices:
+                        scores, fallback_indices = retry_scores, retry_fallback_indices
                 except Exception as retry_error:
                     logger.debug(f"Rerank compact retry failed: {retry_error}")
 
@@ -355,7 +383,7 @@ class LiteLLMReranker(BaseReranker):
             passage_scores = passage_scores[:top_n]
 
             logger.debug(f"LLM rerank: {len(passages)} passages -> {len(passage_scores)} results")
-            return passage_scores
+            return passage_scores, {passages[index] for index in fallback_indices}
 
         except Exception as e:
             error_msg = str(e).lower()
@@ -421,9 +449,13 @@ Ensure:
             cleaned = "\n".join(lines).strip()
         return cleaned
 
-    def _normalize_scores(self, scores: list, expected_count: int) -> tuple[list[float], bool]:
-        """Normalize and validate scores list."""
-        padded = False
+    def _normalize_scores(self, scores: list, expected_count: int) -> tuple[list[float], set[int]]:
+        """Normalize and validate scores list.
+
+        Returns the scores and the indices that got the neutral fallback
+        score (missing or invalid in the response).
+        """
+        fallback_indices = set(range(len(scores), expected_count))
         if len(scores) != expected_count:
             logger.warning(
                 f"Expected {expected_count} scores, got {len(scores)}. Padding or truncating..."
@@ -431,7 +463,6 @@ Ensure:
             while len(scores) < expected_count:
                 scores.append(0.5)
             scores = scores[:expected_count]
-            padded = True
 
         normalized_scores = []
         for index, score in enumerate(scores):
@@ -444,10 +475,11 @@ Ensure:
                     type(e).__name__,
                 )
                 score_float = 0.5
+                fallback_indices.add(index)
             score_float = max(0.0, min(1.0, score_float))
             normalized_scores.append(score_float)
 
-        return normalized_scores, padded
+        return normalized_scores, fallback_indices
 
     def _extract_scores_from_data(self, data: Any) -> list:
         """Extract scores list from parsed JSON data."""
@@ -463,14 +495,14 @@ Ensure:
 
     def _parse_rerank_response(
         self, response: str, expected_count: int
-    ) -> tuple[list[float], bool]:
+    ) -> tuple[list[float], set[int]]:
         """
         Parse LLM response into scores.
         Args:
             response: LLM response string (JSON)
             expected_count: Expected number of scores
         Returns:
-            Tuple of (scores list, was_padded bool)
+            Tuple of (scores list, indices padded with the neutral score)
         """
         try:
             cleaned_response = self._strip_markdown_code_block(response)
@@ -480,7 +512,7 @@ Ensure:
 
         except Exception as e:
             logger.error(f"Error parsing rerank response: {e}")
-            return [0.5] * expected_count, True
+            return [0.5] * expected_count, set(range(expected_count))
 
     async def score(self, query: str, passage: str) -> float:
         """
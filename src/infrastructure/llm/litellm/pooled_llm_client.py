@@ -15,8 +15,10 @@ Per call the client:
 4. On failover-worthy errors records the failure with the balancer and
    re-picks, excluding the failed candidate, up to ``max_attempts``
    times.
-5. Streaming reuses step 2 once; mid-stream retries are out of scope
-   (the existing failover chain handles those in the agent layer).
+5. Streaming applies the same failover loop. When a stream drops after
+   text was already yielded, the next candidate receives the partial
+   assistant text as a prefill / continuation request and the overlap is
+   trimmed so callers observe one seamless stream (``resume_streams``).
 """
 
 from __future__ import annotations
@@ -58,6 +60,19 @@ logger = logging.getLogger(__name__)
 _AUTO_MODEL_SENTINEL = "auto"
 _DEFAULT_MAX_ATTEMPTS = 3
 
+# Providers that accept a trailing assistant message as a prefill and
+# continue it verbatim. Everything else gets an explicit instruction.
+_PREFILL_PROVIDER_TYPES = frozenset({"anthropic"})
+_RESUME_INSTRUCTION = (
+    "Your previous response was interrupted. Continue it exactly from where "
+    "it stopped. Do not repeat any text that was already written and do not "
+    "add any preamble."
+)
+# Maximum number of continuation characters inspected for overlap with the
+# already-streamed text, and the minimum overlap length worth trimming.
+_RESUME_OVERLAP_WINDOW = 256
+_MIN_RESUME_OVERLAP = 8
+
 
 class PooledLLMClient(LLMClient):
     """``LLMClient`` that fans out across the tenant pool per call.
@@ -77,6 +92,7 @@ class PooledLLMClient(LLMClient):
         broker: AutoBroker | None = None,
         temperature: float = 0.7,
         max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        resume_streams: bool = True,
     ) -> None:
         super().__init__(config=LLMConfig(temperature=temperature), cache=True)
         self._tenant_id = tenant_id
@@ -84,6 +100,7 @@ class PooledLLMClient(LLMClient):
         self._balancer = balancer or get_load_balancer()
         self._broker = broker or get_auto_broker()
         self._max_attempts = max(1, max_attempts)
+        self._resume_streams = resume_streams
         self._client_cache: dict[str, LiteLLMClient] = {}
 
     @property
@@ -192,41 +209,102 @@ class PooledLLMClient(LLMClient):
         langfuse_context: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> AsyncGenerator[Any, None]:
-        """Stream from a single candidate. Mid-stream failover is out of scope."""
-        candidate = await self._pick_candidate(
-            messages=messages,
-            tools=kwargs.get("tools"),
-            model_arg=kwargs.pop("model", None),
-            model_size=model_size,
-            excluded=set(),
-        )
-        if candidate is None:
-            raise RuntimeError(
-                f"PooledLLMClient: no candidate model available for tenant={self._tenant_id}"
+        """Stream from the pool, resuming on another candidate after a drop.
+
+        A failover-worthy error re-issues the request to the next
+        candidate. Text that was already yielded is sent back as a partial
+        assistant turn and the continuation is stitched onto it, so the
+        caller never sees the interruption. Streams that already yielded
+        tool-call deltas are not resumable and re-raise the error.
+        """
+        tools = kwargs.get("tools")
+        model_arg = kwargs.pop("model", None)
+        max_attempts = self._max_attempts if self._resume_streams else 1
+        excluded: set[str] = set()
+        transcript = _StreamTranscript()
+        last_error: Exception | None = None
+        dropped: tuple[str, str] | None = None  # (candidate key, error type) to resume
+
+        for attempt in range(max_attempts):
+            candidate = await self._pick_candidate(
+                messages=messages,
+                tools=tools,
+                model_arg=model_arg if attempt == 0 else None,
+                model_size=model_size,
+                excluded=excluded,
             )
+            if candidate is None:
+                break
+            # Logged only once a candidate is there to resume on.
+            self._log_stream_resume(dropped, len(transcript.text), attempt, max_attempts)
+
+            client = self._get_client(candidate.provider_config)
+            request_messages: list[Any] = list(messages)
+            stitcher: _ContinuationStitcher | None = None
+            if transcript.text:
+                request_messages = self._build_resume_messages(messages, transcript.text, candidate)
+                stitcher = _ContinuationStitcher(transcript.text)
 
-        client = self._get_client(candidate.provider_config)
-        async with self._balancer.track(candidate):
             try:
-                async for chunk in client.generate_stream(
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    model_size=model_size,
-                    langfuse_context=langfuse_context,
-                    model=candidate.model_name,
-                    **kwargs,
-                ):
-                    yield chunk
+                async with self._balancer.track(candidate):
+                    async for chunk in client.generate_stream(
+                        messages=request_messages,
+                        max_tokens=max_tokens,
+                        model_size=model_size,
+                        langfuse_context=langfuse_context,
+                        model=candidate.model_name,
+                        **kwargs,
+                    ):
+                        ready = [chunk] if stitcher is None else stitcher.feed(chunk)
+                        for out in ready:
+                            transcript.record(out)
+                            yield out
+                    if stitcher is not None:
+                        for out in stitcher.flush():
+                            transcript.record(out)
+                            yield out
                 self._balancer.record_success(candidate)
+                return
             except Exception as exc:
-                if is_failover_worthy(exc):
-                    self._balancer.record_failure(candidate)
-                raise
+                if not is_failover_worthy(exc):
+                    raise
+                self._balancer.record_failure(candidate)
+                if not self._resume_streams or transcript.has_tool_calls:
+                    raise
+                last_error = exc
+                dropped = (candidate.candidate_key, type(exc).__name__)
+                excluded.add(candidate.candidate_key)
+
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError(
+            f"PooledLLMClient: no candidate model available for tenant={self._tenant_id}"
+        )
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _log_stream_resume(
+        self,
+        dropped: tuple[str, str] | None,
+        resumed_chars: int,
+        attempt: int,
+        max_attempts: int,
+    ) -> None:
+        """Log the drop of ``attempt`` (1-based) that the next attempt resumes."""
+        if dropped is None:
+            return
+        failed_candidate_key, error_type = dropped
+        get_llm_logger().log_pool_stream_resume(
+            tenant_id=self._tenant_id,
+            failed_candidate_key=failed_candidate_key,
+            error_type=error_type,
+            resumed_chars=resumed_chars,
+            attempt=attempt,
+            max_attempts=max_attempts,
+        )
+
     async def _pick_candidate(
         self,
         *,
@@ -346,6 +424,23 @@ class PooledLLMClient(LLMClient):
         self._client_cache[key] = client
         return client
 
+    @staticmethod
+    def _build_resume_messages(
+        messages: list[Message] | list[dict[str, Any]],
+        partial_text: str,
+        candidate: CandidateModel,
+    ) -> list[Any]:
+        """Append the partial assistant turn (and instruction) for a resume."""
+        resumed: list[Any] = list(messages)
+        if candidate.provider_type in _PREFILL_PROVIDER_TYPES:
+            # Prefill providers reject a final assistant turn that ends in
+            # whitespace; the stitcher re-aligns the leading whitespace.
+            resumed.append({"role": "assistant", "content": partial_text.rstrip()})
+            return resumed
+        resumed.append({"role": "assistant", "content": partial_text})
+        resumed.append({"role": "user", "content": _RESUME_INSTRUCTION})
+        return resumed
+
     @staticmethod
     def _annotate_response(
         response: dict[str, Any], candidate: CandidateModel, attempt: int
@@ -358,3 +453,125 @@ class PooledLLMClient(LLMClient):
         meta["provider_type"] = candidate.provider_type
         meta["model"] = candidate.model_name
         meta["attempts"] = attempt + 1
+
+
+def _chunk_delta(chunk: Any) -> Any:  # noqa: ANN401
+    """Return the first choice's delta of a streaming chunk, if any."""
+    choices = getattr(chunk, "choices", None)
+    if not choices:
+        return None
+    return getattr(choices[0], "delta", None)
+
+
+def _chunk_has_payload(chunk: Any) -> bool:  # noqa: ANN401
+    """Whether a chunk carries anything besides (empty) text content."""
+    if getattr(chunk, "usage", None):
+        return True
+    choices = getattr(chunk, "choices", None)
+    if not choices:
+        return False
+    if getattr(choices[0], "finish_reason", None):
+        return True
+    delta = getattr(choices[0], "delta", None)
+    if delta is None:
+        return False
+    return bool(
+        getattr(delta, "content", None)
+        or getattr(delta, "tool_calls", None)
+        or getattr(delta, "reasoning_content", None)
+        or getattr(delta, "thinking", None)
+        or getattr(delta, "reasoning", None)
+    )
+
+
+class _StreamTranscript:
+    """Accumulates what has been yielded to the caller so far."""
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self.has_tool_calls = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def record(self, chunk: Any) -> None:  # noqa: ANN401
+        delta = _chunk_delta(chunk)
+        if delta is None:
+            return
+        content = getattr(delta, "content", None)
+        if isinstance(content, str) and content:
+            self._parts.append(content)
+        if getattr(delta, "tool_calls", None):
+            self.has_tool_calls = True
+
+
+class _ContinuationStitcher:
+    """Trims the part of a resumed stream that repeats the streamed prefix.
+
+    Continuation chunks are held back until enough text has arrived to
+    decide how much of it duplicates ``prefix``: either a full restart
+    (the model re-emits the whole prefix) or a short suffix/prefix
+    overlap. Once decided, chunks pass through untouched.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._target = min(len(prefix), _RESUME_OVERLAP_WINDOW)
+        self._pending: list[Any] = []
+        self._buffered = ""
+        self._resolved = False
+
+    def feed(self, chunk: Any) -> list[Any]:  # noqa: ANN401
+        if self._resolved:
+            return [chunk]
+        self._pending.append(chunk)
+        delta = _chunk_delta(chunk)
+        content = getattr(delta, "content", None) if delta is not None else None
+        if isinstance(content, str):
+            self._buffered += content
+        if self._should_wait():
+            return []
+        return self._release()
+
+    def flush(self) -> list[Any]:
+        if self._resolved:
+            return []
+        return self._release()
+
+    def _should_wait(self) -> bool:
+        buffered = self._buffered
+        if len(buffered) < self._target:
+            return True
+        # Still replaying the already-streamed text verbatim: nothing new
+        # has been produced yet, so holding it back costs no latency.
+        return len(buffered) < len(self._prefix) and self._prefix.startswith(buffered)
+
+    def _trim_length(self) -> int:
+        prefix, buffered = self._prefix, self._buffered
+        if buffered.startswith(prefix):
+            return len(prefix)
+        limit = min(len(buffered), _RESUME_OVERLAP_WINDOW, len(prefix))
+        for size in range(limit, _MIN_RESUME_OVERLAP - 1, -1):
+            if prefix.endswith(buffered[:size]):
+                return size
+        if prefix[-1:].isspace():
+            return len(buffered) - len(buffered.lstrip())
+        return 0
+
+    def _release(self) -> list[Any]:
+        self._resolved = True
+        remaining = self._trim_length() if self._prefix else 0
+        released: list[Any] = []
+        for chunk in self._pending:
+            delta = _chunk_delta(chunk)
+            content = getattr(delta, "content", None) if delta is not None else None
+            if remaining and isinstance(content, str) and content:
+                cut = min(remaining, len(content))
+                remaining -= cut
+                delta.content = content[cut:]
+                if not _chunk_has_payload(chunk):
+                    continue
+            released.append(chunk)
+        self._pending = []
+        return released
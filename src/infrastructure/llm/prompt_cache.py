@@ -0,0 +1,256 @@
+"""Prompt-cache breakpoint planner for stable agent prefixes.
+
+Agent requests repeat the same tool schema list and system prompt on every
+step. Providers reuse a cached prefix only when it is byte-identical, so the
+planner:
+
+1. Canonicalizes tool ordering (sorted by function name) for every provider,
+   which also helps providers with automatic prefix caching (OpenAI,
+   DeepSeek).
+2. Splits the system prompt at :data:`PROMPT_CACHE_BOUNDARY`, the marker
+   :class:`~src.infrastructure.agent.prompts.manager.SystemPromptManager`
+   places between its stable sections and per-turn volatile sections.
+3. For providers with explicit breakpoints (Anthropic-style
+   ``cache_control``), marks the end of the tool list, the stable system
+   prefix and the conversation tail, within the provider's breakpoint limit.
+
+The boundary marker is always stripped, so providers without explicit
+caching receive the same prompt text as before.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+PROMPT_CACHE_BOUNDARY = "\n\n<!-- prompt-cache-boundary -->\n\n"
+
+# Anthropic accepts at most four cache breakpoints per request.
+MAX_CACHE_BREAKPOINTS = 4
+
+_EPHEMERAL: dict[str, str] = {"type": "ephemeral"}
+
+# Providers that always speak the Anthropic messages API.
+_BREAKPOINT_PROVIDERS = frozenset({"anthropic"})
+# Multi-model gateways that forward ``cache_control`` for Claude models.
+_CLAUDE_GATEWAY_PROVIDERS = frozenset({"bedrock", "vertex", "openrouter"})
+
+
+def supports_cache_breakpoints(provider_type: str, model: str) -> bool:
+    """Whether requests for ``model`` on ``provider_type`` honor ``cache_control``."""
+    provider = provider_type.lower()
+    if provider in _BREAKPOINT_PROVIDERS:
+        return True
+    return provider in _CLAUDE_GATEWAY_PROVIDERS and "claude" in model.lower()
+
+
+def canonicalize_tools(tools: list[dict[str, Any]] | None) -> list[dict[str, Any]] | None:
+    """Return tools in a deterministic order so the schema prefix is stable."""
+    if not tools:
+        return tools
+    return sorted(tools, key=_tool_name)
+
+
+def _tool_name(tool: dict[str, Any]) -> str:
+    function = tool.get("function")
+    if isinstance(function, dict):
+        return str(function.get("name", ""))
+    return str(tool.get("name", ""))
+
+
+@dataclass(frozen=True)
+class PromptCachePlan:
+    """Request payload after canonicalization and breakpoint placement."""
+
+    messages: list[dict[str, Any]]
+    tools: list[dict[str, Any]] | None
+    breakpoints: int = 0
+
+
+class PromptCachePlanner:
+    """Places prompt-cache breakpoints at stable request boundaries."""
+
+    def __init__(self, max_breakpoints: int = MAX_CACHE_BREAKPOINTS) -> None:
+        self._max_breakpoints = max(0, min(max_breakpoints, MAX_CACHE_BREAKPOINTS))
+
+    def plan(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        *,
+        breakpoints_enabled: bool = False,
+    ) -> PromptCachePlan:
+        """Canonicalize ``messages``/``tools`` and optionally add breakpoints.
+
+        Args:
+            messages: OpenAI-format messages. Not mutated.
+            tools: OpenAI-format tool schemas. Not mutated.
+            breakpoints_enabled: Whether to emit ``cache_control`` markers.
+
+        Returns:
+            A :class:`PromptCachePlan` with fresh message/tool lists.
+        """
+        planned_tools = canonicalize_tools(tools)
+        if not breakpoints_enabled or self._max_breakpoints == 0:
+            return PromptCachePlan(
+                messages=[self._split_system(m, False) for m in messages],
+                tools=planned_tools,
+            )
+
+        # Breakpoints the caller already placed count against the limit.
+        budget = self._max_breakpoints - _count_breakpoints(messages, planned_tools)
+        if planned_tools and budget > 0 and not planned_tools[-1].get("cache_control"):
+            planned_tools = list(planned_tools)
+            last_tool = dict(planned_tools[-1])
+            last_tool["cache_control"] = dict(_EPHEMERAL)
+            planned_tools[-1] = last_tool
+            budget -= 1
+
+        # Only the leading system block is split at a breakpoint; boundaries
+        # in any other system message are just stripped.
+        system_index = self._leading_system_index(messages)
+        planned_messages = list(messages)
+        for index, message in enumerate(messages):
+            mark_system = index == system_index and budget > 0 and not _has_breakpoint(message)
+            planned_messages[index] = self._split_system(message, mark_system)
+            if mark_system:
+                if not _has_breakpoint(planned_messages[index]):
+                    planned_messages[index] = _mark_message(planned_messages[index])
+                budget -= 1
+
+        for index in self._tail_indices(planned_messages, budget):
+            planned_messages[index] = _mark_message(planned_messages[index])
+
+        return PromptCachePlan(
+            messages=planned_messages,
+            tools=planned_tools,
+            breakpoints=_count_breakpoints(planned_messages, planned_tools),
+        )
+
+    @staticmethod
+    def _split_system(message: dict[str, Any], breakpoints_enabled: bool) -> dict[str, Any]:
+        """Strip the boundary marker, splitting into blocks when caching."""
+        content = message.get("content")
+        if message.get("role") != "system" or not isinstance(content, str):
+            return message
+        if PROMPT_CACHE_BOUNDARY not in content:
+            return message
+        stable, _, volatile = content.partition(PROMPT_CACHE_BOUNDARY)
+        volatile = volatile.replace(PROMPT_CACHE_BOUNDARY, "\n\n")
+        split = dict(message)
+        if not breakpoints_enabled or not stable.strip() or not volatile.strip():
+            split["content"] = "\n\n".join(part for part in (stable, volatile) if part)
+            return split
+        split["content"] = [
+            {"type": "text", "text": stable, "cache_control": dict(_EPHEMERAL)},
+            {"type": "text", "text": volatile},
+        ]
+        return split
+
+    @staticmethod
+    def _leading_system_index(messages: list[dict[str, Any]]) -> int | None:
+        """Index of the last system message in the leading system block."""
+        candidate: int | None = None
+        for index, message in enumerate(messages):
+            if message.get("role") != "system":
+                break
+            candidate = index
+        return candidate
+
+    @staticmethod
+    def _tail_indices(messages: list[dict[str, Any]], budget: int) -> list[int]:
+        """Pick the last message and the latest user turn before it.
+
+        Marking the final message lets the next agent step read everything
+        up to it from cache; the latest user turn keeps a hit available when
+        the tail is rewritten (e.g. after a retried step).
+        """
+        if budget <= 0:
+            return []
+        picked: list[int] = []
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
+            if (
+                message.get("role") == "system"
+                or not _is_markable(message)
+                or _has_breakpoint(message)
+            ):
+                continue
+            if not picked or message.get("role") == "user":
+                picked.append(index)
+            if len(picked) >= min(budget, 2):
+                break
+        return picked
+
+
+def _is_markable(message: dict[str, Any]) -> bool:
+    content = message.get("content")
+    if isinstance(content, str):
+        return bool(content) or message.get("role") == "tool"
+    return isinstance(content, list) and any(isinstance(part, dict) for part in content)
+
+
+def _has_breakpoint(message: dict[str, Any]) -> bool:
+    if message.get("cache_control"):
+        return True
+    content = message.get("content")
+    if isinstance(content, list):
+        return any(isinstance(part, dict) and part.get("cache_control") for part in content)
+    return False
+
+
+def _count_breakpoints(messages: list[dict[str, Any]], tools: list[dict[str, Any]] | None) -> int:
+    """Number of ``cache_control`` markers across messages, their blocks and tools."""
+    count = sum(1 for tool in tools or [] if tool.get("cache_control"))
+    for message in messages:
+        if message.get("cache_control"):
+            count += 1
+        content = message.get("content")
+        if isinstance(content, list):
+            count += sum(
+                1 for part in content if isinstance(part, dict) and part.get("cache_control")
+            )
+    return count
+
+
+def _mark_message(message: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of ``message`` with a breakpoint on its last content block."""
+    marked = dict(message)
+    content = marked.get("content")
+    if isinstance(content, list):
+        parts = list(content)
+        for index in range(len(parts) - 1, -1, -1):
+            if isinstance(parts[index], dict):
+                part = dict(parts[index])
+                part["cache_control"] = dict(_EPHEMERAL)
+                parts[index] = part
+                break
+        marked["content"] = parts
+        return marked
+    marked["cache_control"] = dict(_EPHEMERAL)
+    return marked
+
+
+def count_cached_prefix(messages: list[dict[str, Any]]) -> int:
+    """Number of leading messages covered by the last cache breakpoint.
+
+    A breakpoint caches the whole request prefix up to and including the
+    marked block, so every message up to the last marked one is served
+    from cache on a hit.
+    """
+    last = -1
+    for index, message in enumerate(messages):
+        if _has_breakpoint(message):
+            last = index
+    return last + 1
+
+
+_default_planner: PromptCachePlanner | None = None
+
+
+def get_prompt_cache_planner() -> PromptCachePlanner:
+    """Return the process-wide planner."""
+    global _default_planner
+    if _default_planner is None:
+        _default_planner = PromptCachePlanner()
+    return _default_planner
@@ -421,6 +421,35 @@ class StructuredLLMLogger:
             },
         )
 
+    def log_pool_stream_resume(
+        self,
+        *,
+        tenant_id: str | None,
+        failed_candidate_key: str,
+        error_type: str,
+        resumed_chars: int,
+        attempt: int,
+        max_attempts: int,
+    ) -> None:
+        """Log a mid-stream drop that will be resumed on the next candidate."""
+        self._logger.warning(
+            "Pool stream resume: %s dropped (%s) after %d chars attempt=%d/%d",
+            failed_candidate_key,
+            error_type,
+            resumed_chars,
+            attempt,
+            max_attempts,
+            extra={
+                "event": "pool_stream_resume",
+                "tenant_id": tenant_id,
+                "failed_candidate_key": failed_candidate_key,
+                "error_type": error_type,
+                "resumed_chars": resumed_chars,
+                "pool_attempt": attempt,
+                "pool_max_attempts": max_attempts,
+            },
+        )
+
     def log_auto_broker_verdict(
         self,
         *,
@@ -1,19 +1,38 @@
 """Hybrid search on memory chunks using PostgreSQL (pgvector + FTS + RRF).
 
 Combines vector similarity search and full-text search with
-Reciprocal Rank Fusion, MMR re-ranking, and temporal decay.
+Reciprocal Rank Fusion, MMR re-ranking, and temporal decay (all computed by the
+columnar engine in :mod:`ranking`). Both caches are keyed by the
+project's committed index version, read once per search: the vector leg of
+hot projects is answered from the in-process :mod:`chunk_vector_cache`, and
+ranked candidates are reused via :mod:`recall_cache` until the project's
+chunks change.
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from collections.abc import Hashable
+from dataclasses import astuple, dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, cast
 
-from src.infrastructure.memory.mmr import mmr_rerank
+from src.infrastructure.memory.chunk_vector_cache import ChunkVectorCache, get_chunk_vector_cache
 from src.infrastructure.memory.query_expansion import extract_keywords
-from src.infrastructure.memory.temporal_decay import apply_temporal_decay
+from src.infrastructure.memory.ranking import (
+    MMRStage,
+    RankingFrame,
+    RankingStage,
+    SortStage,
+    TemporalDecayStage,
+    rrf_fuse,
+    run_stages,
+)
+from src.infrastructure.memory.recall_cache import (
+    RecallResultCache,
+    get_recall_result_cache,
+    normalize_recall_query,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +58,8 @@ class ChunkSearchConfig:
     enable_mmr: bool = True
     enable_temporal_decay: bool = True
     enable_fts_fallback: bool = True
+    enable_vector_cache: bool = True
+    enable_result_cache: bool = True
 
 
 @dataclass
@@ -68,10 +89,18 @@ class ChunkHybridSearch:
         embedding_service: EmbeddingService,
         session_factory: async_sessionmaker[AsyncSession] | None = None,
         config: ChunkSearchConfig | None = None,
+        vector_cache: ChunkVectorCache | None = None,
+        result_cache: RecallResultCache | None = None,
     ) -> None:
         self._embedding = embedding_service
         self._session_factory = session_factory
         self._config = config or ChunkSearchConfig()
+        self._vector_cache = vector_cache
+        if self._vector_cache is None and self._config.enable_vector_cache:
+            self._vector_cache = get_chunk_vector_cache()
+        self._result_cache = result_cache
+        if self._result_cache is None and self._config.enable_result_cache:
+            self._result_cache = get_recall_result_cache()
 
     async def _get_chunk_repo(self) -> SqlChunkRepository | None:
         """Create a chunk repository with a fresh DB session."""
@@ -114,13 +143,44 @@ class ChunkHybridSearch:
             logger.warning("No chunk repo available for search")
             return []
 
+        cache = self._result_cache
+        cache_key = self._result_cache_key(query, limit, category)
         session = getattr(chunk_repo, "_session", None)
         try:
-            return await self._do_search(chunk_repo, query, project_id, limit, category=category)
+            version = await self._index_version(chunk_repo, project_id)
+            if cache is not None and version is not None:
+                cached = cache.get(project_id, cache_key, version=version)
+                if cached is not None:
+                    return self._finalize(cached, limit)
+            candidates, cacheable = await self._do_search(
+                chunk_repo, query, project_id, limit, category=category, version=version
+            )
         finally:
             if session:
                 await session.close()
 
+        if cache is not None and version is not None and cacheable:
+            cache.put(project_id, cache_key, candidates, version=version)
+        return self._finalize(candidates, limit)
+
+    async def _index_version(self, chunk_repo: SqlChunkRepository, project_id: str) -> int | None:
+        """Committed index version keying both caches; None bypasses them."""
+        if self._result_cache is None and self._vector_cache is None:
+            return None
+        try:
+            return await chunk_repo.get_index_version(project_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to read memory index version error_type=%s",
+                type(e).__name__,
+            )
+            return None
+
+    def _result_cache_key(
+        self, query: str, limit: int, category: str | None
+    ) -> tuple[Hashable, ...]:
+        return (normalize_recall_query(query), category, limit, astuple(self._config))
+
     async def _do_search(
         self,
         chunk_repo: SqlChunkRepository,
@@ -128,8 +188,13 @@ class ChunkHybridSearch:
         project_id: str,
         limit: int,
         category: str | None = None,
-    ) -> list[ChunkSearchResult]:
-        """Internal search logic with a live chunk_repo."""
+        version: int | None = None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Retrieve, fuse and MMR-rank candidates with a live chunk_repo.
+
+        Returns the candidates before temporal decay and whether they may be
+        cached (results degraded by an embedding failure are not).
+        """
         fetch_limit = limit * 3  # Over-fetch for MMR/decay filtering
 
         # 1. Vector search (with graceful fallback)
@@ -137,12 +202,12 @@ class ChunkHybridSearch:
         query_embedding: list[float] | None = await self._embedding.embed_text_safe(query)
 
         if query_embedding is not None:
-            vector_results = await chunk_repo.vector_search(
-                query_embedding, project_id, fetch_limit, category=category
+            vector_results = await self._vector_search(
+                chunk_repo, query_embedding, project_id, fetch_limit, category, version
             )
         elif not self._config.enable_fts_fallback:
             logger.error("Embedding failed and FTS fallback disabled")
-            return []
+            return [], False
         # Fall through to FTS search below
         # 2. FTS search with keyword extraction
         keywords = extract_keywords(query)
@@ -154,6 +219,133 @@ class ChunkHybridSearch:
             keywords=keywords if keywords else None,
         )
 
+        return self._fuse(vector_results, fts_results), query_embedding is not None
+
+    async def search_many(
+        self,
+        queries: list[str],
+        project_id: str,
+        limit: int = 6,
+        category: str | None = None,
+    ) -> list[list[ChunkSearchResult]]:
+        """Hybrid search for several queries with batched round trips.
+
+        Cache misses are embedded with one ``embed_batch_safe`` call and their
+        vector and FTS legs run as one statement each; fusion, MMR and decay
+        are applied per query exactly as in :meth:`search`.
+
+        Returns:
+            One ranked result list per query, in input order.
+        """
+        chunk_repo = await self._get_chunk_repo()
+        if chunk_repo is None:
+            logger.warning("No chunk repo available for search")
+            return [[] for _ in queries]
+
+        cache = self._result_cache
+        keys = [self._result_cache_key(query, limit, category) for query in queries]
+        candidates: dict[tuple[Hashable, ...], list[dict[str, Any]]] = {}
+        misses: dict[tuple[Hashable, ...], str] = {}
+        session = getattr(chunk_repo, "_session", None)
+        try:
+            version = await self._index_version(chunk_repo, project_id)
+            for query, key in zip(queries, keys, strict=True):
+                if key in candidates or key in misses:
+                    continue
+                cached = None
+                if cache is not None and version is not None:
+                    cached = cache.get(project_id, key, version=version)
+                if cached is not None:
+                    candidates[key] = cached
+                else:
+                    misses[key] = query
+            fetched = (
+                await self._do_search_many(
+                    chunk_repo, list(misses.values()), project_id, limit, category, version
+                )
+                if misses
+                else []
+            )
+        finally:
+            if session:
+                await session.close()
+
+        for key, (merged, cacheable) in zip(misses, fetched, strict=True):
+            if cache is not None and version is not None and cacheable:
+                cache.put(project_id, key, merged, version=version)
+            candidates[key] = merged
+
+        # Copy per query: decay rewrites scores and queries may repeat.
+        return [self._finalize([dict(item) for item in candidates[key]], limit) for key in keys]
+
+    async def _do_search_many(
+        self,
+        chunk_repo: SqlChunkRepository,
+        queries: list[str],
+        project_id: str,
+        limit: int,
+        category: str | None,
+        version: int | None = None,
+    ) -> list[tuple[list[dict[str, Any]], bool]]:
+        """Batched counterpart of :meth:`_do_search`."""
+        fetch_limit = limit * 3  # Over-fetch for MMR/decay filtering
+
+        # 1. Vector legs: hot-project cache first, the rest in one statement
+        embeddings = await self._embedding.embed_batch_safe(queries)
+        vector_results: list[list[dict[str, Any]]] = [[] for _ in queries]
+        sql_indices: list[int] = []
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                continue
+            cached = self._cached_vector_search(
+                project_id, embedding, fetch_limit, category, version
+            )
+            if cached is None:
+                sql_indices.append(i)
+            else:
+                vector_results[i] = cached
+        if sql_indices:
+            batch = await chunk_repo.vector_search_many(
+                [cast("list[float]", embeddings[i]) for i in sql_indices],
+                project_id,
+                fetch_limit,
+                category=category,
+            )
+            for i, results in zip(sql_indices, batch, strict=True):
+                vector_results[i] = results
+
+        # 2. FTS legs in one statement
+        fts_indices = [
+            i
+            for i, embedding in enumerate(embeddings)
+            if embedding is not None or self._config.enable_fts_fallback
+        ]
+        if len(fts_indices) < len(queries):
+            logger.error("Embedding failed and FTS fallback disabled")
+        fts_results: list[list[dict[str, Any]]] = [[] for _ in queries]
+        if fts_indices:
+            batch = await chunk_repo.fts_search_many(
+                [queries[i] for i in fts_indices],
+                project_id,
+                fetch_limit,
+                category=category,
+                keywords=[extract_keywords(queries[i]) or None for i in fts_indices],
+            )
+            for i, results in zip(fts_indices, batch, strict=True):
+                fts_results[i] = results
+
+        # 3-4. Fuse and re-rank per query
+        return [
+            (self._fuse(vector_results[i], fts_results[i]), embeddings[i] is not None)
+            for i in range(len(queries))
+        ]
+
+    def _fuse(
+        self,
+        vector_results: list[dict[str, Any]],
+        fts_results: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """RRF-fuse the two legs, then MMR re-rank."""
         # 3. RRF fusion
         if vector_results and fts_results:
             merged = self._rrf_fusion(vector_results, fts_results)
@@ -166,42 +358,93 @@ class ChunkHybridSearch:
 
         # 4. MMR re-ranking
         if self._config.enable_mmr and len(merged) > 1:
-            merged = mmr_rerank(
-                merged,
-                lambda_=self._config.mmr_lambda,
-                content_key="content",
-                score_key="score",
+            frame = MMRStage(self._config.mmr_lambda)(
+                RankingFrame.build(
+                    (item.get("score", 0.0) for item in merged),
+                    texts=[item.get("content", "") for item in merged],
+                )
             )
+            merged = [{**merged[row], "score": score} for row, score in frame.ranked()]
+        return merged
 
-        # 5. Temporal decay
+    def _finalize(self, merged: list[dict[str, Any]], limit: int) -> list[ChunkSearchResult]:
+        """Apply temporal decay as of now, then sort and limit."""
+        # 5. Temporal decay, then sort by final score
+        stages: list[RankingStage] = []
         if self._config.enable_temporal_decay:
-            now = datetime.now(UTC)
-            for item in merged:
-                created_at = item.get("created_at")
-                if created_at:
-                    item["score"] = apply_temporal_decay(
-                        item["score"],
-                        created_at,
-                        self._config.temporal_half_life_days,
-                        now,
-                    )
-
-        # Sort by final score and limit
-        merged.sort(key=lambda x: x.get("score", 0), reverse=True)
+            stages.append(TemporalDecayStage(self._config.temporal_half_life_days))
+        stages.append(SortStage())
+        frame = run_stages(
+            RankingFrame.build(
+                (item.get("score", 0) for item in merged),
+                timestamps=[item.get("created_at") for item in merged],
+            ),
+            stages,
+        )
 
-        return [
-            ChunkSearchResult(
-                id=item["id"],
-                content=item["content"],
-                score=item.get("score", 0),
-                metadata=item.get("metadata", {}),
-                category=item.get("category", "other"),
-                source_type=item.get("source_type"),
-                source_id=item.get("source_id"),
-                created_at=item.get("created_at"),
+        results: list[ChunkSearchResult] = []
+        for row, score in frame.ranked(limit):
+            item = merged[row]
+            results.append(
+                ChunkSearchResult(
+                    id=item["id"],
+                    content=item["content"],
+                    score=score,
+                    metadata=item.get("metadata", {}),
+                    category=item.get("category", "other"),
+                    source_type=item.get("source_type"),
+                    source_id=item.get("source_id"),
+                    created_at=item.get("created_at"),
+                )
             )
-            for item in merged[:limit]
-        ]
+        return results
+
+    async def _vector_search(
+        self,
+        chunk_repo: SqlChunkRepository,
+        query_embedding: list[float],
+        project_id: str,
+        limit: int,
+        category: str | None,
+        version: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Vector leg: the in-process cache when it can answer, else pgvector."""
+        cached = self._cached_vector_search(project_id, query_embedding, limit, category, version)
+        if cached is not None:
+            return cached
+        return await chunk_repo.vector_search(query_embedding, project_id, limit, category=category)
+
+    def _cached_vector_search(
+        self,
+        project_id: str,
+        query_embedding: list[float],
+        limit: int,
+        category: str | None,
+        version: int | None,
+    ) -> list[dict[str, Any]] | None:
+        cache = self._vector_cache
+        if cache is None or version is None:
+            return None
+        # One past the cap so the cache can tell the project is too large.
+        load_limit = cache.max_chunks + 1
+        cache.maybe_warm(
+            project_id,
+            lambda: self._load_project_chunks(project_id, load_limit),
+            version=version,
+        )
+        return cache.search(project_id, query_embedding, limit, category, version=version)
+
+    async def _load_project_chunks(self, project_id: str, limit: int) -> list[dict[str, Any]]:
+        """Load a project's embedded chunks for the vector cache."""
+        chunk_repo = await self._get_chunk_repo()
+        if chunk_repo is None:
+            return []
+        session = getattr(chunk_repo, "_session", None)
+        try:
+            return await chunk_repo.list_embedded_chunks(project_id, limit)
+        finally:
+            if session:
+                await session.close()
 
     def _rrf_fusion(
         self,
@@ -212,28 +455,13 @@ class ChunkHybridSearch:
 
         RRF score = w_vec / (K + rank_vec) + w_fts / (K + rank_fts)
         """
-        scores: dict[str, float] = {}
-        items: dict[str, dict[str, Any]] = {}
-        k = RRF_K
-
-        for rank, item in enumerate(vector_results):
-            item_id = item["id"]
-            rrf_score = self._config.vector_weight / (k + rank + 1)
-            scores[item_id] = scores.get(item_id, 0) + rrf_score
-            items[item_id] = item
-
-        for rank, item in enumerate(fts_results):
-            item_id = item["id"]
-            rrf_score = self._config.fts_weight / (k + rank + 1)
-            scores[item_id] = scores.get(item_id, 0) + rrf_score
-            if item_id not in items:
-                items[item_id] = item
-
-        # Apply fused scores
-        result = []
-        for item_id, score in sorted(scores.items(), key=lambda x: x[1], reverse=True):
-            item = dict(items[item_id])
-            item["score"] = score
-            result.append(item)
-
-        return result
+        legs = (vector_results, fts_results)
+        sources, scores = rrf_fuse(
+            [[item["id"] for item in leg] for leg in legs],
+            [self._config.vector_weight, self._config.fts_weight],
+            k=RRF_K,
+        )
+        return [
+            {**legs[leg][position], "score": score}
+            for (leg, position), score in zip(sources, scores.tolist(), strict=True)
+        ]
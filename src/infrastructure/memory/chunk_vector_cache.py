@@ -0,0 +1,342 @@
+"""In-process vector index for hot projects' memory chunks.
+
+pgvector answers every recall with an ``ORDER BY embedding <=> ...`` scan; for
+projects that are searched many times a minute the same chunks are scored over
+and over. This cache keeps a normalized float32 matrix per hot project and
+answers the vector leg of :class:`ChunkHybridSearch` with one matrix product:
+
+- A project is loaded once it sees ``HOT_PROJECT_QUERIES`` searches within
+  ``HOT_PROJECT_WINDOW`` seconds; until then (and whenever the cache cannot
+  answer, e.g. a different embedding dimension) pgvector is used.
+- Every index is tagged with the project's committed index version (the
+  ``memory_index_versions`` row bumped by each chunk write) read before it was
+  loaded. Searches pass the current version and an index at any other version
+  is not served but rebuilt, so writes committed by other processes (API
+  edits, other workers) are never masked.
+- ``SqlChunkRepository`` pushes its own committed saves and deletes into
+  loaded indexes, tagged with the version their transaction bumped to. A write
+  is applied only on top of the version it follows, which keeps the index
+  current without a rebuild; anything else leaves it to the version check.
+  Writes that arrive while an index is being built are replayed afterwards.
+- Indexes are also rebuilt after ``INDEX_MAX_AGE`` seconds.
+- Indexes are evicted least-recently-used first once their combined size
+  exceeds ``CACHE_MAX_BYTES``.
+
+Scores match pgvector's ``1 - cosine_distance`` so cached and SQL results mix.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+HOT_PROJECT_QUERIES = 20  # searches within the window before a project is loaded
+HOT_PROJECT_WINDOW = 60.0  # seconds
+INDEX_MAX_AGE = 600.0  # seconds before a loaded index is rebuilt from the database
+INDEX_MAX_CHUNKS = 200_000  # projects larger than this stay on pgvector
+CACHE_MAX_BYTES = 512 * 1024 * 1024  # combined budget across all loaded projects
+
+ChunkLoader = Callable[[], Awaitable[list[dict[str, Any]]]]
+"""Loads every embedded chunk of a project (row dicts including ``embedding``)."""
+
+
+def _normalized(vector: npt.ArrayLike) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(array))
+    return array / norm if norm > 0 else array
+
+
+class ProjectVectorIndex:
+    """Exact cosine index over one project's chunks of a single dimension."""
+
+    def __init__(self, dim: int, capacity: int = 1024) -> None:
+        self.dim = dim
+        self.built_at = time.monotonic()
+        self.version = 0
+        self._matrix = np.zeros((max(capacity, 1), dim), dtype=np.float32)
+        self._rows: list[dict[str, Any]] = []
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._matrix.nbytes)
+
+    def upsert(self, row: dict[str, Any]) -> bool:
+        """Insert or replace a chunk; returns False if its dimension differs."""
+        embedding = row.get("embedding")
+        if embedding is None:
+            return False
+        vector = _normalized(embedding)
+        if vector.shape[0] != self.dim:
+            return False
+        record = {key: value for key, value in row.items() if key != "embedding"}
+        position = self._positions.get(record["id"])
+        if position is None:
+            position = len(self._rows)
+            if position == self._matrix.shape[0]:
+                grown = np.zeros((position * 2, self.dim), dtype=np.float32)
+                grown[:position] = self._matrix
+                self._matrix = grown
+            self._rows.append(record)
+            self._positions[record["id"]] = position
+        else:
+            self._rows[position] = record
+        self._matrix[position] = vector
+        return True
+
+    def remove(self, chunk_id: str) -> None:
+        """Drop a chunk by moving the last row into its slot."""
+        position = self._positions.pop(chunk_id, None)
+        if position is None:
+            return
+        last = len(self._rows) - 1
+        if position != last:
+            moved = self._rows[last]
+            self._rows[position] = moved
+            self._matrix[position] = self._matrix[last]
+            self._positions[moved["id"]] = position
+        self._rows.pop()
+
+    def remove_source(self, source_type: str, source_id: str) -> None:
+        stale = [
+            row["id"]
+            for row in self._rows
+            if row.get("source_type") == source_type and row.get("source_id") == source_id
+        ]
+        for chunk_id in stale:
+            self.remove(chunk_id)
+
+    def search(
+        self, query_embedding: list[float], limit: int, category: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Top-``limit`` rows by cosine similarity, or None on a dimension mismatch."""
+        query = _normalized(query_embedding)
+        if query.shape[0] != self.dim:
+            return None
+        count = len(self._rows)
+        if count == 0 or limit <= 0:
+            return []
+        scores = self._matrix[:count] @ query
+        if category:
+            mask = np.fromiter(
+                (row.get("category") == category for row in self._rows), dtype=bool, count=count
+            )
+            scores = np.where(mask, scores, -np.inf)
+        top = min(limit, count)
+        candidates = np.argpartition(-scores, top - 1)[:top]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            {**self._rows[index], "score": float(scores[index])}
+            for index in ordered
+            if np.isfinite(scores[index])
+        ]
+
+
+class ChunkVectorCache:
+    """LRU-by-bytes set of :class:`ProjectVectorIndex`, one per hot project."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = CACHE_MAX_BYTES,
+        hot_queries: int = HOT_PROJECT_QUERIES,
+        hot_window: float = HOT_PROJECT_WINDOW,
+        max_age: float = INDEX_MAX_AGE,
+        max_chunks: int = INDEX_MAX_CHUNKS,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._hot_queries = hot_queries
+        self._hot_window = hot_window
+        self._max_age = max_age
+        self._max_chunks = max_chunks
+        self._indexes: OrderedDict[str, ProjectVectorIndex] = OrderedDict()
+        self._queries: dict[str, deque[float]] = {}
+        # Writes seen while a project's index is being built, replayed afterwards.
+        self._building: dict[str, list[Callable[[ProjectVectorIndex], None]]] = {}
+        self._build_tasks: set[asyncio.Task[None]] = set()
+        self._stats = {"hits": 0, "misses": 0, "builds": 0, "evictions": 0, "skipped": 0}
+
+    @property
+    def max_chunks(self) -> int:
+        return self._max_chunks
+
+    def _is_fresh(self, index: ProjectVectorIndex, version: int) -> bool:
+        return index.version == version and time.monotonic() - index.built_at <= self._max_age
+
+    def search(
+        self,
+        project_id: str,
+        query_embedding: list[float],
+        limit: int,
+        category: str | None = None,
+        *,
+        version: int,
+    ) -> list[dict[str, Any]] | None:
+        """Answer from a loaded index at ``version``; None means use pgvector."""
+        index = self._indexes.get(project_id)
+        if index is not None and not self._is_fresh(index, version):
+            index = None  # Stale: keep serving SQL until the rebuild lands
+        results = index.search(query_embedding, limit, category) if index is not None else None
+        if results is None:
+            self._stats["misses"] += 1
+            return None
+        self._indexes.move_to_end(project_id)
+        self._stats["hits"] += 1
+        return results
+
+    def maybe_warm(self, project_id: str, loader: ChunkLoader, *, version: int) -> None:
+        """Count a search and start a background build once the project is hot.
+
+        ``version`` must be read before ``loader`` runs: the index is tagged
+        with it, so writes committed in between only cost another rebuild.
+        """
+        now = time.monotonic()
+        window = self._queries.setdefault(project_id, deque())
+        window.append(now)
+        while window and now - window[0] > self._hot_window:
+            window.popleft()
+        if project_id in self._building or len(window) < self._hot_queries:
+            return
+        index = self._indexes.get(project_id)
+        if index is not None and self._is_fresh(index, version):
+            return
+        self._building[project_id] = []
+        task = asyncio.create_task(self._build(project_id, loader, version))
+        self._build_tasks.add(task)
+        task.add_done_callback(self._build_tasks.discard)
+
+    async def _build(self, project_id: str, loader: ChunkLoader, version: int) -> None:
+        try:
+            rows = await loader()
+            index = self._index_from_rows(rows)
+            if index is None:
+                self._stats["skipped"] += 1
+                self._indexes.pop(project_id, None)
+                return
+            index.version = version
+            for replay in self._building.get(project_id, []):
+                replay(index)
+            self._indexes[project_id] = index
+            self._indexes.move_to_end(project_id)
+            self._stats["builds"] += 1
+            self._evict()
+        except Exception as e:
+            logger.warning(
+                "Chunk vector cache build failed error_type=%s",
+                type(e).__name__,
+            )
+        finally:
+            self._building.pop(project_id, None)
+
+    def _index_from_rows(self, rows: list[dict[str, Any]]) -> ProjectVectorIndex | None:
+        embedded = [row for row in rows if row.get("embedding") is not None]
+        if not embedded or len(embedded) > self._max_chunks:
+            return None
+        # Mixed-dimension projects keep the dominant dimension; queries of any
+        # other dimension fall back to pgvector, which filters by dims as well.
+        dims: dict[int, int] = {}
+        for row in embedded:
+            dim = len(row["embedding"])
+            dims[dim] = dims.get(dim, 0) + 1
+        dim = max(dims, key=lambda d: dims[d])
+        index = ProjectVectorIndex(dim, capacity=dims[dim])
+        for row in embedded:
+            index.upsert(row)
+        if index.nbytes > self._max_bytes:
+            return None
+        return index
+
+    def _evict(self) -> None:
+        total = sum(index.nbytes for index in self._indexes.values())
+        while total > self._max_bytes and len(self._indexes) > 1:
+            _, evicted = self._indexes.popitem(last=False)
+            total -= evicted.nbytes
+            self._stats["evictions"] += 1
+
+    # --- write path ------------------------------------------------------
+
+    def _apply(
+        self, project_id: str, version: int, operation: Callable[[ProjectVectorIndex], None]
+    ) -> None:
+        def _versioned(index: ProjectVectorIndex) -> None:
+            # A committed write moves the index from version - 1 to version; a
+            # transaction's later writes find it at version already. Any other
+            # gap means writes this process never saw, so the index is left
+            # behind for the version check to rebuild.
+            if index.version in (version - 1, version):
+                operation(index)
+                index.version = version
+
+        pending = self._building.get(project_id)
+        if pending is not None:
+            pending.append(_versioned)
+        index = self._indexes.get(project_id)
+        if index is not None:
+            _versioned(index)
+
+    def is_tracking(self, project_id: str) -> bool:
+        """Whether writes to the project must be mirrored (index loaded or building)."""
+        return project_id in self._indexes or project_id in self._building
+
+    def upsert_chunks(
+        self, project_id: str, rows: Iterable[dict[str, Any]], *, version: int
+    ) -> None:
+        """Mirror chunks saved by a transaction that committed ``version``."""
+        if not self.is_tracking(project_id):
+            return
+        rows = list(rows)
+
+        def _upsert(index: ProjectVectorIndex) -> None:
+            for row in rows:
+                if not index.upsert(row):
+                    index.remove(row["id"])
+
+        self._apply(project_id, version, _upsert)
+
+    def remove_source(
+        self, project_id: str, source_type: str, source_id: str, *, version: int
+    ) -> None:
+        """Mirror a ``delete_by_source`` whose transaction committed ``version``."""
+        self._apply(project_id, version, lambda index: index.remove_source(source_type, source_id))
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        """Drop one project's index, or all of them."""
+        if project_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(project_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and per-project index sizes."""
+        return {
+            **self._stats,
+            "bytes": sum(index.nbytes for index in self._indexes.values()),
+            "projects": {
+                project_id: {"chunks": len(index), "bytes": index.nbytes}
+                for project_id, index in self._indexes.items()
+            },
+        }
+
+
+# Singleton instance
+_chunk_vector_cache: ChunkVectorCache | None = None
+
+
+def get_chunk_vector_cache() -> ChunkVectorCache:
+    """Get the process-wide chunk vector cache."""
+    global _chunk_vector_cache
+    if _chunk_vector_cache is None:
+        _chunk_vector_cache = ChunkVectorCache()
+    return _chunk_vector_cache
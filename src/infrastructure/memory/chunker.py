@@ -2,9 +2,12 @@
 
 Ported from Moltbot's internal.ts chunkMarkdown() algorithm.
 Character-based chunking with configurable overlap and SHA256 hashing.
+Chunks are produced lazily so large documents can be indexed as a stream.
 """
 
 import hashlib
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 
@@ -31,6 +34,18 @@ def _split_line_into_segments(line: str, max_chars: int) -> list[str]:
     return [line[start : start + max_chars] for start in range(0, len(line), max_chars)]
 
 
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield ``content.split("\n")`` lazily, without materializing the list."""
+    start = 0
+    while True:
+        end = content.find("\n", start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
 def chunk_text(
     content: str,
     max_tokens: int = 400,
@@ -48,60 +63,63 @@ def chunk_text(
         chars_per_token: Character-to-token multiplier (default 4).
         List of TextChunk with text, line range, and content hash.
     """
+    return list(iter_chunks(content, max_tokens, overlap_tokens, chars_per_token))
+
+
+def iter_chunks(
+    content: str,
+    max_tokens: int = 400,
+    overlap_tokens: int = 80,
+    chars_per_token: int = 4,
+) -> Iterator[TextChunk]:
+    """Lazily yield the chunks :func:`chunk_text` would return."""
     if not content or not content.strip():
-        return []
-    lines = content.split("\n")
-    if not lines:
-        return []
+        return
+    yield from iter_line_chunks(_iter_lines(content), max_tokens, overlap_tokens, chars_per_token)
+
+
+def iter_line_chunks(
+    lines: Iterable[str],
+    max_tokens: int = 400,
+    overlap_tokens: int = 80,
+    chars_per_token: int = 4,
+) -> Iterator[TextChunk]:
+    """Chunk a stream of lines (without trailing newlines) incrementally.
+
+    Only the current chunk is held in memory. Overlap is carried by dropping
+    lines from the front of a deque, so each line is pushed and popped once.
+    """
     max_chars = max(32, max_tokens * chars_per_token)
     overlap_chars = max(0, overlap_tokens * chars_per_token)
-    chunks: list[TextChunk] = []
-    current: list[tuple[str, int]] = []  # (line_text, line_number)
+    current: deque[tuple[str, int]] = deque()  # (line_text, line_number)
     current_chars = 0
+    chunk_index = 0
 
-    def flush() -> None:
-        if not current:
-            return
+    def build() -> TextChunk:
         text = "\n".join(line for line, _ in current)
-        start_line = current[0][1]
-        end_line = current[-1][1]
-        chunks.append(
-            TextChunk(
-                text=text,
-                start_line=start_line,
-                end_line=end_line,
-                content_hash=_hash_text(text),
-                chunk_index=len(chunks),
-            )
+        return TextChunk(
+            text=text,
+            start_line=current[0][1],
+            end_line=current[-1][1],
+            content_hash=_hash_text(text),
+            chunk_index=chunk_index,
         )
 
-    def carry_overlap() -> None:
-        nonlocal current, current_chars
-        if overlap_chars <= 0 or not current:
-            current = []
-            current_chars = 0
-            return
-        acc = 0
-        kept: list[tuple[str, int]] = []
-        for i in range(len(current) - 1, -1, -1):
-            line_text, line_no = current[i]
-            acc += len(line_text) + 1
-            kept.insert(0, (line_text, line_no))
-            if acc >= overlap_chars:
-                break
-        current = kept
-        current_chars = sum(len(t) + 1 for t, _ in kept)
-
-    for i, line in enumerate(lines):
-        line_no = i + 1
-        segments = _split_line_into_segments(line, max_chars)
-        for segment in segments:
+    for line_no, line in enumerate(lines, start=1):
+        for segment in _split_line_into_segments(line, max_chars):
             line_size = len(segment) + 1
             if current_chars + line_size > max_chars and current:
-                flush()
-                carry_overlap()
+                yield build()
+                chunk_index += 1
+                # Keep the shortest suffix covering overlap_chars (or everything
+                # if the chunk is shorter than that).
+                if overlap_chars <= 0:
+                    current.clear()
+                    current_chars = 0
+                while current and current_chars - (len(current[0][0]) + 1) >= overlap_chars:
+                    current_chars -= len(current.popleft()[0]) + 1
             current.append((segment, line_no))
             current_chars += line_size
 
-    flush()
-    return chunks
+    if current:
+        yield build()
@@ -7,7 +7,6 @@ using Jaccard similarity on token sets.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
 from typing import Any, Protocol
 
 
@@ -37,16 +36,6 @@ def text_similarity(text_a: str, text_b: str) -> float:
     return jaccard_similarity(tokenize(text_a), tokenize(text_b))
 
 
-@dataclass
-class MMRItem:
-    """Wrapper for items during MMR reranking."""
-
-    index: int
-    content: str
-    relevance: float
-    mmr_score: float = 0.0
-
-
 def mmr_rerank(
     items: list[dict[str, Any]],
     lambda_: float = 0.7,
@@ -57,6 +46,8 @@ def mmr_rerank(
 
     MMR score = lambda * relevance - (1 - lambda) * max_similarity_to_selected
 
+    Dict-based entry point to :class:`~src.infrastructure.memory.ranking.MMRStage`.
+
     Args:
         items: List of result dicts with content and score.
         lambda_: Balance between relevance (1.0) and diversity (0.0).
@@ -69,50 +60,13 @@ def mmr_rerank(
     if not items or len(items) <= 1:
         return items
 
-    # Normalize scores to [0, 1]
-    scores = [item.get(score_key, 0.0) for item in items]
-    min_score = min(scores)
-    max_score = max(scores)
-    score_range = max_score - min_score if max_score > min_score else 1.0
-
-    candidates = [
-        MMRItem(
-            index=i,
-            content=item.get(content_key, ""),
-            relevance=(item.get(score_key, 0.0) - min_score) / score_range,
+    from src.infrastructure.memory.ranking import MMRStage, RankingFrame
+
+    frame = MMRStage(lambda_)(
+        RankingFrame.build(
+            (item.get(score_key, 0.0) for item in items),
+            texts=[item.get(content_key, "") for item in items],
         )
-        for i, item in enumerate(items)
-    ]
-
-    selected: list[MMRItem] = []
-    remaining = list(candidates)
-
-    while remaining:
-        best_idx = -1
-        best_mmr = float("-inf")
-
-        for i, candidate in enumerate(remaining):
-            if not selected:
-                max_sim = 0.0
-            else:
-                max_sim = max(text_similarity(candidate.content, s.content) for s in selected)
-
-            mmr_score = lambda_ * candidate.relevance - (1.0 - lambda_) * max_sim
-            if mmr_score > best_mmr:
-                best_mmr = mmr_score
-                best_idx = i
-
-        if best_idx >= 0:
-            chosen = remaining.pop(best_idx)
-            chosen.mmr_score = best_mmr
-            selected.append(chosen)
-
-    # Map back to original items with updated scores
-    result = []
-    for rank, item in enumerate(selected):
-        original = dict(items[item.index])
-        # Assign rank-based score: highest MMR gets highest score
-        original[score_key] = 1.0 - (rank / len(selected))
-        result.append(original)
-
-    return result
+    )
+    # Rank-based scores: highest MMR gets highest score
+    return [{**items[row], score_key: score} for row, score in frame.ranked()]
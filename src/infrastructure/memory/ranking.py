@@ -0,0 +1,246 @@
+"""Columnar ranking engine shared by chunk and graph hybrid search.
+
+:class:`ChunkHybridSearch` and graph :class:`HybridSearch` both fuse a vector
+leg and a keyword leg with RRF, then apply temporal decay and MMR. Those steps
+run here on a :class:`RankingFrame` (parallel NumPy columns of scores,
+timestamps, texts and optional embeddings), so a query costs a handful of
+array operations instead of converting every candidate between dataclasses,
+Pydantic models and dicts at each step. Callers keep their own row objects
+and materialize only the final ordering through :meth:`RankingFrame.ranked`.
+
+Stages are plain ``RankingFrame -> RankingFrame`` callables run in order by
+:func:`run_stages`, so call sites compose their own pipeline.
+:class:`TemporalDecayStage`, :class:`SortStage` and :class:`MMRStage` produce
+the same orderings and scores as the per-item implementations in
+:mod:`temporal_decay` and :mod:`mmr`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+
+import numpy as np
+import numpy.typing as npt
+
+from src.infrastructure.memory.mmr import tokenize
+from src.infrastructure.memory.temporal_decay import decay_lambda
+
+SECONDS_PER_DAY = 86400.0
+
+
+def to_timestamp(value: datetime | str | None) -> float:
+    """Epoch seconds of a datetime or ISO-8601 string; NaN if missing or invalid.
+
+    Naive datetimes are taken as UTC, matching :func:`apply_temporal_decay`.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return float("nan")
+    if not isinstance(value, datetime):
+        return float("nan")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+@dataclass(frozen=True)
+class RankingFrame:
+    """Candidates as parallel columns; ``rows`` indexes the caller's objects."""
+
+    rows: npt.NDArray[np.int64]
+    scores: npt.NDArray[np.float64]
+    timestamps: npt.NDArray[np.float64]
+    texts: npt.NDArray[np.object_]
+    embeddings: npt.NDArray[np.float32] | None = None
+
+    @classmethod
+    def build(
+        cls,
+        scores: Iterable[float],
+        *,
+        texts: Sequence[str] | None = None,
+        timestamps: Iterable[datetime | str | None] | None = None,
+        embeddings: npt.ArrayLike | None = None,
+    ) -> RankingFrame:
+        """Frame over candidates in their current order (row ``i`` is candidate ``i``)."""
+        score_column = np.fromiter(scores, dtype=np.float64)
+        count = score_column.shape[0]
+        text_column = np.empty(count, dtype=object)
+        text_column[:] = list(texts) if texts is not None else [""] * count
+        return cls(
+            rows=np.arange(count, dtype=np.int64),
+            scores=score_column,
+            timestamps=(
+                np.fromiter((to_timestamp(t) for t in timestamps), dtype=np.float64, count=count)
+                if timestamps is not None
+                else np.full(count, np.nan)
+            ),
+            texts=text_column,
+            embeddings=(
+                np.asarray(embeddings, dtype=np.float32).reshape(count, -1)
+                if embeddings is not None
+                else None
+            ),
+        )
+
+    def __len__(self) -> int:
+        return int(self.rows.shape[0])
+
+    def take(
+        self,
+        order: npt.NDArray[np.int64],
+        scores: npt.NDArray[np.float64] | None = None,
+    ) -> RankingFrame:
+        """Reorder (or subset) every column by ``order``, optionally replacing scores."""
+        return RankingFrame(
+            rows=self.rows[order],
+            scores=self.scores[order] if scores is None else scores,
+            timestamps=self.timestamps[order],
+            texts=self.texts[order],
+            embeddings=self.embeddings[order] if self.embeddings is not None else None,
+        )
+
+    def ranked(self, limit: int | None = None) -> list[tuple[int, float]]:
+        """``(row, score)`` pairs in frame order, optionally truncated to ``limit``."""
+        return list(zip(self.rows[:limit].tolist(), self.scores[:limit].tolist(), strict=True))
+
+
+RankingStage = Callable[[RankingFrame], RankingFrame]
+
+
+def run_stages(frame: RankingFrame, stages: Iterable[RankingStage]) -> RankingFrame:
+    """Apply ``stages`` to ``frame`` in order."""
+    for stage in stages:
+        frame = stage(frame)
+    return frame
+
+
+def rrf_fuse(
+    legs: Sequence[Sequence[Hashable]],
+    weights: Sequence[float],
+    k: int = 60,
+) -> tuple[list[tuple[int, int]], npt.NDArray[np.float64]]:
+    """Weighted Reciprocal Rank Fusion of ranked key lists.
+
+    RRF score = sum over legs of ``weight / (k + rank)`` with 1-based ranks.
+
+    Returns:
+        ``(sources, scores)`` in descending score order (ties keep first-seen
+        order). ``sources[i]`` is the ``(leg, position)`` where key ``i`` was
+        first seen, so callers can pick the row object to keep.
+    """
+    slots: dict[Hashable, int] = {}
+    sources: list[tuple[int, int]] = []
+    leg_slots: list[npt.NDArray[np.int64]] = []
+    for leg_index, keys in enumerate(legs):
+        positions = np.empty(len(keys), dtype=np.int64)
+        for position, key in enumerate(keys):
+            slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(sources)
+                sources.append((leg_index, position))
+            positions[position] = slot
+        leg_slots.append(positions)
+
+    scores = np.zeros(len(sources), dtype=np.float64)
+    for positions, weight in zip(leg_slots, weights, strict=True):
+        np.add.at(scores, positions, weight / (k + np.arange(1, len(positions) + 1)))
+    order = np.argsort(-scores, kind="stable")
+    return [sources[i] for i in order.tolist()], scores[order]
+
+
+def jaccard_matrix(texts: Sequence[str]) -> npt.NDArray[np.float64]:
+    """Pairwise Jaccard similarity of the texts' token sets (see :func:`tokenize`)."""
+    vocabulary: dict[str, int] = {}
+    token_ids = [[vocabulary.setdefault(t, len(vocabulary)) for t in tokenize(s)] for s in texts]
+    incidence = np.zeros((len(texts), max(len(vocabulary), 1)), dtype=np.float64)
+    for row, ids in enumerate(token_ids):
+        incidence[row, ids] = 1.0
+    intersection = incidence @ incidence.T
+    sizes = incidence.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def cosine_matrix(embeddings: npt.NDArray[np.float32]) -> npt.NDArray[np.float64]:
+    """Pairwise cosine similarity of embedding rows."""
+    matrix = embeddings.astype(np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.where(norms > 0, norms, 1.0)
+    return matrix @ matrix.T
+
+
+def mmr_order(
+    scores: npt.NDArray[np.float64],
+    similarity: npt.NDArray[np.float64],
+    lambda_: float = 0.7,
+) -> npt.NDArray[np.int64]:
+    """Greedy Maximal Marginal Relevance selection order.
+
+    MMR score = lambda * relevance - (1 - lambda) * max_similarity_to_selected,
+    with relevance min-max normalized to [0, 1]. Ties go to the lower index.
+    """
+    count = scores.shape[0]
+    low, high = float(scores.min()), float(scores.max())
+    relevance = (scores - low) / (high - low if high > low else 1.0)
+    max_similarity = np.zeros(count, dtype=np.float64)
+    selected = np.zeros(count, dtype=bool)
+    order = np.empty(count, dtype=np.int64)
+    for step in range(count):
+        mmr = lambda_ * relevance - (1.0 - lambda_) * max_similarity
+        mmr[selected] = -np.inf
+        best = int(np.argmax(mmr))
+        order[step] = best
+        selected[best] = True
+        np.maximum(max_similarity, similarity[best], out=max_similarity)
+    return order
+
+
+@dataclass(frozen=True)
+class TemporalDecayStage:
+    """Multiply scores by ``exp(-ln 2 / half_life * age_days)``; undated rows are kept."""
+
+    half_life_days: float = 30.0
+    now: float | None = None  # epoch seconds; the time of the call when None
+
+    def __call__(self, frame: RankingFrame) -> RankingFrame:
+        now = time.time() if self.now is None else self.now
+        age_days = np.maximum((now - frame.timestamps) / SECONDS_PER_DAY, 0.0)
+        multiplier = np.exp(-decay_lambda(self.half_life_days) * age_days)
+        return replace(frame, scores=frame.scores * np.nan_to_num(multiplier, nan=1.0))
+
+
+@dataclass(frozen=True)
+class SortStage:
+    """Stable sort by descending score."""
+
+    def __call__(self, frame: RankingFrame) -> RankingFrame:
+        return frame.take(np.argsort(-frame.scores, kind="stable"))
+
+
+@dataclass(frozen=True)
+class MMRStage:
+    """Reorder by MMR and assign rank-based scores ``1 - rank / n``.
+
+    Similarity is Jaccard over text tokens, or cosine over the frame's
+    embeddings when ``use_embeddings`` is set and the frame carries them.
+    """
+
+    lambda_: float = 0.7
+    use_embeddings: bool = False
+
+    def __call__(self, frame: RankingFrame) -> RankingFrame:
+        count = len(frame)
+        if count <= 1:
+            return frame
+        if self.use_embeddings and frame.embeddings is not None:
+            similarity = cosine_matrix(frame.embeddings)
+        else:
+            similarity = jaccard_matrix(frame.texts.tolist())
+        order = mmr_order(frame.scores, similarity, self.lambda_)
+        return frame.take(order, scores=1.0 - np.arange(count, dtype=np.float64) / count)
@@ -0,0 +1,93 @@
+"""Result cache for memory chunk recall.
+
+Agents re-issue the same recall query on nearly every step. Each
+:class:`ChunkHybridSearch` call costs an embedding, two SQL searches, RRF and
+MMR, so the ranked candidates are cached per
+``(project, normalized query, category, limit, config)``:
+
+- Every project has a monotonically increasing index version, stored in
+  ``memory_index_versions`` and bumped by the chunk write paths of
+  ``SqlChunkRepository`` in the same transaction as the write. Searches read
+  the committed version first and key entries by it, so entries stay valid
+  exactly until the project's memory changes, in this process or any other.
+- Candidates are cached *before* temporal decay. Decay depends on the current
+  time, so it is re-applied on every hit instead of invalidating entries.
+- ``RECALL_CACHE_TTL`` only bounds how long an unused entry is kept.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+RECALL_CACHE_SIZE = 1024  # cached queries across all projects
+RECALL_CACHE_TTL = 300.0  # seconds
+
+
+def normalize_recall_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a recall query."""
+    return " ".join(query.lower().split())
+
+
+class RecallResultCache:
+    """LRU cache of ranked recall candidates, invalidated by index version."""
+
+    def __init__(self, max_entries: int = RECALL_CACHE_SIZE, ttl: float = RECALL_CACHE_TTL) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float, list[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(
+        self, project_id: str, key: tuple[Hashable, ...], *, version: int
+    ) -> list[dict[str, Any]] | None:
+        """Cached candidates (fresh copies) for the project at index ``version``."""
+        full_key = (project_id, version, *key)
+        entry = self._entries.get(full_key)
+        if entry is None or time.monotonic() - entry[0] > self._ttl:
+            if entry is not None:
+                del self._entries[full_key]
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(full_key)
+        self._stats["hits"] += 1
+        return [dict(item) for item in entry[1]]
+
+    def put(
+        self,
+        project_id: str,
+        key: tuple[Hashable, ...],
+        candidates: list[dict[str, Any]],
+        *,
+        version: int,
+    ) -> None:
+        """Store candidates computed after reading index ``version``.
+
+        The version must be read before searching: a write committed
+        mid-search then only makes the entry newer than its key.
+        """
+        full_key = (project_id, version, *key)
+        self._entries[full_key] = (time.monotonic(), [dict(item) for item in candidates])
+        self._entries.move_to_end(full_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the number of cached queries."""
+        return {**self._stats, "entries": len(self._entries)}
+
+
+# Singleton instance
+_recall_result_cache: RecallResultCache | None = None
+
+
+def get_recall_result_cache() -> RecallResultCache:
+    """Get the process-wide recall result cache."""
+    global _recall_result_cache
+    if _recall_result_cache is None:
+        _recall_result_cache = RecallResultCache()
+    return _recall_result_cache
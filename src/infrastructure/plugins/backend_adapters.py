@@ -132,6 +132,11 @@ class PluginRerankerAdapter(BaseReranker):
         self._implementation = implementation
         self._route = route
 
+    @property
+    def model(self) -> str:
+        """Model id of the resolved route (identifies cached rerank scores)."""
+        return self._route.model_id
+
     @override
     async def rank(
         self,
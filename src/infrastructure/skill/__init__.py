@@ -4,6 +4,7 @@ Skill infrastructure components.
 This module provides infrastructure-level components for the Skill system:
 - MarkdownParser: Parse SKILL.md files (YAML Frontmatter + Markdown)
 - FileSystemSkillScanner: Scan directories for SKILL.md files
+- SkillCatalog: Process-wide incremental cache of parsed SKILL.md files
 """
 
 from src.infrastructure.skill.filesystem_scanner import (
@@ -12,11 +13,14 @@ from src.infrastructure.skill.filesystem_scanner import (
     SkillFileInfo,
 )
 from src.infrastructure.skill.markdown_parser import MarkdownParser, SkillMarkdown
+from src.infrastructure.skill.skill_catalog import SkillCatalog, get_skill_catalog
 
 __all__ = [
     "FileSystemSkillScanner",
     "MarkdownParser",
     "ScanResult",
+    "SkillCatalog",
     "SkillFileInfo",
     "SkillMarkdown",
+    "get_skill_catalog",
 ]
@@ -124,7 +124,42 @@ class MarkdownParser:
             raise MarkdownParseError("Empty content", file_path)
 
         frontmatter, markdown_content = self._extract_frontmatter(content, file_path)
+        return self._build_skill_markdown(frontmatter, markdown_content, file_path)
 
+    def parse_frontmatter(self, content: str, file_path: str | None = None) -> SkillMarkdown:
+        """
+        Parse only the frontmatter of a SKILL.md file.
+
+        The returned SkillMarkdown carries every metadata field but an empty
+        ``content``; use ``extract_body`` to load the markdown body on demand.
+
+        Args:
+            content: Raw file content as string
+            file_path: Optional file path for error messages
+
+        Returns:
+            SkillMarkdown object with parsed frontmatter and empty content
+
+        Raises:
+            MarkdownParseError: If parsing fails
+        """
+        if not content or not content.strip():
+            raise MarkdownParseError("Empty content", file_path)
+
+        frontmatter, _ = self._extract_frontmatter(content, file_path)
+        return self._build_skill_markdown(frontmatter, "", file_path)
+
+    def extract_body(self, content: str, file_path: str | None = None) -> str:
+        """Return the markdown body (everything after the frontmatter)."""
+        match = self.FRONTMATTER_PATTERN.match(content)
+        if not match:
+            raise MarkdownParseError("Invalid SKILL.md format: missing frontmatter", file_path)
+        return match.group(2).strip()
+
+    def _build_skill_markdown(
+        self, frontmatter: dict[str, Any], markdown_content: str, file_path: str | None
+    ) -> SkillMarkdown:
+        """Build a SkillMarkdown from parsed frontmatter and body."""
         name = frontmatter.get("name")
         if not name:
             raise MarkdownParseError(
@@ -0,0 +1,228 @@
+"""
+Process-wide incremental catalog of parsed SKILL.md files.
+
+The catalog keeps one entry per SKILL.md path holding the parsed frontmatter
+(name, description, tools, ...) together with the file's mtime, size and
+content hash. Lookups re-stat the file and only re-parse it when the stat
+changed *and* the content hash differs, so repeated loads across loader
+instances and tenants share a single parse per file version.
+
+Skill bodies are only retained when a caller asks for them
+(``lookup(..., keep_body=True)``); otherwise ``SkillCatalogEntry.load_body``
+reads them on first use and caches them on the entry.
+
+The catalog holds at most ``CATALOG_MAX_ENTRIES`` files and evicts the least
+recently looked-up entry beyond that, so skill directories of many tenants
+and sandboxes cannot grow it without bound. An evicted file is simply
+re-parsed on its next lookup.
+
+All methods do blocking file I/O and are meant to be called from a worker
+thread (e.g. via ``asyncio.to_thread``).
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from src.infrastructure.skill.markdown_parser import (
+    MarkdownParseError,
+    MarkdownParser,
+    SkillMarkdown,
+)
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MAX_ENTRIES = 2048  # SKILL.md files kept before least-recently-used eviction
+
+
+def _read_file(file_path: Path) -> bytes:
+    try:
+        return file_path.read_bytes()
+    except FileNotFoundError:
+        raise MarkdownParseError(f"File not found: {file_path}", str(file_path)) from None
+    except OSError as e:
+        raise MarkdownParseError(f"Error reading file: {e}", str(file_path)) from e
+
+
+def _decode(raw: bytes, file_path: Path) -> str:
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise MarkdownParseError(f"Error reading file: {e}", str(file_path)) from e
+
+
+@dataclass
+class SkillCatalogEntry:
+    """
+    Parsed state of a single SKILL.md file.
+
+    Attributes:
+        file_path: Absolute path to the SKILL.md file
+        mtime_ns: File modification time when last checked
+        size: File size when last checked
+        digest: SHA-256 of the file content that was parsed
+        header: Frontmatter-only SkillMarkdown (``content`` is empty)
+        error: Parse error for this file version, if parsing failed
+    """
+
+    file_path: Path
+    mtime_ns: int
+    size: int
+    digest: str
+    header: SkillMarkdown | None = None
+    error: MarkdownParseError | None = None
+    _parser: MarkdownParser = field(default_factory=MarkdownParser, repr=False)
+    _body: str | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def body_loaded(self) -> bool:
+        """Whether the markdown body has been read."""
+        return self._body is not None
+
+    def load_body(self) -> str:
+        """Read (once) and return the markdown body of the skill."""
+        with self._lock:
+            if self._body is None:
+                content = _decode(_read_file(self.file_path), self.file_path)
+                self._body = self._parser.extract_body(content, str(self.file_path))
+            return self._body
+
+    def markdown(self) -> SkillMarkdown:
+        """Return the full SkillMarkdown, loading the body if needed."""
+        if self.header is None:
+            raise self.error or MarkdownParseError("Skill not parsed", str(self.file_path))
+        return replace(self.header, content=self.load_body())
+
+
+class SkillCatalog:
+    """
+    Incremental, thread-safe cache of parsed SKILL.md frontmatter.
+
+    Example:
+        catalog = get_skill_catalog()
+        entry = await asyncio.to_thread(catalog.lookup, file_info.file_path)
+        body = await asyncio.to_thread(entry.load_body)
+    """
+
+    def __init__(
+        self, parser: MarkdownParser | None = None, max_entries: int = CATALOG_MAX_ENTRIES
+    ) -> None:
+        self.parser = parser or MarkdownParser()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Path, SkillCatalogEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.parses = 0
+        self.evictions = 0
+
+    def lookup(self, file_path: Path, *, keep_body: bool = False) -> SkillCatalogEntry:
+        """
+        Return the current entry for ``file_path``, re-parsing only on change.
+
+        Args:
+            file_path: Path to a SKILL.md file
+            keep_body: Also cache the body when the file has to be (re)read,
+                avoiding a second read for callers that need it right away
+
+        Returns:
+            SkillCatalogEntry with a parsed header
+
+        Raises:
+            MarkdownParseError: If the file cannot be read or parsed
+        """
+        entry = self._refresh(Path(file_path), keep_body)
+        if entry.error is not None:
+            raise entry.error
+        return entry
+
+    def _refresh(self, file_path: Path, keep_body: bool) -> SkillCatalogEntry:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self.invalidate(file_path)
+            raise MarkdownParseError(f"File not found: {file_path}", str(file_path)) from None
+
+        with self._lock:
+            current = self._entries.get(file_path)
+            if (
+                current is not None
+                and current.mtime_ns == stat.st_mtime_ns
+                and current.size == stat.st_size
+            ):
+                self._entries.move_to_end(file_path)
+                self.hits += 1
+                return current
+
+        raw = _read_file(file_path)
+        digest = hashlib.sha256(raw).hexdigest()
+        if current is not None and current.digest == digest:
+            # Touched but unchanged: keep the parsed header and any loaded body.
+            with self._lock:
+                current.mtime_ns = stat.st_mtime_ns
+                current.size = stat.st_size
+                if file_path in self._entries:
+                    self._entries.move_to_end(file_path)
+                self.hits += 1
+            return current
+
+        entry = SkillCatalogEntry(
+            file_path=file_path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=digest,
+            _parser=self.parser,
+        )
+        try:
+            content = _decode(raw, file_path)
+            entry.header = self.parser.parse_frontmatter(content, str(file_path))
+            if keep_body:
+                entry._body = self.parser.extract_body(content, str(file_path))
+        except MarkdownParseError as e:
+            entry.error = e
+
+        with self._lock:
+            self._entries[file_path] = entry
+            self._entries.move_to_end(file_path)
+            self.parses += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        logger.debug(f"Parsed skill frontmatter: {file_path}")
+        return entry
+
+    def invalidate(self, file_path: Path | None = None) -> None:
+        """Drop one entry, or all entries when ``file_path`` is None."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(file_path), None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return catalog size and hit/parse/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bodies_loaded": sum(1 for e in self._entries.values() if e.body_loaded),
+                "hits": self.hits,
+                "parses": self.parses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_skill_catalog: SkillCatalog | None = None
+
+
+def get_skill_catalog() -> SkillCatalog:
+    """Return the process-wide skill catalog."""
+    global _skill_catalog
+    if _skill_catalog is None:
+        _skill_catalog = SkillCatalog()
+    return _skill_catalog
@@ -419,6 +419,7 @@ def mock_neo4j_client():
         return mock_result
 
     client.execute_query = AsyncMock(side_effect=mock_execute_query)
+    client.execute_read = client.execute_query
 
     # Mock close
     client.close = AsyncMock()
@@ -0,0 +1,109 @@
+"""Query-plan checks for graph write paths.
+
+Every node lookup on a write path (MERGE of nodes, endpoint MATCH of edge
+writes, deletes) must be planned as a label + uuid index seek backed by the
+uniqueness constraints created in ``Neo4jClient.build_indices``. A label-less
+``{uuid: ...}`` match degrades to an ``AllNodesScan`` that grows with the whole
+database, so each write is run under ``EXPLAIN`` and its plan is walked for
+that operator.
+
+These require a running Neo4j (``NEO4J_*`` env) and are skipped automatically
+when no graph backend can be reached.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+
+from src.infrastructure.graph.neo4j_client import TRANSACTION_TIMEOUT, Neo4jClient
+from src.infrastructure.graph.schemas import EntityEdge
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
+
+
+class _ExplainingClient(Neo4jClient):
+    """Neo4jClient that, while ``explain`` is set, only plans queries."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.explain = False
+        self.plans: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute_query(
+        self, query: str, timeout: float = TRANSACTION_TIMEOUT, **parameters: Any
+    ) -> Any:
+        if not self.explain:
+            return await super().execute_query(query, timeout=timeout, **parameters)
+        result = await super().execute_query(f"EXPLAIN {query}", timeout=timeout, **parameters)
+        self.plans.append((query, result.summary.plan))
+        return result
+
+
+def _operators(plan: dict[str, Any]) -> list[str]:
+    operators = [plan.get("operatorType", "")]
+    for child in plan.get("children", []):
+        operators.extend(_operators(child))
+    return operators
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def explaining_client():
+    from src.configuration.config import get_settings
+
+    settings = get_settings()
+    client = _ExplainingClient(
+        uri=settings.effective_graph_store_uri,
+        user=settings.effective_graph_store_user,
+        password=settings.effective_graph_store_password,
+    )
+    try:
+        await client.execute_query("RETURN 1 AS ok")
+    except Exception:
+        await client.close()
+        pytest.skip("Graph backend not reachable")
+    await client.build_indices()
+    client.explain = True
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+async def test_write_paths_never_plan_all_nodes_scan(explaining_client):
+    from src.infrastructure.graph.native_graph_adapter import NativeGraphAdapter
+
+    client = explaining_client
+    adapter = NativeGraphAdapter(
+        neo4j_client=client, llm_client=MagicMock(), embedding_service=MagicMock()
+    )
+
+    await client.save_node(["Episodic", "Node"], "plan-ep", {"content": "c"})
+    await client.save_nodes_batch(
+        [{"labels": ["Entity", "Node"], "uuid": "plan-a", "properties": {"name": "a"}}]
+    )
+    await client.save_edge("plan-a", "plan-b", "RELATES_TO", from_label="Entity", to_label="Entity")
+    await client.save_edge("plan-a", "plan-b", "RELATES_TO")
+    await client.save_edges_batch(
+        [
+            {
+                "from_uuid": "plan-ep",
+                "to_uuid": "plan-a",
+                "relationship_type": "MENTIONS",
+                "from_label": "Episodic",
+                "to_label": "Entity",
+            }
+        ]
+    )
+    await client.delete_node("plan-a", label="Entity")
+    await adapter._save_entity_relationship(
+        EntityEdge(source_uuid="plan-a", target_uuid="plan-b", relationship_type="KNOWS")
+    )
+
+    assert len(client.plans) == 7
+    for query, plan in client.plans:
+        scans = [op for op in _operators(plan) if op.startswith("AllNodesScan")]
+        assert not scans, f"{query.strip()[:80]} plans {scans}"
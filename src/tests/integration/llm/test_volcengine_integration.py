@@ -355,7 +355,7 @@ class TestVolcengineIntegration:
 
         try:
             async with asyncio.timeout(_LIVE_CALL_TIMEOUT_SECONDS):
-                ranked = await reranker._llm_rerank(
+                ranked, _ = await reranker._llm_rerank(
                     "Where is Paris?",
                     docs,
                     top_n=2,
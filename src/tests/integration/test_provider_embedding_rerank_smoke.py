@@ -140,7 +140,7 @@ class TestProviderEmbeddingRerankSmoke:
 
         docs = ["The sky is blue.", "Paris is in France."]
         try:
-            ranked = await reranker._llm_rerank("Where is Paris?", docs, top_n=2)
+            ranked, _ = await reranker._llm_rerank("Where is Paris?", docs, top_n=2)
         except Exception as e:
             _skip_or_raise_external_issue(provider_name, e)
             return
@@ -0,0 +1,134 @@
+"""Benchmark for ArcadeDBGraphStore's SQL-over-HTTP path against a live ArcadeDB.
+
+Start a local container first, e.g.::
+
+    docker run --rm -p 2480:2480 -p 7688:7687 \
+        -e JAVA_OPTS="-Darcadedb.server.rootPassword=arcadepw" arcadedata/arcadedb:latest
+
+The test is skipped when ArcadeDB's HTTP port is not reachable. It reports:
+
+- per-statement latency of the pooled client vs. a fresh client per statement
+  (the previous transport);
+- repeated ``fulltext_search`` latency now that the schema is ensured once;
+- project-scoped ``vector_search`` hit counts in a multi-tenant database.
+
+Run with: pytest src/tests/performance/test_arcadedb_store_performance.py -v -m performance
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import socket
+import statistics
+import time
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import urlparse
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.infrastructure.graph.stores.arcadedb_graph_store import ArcadeDBGraphStore
+
+DIM = 32
+PROJECTS = 10
+ENTITIES_PER_PROJECT = 50
+STATEMENTS = 100
+LIMIT = 10
+
+
+def _http_base_url() -> str:
+    host = urlparse(os.environ.get("ARCADEDB_URI", "bolt://localhost:7688")).hostname
+    return f"http://{host or 'localhost'}:2480"
+
+
+def _can_reach_http() -> bool:
+    parsed = urlparse(_http_base_url())
+    try:
+        with socket.create_connection((parsed.hostname, parsed.port or 2480), timeout=2.0):
+            return True
+    except OSError:
+        return False
+
+
+def _make_store() -> ArcadeDBGraphStore:
+    # Only the HTTP SQL primitives are exercised, so the Bolt client is a stub.
+    client = MagicMock()
+    client.uri = os.environ.get("ARCADEDB_URI", "bolt://localhost:7688")
+    client.database = os.environ.get("ARCADEDB_DATABASE", "memstack")
+    client.user = "root"
+    client.password = os.environ.get("ARCADEDB_PASSWORD", "arcadepw")
+    client.close = AsyncMock()
+    embedding_service = MagicMock()
+    embedding_service.embedding_dim = DIM
+    return ArcadeDBGraphStore(
+        neo4j_client=client, llm_client=MagicMock(), embedding_service=embedding_service
+    )
+
+
+async def _fresh_client_sql(store: ArcadeDBGraphStore, command: str) -> None:
+    """The previous transport: one new client (and TCP connection) per statement."""
+    async with httpx.AsyncClient(auth=store._http_auth, timeout=30.0) as client:
+        resp = await client.post(
+            f"{store._http_base_url}/api/v1/command/{store._http_database}",
+            json={"language": "sql", "command": command},
+        )
+        resp.raise_for_status()
+
+
+def _ms(samples: list[float]) -> str:
+    return f"p50={statistics.median(samples):.2f}ms max={max(samples):.2f}ms"
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_arcadedb_sql_transport_and_scoped_vector_search() -> None:
+    if not _can_reach_http():
+        pytest.skip("ArcadeDB HTTP API not reachable at " + _http_base_url())
+
+    store = _make_store()
+    tag = f"bench-{uuid4().hex[:8]}"
+    rng = random.Random(7)
+    try:
+        await store.initialize_schema()
+        for p in range(PROJECTS):
+            for i in range(ENTITIES_PER_PROJECT):
+                vector = store._sql_vec_literal([rng.gauss(0, 1) for _ in range(DIM)])
+                await store._sql(
+                    f"INSERT INTO Entity SET uuid = '{tag}-{p}-{i}', "
+                    f"project_id = '{tag}-{p}', name_summary = 'bench entity {i}', "
+                    f"name_embedding = {vector}"
+                )
+
+        probe = "SELECT FROM Entity LIMIT 1"
+        fresh_ms: list[float] = []
+        pooled_ms: list[float] = []
+        for _ in range(STATEMENTS):
+            started = time.perf_counter()
+            await _fresh_client_sql(store, probe)
+            fresh_ms.append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            await store._sql(probe)
+            pooled_ms.append((time.perf_counter() - started) * 1000)
+
+        fulltext_ms: list[float] = []
+        for _ in range(STATEMENTS // 5):
+            started = time.perf_counter()
+            await store.fulltext_search("bench", limit=LIMIT)
+            fulltext_ms.append((time.perf_counter() - started) * 1000)
+
+        query = [rng.gauss(0, 1) for _ in range(DIM)]
+        hits = await store.vector_search(query, limit=LIMIT, project_id=f"{tag}-0")
+
+        print(
+            f"\n[arcadedb] fresh-client {_ms(fresh_ms)} | pooled {_ms(pooled_ms)} | "
+            f"fulltext {_ms(fulltext_ms)} | scoped vector hits={len(hits)}/{LIMIT} "
+            f"across {PROJECTS} projects"
+        )
+        assert statistics.median(pooled_ms) <= statistics.median(fresh_ms)
+        assert len(hits) == LIMIT
+        assert all(hit.node["project_id"] == f"{tag}-0" for hit in hits)
+    finally:
+        await store._sql(f"DELETE FROM Entity WHERE project_id LIKE '{tag}-%'")
+        await store.close()
@@ -0,0 +1,66 @@
+"""Recall and latency benchmark for the in-process chunk vector cache.
+
+The reference ranking is an exact float64 cosine scan, i.e. what pgvector's
+``ORDER BY embedding <=> :q`` returns without an approximate index.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from src.infrastructure.memory.chunk_vector_cache import ProjectVectorIndex
+
+CHUNKS = 100_000
+DIM = 256
+QUERIES = 50
+TOP_K = 10
+
+
+def _synthetic_project(rng: np.random.Generator) -> np.ndarray:
+    # Clustered vectors so neighbourhoods resemble real embeddings.
+    centers = rng.standard_normal((200, DIM))
+    labels = rng.integers(0, len(centers), CHUNKS)
+    return centers[labels] + 0.3 * rng.standard_normal((CHUNKS, DIM))
+
+
+@pytest.mark.performance
+def test_chunk_vector_cache_recall_and_latency() -> None:
+    rng = np.random.default_rng(7)
+    vectors = _synthetic_project(rng)
+    index = ProjectVectorIndex(DIM, capacity=CHUNKS)
+    started = time.perf_counter()
+    for i, vector in enumerate(vectors):
+        index.upsert({"id": f"c{i}", "content": "", "category": "fact", "embedding": vector})
+    build_seconds = time.perf_counter() - started
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = vectors[rng.integers(0, CHUNKS, QUERIES)] + 0.1 * rng.standard_normal((QUERIES, DIM))
+
+    recalls: list[float] = []
+    cache_ms: list[float] = []
+    scan_ms: list[float] = []
+    for query in queries:
+        started = time.perf_counter()
+        expected = np.argsort(-(unit @ (query / np.linalg.norm(query))))[:TOP_K]
+        scan_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        results = index.search(query.tolist(), TOP_K)
+        cache_ms.append((time.perf_counter() - started) * 1000)
+
+        assert results is not None
+        found = {int(row["id"][1:]) for row in results}
+        recalls.append(len(found & set(expected.tolist())) / TOP_K)
+
+    recall = float(np.mean(recalls))
+    p50, p95 = np.percentile(cache_ms, [50, 95])
+    print(
+        f"[chunk-vector-cache] chunks={CHUNKS} dim={DIM} build_s={build_seconds:.2f} "
+        f"recall@{TOP_K}={recall:.3f} p50_ms={p50:.2f} p95_ms={p95:.2f} "
+        f"exact_scan_p50_ms={np.percentile(scan_ms, 50):.2f} mb={index.nbytes / 2**20:.0f}"
+    )
+    assert recall >= 0.99
+    assert p95 < 250
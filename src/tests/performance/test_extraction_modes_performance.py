@@ -0,0 +1,231 @@
+"""Latency comparison of graph episode extraction modes.
+
+``NativeGraphAdapter.process_episode`` is run over synthetic episodes with a
+fake LLM that returns hand-written responses for each prompt after a fixed
+delay, and a fake graph read for the existing entities used by dedup:
+
+* staged: entity extraction, then reflexion overlapped with the existing-entity
+  read and first dedup pass, then relationship extraction (three LLM calls on
+  the critical path, the graph read hidden behind reflexion);
+* joint: one prompt returning entities and relationships together, with
+  reflexion still overlapped (two LLM calls), plus a relationship pass
+  restricted to the entities only reflexion found, when it finds any.
+
+Only call counts and latency are measured. Extraction quality is out of
+scope: the responses are hand-written, so scoring them would only score the
+fixtures.
+
+Run with: pytest src/tests/performance/test_extraction_modes_performance.py -v -s -m performance
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.infrastructure.graph.extraction.prompts import (
+    ENTITY_EXTRACTION_SYSTEM_PROMPT,
+    JOINT_EXTRACTION_SYSTEM_PROMPT,
+    REFLEXION_SYSTEM_PROMPT,
+    RELATIONSHIP_EXTRACTION_SYSTEM_PROMPT,
+)
+from src.infrastructure.graph.native_graph_adapter import NativeGraphAdapter
+
+LLM_LATENCY_S = 0.05
+GRAPH_READ_LATENCY_S = 0.04
+
+ENTITY_TYPES_CONTEXT = [
+    {"entity_type_id": 0, "entity_type_name": "Entity", "entity_type_description": "fallback"},
+    {"entity_type_id": 1, "entity_type_name": "Person", "entity_type_description": "human"},
+    {"entity_type_id": 2, "entity_type_name": "Organization", "entity_type_description": "org"},
+    {"entity_type_id": 3, "entity_type_name": "Location", "entity_type_description": "place"},
+]
+
+
+def _entity(name: str, type_id: int) -> dict[str, Any]:
+    return {"name": name, "entity_type_id": type_id, "summary": f"{name} (synthetic)"}
+
+
+def _rel(source: str, rel_type: str, target: str) -> dict[str, Any]:
+    return {
+        "from_entity": source,
+        "to_entity": target,
+        "relationship_type": rel_type,
+        "fact": f"{source} {rel_type.lower().replace('_', ' ')} {target}",
+        "weight": 1.0,
+    }
+
+
+# Hand-written LLM responses per prompt kind. Joint responses hold the
+# relationships whose endpoints the joint pass extracted, but not those
+# touching entities that only reflexion recovers.
+SYNTHETIC_EPISODES: list[dict[str, Any]] = [
+    {
+        "content": "Ada Lovelace founded Analytical Labs in London with Charles Babbage.",
+        "entities": [_entity("Ada Lovelace", 1), _entity("Analytical Labs", 2)],
+        "reflexion": [_entity("London", 3), _entity("Charles Babbage", 1)],
+        "relationships": [
+            _rel("Ada Lovelace", "FOUNDED", "Analytical Labs"),
+            _rel("Analytical Labs", "LOCATED_IN", "London"),
+            _rel("Charles Babbage", "FOUNDED", "Analytical Labs"),
+        ],
+        "joint": [_rel("Ada Lovelace", "FOUNDED", "Analytical Labs")],
+    },
+    {
+        "content": "Grace Hopper works at Navy Research and manages the COBOL team.",
+        "entities": [
+            _entity("Grace Hopper", 1),
+            _entity("Navy Research", 2),
+            _entity("COBOL team", 2),
+        ],
+        "reflexion": [],
+        "relationships": [
+            _rel("Grace Hopper", "WORKS_AT", "Navy Research"),
+            _rel("Grace Hopper", "MANAGES", "COBOL team"),
+        ],
+        "joint": [
+            _rel("Grace Hopper", "WORKS_AT", "Navy Research"),
+            _rel("Grace Hopper", "MANAGES", "COBOL team"),
+        ],
+    },
+    {
+        "content": "Alan Turing met Joan Clarke at Bletchley Park.",
+        "entities": [_entity("Alan Turing", 1), _entity("Bletchley Park", 3)],
+        "reflexion": [_entity("Joan Clarke", 1)],
+        "relationships": [
+            _rel("Alan Turing", "KNOWS", "Joan Clarke"),
+            _rel("Alan Turing", "LOCATED_IN", "Bletchley Park"),
+        ],
+        "joint": [_rel("Alan Turing", "LOCATED_IN", "Bletchley Park")],
+    },
+]
+
+PROMPT_KINDS = {
+    ENTITY_EXTRACTION_SYSTEM_PROMPT: "entities",
+    REFLEXION_SYSTEM_PROMPT: "reflexion",
+    RELATIONSHIP_EXTRACTION_SYSTEM_PROMPT: "relationships",
+    JOINT_EXTRACTION_SYSTEM_PROMPT: "joint",
+}
+
+
+class _SyntheticLLM:
+    """Returns synthetic responses keyed by system prompt and episode text."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def generate(self, messages: list[dict[str, str]], **_kwargs: Any) -> dict[str, str]:
+        kind = PROMPT_KINDS[messages[0]["content"]]
+        episode = next(e for e in SYNTHETIC_EPISODES if e["content"] in messages[1]["content"])
+        self.calls.append(kind)
+        await asyncio.sleep(LLM_LATENCY_S)
+        if kind == "entities":
+            payload: dict[str, Any] = {"entities": episode["entities"]}
+        elif kind == "reflexion":
+            payload = {"missed_entities": episode["reflexion"]}
+        elif kind == "relationships":
+            payload = {"relationships": episode["relationships"]}
+        else:
+            payload = {"entities": episode["entities"], "relationships": episode["joint"]}
+        return {"content": json.dumps(payload)}
+
+
+class _HashEmbeddings:
+    """Deterministic, near-orthogonal embeddings so distinct names never dedupe."""
+
+    embedding_dim = 32
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [[b / 255 - 0.5 for b in hashlib.sha256(t.encode()).digest()] for t in texts]
+
+    async def find_most_similar_batch(
+        self, query_embeddings: list[list[float]], candidates: list[list[float]], top_k: int = 1
+    ) -> list[list[tuple[int, float]]]:
+        matrix = np.asarray(candidates)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        results = []
+        for query in query_embeddings:
+            scores = matrix @ (np.asarray(query) / np.linalg.norm(query))
+            best = np.argsort(-scores)[:top_k]
+            results.append([(int(i), float(scores[i])) for i in best])
+        return results
+
+
+async def _slow_existing_entities(*_args: Any, **_kwargs: Any) -> list[Any]:
+    await asyncio.sleep(GRAPH_READ_LATENCY_S)
+    return []
+
+
+async def _run_episode(content: str, *, joint: bool) -> tuple[float, list[str]]:
+    llm = _SyntheticLLM()
+    neo4j_client = MagicMock()
+    for method in ("execute_query", "save_nodes_batch", "save_edges_batch", "find_node_by_uuid"):
+        setattr(neo4j_client, method, AsyncMock(return_value=None))
+    adapter = NativeGraphAdapter(
+        neo4j_client=neo4j_client,
+        llm_client=llm,  # type: ignore[arg-type]
+        embedding_service=_HashEmbeddings(),  # type: ignore[arg-type]
+        enable_reflexion=True,
+        joint_extraction=joint,
+    )
+    schema_context = {
+        "entity_types_context": ENTITY_TYPES_CONTEXT,
+        "entity_type_id_to_name": {
+            ctx["entity_type_id"]: ctx["entity_type_name"] for ctx in ENTITY_TYPES_CONTEXT
+        },
+        "edge_type_map": {},
+    }
+    with (
+        patch.object(adapter, "_check_embedding_dimension", AsyncMock()),
+        patch.object(adapter, "_load_schema_context", AsyncMock(return_value=schema_context)),
+        patch.object(adapter, "_get_existing_entities", _slow_existing_entities),
+        patch.object(adapter, "_save_discovered_types", AsyncMock()),
+        patch.object(adapter, "_update_episode_status", AsyncMock()),
+    ):
+        started = time.perf_counter()
+        await adapter.process_episode(episode_uuid="episode-1", content=content)
+        elapsed = time.perf_counter() - started
+    return elapsed, llm.calls
+
+
+async def _evaluate(*, joint: bool) -> dict[str, float]:
+    latencies, llm_calls = [], 0
+    for episode in SYNTHETIC_EPISODES:
+        elapsed, calls = await _run_episode(episode["content"], joint=joint)
+        latencies.append(elapsed)
+        llm_calls += len(calls)
+    return {
+        "mean_latency_ms": 1000 * sum(latencies) / len(latencies),
+        "llm_calls": llm_calls,
+    }
+
+
+@pytest.mark.performance
+async def test_extraction_modes_latency() -> None:
+    staged = await _evaluate(joint=False)
+    joint = await _evaluate(joint=True)
+
+    for mode, report in (("staged", staged), ("joint", joint)):
+        print(
+            f"\n[extraction] {mode:6s} latency={report['mean_latency_ms']:.0f}ms "
+            f"llm_calls={report['llm_calls']:.0f}"
+        )
+
+    # The graph read is hidden behind reflexion: the staged critical path is
+    # three LLM calls, not three calls plus the read.
+    serial_ms = 1000 * (3 * LLM_LATENCY_S + GRAPH_READ_LATENCY_S)
+    assert staged["mean_latency_ms"] < serial_ms - 1000 * GRAPH_READ_LATENCY_S / 2
+
+    # Joint mode saves one LLM round trip per episode where reflexion finds
+    # nothing; elsewhere the restricted relationship pass takes it back.
+    unchanged = [episode for episode in SYNTHETIC_EPISODES if not episode["reflexion"]]
+    saved_ms = 1000 * LLM_LATENCY_S * len(unchanged) / len(SYNTHETIC_EPISODES)
+    assert joint["llm_calls"] == staged["llm_calls"] - len(unchanged)
+    assert joint["mean_latency_ms"] < staged["mean_latency_ms"] - saved_ms / 2
@@ -0,0 +1,170 @@
+"""Benchmark for the columnar ranking engine at both hybrid search call sites.
+
+Each call site (chunk search: RRF + MMR + decay/sort; graph search: RRF +
+decay/sort + MMR) is timed against a per-item reference that reproduces the
+previous dict-based pipeline, and the two must produce the same ordering.
+
+Run with: pytest src/tests/performance/test_ranking_performance.py -v -s -m performance
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.graph.schemas import SearchResultItem
+from src.infrastructure.graph.search.hybrid_search import HybridSearch
+from src.infrastructure.memory.chunk_search import ChunkHybridSearch
+from src.infrastructure.memory.mmr import text_similarity
+from src.infrastructure.memory.temporal_decay import apply_temporal_decay
+
+LEG_SIZES = (18, 30)  # default over-fetch of chunk (limit=6) and graph (limit=10) search
+ROUNDS = 5
+WORDS = [f"w{i}" for i in range(400)]
+
+
+def _reference_mmr(items: list[dict[str, Any]], lambda_: float = 0.7) -> list[dict[str, Any]]:
+    """The previous per-item MMR loop (Jaccard similarity on token sets)."""
+    if len(items) <= 1:
+        return items
+    scores = [item["score"] for item in items]
+    low, high = min(scores), max(scores)
+    span = high - low if high > low else 1.0
+    remaining = [(i, (item["score"] - low) / span) for i, item in enumerate(items)]
+    selected: list[int] = []
+    while remaining:
+        best, best_mmr = 0, float("-inf")
+        for position, (index, relevance) in enumerate(remaining):
+            max_sim = max(
+                (text_similarity(items[index]["content"], items[s]["content"]) for s in selected),
+                default=0.0,
+            )
+            mmr = lambda_ * relevance - (1.0 - lambda_) * max_sim
+            if mmr > best_mmr:
+                best, best_mmr = position, mmr
+        selected.append(remaining.pop(best)[0])
+    return [
+        {**items[index], "score": 1.0 - rank / len(selected)} for rank, index in enumerate(selected)
+    ]
+
+
+def _reference_rrf(legs: list[list[dict[str, Any]]], weights: list[float]) -> list[dict[str, Any]]:
+    scores: dict[str, float] = {}
+    rows: dict[str, dict[str, Any]] = {}
+    for leg, weight in zip(legs, weights, strict=True):
+        for rank, item in enumerate(leg, start=1):
+            scores[item["id"]] = scores.get(item["id"], 0.0) + weight / (60 + rank)
+            rows.setdefault(item["id"], item)
+    ordered = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    return [{**rows[key], "score": score} for key, score in ordered]
+
+
+def _reference_decay_sort(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    now = datetime.now(UTC)
+    items = [
+        {**item, "score": apply_temporal_decay(item["score"], item["created_at"], 30.0, now)}
+        for item in items
+    ]
+    items.sort(key=lambda x: x["score"], reverse=True)
+    return items
+
+
+def _legs(rng: random.Random, size: int) -> list[list[dict[str, Any]]]:
+    now = datetime.now(UTC)
+    pool = [
+        {
+            "id": f"c{i}",
+            "content": " ".join(rng.choices(WORDS, k=40)),
+            "score": rng.random(),
+            "created_at": now - timedelta(days=rng.uniform(0, 120)),
+            "metadata": {},
+        }
+        for i in range(size * 2)
+    ]
+    return [rng.sample(pool, size), rng.sample(pool, size)]
+
+
+def _time_ms(fn: Callable[[], Any]) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", LEG_SIZES)
+def test_chunk_search_ranking(size: int) -> None:
+    search = ChunkHybridSearch(MagicMock(), vector_cache=MagicMock(), result_cache=MagicMock())
+    vector, fts = _legs(random.Random(size), size)
+
+    def engine() -> list[str]:
+        return [r.id for r in search._finalize(search._fuse(vector, fts), size)]
+
+    def reference() -> list[str]:
+        merged = _reference_mmr(_reference_rrf([vector, fts], [0.7, 0.3]))
+        return [r["id"] for r in _reference_decay_sort(merged)[:size]]
+
+    assert engine() == reference()
+    engine_ms, reference_ms = _time_ms(engine), _time_ms(reference)
+    print(
+        f"\n[ranking] chunk legs={size} engine={engine_ms:.2f}ms "
+        f"per-item={reference_ms:.2f}ms speedup={reference_ms / engine_ms:.1f}x"
+    )
+    assert engine_ms <= reference_ms
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", LEG_SIZES)
+def test_graph_search_ranking(size: int) -> None:
+    search = HybridSearch(MagicMock(), MagicMock(), rerank_cache=MagicMock())
+    vector, keyword = (
+        [
+            SearchResultItem(
+                type="entity",
+                uuid=row["id"],
+                name=row["id"],
+                summary=row["content"],
+                score=row["score"],
+                metadata={"created_at": row["created_at"].isoformat()},
+            )
+            for row in leg
+        ]
+        for leg in _legs(random.Random(size), size)
+    )
+
+    def engine() -> list[str]:
+        fused = search._rrf_fusion(vector, keyword, vector_weight=0.6, keyword_weight=0.4)
+        return [item.uuid for item in search._apply_post_processing(fused)]
+
+    def reference() -> list[str]:
+        legs = [
+            [
+                {
+                    "id": i.uuid,
+                    "content": i.summary,
+                    "score": i.score,
+                    "created_at": datetime.fromisoformat(i.metadata["created_at"]),
+                }
+                for i in leg
+            ]
+            for leg in (vector, keyword)
+        ]
+        fused = _reference_decay_sort(_reference_rrf(legs, [0.6, 0.4]))
+        return [row["id"] for row in _reference_mmr(fused)]
+
+    assert engine() == reference()
+    engine_ms, reference_ms = _time_ms(engine), _time_ms(reference)
+    print(
+        f"\n[ranking] graph legs={size} engine={engine_ms:.2f}ms "
+        f"per-item={reference_ms:.2f}ms speedup={reference_ms / engine_ms:.1f}x"
+    )
+    assert engine_ms <= reference_ms
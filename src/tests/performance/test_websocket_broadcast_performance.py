@@ -0,0 +1,66 @@
+"""Throughput benchmark for serialize-once conversation broadcasts."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from src.infrastructure.adapters.primary.web.routers.event_dispatcher import DispatcherManager
+from src.infrastructure.adapters.primary.web.websocket.connection_manager import ConnectionManager
+
+EVENTS = 500
+
+
+class _CountingWebSocket:
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes_sent = 0
+
+    async def send_text(self, data: str) -> None:
+        self.frames += 1
+        self.bytes_sent += len(data)
+
+
+def _tool_event(index: int) -> dict[str, Any]:
+    return {
+        "type": "observe",
+        "conversation_id": "conv-bench",
+        "data": {
+            "tool_name": "web_search",
+            "tool_execution_id": f"exec-{index}",
+            "observation": {"results": [{"title": f"Result {n}", "score": n} for n in range(20)]},
+        },
+        "event_time_us": 1_700_000_000_000_000 + index,
+        "event_counter": index,
+    }
+
+
+async def _broadcast_events_per_second(subscribers: int) -> float:
+    manager = ConnectionManager(dispatcher_manager=DispatcherManager())
+    sockets = [_CountingWebSocket() for _ in range(subscribers)]
+    for index, websocket in enumerate(sockets):
+        session_id = f"session-{index:04d}"
+        manager.active_connections[session_id] = websocket  # type: ignore[assignment]
+        manager.conversation_subscribers.setdefault("conv-bench", set()).add(session_id)
+
+    events = [_tool_event(index) for index in range(EVENTS)]
+    started = time.perf_counter()
+    for event in events:
+        await manager.broadcast_to_conversation("conv-bench", event)
+    for dispatcher in manager.dispatcher_manager.dispatchers.values():
+        await dispatcher.stop()
+    elapsed = time.perf_counter() - started
+
+    assert all(websocket.bytes_sent > 0 for websocket in sockets)
+    return EVENTS / elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("subscribers", [1, 10, 100])
+async def test_conversation_broadcast_throughput(subscribers: int) -> None:
+    events_per_second = await _broadcast_events_per_second(subscribers)
+
+    print(f"[ws-broadcast] subscribers={subscribers} events_per_sec={events_per_second:,.0f}")
+    assert events_per_second > 50, f"{subscribers} subscribers: {events_per_second:.0f} events/s"
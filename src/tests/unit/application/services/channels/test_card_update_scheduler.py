@@ -0,0 +1,141 @@
+"""Unit tests for the shared streaming card update scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.application.services.channels import channel_message_router as router_module
+from src.application.services.channels.card_update_scheduler import CardUpdateScheduler
+from src.application.services.channels.channel_message_router import (
+    ChannelMessageRouter,
+    _AgentStreamState,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _sized(chars: int) -> Any:
+    return lambda: chars
+
+
+async def test_tokens_go_to_the_largest_unseen_delta_first() -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=50, burst=1)
+    blocker = scheduler.open_stream("app-1", min_interval=0, size=_sized(0))
+    small = scheduler.open_stream("app-1", min_interval=0, size=_sized(10))
+    large = scheduler.open_stream("app-1", min_interval=0, size=_sized(500))
+    assert await scheduler.acquire(blocker)  # drains the bucket
+
+    order: list[str] = []
+
+    async def _wait(name: str, ticket: Any) -> None:
+        await scheduler.acquire(ticket)
+        order.append(name)
+
+    await asyncio.wait_for(
+        asyncio.gather(_wait("small", small), _wait("large", large)), timeout=1.0
+    )
+
+    assert order == ["large", "small"]
+    assert scheduler.get_stats()["app-1"]["waits"] == 2
+
+
+async def test_apps_have_independent_budgets() -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=0.001, burst=1)
+    first = scheduler.open_stream("app-1", min_interval=0, size=_sized(1))
+    second = scheduler.open_stream("app-2", min_interval=0, size=_sized(1))
+
+    assert await asyncio.wait_for(scheduler.acquire(first), timeout=0.1)
+    assert await asyncio.wait_for(scheduler.acquire(second), timeout=0.1)
+
+
+async def test_abort_releases_a_waiting_stream() -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=0.001, burst=1)
+    ticket = scheduler.open_stream("app-1", min_interval=0, size=_sized(1))
+    assert await scheduler.acquire(ticket)
+    abort = asyncio.Event()
+
+    pending = asyncio.create_task(scheduler.acquire(ticket, abort=abort))
+    await asyncio.sleep(0)
+    abort.set()
+
+    assert await asyncio.wait_for(pending, timeout=0.5) is False
+    assert scheduler.get_stats()["app-1"]["waiting"] == 0
+
+
+async def test_rescheduling_cancels_the_pending_timer() -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=0.001, burst=1)
+    tickets = [scheduler.open_stream("app-1", min_interval=0, size=_sized(1)) for _ in range(3)]
+    assert await scheduler.acquire(tickets[0])
+    abort = asyncio.Event()
+
+    timers = []
+    waiting = []
+    for ticket in tickets:
+        waiting.append(asyncio.create_task(scheduler.acquire(ticket, abort=abort)))
+        await asyncio.sleep(0)
+        timers.append(scheduler._apps["app-1"].timer)
+
+    assert all(timer.cancelled() for timer in timers[:-1])
+    assert not timers[-1].cancelled()
+    abort.set()
+    await asyncio.gather(*waiting)
+    for ticket in tickets:
+        scheduler.close_stream(ticket)
+    assert timers[-1].cancelled()
+
+
+def test_final_flush_overdraws_within_the_burst() -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=0.001, burst=2)
+    ticket = scheduler.open_stream("app-1", min_interval=0, size=_sized(1))
+
+    for _ in range(10):
+        scheduler.acquire_final(ticket)
+
+    stats = scheduler.get_stats()["app-1"]
+    assert stats["finals"] == 10
+    assert stats["tokens"] >= -2
+
+
+def test_interval_stretches_with_concurrent_streams() -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=2, max_interval=4)
+    tickets = [scheduler.open_stream("app-1", min_interval=0.5, size=_sized(0)) for _ in range(3)]
+
+    assert scheduler.interval_for(tickets[0]) == pytest.approx(1.5)
+    for _ in range(20):
+        scheduler.open_stream("app-1", min_interval=0.5, size=_sized(0))
+    assert scheduler.interval_for(tickets[0]) == pytest.approx(4)
+
+    for ticket in tickets:
+        scheduler.close_stream(ticket)
+    assert scheduler.get_stats()["app-1"]["streams"] == 20
+
+
+async def test_router_updates_on_new_text_and_skips_unchanged_state(monkeypatch) -> None:
+    scheduler = CardUpdateScheduler(rate_per_second=100, burst=10)
+    monkeypatch.setattr(router_module, "get_card_update_scheduler", lambda: scheduler)
+    router = ChannelMessageRouter()
+    state = _AgentStreamState()
+    ticket = scheduler.open_stream("app-1", min_interval=0, size=lambda: 0)
+    pushed: list[str] = []
+
+    async def _push(text: str) -> bool:
+        pushed.append(text)
+        return True
+
+    updater = asyncio.create_task(router._stream_card_updates(state, ticket, _push))
+    router._apply_stream_event(state, "text_delta", {"delta": "Hello"})
+    for _ in range(50):
+        if pushed:
+            break
+        await asyncio.sleep(0.01)
+    router._apply_stream_event(state, "observe", {})  # no visible change
+    await asyncio.sleep(0.02)
+    state.mark_done()
+    last = await asyncio.wait_for(updater, timeout=1.0)
+
+    assert pushed == ["Hello"]
+    assert last == "Hello"
+    assert ticket.sent_chars == len("Hello")
@@ -22,6 +22,7 @@ async def test_create_native_graph_adapter_uses_reflexion_settings(monkeypatch:
         embedding_dimension = None
         graph_reflexion_enabled = True
         graph_reflexion_max_iterations = 4
+        graph_joint_extraction_enabled = True
         auto_clear_mismatched_embeddings = False
 
         # Graph store config (effective_* resolve to NEO4J_* fallbacks)
@@ -86,5 +87,6 @@ async def test_create_native_graph_adapter_uses_reflexion_settings(monkeypatch:
     assert captured["resolve_provider"]["tenant_id"] == "tenant-1"
     assert captured["adapter_kwargs"]["enable_reflexion"] is True
     assert captured["adapter_kwargs"]["reflexion_max_iterations"] == 4
+    assert captured["adapter_kwargs"]["joint_extraction"] is True
     assert captured["adapter_kwargs"]["auto_clear_embeddings"] is False
     assert captured["vector_indices"][0]["dimensions"] == 321
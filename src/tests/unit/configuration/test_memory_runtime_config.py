@@ -42,10 +42,12 @@ def test_settings_accept_graph_reflexion_controls() -> None:
     settings = Settings(
         GRAPH_REFLEXION_ENABLED="true",
         GRAPH_REFLEXION_MAX_ITERATIONS="3",
+        GRAPH_JOINT_EXTRACTION_ENABLED="true",
     )
 
     assert settings.graph_reflexion_enabled is True
     assert settings.graph_reflexion_max_iterations == 3
+    assert settings.graph_joint_extraction_enabled is True
 
 
 @pytest.mark.unit
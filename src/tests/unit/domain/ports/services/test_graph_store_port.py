@@ -0,0 +1,59 @@
+"""Tests for GraphStorePort streaming export defaults and cursors."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.model.graph.dtos import GraphExportCursor, GraphExportDTO
+from src.tests._helpers.graph_stubs import NullGraphStoreStub
+
+pytestmark = pytest.mark.unit
+
+
+class _ExportStore(NullGraphStoreStub):
+    async def data_export(self, **kwargs: object) -> GraphExportDTO:
+        return GraphExportDTO(
+            exported_at="t",
+            tenant_id=None,
+            project_id="p1",
+            episodes=[{"uuid": "ep-2"}, {"uuid": "ep-1"}, {"uuid": "ep-3"}],
+            relationships=[{"edge_id": "r-1", "type": "RELATES_TO", "properties": {}}],
+            communities=[{"uuid": "c-1"}],
+        )
+
+
+async def _collect(store: NullGraphStoreStub, **kwargs: object) -> list[tuple[str, list[str]]]:
+    return [
+        (page.section, [row.get("uuid") or row["edge_id"] for row in page.rows])
+        async for page in store.iter_data_export(**kwargs)
+    ]
+
+
+def test_cursor_round_trips_and_rejects_malformed_tokens() -> None:
+    cursor = GraphExportCursor("relationships", "node-9")
+
+    assert GraphExportCursor.decode(cursor.encode()) == cursor
+    for token in ("not-base64!", GraphExportCursor("episodes").encode()[:-4], "bnVsbA=="):
+        with pytest.raises(ValueError, match="Malformed export cursor"):
+            GraphExportCursor.decode(token)
+
+
+async def test_default_pages_materialized_export_in_key_order() -> None:
+    pages = await _collect(_ExportStore(), page_size=2, include_entities=False)
+
+    assert pages == [
+        ("episodes", ["ep-1", "ep-2"]),
+        ("episodes", ["ep-3"]),
+        ("relationships", ["r-1"]),
+        ("communities", ["c-1"]),
+    ]
+
+
+async def test_default_resumes_after_cursor() -> None:
+    pages = await _collect(
+        _ExportStore(),
+        cursor=GraphExportCursor("episodes", "ep-1"),
+        include_relationships=False,
+    )
+
+    assert pages == [("episodes", ["ep-2", "ep-3"]), ("communities", ["c-1"])]
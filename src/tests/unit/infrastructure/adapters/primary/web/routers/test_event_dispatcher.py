@@ -0,0 +1,169 @@
+"""Unit tests for the coalescing WebSocket event dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from src.infrastructure.adapters.primary.web.routers.event_dispatcher import (
+    BATCH_FRAME_EVENTS,
+    DispatcherConfig,
+    EventDispatcher,
+    encode_event,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _RecordingWebSocket:
+    def __init__(self) -> None:
+        self.frames: list[Any] = []
+
+    async def send_text(self, data: str) -> None:
+        self.frames.append(json.loads(data))
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        flat: list[dict[str, Any]] = []
+        for frame in self.frames:
+            flat.extend(frame if isinstance(frame, list) else [frame])
+        return flat
+
+
+def _delta(text: str, counter: int, event_type: str = "text_delta") -> dict[str, Any]:
+    return {
+        "type": event_type,
+        "conversation_id": "conv-1",
+        "data": {"delta": text, "message_id": "msg-1"},
+        "event_counter": counter,
+    }
+
+
+def _event(event_type: str, counter: int) -> dict[str, Any]:
+    return {"type": event_type, "conversation_id": "conv-1", "data": {}, "event_counter": counter}
+
+
+def _dispatcher(**config: Any) -> tuple[EventDispatcher, _RecordingWebSocket]:
+    websocket = _RecordingWebSocket()
+    dispatcher = EventDispatcher("session-1", websocket, DispatcherConfig(**config))  # type: ignore[arg-type]
+    return dispatcher, websocket
+
+
+async def test_consecutive_deltas_are_merged_without_mutating_input() -> None:
+    dispatcher, websocket = _dispatcher()
+    first = _delta("Hel", 1)
+    for event in (first, _delta("lo", 2), _delta(" world", 3)):
+        await dispatcher.enqueue(event)
+
+    await dispatcher.stop()
+
+    assert websocket.events == [
+        {
+            "type": "text_delta",
+            "conversation_id": "conv-1",
+            "data": {"delta": "Hello world", "message_id": "msg-1"},
+            "event_counter": 3,
+        }
+    ]
+    assert first["data"]["delta"] == "Hel"
+    stats = dispatcher.get_stats()
+    assert stats["coalesced"] == 2
+    assert stats["coalesce_ratio"] == pytest.approx(2 / 3)
+
+
+async def test_deltas_are_not_merged_across_other_events() -> None:
+    dispatcher, websocket = _dispatcher(max_frame_events=BATCH_FRAME_EVENTS)
+    await dispatcher.enqueue(_delta("a", 1))
+    await dispatcher.enqueue(_delta("b", 2, event_type="thought_delta"))
+    await dispatcher.enqueue(_event("act", 3))
+    await dispatcher.enqueue(_delta("c", 4))
+
+    await dispatcher.stop()
+
+    assert [e["event_counter"] for e in websocket.events] == [1, 2, 3, 4]
+    assert len(websocket.frames) == 1
+    assert dispatcher.get_stats()["events_per_frame"] == 4
+
+
+async def test_full_queue_drops_deltas_but_keeps_control_events() -> None:
+    dispatcher, websocket = _dispatcher(queue_size=2, coalesce_deltas=False)
+    await dispatcher.enqueue(_delta("a", 1))
+    await dispatcher.enqueue(_event("act", 2))
+
+    assert await dispatcher.enqueue(_event("complete", 3))
+    assert await dispatcher.enqueue(_event("clarification_asked", 4))
+    assert not await dispatcher.enqueue(_delta("b", 5))
+
+    await dispatcher.stop()
+
+    assert [e["type"] for e in websocket.events] == ["act", "complete", "clarification_asked"]
+    assert dispatcher.get_stats()["dropped"] == 2
+
+
+async def test_frames_respect_max_frame_events() -> None:
+    dispatcher, websocket = _dispatcher(max_frame_events=2)
+    for counter in range(5):
+        await dispatcher.enqueue(_event("observe", counter))
+
+    await dispatcher.stop()
+
+    assert websocket.frames[0] == [_event("observe", 0), _event("observe", 1)]
+    assert websocket.frames[-1] == _event("observe", 4)
+
+
+async def test_default_frames_are_single_json_objects() -> None:
+    dispatcher, websocket = _dispatcher()
+    for counter in range(3):
+        await dispatcher.enqueue(_event("observe", counter))
+
+    await dispatcher.stop()
+
+    assert websocket.frames == [_event("observe", counter) for counter in range(3)]
+
+
+async def test_sender_loop_delivers_control_events_and_reports_latency() -> None:
+    dispatcher, websocket = _dispatcher(max_frame_delay=0.5)
+    await dispatcher.start()
+    try:
+        await dispatcher.enqueue(_event("complete", 1))
+        for _ in range(50):
+            if websocket.frames:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await dispatcher.stop()
+
+    assert websocket.frames == [_event("complete", 1)]
+    stats = dispatcher.get_stats()
+    assert stats["frames"] == 1
+    assert stats["max_send_latency_ms"] < 500
+
+
+async def test_pre_encoded_payload_is_sent_verbatim() -> None:
+    dispatcher, websocket = _dispatcher()
+    sent: list[str] = []
+
+    async def _capture(data: str) -> None:
+        sent.append(data)
+
+    websocket.send_text = _capture  # type: ignore[method-assign]
+    encoded = encode_event(_event("act", 1))
+    await dispatcher.enqueue({"type": "act"}, encoded=encoded)
+
+    await dispatcher.stop()
+
+    assert sent == [encoded]
+
+
+async def test_coalescing_discards_stale_encoding() -> None:
+    dispatcher, websocket = _dispatcher()
+    first = _delta("a", 1)
+    await dispatcher.enqueue(first, encoded=encode_event(first))
+    await dispatcher.enqueue(_delta("b", 2))
+
+    await dispatcher.stop()
+
+    assert websocket.events[0]["data"]["delta"] == "ab"
@@ -7,6 +7,10 @@ from collections.abc import Callable
 
 import pytest
 
+from src.infrastructure.adapters.primary.web.routers.event_dispatcher import (
+    BATCH_FRAME_EVENTS,
+    DispatcherManager,
+)
 from src.infrastructure.adapters.primary.web.websocket.connection_manager import ConnectionManager
 
 
@@ -29,6 +33,9 @@ class _AcceptingWebSocket:
     async def accept(self, *, subprotocol: str | None = None) -> None:
         self.accepted_subprotocol = subprotocol
 
+    async def send_text(self, data: str) -> None:
+        pass
+
 
 def _make_task_with_bridge_message_id(message_id: str) -> _StubTask:
     task = _StubTask(done=False)
@@ -57,6 +64,31 @@ async def test_connect_accepts_selected_subprotocol() -> None:
     assert manager.active_connections["session-1"] is websocket
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_array_frames_are_only_used_for_sessions_that_opt_in() -> None:
+    manager = ConnectionManager(dispatcher_manager=DispatcherManager())
+    await manager.connect("user-1", "legacy", _AcceptingWebSocket())  # type: ignore[arg-type]
+    await manager.connect(
+        "user-1",
+        "batching",
+        _AcceptingWebSocket(),  # type: ignore[arg-type]
+        batch_frames=True,
+    )
+    manager.conversation_subscribers["conv-1"] = {"legacy", "batching"}
+
+    try:
+        assert await manager.broadcast_to_conversation("conv-1", {"type": "act"}) == 2
+        dispatchers = manager.dispatcher_manager.dispatchers
+        assert dispatchers["legacy"].config.max_frame_events == 1
+        assert dispatchers["batching"].config.max_frame_events == BATCH_FRAME_EVENTS
+    finally:
+        await manager.disconnect("legacy")
+        await manager.disconnect("batching")
+
+    assert not manager.batch_frame_sessions
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_try_start_bridge_task_skips_when_active_bridge_exists() -> None:
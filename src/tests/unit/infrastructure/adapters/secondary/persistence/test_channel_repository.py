@@ -23,6 +23,7 @@ from src.infrastructure.adapters.secondary.persistence.channel_repository import
     ChannelMessageRepository,
     ChannelOutboxRepository,
     ChannelSessionBindingRepository,
+    outbox_retry_backoff,
 )
 
 
@@ -547,3 +548,27 @@ class TestChannelOutboxRepository:
 
         assert result is False
         assert mock_session.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_schedule_skips_messages_without_retry_time(self, mock_session):
+        """Failed rows with a NULL next_retry_at keep waiting instead of becoming due."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        repo = ChannelOutboxRepository(mock_session)
+        await repo.list_retry_schedule(outbox_ids=["outbox-1"])
+
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "next_retry_at IS NOT NULL" in sql
+        assert "channel_outbox.id IN" in sql
+        assert await repo.list_retry_schedule(outbox_ids=[]) == []
+        assert mock_session.execute.call_count == 1
+
+    def test_retry_backoff_is_exponential_with_jitter(self):
+        """Backoff doubles per attempt, is capped, and is jittered downwards."""
+        delays = [outbox_retry_backoff(3) for _ in range(50)]
+
+        assert all(4 <= delay <= 8 for delay in delays)
+        assert len(set(delays)) > 1
+        assert outbox_retry_backoff(20) <= 300
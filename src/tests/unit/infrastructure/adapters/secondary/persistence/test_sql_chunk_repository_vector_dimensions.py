@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -33,7 +34,9 @@ async def test_vector_search_filters_rows_by_embedding_dimension() -> None:
 
     await repo.vector_search([0.1, 0.2], project_id="project-1")
 
-    assert "vector_dims(embedding) = vector_dims(CAST(:qvec_dims AS vector))" in session.statements[0]
+    assert (
+        "vector_dims(embedding) = vector_dims(CAST(:qvec_dims AS vector))" in session.statements[0]
+    )
 
 
 @pytest.mark.unit
@@ -44,4 +47,81 @@ async def test_find_similar_filters_rows_by_embedding_dimension() -> None:
 
     await repo.find_similar([0.1, 0.2], project_id="project-1")
 
-    assert "vector_dims(embedding) = vector_dims(CAST(:qvec_dims AS vector))" in session.statements[0]
+    assert (
+        "vector_dims(embedding) = vector_dims(CAST(:qvec_dims AS vector))" in session.statements[0]
+    )
+
+
+class _RowsResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def fetchall(self) -> list[Any]:
+        return self._rows
+
+
+class _ScriptedSession:
+    def __init__(self, *results: list[Any]) -> None:
+        self.statements: list[str] = []
+        self._results = list(results)
+
+    async def execute(self, statement: Any, *_args: Any, **_kwargs: Any) -> _RowsResult:
+        self.statements.append(str(statement))
+        return _RowsResult(self._results.pop(0) if self._results else [])
+
+
+def _row(query_index: int, chunk_id: str, score: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        query_index=query_index,
+        id=chunk_id,
+        content=chunk_id,
+        metadata={},
+        score=score,
+        created_at=None,
+        category="fact",
+        source_type="memory",
+        source_id=chunk_id,
+    )
+
+
+@pytest.mark.unit
+async def test_vector_search_many_runs_one_lateral_statement() -> None:
+    session = _ScriptedSession([_row(0, "a", 0.9), _row(2, "c", 0.8), _row(0, "b", 0.7)])
+    repo = SqlChunkRepository(session)  # type: ignore[arg-type]
+
+    results = await repo.vector_search_many([[0.1], [0.2], [0.3]], project_id="project-1")
+
+    assert len(session.statements) == 1
+    assert "CROSS JOIN LATERAL" in session.statements[0]
+    assert "vector_dims(embedding) = vector_dims(q.qvec)" in session.statements[0]
+    assert [[r["id"] for r in rows] for rows in results] == [["a", "b"], [], ["c"]]
+
+
+@pytest.mark.unit
+async def test_fts_search_many_falls_back_to_ilike_per_empty_query() -> None:
+    session = _ScriptedSession([_row(0, "a", 0.5)], [_row(0, "fallback", 1.0)])
+    repo = SqlChunkRepository(session)  # type: ignore[arg-type]
+
+    results = await repo.fts_search_many(
+        ["dark mode", "偏好"], project_id="project-1", keywords=[["dark", "mode"], None]
+    )
+
+    assert len(session.statements) == 2
+    assert "to_tsquery('simple', :query_0)" in session.statements[0]
+    assert "plainto_tsquery('simple', :query_1)" in session.statements[0]
+    assert "ILIKE" in session.statements[1]
+    assert [[r["id"] for r in rows] for rows in results] == [["a"], ["fallback"]]
+
+
+@pytest.mark.unit
+async def test_find_similar_many_groups_matches_per_embedding() -> None:
+    match = SimpleNamespace(query_index=1, id="dup", content="dup", similarity=0.97)
+    session = _ScriptedSession([match])
+    repo = SqlChunkRepository(session)  # type: ignore[arg-type]
+
+    results = await repo.find_similar_many([[0.1], [0.2]], project_id="project-1")
+
+    assert len(session.statements) == 1
+    assert "CROSS JOIN LATERAL" in session.statements[0]
+    assert "vector_dims(embedding) = vector_dims(q.qvec)" in session.statements[0]
+    assert results == [[], [{"id": "dup", "content": "dup", "similarity": 0.97}]]
@@ -0,0 +1,220 @@
+"""Unit tests for actor handle caching and idle hibernation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.infrastructure.agent.actor import actor_manager
+from src.infrastructure.agent.actor.project_agent_actor import ProjectAgentActor
+from src.infrastructure.agent.actor.types import ProjectAgentActorConfig, ProjectChatRequest
+
+pytestmark = pytest.mark.unit
+
+ACTOR_ID = ProjectAgentActor.actor_id("tenant-1", "project-1", "default")
+
+
+class _RemoteMethod:
+    def __init__(self, result: Any) -> None:
+        self.result = result
+        self.calls: list[tuple[Any, ...]] = []
+
+    def remote(self, *args: Any) -> Any:
+        self.calls.append(args)
+        return self.result
+
+
+def _settings(**overrides: Any) -> SimpleNamespace:
+    values = {
+        "ray_namespace": "memstack",
+        "ray_actor_handle_ttl_seconds": 30.0,
+        "ray_actor_idle_hibernate_seconds": 1800.0,
+        "ray_actor_hibernate_interval_seconds": 60.0,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture(autouse=True)
+def _ray_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _available() -> bool:
+        return True
+
+    async def _await_ray(ref: Any) -> Any:
+        return ref
+
+    monkeypatch.setattr(actor_manager, "init_ray_if_needed", _available)
+    monkeypatch.setattr(actor_manager, "is_ray_available", lambda: True)
+    monkeypatch.setattr(actor_manager, "await_ray", _await_ray)
+    monkeypatch.setattr(actor_manager, "get_ray_settings", _settings)
+    monkeypatch.setattr(actor_manager, "_actor_handles", {})
+    monkeypatch.setattr(actor_manager, "_hibernation_snapshots", actor_manager.OrderedDict())
+    monkeypatch.setattr(actor_manager, "_actor_stats", dict.fromkeys(actor_manager._actor_stats, 0))
+    monkeypatch.setattr(actor_manager, "_live_gauge_registered", True)
+
+
+def _config() -> ProjectAgentActorConfig:
+    return ProjectAgentActorConfig(tenant_id="tenant-1", project_id="project-1")
+
+
+async def test_existing_actor_handle_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    handle = object()
+    lookups: list[str] = []
+
+    def _get_actor(name: str, namespace: str) -> Any:
+        lookups.append(name)
+        return handle
+
+    monkeypatch.setattr(actor_manager.ray, "get_actor", _get_actor)
+
+    first = await actor_manager.get_or_create_actor("tenant-1", "project-1", "default", _config())
+    second = await actor_manager.get_actor_if_exists("tenant-1", "project-1", "default")
+
+    assert first is second is handle
+    assert lookups == [ACTOR_ID]
+    assert actor_manager.get_actor_manager_stats()["handle_hits"] == 1
+
+    actor_manager.invalidate_actor_handle(ACTOR_ID)
+    await actor_manager.get_actor_if_exists("tenant-1", "project-1", "default")
+    assert len(lookups) == 2
+
+
+async def test_missing_actor_is_created_and_counted_as_cold_start(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    initialize = _RemoteMethod({"status": "initialized"})
+    created = SimpleNamespace(initialize=initialize)
+
+    def _get_actor(name: str, namespace: str) -> Any:
+        raise ValueError(name)
+
+    monkeypatch.setattr(actor_manager.ray, "get_actor", _get_actor)
+    monkeypatch.setattr(
+        ProjectAgentActor,
+        "options",
+        lambda **_kwargs: SimpleNamespace(remote=lambda: created),
+        raising=False,
+    )
+
+    actor = await actor_manager.get_or_create_actor("tenant-1", "project-1", "default", _config())
+
+    assert actor is created
+    assert len(initialize.calls) == 1
+    assert actor_manager.get_actor_manager_stats()["cold_starts"] == 1
+
+
+async def test_idle_actors_are_snapshotted_killed_and_evicted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    idle = SimpleNamespace(hibernate=_RemoteMethod({"idle_seconds": 4000.0}))
+    busy = SimpleNamespace(hibernate=_RemoteMethod(None))
+    busy_id = ProjectAgentActor.actor_id("tenant-1", "project-2", "default")
+    actors = {ACTOR_ID: idle, busy_id: busy}
+    killed: list[Any] = []
+
+    monkeypatch.setattr(
+        actor_manager.ray.util,
+        "list_named_actors",
+        lambda all_namespaces: [
+            {"name": ACTOR_ID, "namespace": "memstack"},
+            {"name": busy_id, "namespace": "memstack"},
+            {"name": actor_manager.ROUTER_ACTOR_NAME, "namespace": "memstack"},
+            {"name": ACTOR_ID, "namespace": "other"},
+        ],
+    )
+    monkeypatch.setattr(actor_manager.ray, "get_actor", lambda name, namespace: actors[name])
+    monkeypatch.setattr(actor_manager.ray, "kill", lambda actor, no_restart: killed.append(actor))
+    actor_manager._cache_handle(ACTOR_ID, idle)
+
+    hibernated = await actor_manager.hibernate_idle_actors()
+
+    assert hibernated == 1
+    assert killed == [idle]
+    assert idle.hibernate.calls == [(1800.0,)]
+    assert ACTOR_ID not in actor_manager._actor_handles
+    assert actor_manager.get_hibernation_snapshot(ACTOR_ID) == {"idle_seconds": 4000.0}
+    stats = actor_manager.get_actor_manager_stats()
+    assert stats["hibernations"] == 1
+    assert stats["live_actors"] == 1
+
+
+def test_idle_threshold_never_undercuts_handle_ttl() -> None:
+    settings = _settings(ray_actor_idle_hibernate_seconds=10.0)
+
+    assert actor_manager._hibernate_threshold_seconds(settings) == 60.0
+    disabled = _settings(ray_actor_idle_hibernate_seconds=0)
+    assert actor_manager._hibernate_threshold_seconds(disabled) == 0.0
+
+
+async def test_actor_hibernate_skips_busy_or_recent_actors() -> None:
+    actor = ProjectAgentActor.__ray_metadata__.modified_class()
+
+    assert await actor.hibernate(60.0) is None
+
+    actor._last_activity -= 120.0
+    snapshot = await actor.hibernate(60.0)
+
+    assert snapshot is not None
+    assert snapshot["idle_seconds"] >= 120.0
+    with pytest.raises(RuntimeError):
+        await actor.initialize(_config())
+
+
+async def test_status_and_cancel_do_not_count_as_activity() -> None:
+    actor = ProjectAgentActor.__ray_metadata__.modified_class()
+    actor._last_activity -= 120.0
+
+    await actor.status()
+    await actor.cancel("conv-1")
+
+    assert await actor.hibernate(60.0) is not None
+
+
+class _FailingChat:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    def remote(self, *_args: Any) -> Any:
+        raise self.error
+
+
+def _chat_request() -> ProjectChatRequest:
+    return ProjectChatRequest(
+        conversation_id="conv-1", message_id="msg-1", user_message="hi", user_id="user-1"
+    )
+
+
+async def test_chat_retries_once_on_a_fresh_actor_after_hibernation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stale = SimpleNamespace(chat=_FailingChat(RuntimeError("Actor is hibernating; retry")))
+    fresh = SimpleNamespace(chat=_RemoteMethod({"status": "started"}))
+    resolved: list[str] = []
+
+    async def _get_or_create(tenant_id: str, project_id: str, agent_mode: str, _config: Any):
+        resolved.append(ProjectAgentActor.actor_id(tenant_id, project_id, agent_mode))
+        return fresh
+
+    monkeypatch.setattr(actor_manager, "get_or_create_actor", _get_or_create)
+    actor_manager._cache_handle(ACTOR_ID, stale)
+
+    result = await actor_manager.chat_with_actor(stale, _chat_request(), _config())
+
+    assert result == {"status": "started"}
+    assert resolved == [ACTOR_ID]
+    assert len(fresh.chat.calls) == 1
+    assert ACTOR_ID not in actor_manager._actor_handles
+
+
+async def test_chat_does_not_retry_unrelated_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    actor = SimpleNamespace(chat=_FailingChat(ValueError("bad request")))
+
+    async def _get_or_create(*_args: Any) -> Any:
+        raise AssertionError("should not re-resolve the actor")
+
+    monkeypatch.setattr(actor_manager, "get_or_create_actor", _get_or_create)
+
+    with pytest.raises(ValueError, match="bad request"):
+        await actor_manager.chat_with_actor(actor, _chat_request(), _config())
@@ -0,0 +1,185 @@
+"""Tests for the embedding-backed semantic tool ranker."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.agent.core.tool_embedding_ranker import (
+    EmbeddingToolRanker,
+    ToolRecallCase,
+    ToolVectorCache,
+    evaluate_tool_recall,
+    tool_schema_version,
+)
+from src.infrastructure.agent.core.tool_selector import (
+    CORE_TOOLS,
+    ToolSelectionContext,
+    ToolSelector,
+)
+
+pytestmark = pytest.mark.unit
+
+_VOCAB = ("github", "issue", "slack", "message", "calendar", "event", "weather", "jira")
+
+
+class _BagOfWordsEmbedding:
+    """Deterministic embedding: one dimension per vocabulary word."""
+
+    embedding_dim = len(_VOCAB)
+
+    def __init__(self) -> None:
+        self.embedded_texts: list[str] = []
+
+    def _vector(self, text: str) -> list[float]:
+        lowered = text.lower()
+        return [float(lowered.count(word)) for word in _VOCAB]
+
+    async def embed_text(self, text: str) -> list[float]:
+        self.embedded_texts.append(text)
+        return self._vector(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.embedded_texts.extend(texts)
+        return [self._vector(text) for text in texts]
+
+
+def _tool(name: str, description: str) -> SimpleNamespace:
+    return SimpleNamespace(name=name, description=description, parameters={"type": "object"})
+
+
+def _mcp_tools() -> dict[str, SimpleNamespace]:
+    return {
+        "mcp__github__create_issue": _tool("mcp__github__create_issue", "Open a GitHub issue"),
+        "mcp__slack__post": _tool("mcp__slack__post", "Post a Slack message to a channel"),
+        "mcp__calendar__add": _tool("mcp__calendar__add", "Create a calendar event"),
+        "mcp__weather__now": _tool("mcp__weather__now", "Current weather"),
+        "mcp__jira__ticket": _tool("mcp__jira__ticket", "Create a Jira ticket"),
+    }
+
+
+def _context(message: str, **kwargs) -> ToolSelectionContext:
+    return ToolSelectionContext(
+        conversation_history=[{"role": "user", "content": message}], **kwargs
+    )
+
+
+def _fallback(tool) -> float:
+    return 0.0
+
+
+class TestEmbeddingToolRanker:
+    async def test_ranks_by_cosine_similarity(self):
+        embedding = _BagOfWordsEmbedding()
+        ranker = EmbeddingToolRanker(embedding, cache=ToolVectorCache())
+        tools = _mcp_tools()
+        query = "send a slack message about the calendar event"
+
+        assert await ranker.prepare(tools, query)
+        ranked = ranker.rank_tools(tools, _context(query), score_fallback=_fallback)
+
+        assert set(ranked[:2]) == {"mcp__calendar__add", "mcp__slack__post"}
+        assert set(ranked) == set(tools)
+
+    async def test_tool_vectors_are_cached_across_rankers(self):
+        cache = ToolVectorCache()
+        first = _BagOfWordsEmbedding()
+        second = _BagOfWordsEmbedding()
+        tools = _mcp_tools()
+
+        await EmbeddingToolRanker(first, cache=cache).prepare(tools, "open a github issue")
+        await EmbeddingToolRanker(second, cache=cache).prepare(tools, "weather today")
+
+        assert len(first.embedded_texts) == len(tools) + 1
+        assert second.embedded_texts == ["weather today"]
+
+    async def test_schema_change_reembeds_only_that_tool(self):
+        cache = ToolVectorCache()
+        embedding = _BagOfWordsEmbedding()
+        ranker = EmbeddingToolRanker(embedding, cache=cache)
+        tools = _mcp_tools()
+        await ranker.prepare(tools, "github issue")
+        embedding.embedded_texts.clear()
+
+        tools["mcp__weather__now"] = _tool("mcp__weather__now", "Weather forecast by city")
+        await ranker.prepare(tools, "github issue")
+
+        assert len(embedding.embedded_texts) == 1
+        assert "forecast" in embedding.embedded_texts[0]
+
+    def test_schema_version_tracks_parameters(self):
+        tool = _tool("mcp__x", "desc")
+        changed = SimpleNamespace(name="mcp__x", description="desc", parameters={"type": "array"})
+
+        assert tool_schema_version("mcp__x", tool) != tool_schema_version("mcp__x", changed)
+
+    def test_unprepared_query_uses_fallback_order(self):
+        ranker = EmbeddingToolRanker(_BagOfWordsEmbedding(), cache=ToolVectorCache())
+        tools = _mcp_tools()
+        scores = {"mcp__jira__ticket": 5.0}
+
+        ranked = ranker.rank_tools(
+            tools,
+            _context("anything"),
+            score_fallback=lambda tool: scores.get(tool.name, 0.0),
+        )
+
+        assert ranked[0] == "mcp__jira__ticket"
+        assert ranked[1:] == [name for name in tools if name != "mcp__jira__ticket"]
+
+    async def test_embedding_failure_returns_false(self):
+        class _Failing(_BagOfWordsEmbedding):
+            async def embed_batch(self, texts):
+                raise RuntimeError("provider down")
+
+        ranker = EmbeddingToolRanker(_Failing(), cache=ToolVectorCache())
+
+        assert await ranker.prepare(_mcp_tools(), "github") is False
+
+    async def test_selector_keeps_core_tools(self):
+        ranker = EmbeddingToolRanker(_BagOfWordsEmbedding(), cache=ToolVectorCache())
+        tools = {name: _tool(name, name) for name in sorted(CORE_TOOLS)}
+        tools.update(_mcp_tools())
+        await ranker.prepare(tools, "create a jira ticket")
+
+        selected = ToolSelector().select_tools(
+            tools,
+            _context(
+                "create a jira ticket",
+                max_tools=len(CORE_TOOLS) + 1,
+                metadata={"semantic_backend": "embedding_vector", "embedding_ranker": ranker},
+            ),
+        )
+
+        assert set(selected) >= CORE_TOOLS
+        assert "mcp__jira__ticket" in selected
+        assert len(selected) == len(CORE_TOOLS) + 1
+
+
+class TestEvaluateToolRecall:
+    async def test_reports_recall_against_baseline(self):
+        descriptions = {name: tool.description for name, tool in _mcp_tools().items()}
+        cases = [
+            ToolRecallCase.from_record(
+                {
+                    "user_message": "post a slack message",
+                    "tools": descriptions,
+                    "used_tools": ["mcp__slack__post"],
+                }
+            ),
+            ToolRecallCase.from_record(
+                {
+                    "user_message": "what's the weather",
+                    "tools": [{"name": n, "description": d} for n, d in descriptions.items()],
+                    "used_tools": ["mcp__weather__now", "unknown_tool"],
+                }
+            ),
+        ]
+        ranker = EmbeddingToolRanker(_BagOfWordsEmbedding(), cache=ToolVectorCache())
+
+        report = await evaluate_tool_recall(cases, ranker, max_tools=1, always_include=set())
+
+        assert report.cases == 2
+        assert report.recall == 1.0
+        assert report.baseline_recall == 0.0
+        assert report.mean_selected == 1.0
+        assert report.to_dict()["misses"] == {}
@@ -0,0 +1,39 @@
+"""Unit tests for CostTracker prompt-cache accounting."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.infrastructure.agent.cost.tracker import CostTracker
+
+pytestmark = pytest.mark.unit
+
+
+def test_prompt_cache_summary_tracks_cached_and_uncached_input() -> None:
+    tracker = CostTracker()
+
+    tracker.calculate(
+        usage={"input_tokens": 1000, "output_tokens": 10, "cache_write_tokens": 800},
+        model_name="claude-3-5-sonnet",
+    )
+    tracker.calculate(
+        usage={"input_tokens": 1200, "output_tokens": 10, "cache_read_tokens": 800},
+        model_name="claude-3-5-sonnet",
+    )
+
+    summary = tracker.get_session_summary()["prompt_cache"]
+    assert summary["cached_input_tokens"] == 800
+    assert summary["uncached_input_tokens"] == 1400
+    assert summary["cache_write_tokens"] == 800
+    assert summary["cache_hit_ratio"] == pytest.approx(800 / 2200, abs=1e-4)
+
+
+def test_prompt_cache_summary_without_calls() -> None:
+    summary = CostTracker().get_prompt_cache_summary()
+
+    assert summary == {
+        "cached_input_tokens": 0,
+        "uncached_input_tokens": 0,
+        "cache_write_tokens": 0,
+        "cache_hit_ratio": 0.0,
+    }
@@ -137,3 +137,50 @@ def test_parse_markdown_rejects_invalid_frontmatter(tmp_path: Path, contents: st
     file_path.write_text(contents, encoding="utf-8")
 
     assert MarkdownMemoryStore._parse_markdown(file_path) is None
+
+
+async def test_recall_matches_word_fragments_and_skips_reparsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = MarkdownMemoryStore(tmp_path / "memory")
+    await store.capture("project-1", "conversation-1", "Deployment of the billing service")
+    await store.capture("project-1", "conversation-1", "Billing dashboard redesign")
+    await store.capture("project-1", "conversation-2", "Unrelated note", {"tag": "ops"})
+
+    assert [e.content for e in await store.recall("project-1", "ing serv")] == [
+        "Deployment of the billing service"
+    ]
+    assert [e.content for e in await store.recall("project-1", "BILLING")] == [
+        "Billing dashboard redesign",
+        "Deployment of the billing service",
+    ]
+    assert await store.recall("project-1", "billing ops") == []
+
+    parsed: list[Path] = []
+    original = MarkdownMemoryStore._parse_markdown
+
+    def _counting_parse(file_path: Path):  # type: ignore[no-untyped-def]
+        parsed.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(MarkdownMemoryStore, "_parse_markdown", staticmethod(_counting_parse))
+
+    # A fresh store loads the persisted index instead of parsing every file.
+    reopened = MarkdownMemoryStore(tmp_path / "memory")
+    assert len(await reopened.list_entries("project-1")) == 3
+    assert [e.metadata for e in await reopened.recall("project-1", "ops")] == [{"tag": "ops"}]
+    assert parsed == []
+    assert (tmp_path / "memory" / "project-1" / ".memory_index.json").exists()
+
+
+async def test_index_picks_up_files_changed_by_other_writers(tmp_path: Path) -> None:
+    store = MarkdownMemoryStore(tmp_path / "memory")
+    kept = await store.capture("project-1", "conversation-1", "first note")
+    removed = await store.capture("project-1", "conversation-1", "second note")
+    assert len(await store.list_entries("project-1")) == 2
+
+    other_writer = MarkdownMemoryStore(tmp_path / "memory")
+    added = await other_writer.capture("project-1", "conversation-3", "third note")
+    Path(removed).unlink()
+
+    assert {e.file_path for e in await store.recall("project-1", "note")} == {kept, added}
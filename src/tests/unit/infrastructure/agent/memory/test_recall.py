@@ -1,10 +1,16 @@
 """Tests for memory auto-recall prompt filtering."""
 
+import asyncio
 from dataclasses import dataclass
 
 import pytest
 
-from src.infrastructure.agent.memory.recall import MemoryRecallPreprocessor
+from src.infrastructure.agent.memory.recall import (
+    MemoryRecallPreprocessor,
+    RecallOutcome,
+    RecallPrefetcher,
+)
+from src.infrastructure.agent.memory.runtime import DefaultMemoryRuntime
 
 
 @dataclass
@@ -215,3 +221,103 @@ async def test_search_graph_failure_log_omits_query_and_exception_content(caplog
     assert exception_detail not in caplog.text
     assert "graph-secret-2468" not in caplog.text
     assert "error_type=RuntimeError" in caplog.text
+
+
+class _SlowGraphSearch:
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def search(self, query: str, *, project_id: str, limit: int) -> list[object]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return []
+
+
+@pytest.mark.unit
+async def test_recall_cancels_source_still_running_at_deadline() -> None:
+    graph_search = _SlowGraphSearch()
+    preprocessor = MemoryRecallPreprocessor(
+        chunk_search=_ChunkSearch([_ChunkResult(content="User prefers dark mode")]),
+        graph_search=graph_search,
+        deadline_seconds=0.05,
+    )
+
+    context = await preprocessor.recall("dark mode", "project-1")
+
+    assert context is not None
+    assert "dark mode" in context
+    await asyncio.sleep(0)
+    assert graph_search.cancelled
+
+
+@pytest.mark.unit
+async def test_recall_outcome_leaves_last_results_untouched() -> None:
+    preprocessor = MemoryRecallPreprocessor(
+        chunk_search=_ChunkSearch([_ChunkResult(content="User prefers dark mode")]),
+    )
+
+    outcome = await preprocessor.recall_outcome("dark mode", "project-1")
+
+    assert outcome.memory_context is not None
+    assert [r["content"] for r in outcome.results] == ["User prefers dark mode"]
+    assert preprocessor.last_results == []
+
+
+@pytest.mark.unit
+async def test_prefetcher_is_claimed_once_and_expires() -> None:
+    calls = 0
+
+    async def _recall() -> RecallOutcome:
+        nonlocal calls
+        calls += 1
+        return RecallOutcome(memory_context="ctx")
+
+    prefetcher = RecallPrefetcher()
+    prefetcher.start(("p1", "hello"), _recall)
+    prefetcher.start(("p1", "hello"), _recall)
+
+    claimed = prefetcher.claim(("p1", "hello"))
+    assert claimed is not None
+    assert (await claimed[1]).memory_context == "ctx"
+    assert calls == 1
+    assert prefetcher.claim(("p1", "hello")) is None
+
+    expiring = RecallPrefetcher(ttl=0.0)
+    expiring.start(("p1", "other"), _recall)
+    await asyncio.sleep(0.001)
+    assert expiring.claim(("p1", "other")) is None
+    assert expiring.get_stats()["discarded"] == 1
+
+
+@pytest.mark.unit
+async def test_runtime_recall_for_prompt_uses_prefetched_outcome() -> None:
+    class _Recall:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def recall_outcome(
+            self, query: str, project_id: str, max_results: int = 3
+        ) -> RecallOutcome:
+            self.calls += 1
+            return RecallOutcome(
+                memory_context="ctx",
+                results=[{"content": "User prefers dark mode", "score": 1.0}],
+                search_ms=5,
+            )
+
+    runtime = DefaultMemoryRuntime(llm_client=None, graph_service=None)
+    recall = _Recall()
+    runtime._memory_recall = recall  # type: ignore[assignment]
+
+    runtime.prefetch_recall(user_message="dark mode", project_id="project-1")
+    result = await runtime.recall_for_prompt(user_message="dark mode", project_id="project-1")
+
+    assert recall.calls == 1
+    assert result.memory_context == "ctx"
+    assert result.emitted_events[0]["data"]["count"] == 1
+
+    await runtime.recall_for_prompt(user_message="dark mode", project_id="project-1")
+    assert recall.calls == 2  # a prefetch is used once
@@ -1085,3 +1085,131 @@ def test_register_config_schema_via_sdk() -> None:
     schemas = registry.list_config_schemas()
     assert "sdk-plugin" in schemas
     assert schemas["sdk-plugin"].schema == schema
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_apply_hook_without_handlers_returns_payload_uncopied() -> None:
+    """Hooks with no handlers should skip payload copying and latency tracking."""
+    registry = AgentPluginRegistry()
+    payload = {"key": "value"}
+
+    result = await registry.apply_hook("after_response", payload=payload)
+
+    assert result.payload is payload
+    assert result.diagnostics == []
+    assert registry.get_hook_dispatch_stats() == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_apply_hook_reuses_compiled_plan_until_registration_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Dispatch plans should be cached and invalidated on register/unregister."""
+    registry = AgentPluginRegistry()
+    registry.register_hook("plugin-a", "test_hook", lambda payload: None)
+    resolve_calls = 0
+    original_resolve = registry._resolve_hook_entries
+
+    def _counting_resolve(**kwargs):
+        nonlocal resolve_calls
+        resolve_calls += 1
+        return original_resolve(**kwargs)
+
+    monkeypatch.setattr(registry, "_resolve_hook_entries", _counting_resolve)
+
+    await registry.notify_hook("test_hook")
+    await registry.notify_hook("test_hook")
+    assert resolve_calls == 1
+
+    overrides = [{"plugin_name": "plugin-a", "hook_name": "test_hook", "priority": 5}]
+    await registry.notify_hook("test_hook", runtime_overrides=overrides)
+    await registry.notify_hook("test_hook", runtime_overrides=[dict(overrides[0])])
+    assert resolve_calls == 2
+
+    registry.register_hook("plugin-b", "test_hook", lambda payload: None)
+    await registry.notify_hook("test_hook")
+    assert resolve_calls == 3
+
+    registry.unregister_plugin("plugin-b")
+    await registry.notify_hook("test_hook")
+    assert resolve_calls == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_apply_hook_runs_observe_only_handlers_concurrently() -> None:
+    """Consecutive side-effect handlers should overlap instead of running serially."""
+    import asyncio
+
+    registry = AgentPluginRegistry()
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    def _make_handler(name: str):
+        async def _handler(payload):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return {"ignored": name}
+
+        return _handler
+
+    registry.register_hook("plugin-a", "after_response", _make_handler("a"), priority=200)
+    registry.register_hook("plugin-b", "after_response", _make_handler("b"), priority=100)
+
+    result = await registry.apply_hook("after_response", payload={"key": "value"})
+
+    assert started == ["a", "b"]
+    assert result.payload == {"key": "value"}
+    assert result.diagnostics == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_apply_hook_keeps_mutations_ordered_around_observers() -> None:
+    """Side-effect handlers should see mutations from higher-priority handlers only."""
+    registry = AgentPluginRegistry()
+    seen: list[int] = []
+
+    async def _mutate(payload):
+        return {**payload, "count": payload.get("count", 0) + 1}
+
+    async def _observe(payload):
+        seen.append(payload.get("count", 0))
+
+    registry.register_hook("plugin-m1", "custom_hook", _mutate, priority=300)
+    registry.register_hook(
+        "plugin-o1", "custom_hook", _observe, hook_family="side_effect", priority=200
+    )
+    registry.register_hook("plugin-m2", "custom_hook", _mutate, priority=100)
+    registry.register_hook(
+        "plugin-o2", "custom_hook", _observe, hook_family="side_effect", priority=50
+    )
+
+    result = await registry.apply_hook("custom_hook", payload={})
+
+    assert result.payload["count"] == 2
+    assert seen == [1, 2]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_apply_hook_records_dispatch_latency() -> None:
+    """Each dispatch with handlers should be reflected in per-hook stats."""
+    registry = AgentPluginRegistry()
+
+    async def _failing(payload):
+        raise RuntimeError("boom")
+
+    registry.register_hook("plugin-a", "after_response", _failing)
+
+    first = await registry.apply_hook("after_response", payload={})
+    await registry.apply_hook("after_response", payload={})
+    stats = registry.get_hook_dispatch_stats()
+
+    assert [d.code for d in first.diagnostics] == ["hook_handler_failed"]
+    assert stats["after_response"].calls == 2
+    assert stats["after_response"].max_ms >= stats["after_response"].avg_ms >= 0.0
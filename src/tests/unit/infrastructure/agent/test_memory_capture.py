@@ -7,6 +7,7 @@ from src.infrastructure.agent.memory.builtin_skill_prompts import (
     load_builtin_skill_prompt,
 )
 from src.infrastructure.agent.memory.capture import MemoryCapturePostprocessor
+from src.infrastructure.agent.memory.capture_batch import CaptureCandidate
 
 
 @pytest.mark.unit
@@ -80,20 +81,18 @@ class TestMemoryCapturePostprocessor:
     async def test_store_chunk_log_omits_exception_content(self, caplog) -> None:
         exception_detail = "chunk save leaked memory content beta-3579"
         chunk_repo = Mock()
-        chunk_repo.save = AsyncMock(side_effect=RuntimeError(exception_detail))
+        chunk_repo.save_batch = AsyncMock(side_effect=RuntimeError(exception_detail))
         service = MemoryCapturePostprocessor(llm_client=AsyncMock())
 
         with caplog.at_level("WARNING", logger="src.infrastructure.agent.memory.capture"):
-            stored = await service._store_chunk(
+            stored = await service._store_chunks(
                 chunk_repo=chunk_repo,
-                content="memory content beta-3579",
-                category="fact",
-                embedding=None,
+                candidates=[CaptureCandidate(content="memory content beta-3579", category="fact")],
                 project_id="project-secret",
                 conversation_id="conversation-secret",
             )
 
-        assert stored is False
+        assert stored == []
         assert exception_detail not in caplog.text
         assert "beta-3579" not in caplog.text
         assert "error_type=RuntimeError" in caplog.text
@@ -102,7 +101,7 @@ class TestMemoryCapturePostprocessor:
     async def test_process_and_store_items_log_omits_exception_content(self, caplog) -> None:
         exception_detail = "storage pipeline leaked memory content gamma-4680"
         service = MemoryCapturePostprocessor(llm_client=AsyncMock())
-        service._process_capture_item = AsyncMock(side_effect=RuntimeError(exception_detail))  # type: ignore[method-assign]
+        service._store_chunks = AsyncMock(side_effect=RuntimeError(exception_detail))  # type: ignore[method-assign]
 
         with caplog.at_level("WARNING", logger="src.infrastructure.agent.memory.capture"):
             captured, categories = await service._process_and_store_items(
@@ -0,0 +1,109 @@
+"""Tests for batched embedding and deduplication of captured memories."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.infrastructure.agent.memory.capture import MemoryCapturePostprocessor
+from src.infrastructure.agent.memory.capture_batch import (
+    duplicates_within_batch,
+    prepare_candidates,
+)
+from src.infrastructure.agent.memory.flush import MemoryFlushService
+
+
+def _embedding_service(vectors: dict[str, list[float]]) -> Mock:
+    service = Mock()
+    service.embed_batch_safe = AsyncMock(
+        side_effect=lambda texts: [vectors.get(text) for text in texts]
+    )
+    return service
+
+
+@pytest.mark.unit
+class TestCaptureBatch:
+    def test_duplicates_within_batch_keeps_first_of_each_group(self) -> None:
+        duplicates = duplicates_within_batch(
+            [[1.0, 0.0], [0.99, 0.01], None, [0.0, 1.0], [1.0, 0.0, 0.0], [1.0, 0.0]]
+        )
+
+        assert duplicates == {1, 5}
+
+    @pytest.mark.asyncio
+    async def test_prepare_candidates_embeds_once_and_checks_existing_in_one_query(self) -> None:
+        embedding = _embedding_service(
+            {
+                "prefers dark mode": [1.0, 0.0],
+                "likes the dark theme": [0.999, 0.001],
+                "uses vim": [0.0, 1.0],
+                "deploys on fridays": [0.6, 0.8],
+            }
+        )
+        chunk_repo = Mock()
+        chunk_repo.find_similar_many = AsyncMock(return_value=[[], [{"id": "old"}], []])
+
+        candidates = await prepare_candidates(
+            [
+                {"content": "prefers dark mode", "category": "preference"},
+                {"content": "likes the dark theme", "category": "preference"},
+                {"content": "prefers dark mode", "category": "preference"},
+                {"content": "uses vim", "category": "unknown"},
+                {"content": "deploys on fridays", "category": "fact"},
+                {"content": "no"},
+            ],
+            embedding,
+            chunk_repo,
+            "project-1",
+        )
+
+        embedding.embed_batch_safe.assert_awaited_once()
+        chunk_repo.find_similar_many.assert_awaited_once()
+        assert len(chunk_repo.find_similar_many.await_args.args[0]) == 3
+        assert [(c.content, c.category) for c in candidates] == [
+            ("prefers dark mode", "preference"),
+            ("deploys on fridays", "fact"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_duplicate_query_keeps_items(self) -> None:
+        chunk_repo = Mock()
+        chunk_repo.find_similar_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+        candidates = await prepare_candidates(
+            [{"content": "uses vim", "category": "fact"}],
+            _embedding_service({"uses vim": [0.0, 1.0]}),
+            chunk_repo,
+            "project-1",
+        )
+
+        assert [c.embedding for c in candidates] == [[0.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_capture_and_flush_store_survivors_with_one_save_batch(self) -> None:
+        items = [
+            {"content": "prefers dark mode", "category": "preference"},
+            {"content": "uses vim", "category": "fact"},
+        ]
+        vectors = {"prefers dark mode": [1.0, 0.0], "uses vim": [0.0, 1.0]}
+
+        for service in (
+            MemoryCapturePostprocessor(
+                llm_client=AsyncMock(), embedding_service=_embedding_service(vectors)
+            ),
+            MemoryFlushService(
+                llm_client=AsyncMock(), embedding_service=_embedding_service(vectors)
+            ),
+        ):
+            chunk_repo = Mock()
+            chunk_repo.find_similar_many = AsyncMock(return_value=[[], []])
+            chunk_repo.save_batch = AsyncMock()
+            chunk_repo._session = None
+
+            await service._process_and_store_items(items, chunk_repo, "project-1", "conv-1")
+
+            chunk_repo.save_batch.assert_awaited_once()
+            saved = chunk_repo.save_batch.await_args.args[0]
+            assert [(c.content, c.embedding) for c in saved] == [
+                ("prefers dark mode", [1.0, 0.0]),
+                ("uses vim", [0.0, 1.0]),
+            ]
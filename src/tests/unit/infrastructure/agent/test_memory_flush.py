@@ -6,6 +6,7 @@ from src.infrastructure.agent.memory.builtin_skill_prompts import (
     MEMORY_FLUSH_SKILL_NAME,
     load_builtin_skill_prompt,
 )
+from src.infrastructure.agent.memory.capture_batch import CaptureCandidate
 from src.infrastructure.agent.memory.flush import MemoryFlushService
 
 
@@ -36,28 +37,26 @@ class TestMemoryFlushService:
         saved_chunks = []
         chunk_repo = AsyncMock()
 
-        async def _save(chunk):  # type: ignore[no-untyped-def]
-            saved_chunks.append(chunk)
+        async def _save_batch(chunks):  # type: ignore[no-untyped-def]
+            saved_chunks.extend(chunks)
 
-        chunk_repo.save = AsyncMock(side_effect=_save)
+        chunk_repo.save_batch = AsyncMock(side_effect=_save_batch)
 
-        stored = await service._store_chunk(
+        stored = await service._store_chunks(
             chunk_repo,
-            content="remember this",
-            category="fact",
-            embedding=None,
+            [CaptureCandidate(content="remember this", category="fact")],
             project_id="proj-1",
             conversation_id="conv-1",
         )
 
-        assert stored is True
+        assert stored == 1
         assert saved_chunks[0].metadata_ == {"flush": True}
 
     @pytest.mark.asyncio
     async def test_process_and_store_items_log_omits_exception_content(self, caplog) -> None:
         exception_detail = "flush storage leaked compressed memory alpha-9753"
         service = MemoryFlushService(llm_client=AsyncMock(), session_factory=None)
-        service._process_flush_item = AsyncMock(side_effect=RuntimeError(exception_detail))  # type: ignore[method-assign]
+        service._store_chunks = AsyncMock(side_effect=RuntimeError(exception_detail))  # type: ignore[method-assign]
 
         with caplog.at_level("WARNING", logger="src.infrastructure.agent.memory.flush"):
             flushed = await service._process_and_store_items(
@@ -1,11 +1,14 @@
-"""Unit tests for channel outbox retry worker logging behavior."""
+"""Unit tests for the channel outbox retry worker."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
+from typing import ClassVar
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.infrastructure.channels.outbox_worker import OutboxRetryWorker
+from src.infrastructure.channels.outbox_worker import OutboxRetryWorker, _DeliveryResult
 
 
 @pytest.mark.unit
@@ -43,8 +46,9 @@ async def test_poll_loop_redacts_batch_error(
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_retry_item_redacts_retry_and_status_update_failures(
+async def test_delivery_and_commit_redact_retry_and_status_update_failures(
     caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Retry failures should not log raw exception text or channel identifiers."""
     retry_exception_detail = "send failed channel-outbox-retry-secret-1357"
@@ -59,27 +63,26 @@ async def test_retry_item_redacts_retry_and_status_update_failures(
         async def send_text(*_args: object, **_kwargs: object) -> str:
             raise ValueError(retry_exception_detail)
 
+    class _FailingRepo:
+        mark_failed = AsyncMock(side_effect=RuntimeError(status_exception_detail))
+
+        def __init__(self, _session: object) -> None:
+            pass
+
+    session = _Session()
+    monkeypatch.setattr(_REPO_PATH, _FailingRepo)
     worker = OutboxRetryWorker(
-        session_factory=lambda: None,
+        session_factory=lambda: _SessionContext(session),
         get_connection_fn=lambda _config_id: SimpleNamespace(adapter=_FailingAdapter()),
     )
-    item = SimpleNamespace(
-        id=secret_outbox_id,
-        channel_config_id=secret_config_id,
-        chat_id="chat-secret-1111",
-        content_text="message secret 2222",
-        reply_to_channel_message_id=None,
-    )
-    repo = SimpleNamespace(
-        mark_failed=AsyncMock(side_effect=RuntimeError(status_exception_detail)),
-    )
-    session = SimpleNamespace(commit=AsyncMock())
+    item = _item(secret_outbox_id, secret_config_id)
 
     with caplog.at_level(
         "WARNING",
         logger="src.infrastructure.channels.outbox_worker",
     ):
-        await worker._retry_item(item, repo, session)  # type: ignore[arg-type]
+        result = await worker._deliver(item)  # type: ignore[arg-type]
+        await worker._commit_results([result])
 
     assert "Failed to update outbox status" in caplog.text
     assert "Retry failed" in caplog.text
@@ -90,5 +93,251 @@ async def test_retry_item_redacts_retry_and_status_update_failures(
     assert "error_type=ValueError" in caplog.text
     assert "error_type=RuntimeError" in caplog.text
     assert "has_outbox_id=True" in caplog.text
-    repo.mark_failed.assert_awaited_once_with(secret_outbox_id, retry_exception_detail)
+    _FailingRepo.mark_failed.assert_awaited_once_with(secret_outbox_id, retry_exception_detail)
     session.commit.assert_not_awaited()
+
+
+_REPO_PATH = (
+    "src.infrastructure.adapters.secondary.persistence.channel_repository.ChannelOutboxRepository"
+)
+
+
+class _Savepoint:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+class _Session:
+    def __init__(self, commit: AsyncMock | None = None) -> None:
+        self.commit = commit or AsyncMock()
+        self.savepoints = 0
+
+    def begin_nested(self) -> _Savepoint:
+        self.savepoints += 1
+        return _Savepoint()
+
+
+class _SessionContext:
+    def __init__(self, session: object) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> object:
+        return self._session
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+def _item(outbox_id: str, config_id: str = "config-1") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=outbox_id,
+        channel_config_id=config_id,
+        chat_id="chat-1",
+        content_text=f"message {outbox_id}",
+        reply_to_channel_message_id=None,
+    )
+
+
+class _MemoryOutboxRepo:
+    """In-memory stand-in for ChannelOutboxRepository shared by all sessions."""
+
+    items: ClassVar[dict[str, SimpleNamespace]] = {}
+    due: ClassVar[dict[str, datetime]] = {}
+    sent: ClassVar[list[str]] = []
+    full_listings: ClassVar[int] = 0
+
+    def __init__(self, _session: object) -> None:
+        pass
+
+    async def list_retry_schedule(
+        self, limit: int = 500, outbox_ids: list[str] | None = None
+    ) -> list[tuple[str, datetime]]:
+        if outbox_ids is None:
+            type(self).full_listings += 1
+        entries = [e for e in self.due.items() if outbox_ids is None or e[0] in outbox_ids]
+        return sorted(entries, key=lambda entry: entry[1])[:limit]
+
+    async def count_retry_backlog(self) -> int:
+        return len(self.due)
+
+    async def list_failed_by_ids(self, outbox_ids: list[str]) -> list[SimpleNamespace]:
+        return [self.items[i] for i in outbox_ids if i in self.due]
+
+    async def mark_sent(self, outbox_id: str, _sent_id: str | None) -> bool:
+        self.due.pop(outbox_id, None)
+        self.sent.append(outbox_id)
+        return True
+
+    async def mark_failed(self, outbox_id: str, _error: str) -> bool:
+        self.due[outbox_id] = datetime.now(UTC) + timedelta(hours=1)
+        return True
+
+
+@pytest.fixture
+def memory_repo(monkeypatch: pytest.MonkeyPatch) -> type[_MemoryOutboxRepo]:
+    _MemoryOutboxRepo.items = {}
+    _MemoryOutboxRepo.due = {}
+    _MemoryOutboxRepo.sent = []
+    _MemoryOutboxRepo.full_listings = 0
+    monkeypatch.setattr(_REPO_PATH, _MemoryOutboxRepo)
+    return _MemoryOutboxRepo
+
+
+def _add_failed(repo: type[_MemoryOutboxRepo], outbox_id: str, config_id: str, due: datetime):
+    repo.items[outbox_id] = _item(outbox_id, config_id)
+    repo.due[outbox_id] = due
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_worker_drains_due_messages_concurrently_with_batched_commits(
+    memory_repo: type[_MemoryOutboxRepo],
+) -> None:
+    """Due messages are sent in parallel, capped per channel, and committed in batches."""
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    class _SlowAdapter:
+        connected = True
+
+        def __init__(self, config_id: str) -> None:
+            self.config_id = config_id
+
+        async def send_text(self, chat_id: str, text: str, reply_to: str | None = None) -> str:
+            active[self.config_id] = active.get(self.config_id, 0) + 1
+            peak[self.config_id] = max(peak.get(self.config_id, 0), active[self.config_id])
+            await asyncio.sleep(0.02)
+            active[self.config_id] -= 1
+            return f"sent-{text}"
+
+    past = datetime.now(UTC) - timedelta(seconds=1)
+    for index in range(12):
+        _add_failed(memory_repo, f"outbox-{index}", f"config-{index % 2}", past)
+    _add_failed(memory_repo, "outbox-later", "config-0", datetime.now(UTC) + timedelta(hours=1))
+
+    session = _Session()
+    adapters = {cid: _SlowAdapter(cid) for cid in ("config-0", "config-1")}
+    worker = OutboxRetryWorker(
+        session_factory=lambda: _SessionContext(session),
+        get_connection_fn=lambda cid: SimpleNamespace(adapter=adapters[cid]),
+        per_channel_concurrency=2,
+    )
+    worker.start()
+    try:
+        await _wait_until(lambda: len(memory_repo.sent) == 12)
+    finally:
+        await worker.stop()
+
+    assert "outbox-later" not in memory_repo.sent
+    assert peak == {"config-0": 2, "config-1": 2}
+    assert session.commit.await_count < 12
+    stats = worker.get_stats()
+    assert stats["sent"] == 12
+    assert stats["backlog"] == 1
+    assert stats["drain_rate_per_sec"] > 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_notify_wakes_worker_for_new_failures(
+    memory_repo: type[_MemoryOutboxRepo],
+) -> None:
+    """A failure notification is picked up without waiting for the poll interval."""
+
+    class _Adapter:
+        connected = True
+
+        @staticmethod
+        async def send_text(*_args: object, **_kwargs: object) -> str:
+            return "sent"
+
+    worker = OutboxRetryWorker(
+        session_factory=lambda: _SessionContext(_Session()),
+        get_connection_fn=lambda _cid: SimpleNamespace(adapter=_Adapter()),
+        poll_interval=3600,
+    )
+    worker.start()
+    try:
+        await _wait_until(lambda: worker._last_refresh > 0)
+        _add_failed(memory_repo, "outbox-new", "config-1", datetime.now(UTC))
+        worker.notify("outbox-new")
+        await _wait_until(lambda: memory_repo.sent == ["outbox-new"])
+    finally:
+        await worker.stop()
+
+    # Only the startup refresh read the whole schedule.
+    assert memory_repo.full_listings == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_row_update_does_not_roll_back_the_rest_of_the_batch(
+    memory_repo: type[_MemoryOutboxRepo],
+) -> None:
+    """Each row gets its own SAVEPOINT; failures are re-armed without a full re-read."""
+    for outbox_id in ("outbox-ok", "outbox-bad", "outbox-retry"):
+        _add_failed(memory_repo, outbox_id, "config-1", datetime.now(UTC))
+    mark_sent = memory_repo.mark_sent
+
+    async def _mark_sent(self: _MemoryOutboxRepo, outbox_id: str, sent_id: str | None) -> bool:
+        if outbox_id == "outbox-bad":
+            raise RuntimeError("row lock timeout")
+        return await mark_sent(self, outbox_id, sent_id)
+
+    memory_repo.mark_sent = _mark_sent  # type: ignore[method-assign]
+    session = _Session()
+    worker = OutboxRetryWorker(
+        session_factory=lambda: _SessionContext(session),
+        get_connection_fn=lambda _cid: None,
+    )
+    worker._needs_refresh = False
+    worker._in_flight.update(("outbox-ok", "outbox-bad", "outbox-retry"))
+
+    await worker._commit_results(
+        [
+            _DeliveryResult("outbox-ok", sent_message_id="sent-1"),
+            _DeliveryResult("outbox-bad", sent_message_id="sent-2"),
+            _DeliveryResult("outbox-retry", error="timeout"),
+        ]
+    )
+
+    assert memory_repo.sent == ["outbox-ok"]
+    assert session.savepoints == 3
+    session.commit.assert_awaited_once()
+    assert set(worker._scheduled) == {"outbox-retry"}
+    assert not worker._in_flight
+    assert not worker._needs_refresh
+    assert memory_repo.full_listings == 0
+    assert worker.get_stats()["sent"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_commit_does_not_rearm_the_batch(
+    memory_repo: type[_MemoryOutboxRepo],
+) -> None:
+    """A failed commit leaves retries to the safety poll instead of re-arming them now."""
+    _add_failed(memory_repo, "outbox-retry", "config-1", datetime.now(UTC))
+    session = _Session(commit=AsyncMock(side_effect=RuntimeError("connection lost")))
+    worker = OutboxRetryWorker(
+        session_factory=lambda: _SessionContext(session),
+        get_connection_fn=lambda _cid: None,
+    )
+    worker._needs_refresh = False
+
+    await worker._commit_results([_DeliveryResult("outbox-retry", error="timeout")])
+
+    assert not worker._scheduled
+    assert not worker._needs_refresh
+    assert not worker._wakeup.is_set()
+    assert worker.get_stats()["failed"] == 0
@@ -7,12 +7,17 @@ transformations of ``initialize_schema`` / ``vector_search`` /
 
 from __future__ import annotations
 
+import json
+import re
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 from src.domain.model.graph.dtos import GraphSearchHit
 from src.infrastructure.graph.embedding.embedding_service import NullEmbeddingService
+from src.infrastructure.graph.stores import arcadedb_graph_store
 from src.infrastructure.graph.stores.arcadedb_graph_store import ArcadeDBGraphStore
 
 
@@ -36,6 +41,13 @@ def _make_store() -> ArcadeDBGraphStore:
     return store
 
 
+def _requested_k(command: str) -> int:
+    """Extract ``k`` from a ``vectorNeighbors(..., k))`` SQL command."""
+    match = re.search(r",\s*(\d+)\)\)$", command)
+    assert match is not None
+    return int(match.group(1))
+
+
 @pytest.mark.unit
 class TestArcadeDBGraphStoreOverrides:
     @pytest.mark.asyncio
@@ -127,3 +139,108 @@ class TestArcadeDBGraphStoreOverrides:
         # Every DDL statement "fails" (already exists) — must not raise.
         store._sql = AsyncMock(side_effect=RuntimeError("already exists"))
         await store.initialize_schema()
+
+    @pytest.mark.asyncio
+    async def test_vector_search_widens_k_until_project_hits_fill_limit(self) -> None:
+        store = _make_store()
+
+        def _neighbors(k: int) -> list[dict[str, Any]]:
+            # Only every 10th neighbour belongs to the requested project.
+            return [
+                {
+                    "record": {"uuid": f"e{i}", "project_id": "p1" if i % 10 == 0 else "p2"},
+                    "distance": i / 1000,
+                }
+                for i in range(k)
+            ]
+
+        async def _sql(command: str) -> list[dict[str, Any]]:
+            return _neighbors(_requested_k(command))
+
+        store._sql = AsyncMock(side_effect=_sql)
+
+        hits = await store.vector_search(query_vector=[1.0, 0.0], limit=5, project_id="p1")
+
+        assert [_requested_k(c.args[0]) for c in store._sql.await_args_list] == [20, 80]
+        assert [h.node["uuid"] for h in hits] == ["e0", "e10", "e20", "e30", "e40"]
+
+    @pytest.mark.asyncio
+    async def test_vector_search_stops_when_index_is_exhausted(self) -> None:
+        store = _make_store()
+        store._sql = AsyncMock(
+            return_value=[{"record": {"uuid": "e1", "project_id": "p2"}, "distance": 0.1}]
+        )
+
+        hits = await store.vector_search(query_vector=[1.0, 0.0], limit=5, project_id="p1")
+
+        assert hits == []
+        assert store._sql.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fulltext_schema_is_ensured_once_per_database(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(arcadedb_graph_store, "_fulltext_schema_ensured", set())
+        store = _make_store()
+
+        await store.fulltext_search(query="bob", limit=5)
+        await _make_store().fulltext_search(query="alice", limit=5)
+        await store.fulltext_search(query="carol", limit=5)
+
+        cmds = [c.args[0] for c in store._sql.await_args_list]
+        assert sum("CREATE" in c for c in cmds) == 2
+        assert sum("SEARCH_INDEX" in c for c in cmds) == 2
+
+    @pytest.mark.asyncio
+    async def test_fulltext_schema_failure_is_retried(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(arcadedb_graph_store, "_fulltext_schema_ensured", set())
+        store = _make_store()
+        store._sql = AsyncMock(side_effect=[RuntimeError("busy"), [], [], [], []])
+
+        await store.fulltext_search(query="bob", limit=5)
+        await store.fulltext_search(query="bob", limit=5)
+
+        cmds = [c.args[0] for c in store._sql.await_args_list]
+        assert sum("CREATE" in c for c in cmds) == 3
+
+    @pytest.mark.asyncio
+    async def test_sql_reuses_one_pooled_client_until_close(self) -> None:
+        client = MagicMock()
+        client.uri = "bolt://localhost:7688"
+        client.database = "memstack"
+        client.user = "root"
+        client.password = "arcadepw"
+        client.close = AsyncMock()
+        store = ArcadeDBGraphStore(
+            neo4j_client=client,
+            llm_client=MagicMock(),
+            embedding_service=NullEmbeddingService(),
+        )
+        requests: list[httpx.Request] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": [{"ok": True}]})
+
+        pooled = store._http()
+        store._http_client = httpx.AsyncClient(
+            base_url=store._http_base_url,
+            auth=store._http_auth,
+            transport=httpx.MockTransport(_handler),
+        )
+        await pooled.aclose()
+
+        assert await store._sql("SELECT 1") == [{"ok": True}]
+        assert await store._sql("SELECT 2") == [{"ok": True}]
+        assert store._http() is store._http_client
+
+        assert str(requests[0].url) == "http://localhost:2480/api/v1/command/memstack"
+        assert requests[0].headers["Authorization"].startswith("Basic ")
+        assert json.loads(requests[1].content) == {"language": "sql", "command": "SELECT 2"}
+
+        http_client = store._http_client
+        await store.close()
+        assert http_client.is_closed
+        client.close.assert_awaited_once()
@@ -45,6 +45,17 @@ class GenerateOnlyLLMClient:
         return {"content": '{"entities": [{"name": "Ada", "entity_type": "Person"}]}'}
 
 
+class JointLLMClient:
+    """Mock LLM client answering the joint extraction prompt."""
+
+    async def generate_response(self, **_kwargs):
+        return (
+            '{"entities": [{"name": "Ada", "entity_type_id": 1}, {"name": "Lab"}], '
+            '"relationships": [{"from_entity": "Ada", "to_entity": "Lab", '
+            '"relationship_type": "FOUNDED"}]}'
+        )
+
+
 class FailingLLMClient:
     """Mock LLM client that raises a provider-style error."""
 
@@ -111,6 +122,43 @@ class TestEntityExtractorJsonParsing:
         assert "embedding-secret-8642" not in caplog.text
         assert "error_type=RuntimeError" in caplog.text
 
+    async def test_extract_with_relationships_returns_nodes_and_raw_relationships(self):
+        extractor = EntityExtractor(
+            llm_client=JointLLMClient(),
+            embedding_service=MockEmbeddingService(),
+        )
+
+        nodes, relationships = await extractor.extract_with_relationships(
+            "Ada founded a lab.",
+            entity_type_id_to_name={0: "Entity", 1: "Person"},
+            project_id="project-1",
+        )
+
+        assert [(n.name, n.entity_type, n.project_id) for n in nodes] == [
+            ("Ada", "Person", "project-1"),
+            ("Lab", "Entity", "project-1"),
+        ]
+        assert all(n.name_embedding for n in nodes)
+        assert relationships == [
+            {"from_entity": "Ada", "to_entity": "Lab", "relationship_type": "FOUNDED"}
+        ]
+
+    async def test_extract_with_relationships_redacts_llm_exception_details(self, caplog):
+        extractor = EntityExtractor(
+            llm_client=FailingLLMClient(),
+            embedding_service=MockEmbeddingService(),
+        )
+
+        with caplog.at_level(
+            "ERROR",
+            logger="src.infrastructure.graph.extraction.entity_extractor",
+        ):
+            result = await extractor.extract_with_relationships("Ada discussed a lab")
+
+        assert result == ([], [])
+        assert "entity-secret-9753" not in caplog.text
+        assert "error_type=RuntimeError" in caplog.text
+
     def test_parse_entities_response_redacts_invalid_json_details(self, extractor, caplog):
         """Invalid JSON warnings should not write response text to logs."""
         secret = "entity-json-secret-1357"
@@ -5,12 +5,14 @@ from src.infrastructure.graph.extraction.prompts import (
     DEDUPE_SYSTEM_PROMPT,
     ENTITY_EXTRACTION_SYSTEM_PROMPT,
     ENTITY_SUMMARY_SYSTEM_PROMPT,
+    JOINT_EXTRACTION_SYSTEM_PROMPT,
     REFLEXION_SYSTEM_PROMPT,
     RELATIONSHIP_EXTRACTION_SYSTEM_PROMPT,
     build_community_summary_prompt,
     build_dedupe_prompt,
     build_entity_extraction_prompt,
     build_entity_summary_prompt,
+    build_joint_extraction_prompt,
     build_reflexion_prompt,
     build_relationship_extraction_prompt,
 )
@@ -24,6 +26,7 @@ pytestmark = pytest.mark.unit
         ENTITY_EXTRACTION_SYSTEM_PROMPT,
         REFLEXION_SYSTEM_PROMPT,
         RELATIONSHIP_EXTRACTION_SYSTEM_PROMPT,
+        JOINT_EXTRACTION_SYSTEM_PROMPT,
         DEDUPE_SYSTEM_PROMPT,
         COMMUNITY_SUMMARY_SYSTEM_PROMPT,
         ENTITY_SUMMARY_SYSTEM_PROMPT,
@@ -82,6 +85,28 @@ def test_relationship_prompt_contains_reference_time_and_schema() -> None:
     assert "Do not include Markdown fences" in prompt
 
 
+def test_joint_prompt_requests_entities_and_relationships_together() -> None:
+    prompt = build_joint_extraction_prompt(
+        content="Alice joined Acme yesterday.",
+        entity_types_context=[
+            {
+                "entity_type_id": 1,
+                "entity_type_name": "Person",
+                "entity_type_description": "human",
+            },
+        ],
+        reference_time="2026-06-22T00:00:00Z",
+    )
+
+    assert "1. Person - human" in prompt
+    assert "<RELATIONSHIP_TYPES>" in prompt
+    assert "2026-06-22T00:00:00Z" in prompt
+    assert "must not override the JSON schema" in prompt
+    assert '"entities"' in prompt
+    assert '"relationships"' in prompt
+    assert "Do not include Markdown fences" in prompt
+
+
 def test_reflexion_prompt_contains_missed_entity_contract() -> None:
     prompt = build_reflexion_prompt(
         content="Alice and Bob attended.",
@@ -13,9 +13,8 @@ from src.infrastructure.graph.search.hybrid_search import (
     MAX_FULLTEXT_QUERY_TERMS,
     GraphSearchConfig,
     HybridSearch,
-    _dict_to_item,
-    _item_to_dict,
 )
+from src.infrastructure.graph.search.rerank_cache import RerankScoreCache
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -139,51 +138,43 @@ class TestGraphSearchConfig:
 
 
 class TestItemConversion:
-    """Tests for _item_to_dict / _dict_to_item round-trip."""
+    """Post-processing only rewrites scores; item fields pass through untouched."""
 
     @pytest.mark.unit
-    def test_entity_round_trip(self):
-        """Entity item survives dict conversion round-trip."""
+    def test_entity_fields_survive_post_processing(self, hybrid_search):
         item = _make_entity("e1", "Entity One", "A summary", 0.85, search_type="vector")
-        d = _item_to_dict(item)
+        other = _make_entity("e2", "Entity Two", "Other words", 0.5)
 
-        assert d["uuid"] == "e1"
-        assert d["type"] == "entity"
-        assert d["content"] == "A summary"  # falls back to summary for entity
-        assert d["score"] == 0.85
+        result = hybrid_search._apply_post_processing([item, other])
 
-        restored = _dict_to_item(d)
-        assert restored.uuid == "e1"
+        restored = next(r for r in result if r.uuid == "e1")
         assert restored.type == "entity"
+        assert restored.name == "Entity One"
         assert restored.summary == "A summary"
-        assert restored.content is None  # entity -> content cleared
+        assert restored.content is None
+        assert restored.metadata == {"search_type": "vector"}
 
     @pytest.mark.unit
-    def test_episode_round_trip(self):
-        """Episode item survives dict conversion round-trip."""
+    def test_episode_fields_survive_post_processing(self, hybrid_search):
         item = _make_episode("ep1", "Episode One", "Full content here", 0.75)
-        d = _item_to_dict(item)
+        other = _make_episode("ep2", "Episode Two", "Different text", 0.5)
 
-        assert d["content"] == "Full content here"
+        result = hybrid_search._apply_post_processing([item, other])
 
-        restored = _dict_to_item(d)
-        assert restored.uuid == "ep1"
+        restored = next(r for r in result if r.uuid == "ep1")
         assert restored.content == "Full content here"
-        assert restored.summary is None  # episode -> summary cleared
+        assert restored.summary is None
 
     @pytest.mark.unit
-    def test_entity_content_fallback_chain(self):
-        """Entity with no summary falls back to name for content field."""
-        item = SearchResultItem(type="entity", uuid="e2", name="Named Only", score=0.5, metadata={})
-        d = _item_to_dict(item)
-        assert d["content"] == "Named Only"
+    def test_items_without_text_are_ranked(self, hybrid_search):
+        items = [
+            SearchResultItem(type="entity", uuid="e2", name="Named Only", score=0.5, metadata={}),
+            SearchResultItem(type="entity", uuid="e3", score=0.9, metadata={}),
+        ]
 
-    @pytest.mark.unit
-    def test_entity_all_none_content(self):
-        """Entity with nothing falls back to empty string."""
-        item = SearchResultItem(type="entity", uuid="e3", score=0.5, metadata={})
-        d = _item_to_dict(item)
-        assert d["content"] == ""
+        result = hybrid_search._apply_post_processing(items)
+
+        assert [r.uuid for r in result] == ["e3", "e2"]
 
 
 # ---------------------------------------------------------------------------
@@ -851,3 +842,118 @@ class TestPostProcessingPipeline:
         item = _make_entity("e1", "Entity", "content", 0.9, created_at="not-a-date")
         result = hybrid_search._apply_post_processing([item])
         assert len(result) == 1  # should not raise
+
+
+# ---------------------------------------------------------------------------
+# TestRerankCost
+# ---------------------------------------------------------------------------
+
+
+class _CountingReranker:
+    model = "test-rerank"
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def rank(
+        self, query: str, passages: list[str], top_n: int | None = None
+    ) -> list[tuple[str, float]]:
+        self.calls.append(list(passages))
+        return sorted(((p, len(p) / 100) for p in passages), key=lambda x: x[1], reverse=True)
+
+
+class TestRerankCost:
+    """Tests for the reranker score cache and adaptive rerank depth."""
+
+    def _search(self, mock_neo4j_client, mock_embedding_service, reranker, **config):
+        return HybridSearch(
+            neo4j_client=mock_neo4j_client,
+            embedding_service=mock_embedding_service,
+            search_config=GraphSearchConfig(**config),
+            reranker=reranker,
+            rerank_cache=RerankScoreCache(),
+        )
+
+    @pytest.mark.unit
+    async def test_repeated_query_is_served_from_score_cache(
+        self, mock_neo4j_client, mock_embedding_service
+    ):
+        reranker = _CountingReranker()
+        search = self._search(mock_neo4j_client, mock_embedding_service, reranker)
+        items = [_make_entity(str(i), "E", "x" * (i + 1), 0.5) for i in range(4)]
+
+        first = await search._apply_reranker("q", items, limit=4)
+        second = await search._apply_reranker("q", items, limit=4)
+
+        assert len(reranker.calls) == 1
+        assert [r.uuid for r in second] == [r.uuid for r in first] == ["3", "2", "1", "0"]
+
+        extra = [*items, _make_entity("4", "E", "y" * 10, 0.5), _make_entity("5", "E", "z", 0.5)]
+        third = await search._apply_reranker("q", extra, limit=6)
+
+        assert reranker.calls[-1] == ["y" * 10, "z"]  # only unscored passages
+        assert third[0].uuid == "4"
+
+    @pytest.mark.unit
+    async def test_tail_after_decisive_gap_is_not_reranked(
+        self, mock_neo4j_client, mock_embedding_service
+    ):
+        reranker = _CountingReranker()
+        search = self._search(mock_neo4j_client, mock_embedding_service, reranker)
+        items = [
+            _make_entity("a", "E", "a", 0.9),
+            _make_entity("b", "E", "bb", 0.85),
+            _make_entity("c", "E", "c" * 50, 0.2),
+        ]
+
+        result = await search._apply_reranker("q", items, limit=2)
+
+        assert reranker.calls == [["a", "bb"]]
+        assert [r.uuid for r in result] == ["b", "a", "c"]
+
+    @pytest.mark.unit
+    async def test_without_decisive_gap_every_candidate_is_reranked(
+        self, mock_neo4j_client, mock_embedding_service
+    ):
+        reranker = _CountingReranker()
+        search = self._search(mock_neo4j_client, mock_embedding_service, reranker)
+        items = [_make_entity(str(i), "E", "x" * (i + 1), 0.9 - i * 0.01) for i in range(5)]
+
+        await search._apply_reranker("q", items, limit=2)
+
+        assert len(reranker.calls[0]) == 5
+
+    @pytest.mark.unit
+    async def test_uniform_fallback_scores_are_not_cached(
+        self, mock_neo4j_client, mock_embedding_service
+    ):
+        class _NeutralReranker(_CountingReranker):
+            async def rank(self, query, passages, top_n=None):
+                self.calls.append(list(passages))
+                return [(p, 0.5) for p in passages]
+
+        reranker = _NeutralReranker()
+        search = self._search(mock_neo4j_client, mock_embedding_service, reranker)
+        items = [_make_entity("a", "E", "a", 0.5), _make_entity("b", "E", "b", 0.5)]
+
+        await search._apply_reranker("q", items)
+        await search._apply_reranker("q", items)
+
+        assert len(reranker.calls) == 2
+
+    @pytest.mark.unit
+    async def test_padded_scores_are_not_cached(self, mock_neo4j_client, mock_embedding_service):
+        class _PaddingReranker(_CountingReranker):
+            async def rank_with_fallbacks(self, query, passages, top_n=None):
+                # The response scored only the first passage; the rest are padding.
+                self.calls.append(list(passages))
+                return [(passages[0], 0.9), *((p, 0.5) for p in passages[1:])], set(passages[1:])
+
+        reranker = _PaddingReranker()
+        search = self._search(mock_neo4j_client, mock_embedding_service, reranker)
+        items = [_make_entity(uuid, "E", uuid, 0.5) for uuid in ("a", "b", "c")]
+
+        await search._apply_reranker("q", items)
+        await search._apply_reranker("q", items)
+
+        assert reranker.calls == [["a", "b", "c"], ["b", "c"]]
@@ -1,5 +1,7 @@
 """Unit tests for NativeGraphAdapter."""
 
+import asyncio
+import json
 import logging
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,7 +9,9 @@ from uuid import uuid4
 
 import pytest
 
+from src.domain.model.graph.dtos import GraphExportCursor
 from src.domain.model.memory.episode import Episode, SourceType
+from src.infrastructure.graph.extraction.relationship_extractor import RelationshipExtractor
 from src.infrastructure.graph.native_graph_adapter import NativeGraphAdapter
 from src.infrastructure.graph.schemas import (
     EntityEdge,
@@ -23,6 +27,7 @@ def mock_neo4j_client():
     """Create a mock Neo4j client."""
     client = MagicMock()
     client.execute_query = AsyncMock()
+    client.execute_read = AsyncMock()
     client.save_node = AsyncMock()
     client.save_edge = AsyncMock()
     client.save_nodes_batch = AsyncMock()
@@ -497,6 +502,209 @@ class TestNativeGraphAdapterProcessEpisode:
             "Node",
         ]
 
+    @pytest.mark.asyncio
+    async def test_process_episode_overlaps_reflexion_with_first_dedup_pass(
+        self,
+        adapter,
+        mock_neo4j_client,
+    ):
+        """Reflexion should run while extracted entities are deduplicated."""
+        ada = EntityNode(uuid="new-ada", name="Ada", entity_type="Person")
+        lab = EntityNode(uuid="new-lab", name="Lab", entity_type="Organization")
+        first_pass_started = asyncio.Event()
+
+        async def deduplicate(new_entities, existing_entities):
+            first_pass_started.set()
+            return list(new_entities), {}
+
+        async def check_missed_entities(**_kwargs):
+            # Times out if reflexion must finish before deduplication starts.
+            await asyncio.wait_for(first_pass_started.wait(), timeout=1)
+            return [lab]
+
+        entity_extractor = MagicMock()
+        entity_extractor.extract = AsyncMock(return_value=[ada])
+        entity_extractor.deduplicate_entity_nodes = AsyncMock(side_effect=deduplicate)
+        reflexion_checker = MagicMock()
+        reflexion_checker.check_missed_entities = AsyncMock(side_effect=check_missed_entities)
+        relationship_extractor = MagicMock()
+        relationship_extractor.extract_from_entity_nodes = AsyncMock(return_value=[])
+        mock_neo4j_client.find_node_by_uuid.return_value = {"name": "Episode"}
+        adapter._enable_reflexion = True
+
+        with (
+            patch.object(
+                adapter,
+                "_load_schema_context",
+                AsyncMock(
+                    return_value={
+                        "entity_types_context": [],
+                        "entity_type_id_to_name": {},
+                        "edge_type_map": {},
+                    }
+                ),
+            ),
+            patch.object(adapter, "_get_entity_extractor", return_value=entity_extractor),
+            patch.object(adapter, "_get_reflexion_checker", return_value=reflexion_checker),
+            patch.object(adapter, "_get_existing_entities", AsyncMock(return_value=[])),
+            patch.object(
+                adapter,
+                "_get_relationship_extractor",
+                return_value=relationship_extractor,
+            ),
+            patch.object(adapter, "_save_discovered_types", AsyncMock()),
+            patch.object(adapter, "_update_episode_status", AsyncMock()),
+        ):
+            result = await adapter.process_episode(
+                episode_uuid="episode-1",
+                content="Ada founded a lab.",
+                project_id="project-1",
+            )
+
+        assert [node.uuid for node in result.nodes] == ["new-ada", "new-lab"]
+        # Missed entities get a second pass against the first pass's survivors.
+        second_pass = entity_extractor.deduplicate_entity_nodes.await_args_list[1].kwargs
+        assert second_pass["new_entities"] == [lab]
+        assert [e.uuid for e in second_pass["existing_entities"]] == ["new-ada"]
+
+    @pytest.mark.asyncio
+    async def test_process_episode_joint_mode_resolves_relationships_without_second_call(
+        self,
+        adapter,
+        mock_neo4j_client,
+    ):
+        """Joint extraction should build edges from its own output via the dedup map."""
+        ada = EntityNode(uuid="new-ada", name="Ada", entity_type="Person")
+        lab = EntityNode(uuid="new-lab", name="Lab", entity_type="Organization")
+        existing = EntityNode(uuid="existing-ada", name="Countess Lovelace", entity_type="Person")
+
+        entity_extractor = MagicMock()
+        entity_extractor.extract = AsyncMock()
+        entity_extractor.extract_with_relationships = AsyncMock(
+            return_value=(
+                [ada, lab],
+                [{"from_entity": "Ada", "to_entity": "Lab", "relationship_type": "FOUNDED"}],
+            )
+        )
+        entity_extractor.deduplicate_entity_nodes = AsyncMock(
+            return_value=([lab], {"Ada": "existing-ada"})
+        )
+        relationship_extractor = RelationshipExtractor(llm_client=MagicMock())
+        mock_neo4j_client.find_node_by_uuid.return_value = {"name": "Episode"}
+        adapter._joint_extraction = True
+
+        with (
+            patch.object(
+                adapter,
+                "_load_schema_context",
+                AsyncMock(
+                    return_value={
+                        "entity_types_context": [],
+                        "entity_type_id_to_name": {},
+                        "edge_type_map": {},
+                    }
+                ),
+            ),
+            patch.object(adapter, "_get_entity_extractor", return_value=entity_extractor),
+            patch.object(adapter, "_get_existing_entities", AsyncMock(return_value=[existing])),
+            patch.object(
+                adapter,
+                "_get_relationship_extractor",
+                return_value=relationship_extractor,
+            ),
+            patch.object(adapter, "_save_discovered_types", AsyncMock()),
+            patch.object(adapter, "_update_episode_status", AsyncMock()),
+        ):
+            result = await adapter.process_episode(
+                episode_uuid="episode-1",
+                content="Ada founded a lab.",
+                project_id="project-1",
+            )
+
+        entity_extractor.extract.assert_not_awaited()
+        assert [(e.source_uuid, e.target_uuid) for e in result.edges] == [
+            ("existing-ada", "new-lab")
+        ]
+        assert result.edges[0].episodes == ["episode-1"]
+
+    @pytest.mark.asyncio
+    async def test_process_episode_joint_mode_extracts_relationships_of_recovered_entities(
+        self,
+        adapter,
+        mock_neo4j_client,
+    ):
+        """Entities only reflexion found should get a relationship pass of their own."""
+        ada = EntityNode(uuid="new-ada", name="Ada", entity_type="Person")
+        lab = EntityNode(uuid="new-lab", name="Lab", entity_type="Organization")
+        london = EntityNode(uuid="new-london", name="London", entity_type="Location")
+
+        entity_extractor = MagicMock()
+        entity_extractor.extract_with_relationships = AsyncMock(
+            return_value=(
+                [ada, lab],
+                [{"from_entity": "Ada", "to_entity": "Lab", "relationship_type": "FOUNDED"}],
+            )
+        )
+        entity_extractor.deduplicate_entity_nodes = AsyncMock(
+            side_effect=lambda new_entities, existing_entities: (list(new_entities), {})
+        )
+        reflexion_checker = MagicMock()
+        reflexion_checker.check_missed_entities = AsyncMock(return_value=[london])
+        relationship_extractor = RelationshipExtractor(llm_client=MagicMock())
+        relationship_extractor.extract_from_entity_nodes = AsyncMock(
+            return_value=[
+                EntityEdge(
+                    source_uuid="new-ada", target_uuid="new-lab", relationship_type="FOUNDED"
+                ),
+                EntityEdge(
+                    source_uuid="new-lab", target_uuid="new-london", relationship_type="LOCATED_IN"
+                ),
+                EntityEdge(source_uuid="new-ada", target_uuid="new-lab", relationship_type="KNOWS"),
+            ]
+        )
+        mock_neo4j_client.find_node_by_uuid.return_value = {"name": "Episode"}
+        adapter._enable_reflexion = True
+        adapter._joint_extraction = True
+
+        with (
+            patch.object(
+                adapter,
+                "_load_schema_context",
+                AsyncMock(
+                    return_value={
+                        "entity_types_context": [],
+                        "entity_type_id_to_name": {},
+                        "edge_type_map": {},
+                    }
+                ),
+            ),
+            patch.object(adapter, "_get_entity_extractor", return_value=entity_extractor),
+            patch.object(adapter, "_get_reflexion_checker", return_value=reflexion_checker),
+            patch.object(adapter, "_get_existing_entities", AsyncMock(return_value=[])),
+            patch.object(
+                adapter,
+                "_get_relationship_extractor",
+                return_value=relationship_extractor,
+            ),
+            patch.object(adapter, "_save_discovered_types", AsyncMock()),
+            patch.object(adapter, "_update_episode_status", AsyncMock()),
+        ):
+            result = await adapter.process_episode(
+                episode_uuid="episode-1",
+                content="Ada founded a lab in London.",
+                project_id="project-1",
+            )
+
+        instructions = relationship_extractor.extract_from_entity_nodes.await_args.kwargs[
+            "custom_instructions"
+        ]
+        assert instructions.endswith(": London")
+        # Only edges touching the recovered entity are kept from the extra pass.
+        assert [(e.source_uuid, e.relationship_type, e.target_uuid) for e in result.edges] == [
+            ("new-ada", "FOUNDED", "new-lab"),
+            ("new-lab", "LOCATED_IN", "new-london"),
+        ]
+
     @pytest.mark.asyncio
     async def test_save_entity_relationship_merges_supporting_episodes(
         self,
@@ -679,7 +887,7 @@ class TestNativeGraphAdapterGraphData:
     ):
         """Graph data failures should propagate without writing exception details to logs."""
         secret = "graph-data-secret-2468"
-        mock_neo4j_client.execute_query.side_effect = RuntimeError(secret)
+        mock_neo4j_client.execute_read.side_effect = RuntimeError(secret)
 
         with (
             caplog.at_level(
@@ -836,7 +1044,7 @@ class TestNativeGraphAdapterTypedPrimitives:
         adapter,
         mock_neo4j_client,
     ):
-        mock_neo4j_client.execute_query.return_value = MagicMock(
+        mock_neo4j_client.execute_read.return_value = MagicMock(
             records=[
                 {
                     "b": {
@@ -854,12 +1062,12 @@ class TestNativeGraphAdapterTypedPrimitives:
 
     @pytest.mark.asyncio
     async def test_count_nodes_uses_validated_label(self, adapter, mock_neo4j_client):
-        mock_neo4j_client.execute_query.return_value = MagicMock(records=[{"total": 3}])
+        mock_neo4j_client.execute_read.return_value = MagicMock(records=[{"total": 3}])
 
         result = await adapter.count_nodes(label="Entity")
 
         assert result == 3
-        query = mock_neo4j_client.execute_query.await_args.args[0]
+        query = mock_neo4j_client.execute_read.await_args.args[0]
         assert "MATCH (n:Entity)" in query
 
     @pytest.mark.asyncio
@@ -868,7 +1076,7 @@ class TestNativeGraphAdapterTypedPrimitives:
         adapter,
         mock_neo4j_client,
     ):
-        mock_neo4j_client.execute_query.side_effect = [
+        mock_neo4j_client.execute_read.side_effect = [
             MagicMock(records=[{"total": 1}]),
             MagicMock(records=[{"props": {"uuid": "episode-1"}}]),
         ]
@@ -876,7 +1084,7 @@ class TestNativeGraphAdapterTypedPrimitives:
         result = await adapter.list_episodes(sort_by="created_at")
 
         assert result == {"episodes": [{"uuid": "episode-1"}], "total": 1}
-        query = mock_neo4j_client.execute_query.await_args_list[1].args[0]
+        query = mock_neo4j_client.execute_read.await_args_list[1].args[0]
         assert "ORDER BY e.created_at DESC" in query
 
     @pytest.mark.asyncio
@@ -885,14 +1093,156 @@ class TestNativeGraphAdapterTypedPrimitives:
         adapter,
         mock_neo4j_client,
     ):
-        mock_neo4j_client.execute_query.return_value = MagicMock(records=[{"count": 2}])
+        mock_neo4j_client.execute_read.return_value = MagicMock(records=[{"count": 2}])
 
         result = await adapter.count_scoped_nodes("Community", project_id="project-1")
 
         assert result == 2
-        query = mock_neo4j_client.execute_query.await_args.args[0]
+        query = mock_neo4j_client.execute_read.await_args.args[0]
         assert "MATCH (n:Community)" in query
 
+    @pytest.mark.asyncio
+    async def test_reads_record_latency_and_rows_per_method(self, adapter, mock_neo4j_client):
+        mock_neo4j_client.execute_read.return_value = MagicMock(
+            records=[{"entity_type": "Person", "entity_count": 1}] * 3
+        )
+
+        with patch(
+            "src.infrastructure.telemetry.metrics.record_histogram_value"
+        ) as record_histogram_value:
+            await adapter.get_entity_types(project_id="project-1")
+
+        mock_neo4j_client.execute_query.assert_not_awaited()
+        recorded = {
+            call.args[0]: (call.args[2], call.kwargs["attributes"])
+            for call in record_histogram_value.call_args_list
+        }
+        assert recorded["graph_read_rows"] == (3, {"method": "get_entity_types"})
+        assert recorded["graph_read_latency_ms"][1] == {"method": "get_entity_types"}
+
+    @pytest.mark.asyncio
+    async def test_optional_filters_keep_cypher_text_stable(self, adapter, mock_neo4j_client):
+        mock_neo4j_client.execute_read.return_value = MagicMock(records=[])
+
+        await adapter.faceted_search(
+            query=None,
+            entity_types=None,
+            tags=None,
+            since_iso=None,
+            limit=5,
+            offset=0,
+            project_id="project-1",
+        )
+        await adapter.faceted_search(
+            query="alice",
+            entity_types=["Person"],
+            tags=["vip"],
+            since_iso="2026-01-01",
+            limit=5,
+            offset=0,
+            project_id="project-1",
+            tenant_id="tenant-1",
+        )
+
+        (bare, bare_params), (filtered, filtered_params) = [
+            (call.args[0], call.kwargs) for call in mock_neo4j_client.execute_read.await_args_list
+        ]
+        assert bare == filtered
+        assert bare_params["search_query"] is None
+        assert bare_params["tenant_id"] is None
+        assert filtered_params["search_query"] == "alice"
+        assert filtered_params["tenant_id"] == "tenant-1"
+
+    @pytest.mark.asyncio
+    async def test_iter_data_export_pages_by_uuid_keyset(self, adapter, mock_neo4j_client):
+        mock_neo4j_client.execute_read.side_effect = [
+            MagicMock(
+                records=[
+                    {"key": "e-1", "props": {"uuid": "e-1"}, "labels": ["Entity"]},
+                    {"key": "e-2", "props": {"uuid": "e-2"}, "labels": ["Entity", "Person"]},
+                ]
+            ),
+            MagicMock(records=[{"key": "e-3", "props": {"uuid": "e-3"}, "labels": ["Entity"]}]),
+        ]
+
+        pages = [
+            page
+            async for page in adapter.iter_data_export(
+                project_id="project-1",
+                include_episodes=False,
+                include_relationships=False,
+                include_communities=False,
+                page_size=2,
+            )
+        ]
+
+        assert [(p.section, p.cursor.after) for p in pages] == [
+            ("entities", "e-2"),
+            ("entities", "e-3"),
+        ]
+        assert pages[0].rows[1] == {"uuid": "e-2", "labels": ["Entity", "Person"]}
+        first, resumed = mock_neo4j_client.execute_read.await_args_list
+        assert [first.kwargs["after"], resumed.kwargs["after"]] == [None, "e-2"]
+        # Only resumed pages carry the keyset predicate, as a plain range seek.
+        assert "$after" not in first.args[0]
+        assert "WHERE " in resumed.args[0] and "AND e.uuid > $after " in resumed.args[0]
+        assert "ORDER BY e.uuid LIMIT $page_size" in resumed.args[0]
+
+    @pytest.mark.asyncio
+    async def test_iter_data_export_pages_relationships_per_label_by_edge(
+        self, adapter, mock_neo4j_client
+    ):
+        def _rel(source: str, edge_id: str) -> dict:
+            return {"source": source, "edge_id": edge_id, "rel_type": "KNOWS", "props": {}}
+
+        # One Entity source with three edges spans two pages; no Community edges.
+        mock_neo4j_client.execute_read.side_effect = [
+            MagicMock(records=[_rel("e-1", "5:x:1"), _rel("e-1", "5:x:2")]),
+            MagicMock(records=[_rel("e-1", "5:x:3")]),
+            MagicMock(records=[]),
+        ]
+        resume = GraphExportCursor("relationships", json.dumps(["Entity", "e-0", "5:x:0"]))
+
+        pages = [
+            page
+            async for page in adapter.iter_data_export(
+                tenant_id="tenant-1", include_communities=False, cursor=resume, page_size=2
+            )
+        ]
+
+        assert [p.cursor.after for p in pages] == [
+            json.dumps(["Entity", "e-1", "5:x:2"]),
+            json.dumps(["Entity", "e-1", "5:x:3"]),
+        ]
+        assert [row["edge_id"] for p in pages for row in p.rows] == ["5:x:1", "5:x:2", "5:x:3"]
+        calls = mock_neo4j_client.execute_read.await_args_list
+        # Resuming in Entity skips Episodic and continues from the stored key.
+        assert [call.args[0].split(")")[0] for call in calls] == [
+            "MATCH (a:Entity",
+            "MATCH (a:Entity",
+            "MATCH (a:Community",
+        ]
+        assert [(c.kwargs["after_uuid"], c.kwargs["after_edge"]) for c in calls] == [
+            ("e-0", "5:x:0"),
+            ("e-1", "5:x:2"),
+            (None, None),
+        ]
+        assert "a.uuid >= $after_uuid" in calls[1].args[0]
+        assert "$after" not in calls[2].args[0]
+        assert "LIMIT $page_size" in calls[1].args[0]
+
+        with pytest.raises(ValueError, match="Malformed export cursor"):
+            async for _ in adapter.iter_data_export(
+                cursor=GraphExportCursor("relationships", "e-1")
+            ):
+                pass
+        with pytest.raises(ValueError, match="Malformed export cursor"):
+            adapter.validate_export_cursor(GraphExportCursor("relationships", "e-1"))
+        adapter.validate_export_cursor(
+            GraphExportCursor("relationships", json.dumps(["Entity", "e-1", "5:x:3"]))
+        )
+        adapter.validate_export_cursor(GraphExportCursor("entities", "e-1"))
+
     @pytest.mark.asyncio
     async def test_health_probe_uses_fail_fast_query_timeout(
         self,
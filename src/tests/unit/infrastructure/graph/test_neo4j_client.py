@@ -2,8 +2,10 @@
 
 from types import SimpleNamespace
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from neo4j import RoutingControl
 
 from src.infrastructure.graph.neo4j_client import Neo4jClient
 
@@ -50,11 +52,11 @@ class TestNeo4jClientFulltextSearch:
         )
         calls: list[tuple[str, dict[str, Any]]] = []
 
-        async def record_execute_query(query: str, **kwargs: Any) -> object:
+        async def record_execute_read(query: str, **kwargs: Any) -> object:
             calls.append((query, kwargs))
             return SimpleNamespace(records=[])
 
-        client.execute_query = record_execute_query  # type: ignore[method-assign]
+        client.execute_read = record_execute_read  # type: ignore[method-assign]
 
         hits = await client.fulltext_search(
             index_name="entity_name_summary",
@@ -71,6 +73,26 @@ class TestNeo4jClientFulltextSearch:
         assert "query" not in params
 
 
+@pytest.mark.unit
+class TestNeo4jClientExecuteRead:
+    async def test_routes_to_readers_and_passes_parameters_as_dict(self) -> None:
+        client = Neo4jClient(
+            uri="neo4j://cluster:7687",
+            user="neo4j",
+            password="password",
+        )
+        client._initialized = True
+        client._driver = MagicMock()
+        client._driver.execute_query = AsyncMock(return_value=SimpleNamespace(records=[]))
+
+        await client.execute_read("MATCH (e) WHERE e.name = $query RETURN e", query="needle")
+
+        args, kwargs = client._driver.execute_query.await_args
+        assert args[1] == {"query": "needle"}
+        assert kwargs["routing_"] is RoutingControl.READ
+        assert kwargs["database_"] == client.database
+
+
 @pytest.mark.unit
 class TestNeo4jClientBatchWrites:
     def _client_with_recorder(self) -> tuple[Neo4jClient, list[tuple[str, dict[str, Any]]]]:
@@ -83,7 +105,7 @@ class TestNeo4jClientBatchWrites:
 
         async def record_execute_query(query: str, **kwargs: Any) -> object:
             calls.append((query, kwargs))
-            return object()
+            return SimpleNamespace(records=[])
 
         client.execute_query = record_execute_query  # type: ignore[method-assign]
         return client, calls
@@ -133,12 +155,16 @@ class TestNeo4jClientBatchWrites:
                     "to_uuid": "a",
                     "relationship_type": "MENTIONS",
                     "properties": {"uuid": "edge-1"},
+                    "from_label": "Episodic",
+                    "to_label": "Entity",
                 },
                 {
                     "from_uuid": "e1",
                     "to_uuid": "b",
                     "relationship_type": "MENTIONS",
                     "properties": {"uuid": "edge-2"},
+                    "from_label": "Episodic",
+                    "to_label": "Entity",
                 },
                 {"from_uuid": "a", "to_uuid": "b", "relationship_type": "RELATES_TO"},
             ]
@@ -147,12 +173,115 @@ class TestNeo4jClientBatchWrites:
         assert len(calls) == 2
         mentions_query, mentions_params = next(c for c in calls if "MENTIONS" in c[0])
         assert "SET r += row.properties" in mentions_query
+        assert "MATCH (from:Episodic {uuid: row.from_uuid})" in mentions_query
+        assert "MATCH (to:Entity {uuid: row.to_uuid})" in mentions_query
         assert [(r["from_uuid"], r["to_uuid"]) for r in mentions_params["rows"]] == [
             ("e1", "a"),
             ("e1", "b"),
         ]
         relates_query, _relates_params = next(c for c in calls if "RELATES_TO" in c[0])
         assert "SET" not in relates_query
+        # Unlabelled endpoints fall back to the shared, uuid-constrained Node label.
+        assert "MATCH (from:Node {uuid: row.from_uuid})" in relates_query
+
+    async def test_save_edge_and_delete_node_match_by_label(self) -> None:
+        client, calls = self._client_with_recorder()
+
+        await client.save_edge("c1", "n1", "HAS_MEMBER", from_label="Community", to_label="Entity")
+        await client.delete_node("n1")
+
+        assert "MATCH (from:Community {uuid: $from_uuid})" in calls[0][0]
+        assert "MATCH (to:Entity {uuid: $to_uuid})" in calls[0][0]
+        assert "MATCH (n:Node {uuid: $uuid})" in calls[1][0]
+        with pytest.raises(ValueError, match="node label"):
+            await client.save_edge("a", "b", "RELATES_TO", from_label="Entity) MATCH (x")
+
+    async def test_build_indices_replaces_uuid_indexes_with_unique_constraints(self) -> None:
+        client, calls = self._client_with_recorder()
+
+        await client.build_indices()
+
+        queries = [query for query, _params in calls]
+        assert not any("ON (e.uuid)" in q or "ON (c.uuid)" in q for q in queries)
+        for name, label in (
+            ("episodic_uuid", "Episodic"),
+            ("entity_uuid", "Entity"),
+            ("community_uuid", "Community"),
+        ):
+            drop = queries.index(f"DROP INDEX {name} IF EXISTS")
+            create = queries.index(
+                f"CREATE CONSTRAINT {name}_unique IF NOT EXISTS "
+                f"FOR (n:{label}) REQUIRE n.uuid IS UNIQUE"
+            )
+            assert drop < create
+        assert (
+            "CREATE CONSTRAINT node_uuid_unique IF NOT EXISTS FOR (n:Node) REQUIRE n.uuid IS UNIQUE"
+            in queries
+        )
+
+    async def test_build_indices_restores_plain_index_when_constraint_fails(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        client, calls = self._client_with_recorder()
+
+        async def fail_entity_constraint(query: str, **kwargs: Any) -> object:
+            calls.append((query, kwargs))
+            if query.startswith("CREATE CONSTRAINT entity_uuid_unique"):
+                raise RuntimeError("duplicate uuid secret-entity-42")
+            return SimpleNamespace(records=[])
+
+        client.execute_query = fail_entity_constraint  # type: ignore[method-assign]
+
+        with caplog.at_level("WARNING", logger="src.infrastructure.graph.neo4j_client"):
+            await client.build_indices()
+
+        queries = [query for query, _params in calls]
+        assert "CREATE INDEX entity_uuid IF NOT EXISTS FOR (n:Entity) ON (n.uuid)" in queries
+        assert "error_type=RuntimeError" in caplog.text
+        assert "secret-entity-42" not in caplog.text
+
+    async def test_build_indices_keeps_existing_constraints_untouched(self) -> None:
+        client, calls = self._client_with_recorder()
+
+        async def constraints_exist(query: str, **kwargs: Any) -> object:
+            calls.append((query, kwargs))
+            if query.startswith("SHOW CONSTRAINTS"):
+                return SimpleNamespace(records=[{"name": kwargs["name"]}])
+            return SimpleNamespace(records=[])
+
+        client.execute_query = constraints_exist  # type: ignore[method-assign]
+
+        await client.build_indices()
+
+        queries = [query for query, _params in calls]
+        assert not any(q.startswith(("DROP INDEX", "CREATE CONSTRAINT")) for q in queries)
+        assert not any("count(uuid) AS duplicates" in q for q in queries)
+
+    async def test_build_indices_keeps_plain_index_while_uuids_are_duplicated(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        client, calls = self._client_with_recorder()
+
+        async def duplicated_nodes(query: str, **kwargs: Any) -> object:
+            calls.append((query, kwargs))
+            if "count(uuid) AS duplicates" in query and "(n:Node)" in query:
+                return SimpleNamespace(records=[{"duplicates": 3}])
+            return SimpleNamespace(records=[])
+
+        client.execute_query = duplicated_nodes  # type: ignore[method-assign]
+
+        with caplog.at_level("WARNING", logger="src.infrastructure.graph.neo4j_client"):
+            await client.build_indices()
+
+        queries = [query for query, _params in calls]
+        assert "CREATE INDEX node_uuid IF NOT EXISTS FOR (n:Node) ON (n.uuid)" in queries
+        assert "DROP INDEX node_uuid IF EXISTS" not in queries
+        assert not any(q.startswith("CREATE CONSTRAINT node_uuid_unique") for q in queries)
+        assert "DROP INDEX entity_uuid IF EXISTS" in queries
+        assert caplog.text.count("duplicated uuids") == 1
+        assert "3 duplicated uuids on Node nodes" in caplog.text
 
     async def test_save_nodes_batch_rejects_invalid_label(self) -> None:
         client, calls = self._client_with_recorder()
@@ -6,6 +6,7 @@ from src.infrastructure.graph.extraction.relationship_extractor import (
     RelationshipDeduplicator,
     RelationshipExtractor,
 )
+from src.infrastructure.graph.schemas import EntityNode
 
 
 class MockLLMClient:
@@ -105,6 +106,40 @@ class TestRelationshipExtractorLLMResponse:
         assert "response_length=" in caplog.text
 
 
+@pytest.mark.unit
+class TestRelationshipExtractorJointEdges:
+    """Tests for building edges from joint extraction output."""
+
+    def test_edges_from_extracted_resolves_deduplicated_names(self, extractor):
+        nodes = [
+            EntityNode(uuid="existing-ada", name="Countess Lovelace", entity_type="Person"),
+            EntityNode(uuid="lab-1", name="Lab", entity_type="Organization"),
+        ]
+
+        edges = extractor.edges_from_extracted(
+            [{"from_entity": "Ada", "to_entity": "Lab", "relationship_type": "founded"}],
+            entity_nodes=nodes,
+            name_aliases={"Ada": "existing-ada"},
+            edge_type_map={("Person", "Organization"): ["FOUNDED"]},
+            episode_uuid="episode-1",
+        )
+
+        assert [(e.source_uuid, e.target_uuid, e.relationship_type) for e in edges] == [
+            ("existing-ada", "lab-1", "FOUNDED")
+        ]
+        assert edges[0].episodes == ["episode-1"]
+
+    def test_edges_from_extracted_skips_unknown_entities(self, extractor):
+        nodes = [EntityNode(uuid="lab-1", name="Lab", entity_type="Organization")]
+
+        edges = extractor.edges_from_extracted(
+            [{"from_entity": "Grace", "to_entity": "Lab", "relationship_type": "VISITED"}],
+            entity_nodes=nodes,
+        )
+
+        assert edges == []
+
+
 @pytest.mark.unit
 class TestRelationshipExtractorDatetime:
     """Tests for relationship datetime parsing."""
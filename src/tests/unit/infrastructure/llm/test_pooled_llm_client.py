@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
 from src.domain.llm_providers.llm_types import Message, ModelSize, RateLimitError
-from src.domain.llm_providers.models import ProviderConfig
+from src.domain.llm_providers.models import ProviderConfig, ProviderType
 from src.infrastructure.llm.auto_broker import AutoBroker, BrokerVerdict
 from src.infrastructure.llm.litellm.pooled_llm_client import PooledLLMClient
 from src.infrastructure.llm.load_balancer import LeastLoadedBalancer
@@ -239,3 +241,216 @@ class TestPooledLLMClient:
         assert PooledLLMClient._model_size_to_tier(ModelSize.small) == "small"
         assert PooledLLMClient._model_size_to_tier(ModelSize.large) == "large"
         assert PooledLLMClient._model_size_to_tier(ModelSize.medium) is None
+
+
+# ----------------------------------------------------------------------
+# Mid-stream failover harness
+# ----------------------------------------------------------------------
+
+_FULL_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Pack my box with five dozen liquor jugs. "
+    "How vexingly quick daft zebras jump!"
+)
+
+
+def _text_chunk(content: str) -> SimpleNamespace:
+    delta = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)])
+
+
+def _finish_chunk() -> SimpleNamespace:
+    delta = SimpleNamespace(content=None, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason="stop")])
+
+
+def _split(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class _FakeStreamingProvider:
+    """Streams scripted text per call and drops the connection on cue.
+
+    ``disconnect_at`` maps the call index to the number of chunks that are
+    delivered before a failover-worthy ``ConnectionError`` is raised. The
+    continuation is derived from the resume prompt: the provider replays
+    ``replay`` characters of already-streamed text (to exercise overlap
+    trimming) followed by the rest of ``full_text``.
+    """
+
+    def __init__(
+        self,
+        full_text: str,
+        *,
+        disconnect_at: dict[int, int] | None = None,
+        replay: int = 0,
+        tool_call_first: bool = False,
+    ) -> None:
+        self._full_text = full_text
+        self._disconnect_at = disconnect_at or {}
+        self._replay = replay
+        self._tool_call_first = tool_call_first
+        self.calls: list[dict[str, Any]] = []
+
+    async def generate_stream(self, **kwargs: Any) -> Any:
+        call_index = len(self.calls)
+        self.calls.append(kwargs)
+        messages = kwargs["messages"]
+        partial = ""
+        assistant = [m for m in messages if isinstance(m, dict) and m["role"] == "assistant"]
+        if assistant:
+            partial = assistant[-1]["content"]
+        start = max(0, len(partial) - self._replay)
+        chunks: list[SimpleNamespace] = []
+        if self._tool_call_first and call_index == 0:
+            tool_delta = SimpleNamespace(content=None, tool_calls=[SimpleNamespace(index=0)])
+            chunks.append(
+                SimpleNamespace(choices=[SimpleNamespace(delta=tool_delta, finish_reason=None)])
+            )
+        chunks.extend(_text_chunk(part) for part in _split(self._full_text[start:]))
+        chunks.append(_finish_chunk())
+
+        cutoff = self._disconnect_at.get(call_index)
+        for index, chunk in enumerate(chunks):
+            if cutoff is not None and index == cutoff:
+                raise ConnectionError("peer closed connection mid-stream")
+            yield chunk
+
+
+def _stream_client(
+    provider_config: ProviderConfig, fake: _FakeStreamingProvider, **kwargs: Any
+) -> tuple[PooledLLMClient, LeastLoadedBalancer]:
+    pool = _FakePool(
+        candidates=[
+            _cand(provider_config, "model-a"),
+            _cand(provider_config, "model-b"),
+            _cand(provider_config, "model-c"),
+        ]
+    )
+    balancer = LeastLoadedBalancer()
+    client = PooledLLMClient(
+        tenant_id="t1",
+        pool_service=pool,
+        balancer=balancer,
+        broker=_StubBroker(
+            BrokerVerdict(
+                tier=None,  # type: ignore[arg-type]
+                require_vision=False,
+                require_tools=False,
+                category="chat",
+                rationale="",
+                source="llm",
+            )
+        ),
+        **kwargs,
+    )
+    client._client_cache[str(provider_config.id)] = fake  # type: ignore[assignment]
+    return client, balancer
+
+
+async def _collect_text(client: PooledLLMClient) -> str:
+    parts: list[str] = []
+    async for chunk in client.generate_stream(messages=[Message.user("hi")]):
+        content = chunk.choices[0].delta.content
+        if content:
+            parts.append(content)
+    return "".join(parts)
+
+
+class TestPooledStreamResume:
+    async def test_uninterrupted_stream_passes_through(
+        self, provider_config: ProviderConfig
+    ) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT)
+        client, _ = _stream_client(provider_config, fake)
+
+        assert await _collect_text(client) == _FULL_TEXT
+        assert len(fake.calls) == 1
+
+    @pytest.mark.parametrize("offset", [0, 1, 3, 8, 15, 18])
+    @pytest.mark.parametrize("replay", [0, 12, 10_000])
+    async def test_disconnect_at_offset_is_stitched_seamlessly(
+        self, provider_config: ProviderConfig, offset: int, replay: int
+    ) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: offset}, replay=replay)
+        client, balancer = _stream_client(provider_config, fake)
+
+        assert await _collect_text(client) == _FULL_TEXT
+        assert len(fake.calls) == 2
+        assert fake.calls[0]["model"] != fake.calls[1]["model"]
+        failed_key = f"{provider_config.id}:{fake.calls[0]['model']}"
+        assert balancer.health_store.is_healthy(failed_key) is False
+
+    async def test_resume_sends_partial_text_and_continuation_instruction(
+        self, provider_config: ProviderConfig
+    ) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 3})
+        client, _ = _stream_client(provider_config, fake)
+
+        await _collect_text(client)
+
+        resumed = fake.calls[1]["messages"]
+        assert resumed[-2] == {"role": "assistant", "content": _FULL_TEXT[:21]}
+        assert resumed[-1]["role"] == "user"
+
+    async def test_resume_uses_prefill_for_anthropic(self, provider_config: ProviderConfig) -> None:
+        anthropic_config = provider_config.model_copy(
+            update={"provider_type": ProviderType.ANTHROPIC}
+        )
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 2})
+        client, _ = _stream_client(anthropic_config, fake)
+
+        assert await _collect_text(client) == _FULL_TEXT
+
+        resumed = fake.calls[1]["messages"]
+        assert resumed[-1] == {"role": "assistant", "content": _FULL_TEXT[:14].rstrip()}
+
+    async def test_repeated_disconnects_exhaust_attempts(
+        self, provider_config: ProviderConfig
+    ) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 2, 1: 2, 2: 2})
+        client, _ = _stream_client(provider_config, fake, max_attempts=3)
+
+        with pytest.raises(ConnectionError):
+            await _collect_text(client)
+        assert len(fake.calls) == 3
+
+    async def test_drop_is_logged_once_and_only_when_resumed(
+        self, provider_config: ProviderConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        llm_logger = MagicMock()
+        monkeypatch.setattr(
+            "src.infrastructure.llm.litellm.pooled_llm_client.get_llm_logger", lambda: llm_logger
+        )
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 2, 1: 2, 2: 2})
+        client, _ = _stream_client(provider_config, fake, max_attempts=3)
+
+        with pytest.raises(ConnectionError):
+            await _collect_text(client)
+
+        # The drop on the final attempt is raised, not announced as resumed.
+        resumes = llm_logger.log_pool_stream_resume.call_args_list
+        assert [call.kwargs["attempt"] for call in resumes] == [1, 2]
+
+    async def test_multiple_disconnects_still_stitch(self, provider_config: ProviderConfig) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 2, 1: 4}, replay=9)
+        client, _ = _stream_client(provider_config, fake, max_attempts=3)
+
+        assert await _collect_text(client) == _FULL_TEXT
+        assert len(fake.calls) == 3
+
+    async def test_tool_call_streams_are_not_resumed(self, provider_config: ProviderConfig) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 3}, tool_call_first=True)
+        client, _ = _stream_client(provider_config, fake)
+
+        with pytest.raises(ConnectionError):
+            await _collect_text(client)
+        assert len(fake.calls) == 1
+
+    async def test_resume_disabled_raises_on_drop(self, provider_config: ProviderConfig) -> None:
+        fake = _FakeStreamingProvider(_FULL_TEXT, disconnect_at={0: 3})
+        client, _ = _stream_client(provider_config, fake, resume_streams=False)
+
+        with pytest.raises(ConnectionError):
+            await _collect_text(client)
+        assert len(fake.calls) == 1
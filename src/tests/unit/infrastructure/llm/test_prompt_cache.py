@@ -0,0 +1,144 @@
+"""Unit tests for the prompt-cache breakpoint planner."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.infrastructure.llm.prompt_cache import (
+    PROMPT_CACHE_BOUNDARY,
+    PromptCachePlanner,
+    canonicalize_tools,
+    count_cached_prefix,
+    supports_cache_breakpoints,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _tool(name: str) -> dict[str, Any]:
+    return {"type": "function", "function": {"name": name, "parameters": {}}}
+
+
+def _conversation() -> list[dict[str, Any]]:
+    return [
+        {"role": "system", "content": f"stable rules{PROMPT_CACHE_BOUNDARY}<env>now</env>"},
+        {"role": "user", "content": "first question"},
+        {"role": "assistant", "content": "", "tool_calls": [{"id": "c1"}]},
+        {"role": "tool", "tool_call_id": "c1", "content": "tool output"},
+        {"role": "system", "content": "runtime guidance"},
+    ]
+
+
+class TestSupportsCacheBreakpoints:
+    def test_anthropic_always_supported(self) -> None:
+        assert supports_cache_breakpoints("anthropic", "anthropic/claude-sonnet-4") is True
+
+    def test_gateways_only_for_claude(self) -> None:
+        assert supports_cache_breakpoints("bedrock", "bedrock/anthropic.claude-3") is True
+        assert supports_cache_breakpoints("openrouter", "openrouter/openai/gpt-4o") is False
+
+    def test_openai_uses_automatic_caching(self) -> None:
+        assert supports_cache_breakpoints("openai", "gpt-4o") is False
+
+
+class TestPromptCachePlanner:
+    def test_tools_are_sorted_by_name(self) -> None:
+        tools = [_tool("write"), _tool("bash"), _tool("read")]
+
+        ordered = canonicalize_tools(tools)
+
+        assert [t["function"]["name"] for t in ordered or []] == ["bash", "read", "write"]
+        assert [t["function"]["name"] for t in tools] == ["write", "bash", "read"]
+
+    def test_boundary_is_stripped_without_breakpoints(self) -> None:
+        plan = PromptCachePlanner().plan(_conversation(), [_tool("bash")])
+
+        system = plan.messages[0]["content"]
+        assert system == "stable rules\n\n<env>now</env>"
+        assert plan.breakpoints == 0
+        assert "cache_control" not in plan.tools[0]  # type: ignore[index]
+
+    def test_breakpoints_on_tools_system_prefix_and_tail(self) -> None:
+        messages = _conversation()
+        plan = PromptCachePlanner().plan(
+            messages, [_tool("b"), _tool("a")], breakpoints_enabled=True
+        )
+
+        assert plan.tools is not None
+        assert plan.tools[-1]["function"]["name"] == "b"
+        assert plan.tools[-1]["cache_control"] == {"type": "ephemeral"}
+
+        stable, volatile = plan.messages[0]["content"]
+        assert stable == {
+            "type": "text",
+            "text": "stable rules",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert volatile == {"type": "text", "text": "<env>now</env>"}
+
+        # Tool result (last non-system message) and the latest user turn.
+        assert plan.messages[3]["cache_control"] == {"type": "ephemeral"}
+        assert plan.messages[1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in plan.messages[4]
+        assert plan.breakpoints == 4
+
+        # Inputs are not mutated.
+        assert "cache_control" not in messages[3]
+        assert isinstance(messages[0]["content"], str)
+
+    def test_breakpoint_budget_is_respected(self) -> None:
+        plan = PromptCachePlanner(max_breakpoints=2).plan(
+            _conversation(), [_tool("a")], breakpoints_enabled=True
+        )
+
+        assert plan.breakpoints == 2
+        assert "cache_control" not in plan.messages[3]
+
+    def test_boundary_in_later_system_message_adds_no_breakpoint(self) -> None:
+        messages = [
+            *_conversation(),
+            {"role": "system", "content": f"more rules{PROMPT_CACHE_BOUNDARY}<env>now</env>"},
+        ]
+
+        plan = PromptCachePlanner().plan(messages, [_tool("a")], breakpoints_enabled=True)
+
+        assert plan.messages[-1]["content"] == "more rules\n\n<env>now</env>"
+        assert plan.breakpoints == 4
+
+    def test_existing_breakpoints_count_against_the_limit(self) -> None:
+        messages = _conversation()
+        messages[1] = {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "attachment", "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": "first question", "cache_control": {"type": "ephemeral"}},
+            ],
+        }
+
+        plan = PromptCachePlanner().plan(messages, [_tool("a")], breakpoints_enabled=True)
+
+        # Two caller breakpoints leave room for the tools and the system prefix only.
+        assert plan.breakpoints == 4
+        assert plan.tools[-1]["cache_control"] == {"type": "ephemeral"}  # type: ignore[index]
+        assert isinstance(plan.messages[0]["content"], list)
+        assert "cache_control" not in plan.messages[3]
+
+    def test_plain_system_prompt_gets_message_level_breakpoint(self) -> None:
+        messages = [
+            {"role": "system", "content": "static prompt"},
+            {"role": "user", "content": [{"type": "text", "text": "hi"}]},
+        ]
+
+        plan = PromptCachePlanner().plan(messages, None, breakpoints_enabled=True)
+
+        assert plan.messages[0]["cache_control"] == {"type": "ephemeral"}
+        assert plan.messages[1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert plan.breakpoints == 2
+
+    def test_count_cached_prefix_covers_everything_before_last_breakpoint(self) -> None:
+        plan = PromptCachePlanner().plan(_conversation(), None, breakpoints_enabled=True)
+
+        assert count_cached_prefix(plan.messages) == 4
+        assert count_cached_prefix(_conversation()) == 0
@@ -2,7 +2,8 @@
 
 import pytest
 
-from src.infrastructure.memory.chunk_search import ChunkHybridSearch
+from src.infrastructure.memory.chunk_search import ChunkHybridSearch, ChunkSearchConfig
+from src.infrastructure.memory.recall_cache import RecallResultCache
 
 
 @pytest.mark.unit
@@ -24,3 +25,56 @@ async def test_get_chunk_repo_failure_log_omits_exception_content(caplog) -> Non
     assert exception_detail not in caplog.text
     assert "chunk-repo-secret-9753" not in caplog.text
     assert "error_type=RuntimeError" in caplog.text
+
+
+@pytest.mark.unit
+async def test_search_many_batches_embeddings_and_both_legs() -> None:
+    class _Embedding:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        async def embed_batch_safe(self, texts: list[str]) -> list[list[float] | None]:
+            self.batches.append(texts)
+            return [[1.0, 0.0] if text != "broken" else None for text in texts]
+
+    class _Repo:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, int]] = []
+
+        async def get_index_version(self, _project_id: str) -> int:
+            return 0
+
+        async def vector_search_many(self, embeddings, project_id, limit, category=None):
+            self.calls.append(("vector", len(embeddings)))
+            return [
+                [{"id": f"v{i}", "content": f"v{i}", "score": 0.9}] for i in range(len(embeddings))
+            ]
+
+        async def fts_search_many(self, queries, project_id, limit, category=None, keywords=None):
+            self.calls.append(("fts", len(queries)))
+            return [[{"id": f"f-{q}", "content": f"f-{q}", "score": 0.4}] for q in queries]
+
+    embedding = _Embedding()
+    repo = _Repo()
+    cache = RecallResultCache()
+    search = ChunkHybridSearch(
+        embedding,
+        config=ChunkSearchConfig(enable_vector_cache=False, enable_temporal_decay=False),
+        result_cache=cache,
+    )
+
+    async def _get_chunk_repo() -> _Repo:
+        return repo
+
+    search._get_chunk_repo = _get_chunk_repo
+
+    results = await search.search_many(["alpha", "broken", "Alpha"], "p1")
+
+    assert embedding.batches == [["alpha", "broken"]]
+    assert repo.calls == [("vector", 1), ("fts", 2)]
+    assert [r.id for r in results[0]] == ["v0", "f-alpha"]
+    assert [r.id for r in results[1]] == ["f-broken"]
+    assert [r.id for r in results[2]] == [r.id for r in results[0]]
+
+    await search.search_many(["alpha"], "p1")
+    assert len(embedding.batches) == 1  # served from the result cache
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Any
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.infrastructure.adapters.secondary.persistence import sql_chunk_repository
 from src.infrastructure.adapters.secondary.persistence.models import Base, MemoryChunk
 from src.infrastructure.adapters.secondary.persistence.sql_chunk_repository import (
     SqlChunkRepository,
 )
 from src.infrastructure.memory.chunk_sync import delete_memory_chunks, upsert_memory_chunks
+from src.infrastructure.memory.chunk_vector_cache import ChunkVectorCache
 
 
 @pytest.fixture
@@ -47,7 +51,9 @@ def _chunk(
 @pytest.mark.unit
 class TestMemoryChunkSync:
     @pytest.mark.asyncio
-    async def test_upsert_scopes_to_project_and_source_type(self, chunk_session: AsyncSession) -> None:
+    async def test_upsert_scopes_to_project_and_source_type(
+        self, chunk_session: AsyncSession
+    ) -> None:
         repo = SqlChunkRepository(chunk_session)
         chunk_session.add_all(
             [
@@ -90,7 +96,9 @@ class TestMemoryChunkSync:
         assert len(other_source) == 1
 
     @pytest.mark.asyncio
-    async def test_delete_scopes_to_project_and_source_type(self, chunk_session: AsyncSession) -> None:
+    async def test_delete_scopes_to_project_and_source_type(
+        self, chunk_session: AsyncSession
+    ) -> None:
         repo = SqlChunkRepository(chunk_session)
         chunk_session.add_all(
             [
@@ -164,3 +172,70 @@ class TestMemoryChunkSync:
         assert indexed == len(memory_b_chunks)
         assert len(memory_a_chunks) == 1
         assert len(memory_b_chunks) == 1
+
+    @pytest.mark.asyncio
+    async def test_index_version_is_bumped_once_per_transaction_on_commit(self, tmp_path) -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'chunks.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with session_factory() as writer, session_factory() as reader:
+            repo = SqlChunkRepository(writer)
+            other_process = SqlChunkRepository(reader)
+            await repo.save_batch(
+                [
+                    _chunk(project_id="proj-main", source_type="memory", source_id="m1", content=c)
+                    for c in ("a", "b")
+                ]
+            )
+            await repo.save(
+                _chunk(project_id="proj-main", source_type="memory", source_id="m2", content="c")
+            )
+            assert await other_process.get_index_version("proj-main") == 0
+            await reader.rollback()
+
+            await writer.commit()
+            assert await other_process.get_index_version("proj-main") == 1
+            await reader.rollback()
+
+            await repo.delete_by_source("memory", "m1", "proj-main")
+            await writer.rollback()
+            assert await other_process.get_index_version("proj-main") == 1
+            await reader.rollback()
+
+            await repo.delete_by_source("memory", "m1", "proj-main")
+            await writer.commit()
+            assert await other_process.get_index_version("proj-main") == 2
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_vector_cache_sees_writes_only_once_committed(
+        self, chunk_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = ChunkVectorCache(hot_queries=1)
+        monkeypatch.setattr(sql_chunk_repository, "get_chunk_vector_cache", lambda: cache)
+        repo = SqlChunkRepository(chunk_session)
+        rows = [{"id": "c1", "source_type": "memory", "source_id": "m1", "embedding": [1.0, 0.0]}]
+
+        async def _load() -> list[dict[str, Any]]:
+            return rows
+
+        cache.maybe_warm("proj-main", _load, version=0)
+        await asyncio.sleep(0)
+
+        added = _chunk(project_id="proj-main", source_type="memory", source_id="m2", content="b")
+        added.embedding = [0.0, 1.0]
+        await repo.save(added)
+        assert len(cache.search("proj-main", [1.0, 0.0], 5, version=0)) == 1
+        await chunk_session.commit()
+        assert len(cache.search("proj-main", [1.0, 0.0], 5, version=1)) == 2
+
+        await repo.delete_by_source("memory", "m2", "proj-main")
+        await chunk_session.rollback()
+        assert len(cache.search("proj-main", [1.0, 0.0], 5, version=1)) == 2
+
+        await repo.delete_by_source("memory", "m2", "proj-main")
+        await chunk_session.commit()
+        assert len(cache.search("proj-main", [1.0, 0.0], 5, version=2)) == 1
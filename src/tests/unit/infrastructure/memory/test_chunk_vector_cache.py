@@ -0,0 +1,166 @@
+"""Tests for the in-process chunk vector cache."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.infrastructure.memory.chunk_search import ChunkHybridSearch
+from src.infrastructure.memory.chunk_vector_cache import ChunkVectorCache, ProjectVectorIndex
+
+pytestmark = pytest.mark.unit
+
+
+def _row(chunk_id: str, embedding: list[float], **extra: Any) -> dict[str, Any]:
+    return {
+        "id": chunk_id,
+        "content": f"content {chunk_id}",
+        "metadata": {},
+        "created_at": None,
+        "category": extra.pop("category", "fact"),
+        "source_type": extra.pop("source_type", "memory"),
+        "source_id": extra.pop("source_id", chunk_id),
+        "embedding": embedding,
+    }
+
+
+async def _warm(cache: ChunkVectorCache, rows: list[dict[str, Any]], version: int = 0) -> None:
+    async def _load() -> list[dict[str, Any]]:
+        return rows
+
+    builds = cache.get_stats()["builds"]
+    cache.maybe_warm("p1", _load, version=version)
+    for _ in range(20):
+        if cache.get_stats()["builds"] > builds:
+            return
+        await asyncio.sleep(0)
+
+
+def test_index_ranks_by_cosine_and_filters_category() -> None:
+    index = ProjectVectorIndex(dim=2, capacity=1)
+    index.upsert(_row("a", [1.0, 0.0]))
+    index.upsert(_row("b", [0.6, 0.8], category="preference"))
+    index.upsert(_row("c", [0.0, 1.0]))
+
+    results = index.search([1.0, 0.1], limit=2)
+    assert [r["id"] for r in results] == ["a", "b"]
+    assert results[0]["score"] == pytest.approx(0.995, abs=1e-3)
+    assert "embedding" not in results[0]
+
+    assert [r["id"] for r in index.search([1.0, 0.0], limit=5, category="preference")] == ["b"]
+    assert index.search([1.0, 0.0, 0.0], limit=1) is None
+
+    index.remove("a")
+    assert [r["id"] for r in index.search([1.0, 0.0], limit=3)] == ["b", "c"]
+
+
+async def test_cache_builds_only_for_hot_projects_and_replays_writes() -> None:
+    cache = ChunkVectorCache(hot_queries=2)
+    rows = [_row("a", [1.0, 0.0]), _row("b", [0.0, 1.0], source_id="doc-1")]
+
+    assert cache.search("p1", [1.0, 0.0], 5, version=0) is None
+    await _warm(cache, rows)
+    assert cache.get_stats()["builds"] == 0  # one search is not hot yet
+
+    release = asyncio.Event()
+
+    async def _slow_load() -> list[dict[str, Any]]:
+        await release.wait()
+        return rows
+
+    cache.maybe_warm("p1", _slow_load, version=0)
+    cache.upsert_chunks("p1", [_row("c", [0.9, 0.1])], version=1)
+    cache.remove_source("p1", "memory", "doc-1", version=2)
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    results = cache.search("p1", [1.0, 0.0], 5, version=2)
+    assert results is not None
+    assert [r["id"] for r in results] == ["a", "c"]
+    assert cache.get_stats()["projects"]["p1"]["chunks"] == 2
+
+
+async def test_cache_evicts_least_recently_used_projects_by_bytes() -> None:
+    cache = ChunkVectorCache(hot_queries=1, max_bytes=3 * 4 * 2 * 2)
+
+    async def _load() -> list[dict[str, Any]]:
+        return [_row(f"x{i}", [1.0, float(i)]) for i in range(3)]
+
+    for project_id in ("p1", "p2", "p3"):
+        cache.maybe_warm(project_id, _load, version=0)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        cache.search(project_id, [1.0, 0.0], 1, version=0)
+
+    stats = cache.get_stats()
+    assert set(stats["projects"]) == {"p2", "p3"}
+    assert stats["evictions"] == 1
+
+
+async def test_hybrid_search_uses_cache_and_falls_back_to_sql() -> None:
+    cache = ChunkVectorCache(hot_queries=1)
+    await _warm(cache, [_row("cached", [1.0, 0.0])])
+
+    class _Repo:
+        def __init__(self) -> None:
+            self.vector_calls = 0
+
+        async def vector_search(self, *_args: Any, **_kwargs: Any) -> list[dict[str, Any]]:
+            self.vector_calls += 1
+            return [{**_row("sql", [0.0, 1.0]), "score": 0.5}]
+
+    class _Embedding:
+        def __init__(self, vector: list[float]) -> None:
+            self.vector = vector
+
+        async def embed_text_safe(self, _query: str) -> list[float]:
+            return self.vector
+
+    repo = _Repo()
+    search = ChunkHybridSearch(_Embedding([1.0, 0.0]), vector_cache=cache)
+    results = await search._vector_search(repo, [1.0, 0.0], "p1", 5, None, 0)
+    assert [r["id"] for r in results] == ["cached"]
+    assert repo.vector_calls == 0
+
+    # A query of another dimension cannot be served from the cache.
+    results = await search._vector_search(repo, [1.0, 0.0, 0.0], "p1", 5, None, 0)
+    assert [r["id"] for r in results] == ["sql"]
+    assert repo.vector_calls == 1
+
+    # Nor can a project whose index version could not be read.
+    await search._vector_search(repo, [1.0, 0.0], "p1", 5, None, None)
+    assert repo.vector_calls == 2
+
+
+async def test_index_at_another_version_is_rebuilt_before_it_is_served() -> None:
+    cache = ChunkVectorCache(hot_queries=1)
+    await _warm(cache, [_row("a", [1.0, 0.0])], version=3)
+
+    # Another process committed version 4: the index is not served, and the
+    # search that noticed it starts the rebuild.
+    assert cache.search("p1", [1.0, 0.0], 5, version=4) is None
+    await _warm(cache, [_row("a", [1.0, 0.0]), _row("b", [0.9, 0.1])], version=4)
+    results = cache.search("p1", [1.0, 0.0], 5, version=4)
+    assert results is not None
+    assert [r["id"] for r in results] == ["a", "b"]
+
+
+async def test_committed_writes_apply_only_on_top_of_the_version_they_follow() -> None:
+    cache = ChunkVectorCache(hot_queries=1)
+    await _warm(cache, [_row("a", [1.0, 0.0])], version=3)
+
+    # Both writes of the transaction that committed version 4 apply.
+    cache.upsert_chunks("p1", [_row("b", [0.9, 0.1])], version=4)
+    cache.upsert_chunks("p1", [_row("c", [0.8, 0.2])], version=4)
+    results = cache.search("p1", [1.0, 0.0], 5, version=4)
+    assert results is not None
+    assert [r["id"] for r in results] == ["a", "b", "c"]
+
+    # Version 5 was committed elsewhere, so version 6 cannot be applied and
+    # the index stays behind for the version check.
+    cache.remove_source("p1", "memory", "a", version=6)
+    assert cache.search("p1", [1.0, 0.0], 5, version=6) is None
+    assert cache.get_stats()["projects"]["p1"]["chunks"] == 3
@@ -0,0 +1,98 @@
+"""Tests for the columnar ranking engine."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.infrastructure.memory.mmr import text_similarity
+from src.infrastructure.memory.ranking import (
+    MMRStage,
+    RankingFrame,
+    SortStage,
+    TemporalDecayStage,
+    jaccard_matrix,
+    rrf_fuse,
+    run_stages,
+    to_timestamp,
+)
+from src.infrastructure.memory.temporal_decay import apply_temporal_decay
+
+pytestmark = pytest.mark.unit
+
+
+def test_rrf_fuse_sums_weighted_reciprocal_ranks_and_keeps_first_source() -> None:
+    sources, scores = rrf_fuse([["a", "b"], ["b", "c"]], [0.7, 0.3], k=60)
+
+    assert sources == [(0, 1), (0, 0), (1, 1)]  # b, a, c
+    assert scores.tolist() == pytest.approx([0.7 / 62 + 0.3 / 61, 0.7 / 61, 0.3 / 62])
+
+
+def test_decay_matches_scalar_implementation_and_skips_undated_rows() -> None:
+    now = datetime(2026, 1, 31, tzinfo=UTC)
+    created = [now - timedelta(days=30), None, "not-a-date", (now - timedelta(days=3)).isoformat()]
+    frame = RankingFrame.build([1.0, 0.8, 0.6, 0.4], timestamps=created)
+
+    decayed = TemporalDecayStage(30.0, now=now.timestamp())(frame)
+
+    assert decayed.scores.tolist() == pytest.approx(
+        [
+            apply_temporal_decay(1.0, created[0], 30.0, now),
+            0.8,
+            0.6,
+            apply_temporal_decay(0.4, datetime.fromisoformat(created[3]), 30.0, now),
+        ]
+    )
+
+
+def test_naive_timestamps_are_utc() -> None:
+    assert to_timestamp(datetime(2026, 1, 1)) == datetime(2026, 1, 1, tzinfo=UTC).timestamp()
+
+
+def test_jaccard_matrix_matches_pairwise_similarity() -> None:
+    texts = ["dark mode please", "prefers dark mode", "", "tabs over spaces"]
+
+    matrix = jaccard_matrix(texts)
+
+    for i, a in enumerate(texts):
+        for j, b in enumerate(texts):
+            if i != j:
+                assert matrix[i, j] == pytest.approx(text_similarity(a, b))
+
+
+def test_mmr_stage_demotes_near_duplicates_and_assigns_rank_scores() -> None:
+    frame = RankingFrame.build(
+        [1.0, 0.95, 0.5],
+        texts=["user prefers dark mode", "user prefers dark mode", "deploys on fridays"],
+    )
+
+    ranked = MMRStage(0.5)(frame).ranked()
+
+    assert [row for row, _ in ranked] == [0, 2, 1]
+    assert [score for _, score in ranked] == pytest.approx([1.0, 2 / 3, 1 / 3])
+
+
+def test_mmr_stage_can_use_embeddings() -> None:
+    frame = RankingFrame.build(
+        [1.0, 0.95, 0.5],
+        texts=["a", "b", "c"],
+        embeddings=np.array([[1.0, 0.0], [1.0, 0.01], [0.0, 1.0]]),
+    )
+
+    rows = [row for row, _ in MMRStage(0.5, use_embeddings=True)(frame).ranked()]
+
+    assert rows == [0, 2, 1]
+
+
+def test_stages_compose_and_ranked_truncates() -> None:
+    now = datetime(2026, 1, 31, tzinfo=UTC)
+    frame = RankingFrame.build(
+        [1.0, 0.9, 0.1],
+        timestamps=[now - timedelta(days=365), now, now],
+    )
+
+    ranked = run_stages(frame, [TemporalDecayStage(30.0, now=now.timestamp()), SortStage()])
+
+    assert [row for row, _ in ranked.ranked(limit=2)] == [1, 2]
@@ -0,0 +1,107 @@
+"""Tests for the recall result cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from src.infrastructure.memory.chunk_search import ChunkHybridSearch, ChunkSearchConfig
+from src.infrastructure.memory.recall_cache import RecallResultCache, normalize_recall_query
+
+pytestmark = pytest.mark.unit
+
+
+class _Embedding:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def embed_text_safe(self, _query: str) -> list[float] | None:
+        self.calls += 1
+        return [1.0, 0.0]
+
+
+class _Repo:
+    def __init__(self, created_at: datetime) -> None:
+        self.created_at = created_at
+        self.searches = 0
+        self.version = 0
+
+    async def get_index_version(self, _project_id: str) -> int:
+        return self.version
+
+    async def vector_search(self, *_args: Any, **_kwargs: Any) -> list[dict[str, Any]]:
+        self.searches += 1
+        return [
+            {
+                "id": "chunk-1",
+                "content": "prefers dark mode",
+                "score": 0.9,
+                "metadata": {},
+                "created_at": self.created_at,
+                "category": "preference",
+            }
+        ]
+
+    async def fts_search(self, *_args: Any, **_kwargs: Any) -> list[dict[str, Any]]:
+        return []
+
+
+def _search(repo: _Repo, cache: RecallResultCache) -> ChunkHybridSearch:
+    search = ChunkHybridSearch(
+        _Embedding(),
+        config=ChunkSearchConfig(enable_vector_cache=False),
+        result_cache=cache,
+    )
+
+    async def _get_chunk_repo() -> _Repo:
+        return repo
+
+    search._get_chunk_repo = _get_chunk_repo  # type: ignore[method-assign]
+    return search
+
+
+def test_normalized_query_ignores_case_and_spacing() -> None:
+    assert normalize_recall_query("  Dark   MODE\n") == normalize_recall_query("dark mode")
+
+
+async def test_hits_are_served_until_the_project_version_changes() -> None:
+    cache = RecallResultCache()
+    repo = _Repo(datetime.now(UTC))
+    search = _search(repo, cache)
+
+    first = await search.search("Dark mode?", "p1")
+    second = await search.search("dark  mode?", "p1")
+    assert repo.searches == 1
+    assert [r.id for r in second] == [r.id for r in first]
+    assert cache.get_stats()["hits"] == 1
+
+    await search.search("dark mode?", "p2")
+    assert repo.searches == 2  # other projects are keyed separately
+
+    repo.version += 1  # a chunk write committed, possibly in another process
+    await search.search("dark mode?", "p1")
+    assert repo.searches == 3
+
+
+async def test_temporal_decay_is_reapplied_on_hit() -> None:
+    cache = RecallResultCache()
+    repo = _Repo(datetime.now(UTC) - timedelta(days=30))
+    search = _search(repo, cache)
+
+    first = await search.search("dark mode", "p1")
+    cached = await search.search("dark mode", "p1")
+
+    assert repo.searches == 1
+    assert cached[0].score == pytest.approx(first[0].score)
+    assert cached[0].score < 0.9  # decayed, not the raw cached score
+
+
+def test_entries_only_match_the_version_they_were_computed_at() -> None:
+    cache = RecallResultCache()
+
+    cache.put("p1", ("q",), [{"id": "old"}], version=3)
+
+    assert cache.get("p1", ("q",), version=4) is None
+    assert cache.get("p1", ("q",), version=3) == [{"id": "old"}]
@@ -0,0 +1,179 @@
+"""Tests for the shared incremental skill catalog."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.application.services.filesystem_skill_loader import FileSystemSkillLoader
+from src.infrastructure.skill.filesystem_scanner import FileSystemSkillScanner
+from src.infrastructure.skill.markdown_parser import MarkdownParseError
+from src.infrastructure.skill.skill_catalog import SkillCatalog
+
+pytestmark = pytest.mark.unit
+
+
+def _write_skill(base: Path, name: str, body: str = "Body.") -> Path:
+    skill_dir = base / ".memstack" / "skills" / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text(f"---\nname: {name}\ndescription: {name} skill\n---\n\n{body}\n")
+    return skill_file
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _loader(base: Path, catalog: SkillCatalog, **kwargs) -> FileSystemSkillLoader:
+    return FileSystemSkillLoader(
+        base_path=base,
+        tenant_id=kwargs.pop("tenant_id", "tenant-1"),
+        include_system=False,
+        scanner=FileSystemSkillScanner(include_system=False, include_global=False),
+        catalog=catalog,
+        **kwargs,
+    )
+
+
+class TestSkillCatalog:
+    def test_lookup_parses_frontmatter_only(self, tmp_path):
+        skill_file = _write_skill(tmp_path, "alpha", body="Alpha instructions.")
+        catalog = SkillCatalog()
+
+        entry = catalog.lookup(skill_file)
+
+        assert entry.header.name == "alpha"
+        assert entry.header.content == ""
+        assert not entry.body_loaded
+        assert entry.load_body() == "Alpha instructions."
+        assert catalog.get_stats()["bodies_loaded"] == 1
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        skill_file = _write_skill(tmp_path, "alpha")
+        catalog = SkillCatalog()
+
+        first = catalog.lookup(skill_file)
+        _bump_mtime(skill_file)
+        second = catalog.lookup(skill_file)
+
+        assert second is first
+        assert catalog.parses == 1
+        assert catalog.hits == 1
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        skill_file = _write_skill(tmp_path, "alpha", body="Old.")
+        catalog = SkillCatalog()
+        catalog.lookup(skill_file).load_body()
+
+        _write_skill(tmp_path, "alpha", body="New and longer body.")
+        _bump_mtime(skill_file)
+        entry = catalog.lookup(skill_file)
+
+        assert catalog.parses == 2
+        assert entry.load_body() == "New and longer body."
+
+    def test_parse_errors_are_cached_until_the_file_changes(self, tmp_path):
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("no frontmatter")
+        catalog = SkillCatalog()
+
+        for _ in range(2):
+            with pytest.raises(MarkdownParseError):
+                catalog.lookup(skill_file)
+
+        assert catalog.parses == 1
+
+
+class TestFileSystemSkillLoaderCatalog:
+    async def test_loaders_share_parsed_skills(self, tmp_path):
+        _write_skill(tmp_path, "alpha")
+        _write_skill(tmp_path, "beta")
+        catalog = SkillCatalog()
+
+        first = await _loader(tmp_path, catalog, tenant_id="tenant-1").load_all()
+        second = await _loader(tmp_path, catalog, tenant_id="tenant-2").load_all()
+
+        assert first.count == second.count == 2
+        assert catalog.parses == 2
+        assert {loaded.skill.tenant_id for loaded in second.skills} == {"tenant-2"}
+        assert all(loaded.skill.full_content == "Body." for loaded in second.skills)
+
+    async def test_force_reload_only_reparses_changed_files(self, tmp_path):
+        _write_skill(tmp_path, "alpha")
+        beta = _write_skill(tmp_path, "beta")
+        catalog = SkillCatalog()
+        loader = _loader(tmp_path, catalog)
+        await loader.load_all()
+
+        _write_skill(tmp_path, "beta", body="Updated beta body.")
+        _bump_mtime(beta)
+        result = await loader.load_all(force_reload=True)
+
+        assert catalog.parses == 3
+        assert result.get_skill_by_name("beta").skill.full_content == "Updated beta body."
+
+    async def test_lazy_content_loads_body_on_first_use(self, tmp_path):
+        _write_skill(tmp_path, "alpha", body="Alpha instructions.")
+        catalog = SkillCatalog()
+        loader = _loader(tmp_path, catalog, lazy_content=True)
+
+        result = await loader.load_all()
+
+        assert result.skills[0].skill.full_content is None
+        assert catalog.get_stats()["bodies_loaded"] == 0
+        assert await loader.load_skill_content("alpha") == "Alpha instructions."
+        assert catalog.get_stats()["bodies_loaded"] == 1
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        files = [_write_skill(tmp_path, name) for name in ("alpha", "beta", "gamma")]
+        catalog = SkillCatalog(max_entries=2)
+
+        catalog.lookup(files[0])
+        catalog.lookup(files[1])
+        catalog.lookup(files[0])
+        catalog.lookup(files[2])
+
+        assert len(catalog) == 2
+        assert catalog.get_stats()["evictions"] == 1
+        catalog.lookup(files[0])
+        assert catalog.parses == 3  # alpha stayed cached
+        catalog.lookup(files[1])
+        assert catalog.parses == 4  # beta was evicted and is parsed again
+
+    async def test_skill_service_resolves_lazy_bodies_for_tier_3(self, tmp_path):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.application.services.skill_service import SkillService
+
+        _write_skill(tmp_path, "alpha", body="Alpha instructions.")
+        catalog = SkillCatalog()
+        service = SkillService(
+            skill_repository=MagicMock(list_by_tenant=AsyncMock(return_value=[])),
+            filesystem_loader=_loader(tmp_path, catalog, lazy_content=True),
+        )
+
+        listed = await service.list_available_skills("tenant-1", tier=1, skip_database=True)
+        assert listed[0].full_content is None
+        assert catalog.get_stats()["bodies_loaded"] == 0
+
+        full = await service.list_available_skills("tenant-1", tier=3, skip_database=True)
+        assert full[0].full_content == "Alpha instructions."
+        skill = await service.get_skill_by_name("tenant-1", "alpha")
+        assert skill is not None
+        assert skill.full_content == "Alpha instructions."
+        # The cached skill itself stays body-less.
+        assert service._fs_loader.get_cached_skills()[0].full_content is None
+
+    async def test_parse_errors_are_reported(self, tmp_path):
+        _write_skill(tmp_path, "alpha")
+        broken = tmp_path / ".memstack" / "skills" / "broken"
+        broken.mkdir(parents=True)
+        (broken / "SKILL.md").write_text("no frontmatter")
+
+        result = await _loader(tmp_path, SkillCatalog()).load_all()
+
+        assert result.count == 1
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Failed to parse")
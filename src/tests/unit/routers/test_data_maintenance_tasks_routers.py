@@ -1,5 +1,6 @@
 """Unit tests for data_export, maintenance, and tasks routers."""
 
+import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
@@ -294,6 +295,66 @@ class TestDataExportRouter:
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.json()["detail"] == "Failed to export data"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compress", [False, True])
+    async def test_stream_export_emits_ndjson_pages_with_cursors(
+        self, client, mock_graphiti_client, compress
+    ):
+        """Streaming export writes one NDJSON line per row and a cursor per page."""
+        from src.domain.model.graph.dtos import GraphExportCursor, GraphExportPage
+
+        captured: dict = {}
+
+        async def _pages(**kwargs):
+            captured.update(kwargs)
+            yield GraphExportPage(
+                "episodes", [{"uuid": "ep-2"}], GraphExportCursor("episodes", "ep-2")
+            )
+
+        mock_graphiti_client.iter_data_export = _pages
+        resume = GraphExportCursor("episodes", "ep-1")
+
+        response = client.post(
+            "/api/v1/data/export/stream",
+            json={"include_entities": False, "cursor": resume.encode(), "gzip": compress},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["type"] for line in lines] == ["export", "episodes", "cursor", "end"]
+        assert lines[1]["data"] == {"uuid": "ep-2"}
+        assert GraphExportCursor.decode(lines[2]["cursor"]).after == "ep-2"
+        assert captured["cursor"] == resume
+        assert captured["include_entities"] is False
+
+    @pytest.mark.asyncio
+    async def test_stream_export_rejects_malformed_cursor(self, client):
+        response = client.post("/api/v1/data/export/stream", json={"cursor": "nope"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_stream_export_rejects_cursor_the_store_cannot_resume(
+        self, client, mock_graphiti_client
+    ):
+        """Backend-specific cursor keys are checked before the stream starts."""
+        from src.domain.model.graph.dtos import GraphExportCursor
+
+        mock_graphiti_client.validate_export_cursor = Mock(
+            side_effect=ValueError("Malformed export cursor")
+        )
+        mock_graphiti_client.iter_data_export = Mock()
+
+        response = client.post(
+            "/api/v1/data/export/stream",
+            json={"cursor": GraphExportCursor("relationships", "e-1").encode()},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid export cursor"
+        mock_graphiti_client.iter_data_export.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_graph_stats(self, client, mock_graphiti_client):
         """Test getting graph statistics returns the store's counts."""
@@ -1,11 +1,13 @@
 """Unit tests for MemoryIndexService."""
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from src.application.services.memory_index_service import MemoryIndexService
+from src.application.services.memory_index_service import IndexProgress, MemoryIndexService
+from src.infrastructure.memory.chunker import chunk_text
 
 
 @pytest.mark.asyncio
@@ -52,3 +54,69 @@ class TestMemoryIndexService:
         assert created == 1
         assert exception_detail not in caplog.text
         assert "error_type=RuntimeError" in caplog.text
+
+    async def test_pipeline_bounds_in_flight_batches_and_reports_progress(self):
+        """Embedding runs ahead of saves by at most max_in_flight_batches batches."""
+        events: list[str] = []
+        in_flight = 0
+        peak = 0
+
+        async def embed_batch_safe(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            events.append("embed")
+            await asyncio.sleep(0)
+            return [[1.0, 0.0] for _ in texts]
+
+        async def save_batch(chunks):
+            nonlocal in_flight
+            in_flight -= 1
+            events.append("save")
+
+        chunk_repo = Mock()
+        chunk_repo.delete_by_source = AsyncMock()
+        chunk_repo.save_batch = AsyncMock(side_effect=save_batch)
+        embedding_service = Mock()
+        embedding_service.embed_batch_safe = AsyncMock(side_effect=embed_batch_safe)
+        progress: list[IndexProgress] = []
+        service = MemoryIndexService(
+            chunk_repo,
+            embedding_service=embedding_service,
+            batch_size=2,
+            max_in_flight_batches=2,
+            on_progress=progress.append,
+        )
+        content = "\n".join(f"Distinct line number {i} " + "x" * 40 for i in range(12))
+
+        created = await service.index_memory(
+            memory_id="memory-pipeline",
+            content=content,
+            project_id="project-pipeline",
+            max_tokens=20,
+        )
+
+        assert created == 12
+        assert chunk_repo.save_batch.await_count == 6
+        assert peak <= 2
+        last_embed = max(i for i, event in enumerate(events) if event == "embed")
+        assert events.index("save") < last_embed  # saving overlaps later embeddings
+        assert [p.batches_saved for p in progress] == [1, 2, 3, 4, 5, 6]
+        assert progress[-1].chunks_saved == 12
+
+    async def test_pipeline_skips_duplicate_chunks_across_batches(self):
+        """Chunks repeating earlier content are dropped even in later batches."""
+        chunk_repo = Mock()
+        chunk_repo.delete_by_source = AsyncMock()
+        chunk_repo.save_batch = AsyncMock()
+        service = MemoryIndexService(chunk_repo, embedding_service=None, batch_size=1)
+        line = "Repeated line " + "y" * 40
+
+        chunks = chunk_text("\n".join([line] * 5), max_tokens=20, overlap_tokens=0)
+
+        created = await service._index_chunks(
+            iter(chunks), "memory", "memory-dup", "project-dup", "other"
+        )
+
+        assert created == 1
+        assert chunk_repo.save_batch.await_count == 1
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.infrastructure.memory.chunker import chunk_text
+from src.infrastructure.memory.chunker import chunk_text, iter_chunks, iter_line_chunks
 from src.infrastructure.memory.mmr import (
     jaccard_similarity,
     mmr_rerank,
@@ -87,6 +87,50 @@ class TestChunker:
         for chunk in chunks:
             assert chunk.start_line == 1
 
+    # Boundaries produced by the original list-based chunker; the streaming
+    # one must keep them so existing chunk hashes stay valid.
+    @pytest.mark.parametrize(
+        ("text", "overlap_tokens", "expected"),
+        [
+            # 8 chars per line, 32 per chunk, overlap of 12 keeps two lines.
+            ("\n".join(["a" * 7] * 10), 3, [(1, 4), (3, 6), (5, 8), (7, 10)]),
+            ("\n".join(["a" * 7] * 6), 0, [(1, 4), (5, 6)]),
+            (
+                "short\n" + "b" * 70 + "\nend",
+                2,
+                [(1, 1), (1, 2), (2, 2), (2, 2), (2, 3)],
+            ),
+        ],
+    )
+    def test_iter_chunks_keeps_boundaries_and_overlap(self, text, overlap_tokens, expected):
+        chunks = list(iter_chunks(text, max_tokens=8, overlap_tokens=overlap_tokens))
+        assert [(c.start_line, c.end_line) for c in chunks] == expected
+        assert [c.chunk_index for c in chunks] == list(range(len(expected)))
+
+    def test_iter_chunks_splits_long_lines_into_overlapping_segments(self):
+        chunks = list(iter_chunks("short\n" + "b" * 70 + "\nend", max_tokens=8, overlap_tokens=2))
+        assert [c.text for c in chunks] == [
+            "short",
+            "short\n" + "b" * 32,
+            "b" * 32 + "\n" + "b" * 32,
+            "b" * 32 + "\n" + "b" * 6,
+            "b" * 32 + "\n" + "b" * 6 + "\nend",
+        ]
+
+    def test_iter_line_chunks_consumes_lines_lazily(self):
+        consumed = 0
+
+        def lines():
+            nonlocal consumed
+            for i in range(10_000):
+                consumed += 1
+                yield f"Line {i}: Content."
+
+        chunks = iter_line_chunks(lines(), max_tokens=50, overlap_tokens=10)
+        first = next(chunks)
+        assert first.chunk_index == 0
+        assert consumed < 100
+
 
 # --- MMR Tests ---
 
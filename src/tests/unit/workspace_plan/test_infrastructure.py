@@ -10241,7 +10241,7 @@ class _NoopSupervisor:
     async def is_running(self, workspace_id: str) -> bool:
         return workspace_id in self.started
 
-    def kick(self, workspace_id: str) -> None:
+    def kick(self, workspace_id: str, node_id: str | None = None) -> None:
         return None
 
 
@@ -0,0 +1,260 @@
+"""Unit tests for shared supervisor tick scheduling, sharding, claiming and quiet ticks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from src.domain.model.workspace_plan import (
+    Plan,
+    PlanNode,
+    PlanNodeId,
+    PlanNodeKind,
+    PlanStatus,
+    TaskExecution,
+    TaskIntent,
+)
+from src.domain.ports.services.task_allocator_port import WorkspaceAgent
+from src.domain.ports.services.verifier_port import VerificationContext
+from src.infrastructure.agent.workspace_plan.allocator import CapabilityAllocator
+from src.infrastructure.agent.workspace_plan.planner import LLMGoalPlanner
+from src.infrastructure.agent.workspace_plan.progress import ProgressProjector
+from src.infrastructure.agent.workspace_plan.repository import InMemoryPlanRepository
+from src.infrastructure.agent.workspace_plan.supervisor import WorkspaceSupervisor, _tick_scope
+from src.infrastructure.agent.workspace_plan.tick_scheduler import (
+    WorkspaceShardRing,
+    WorkspaceTickScheduler,
+)
+from src.infrastructure.agent.workspace_plan.verifier import AcceptanceCriterionVerifier
+
+pytestmark = pytest.mark.unit
+
+
+def _running_plan(workspace_id: str = "ws-1") -> Plan:
+    """Plan whose only task is running, so a tick has nothing to do."""
+    plan_id = "plan-1"
+    goal_id = PlanNodeId("goal-1")
+    plan = Plan(id=plan_id, workspace_id=workspace_id, goal_id=goal_id, status=PlanStatus.ACTIVE)
+    plan.add_node(
+        PlanNode(id="goal-1", plan_id=plan_id, parent_id=None, kind=PlanNodeKind.GOAL, title="root")
+    )
+    plan.add_node(
+        PlanNode(
+            id="a",
+            plan_id=plan_id,
+            parent_id=goal_id,
+            kind=PlanNodeKind.TASK,
+            title="task a",
+            intent=TaskIntent.IN_PROGRESS,
+            execution=TaskExecution.RUNNING,
+            current_attempt_id="attempt-a",
+            assignee_agent_id="agent-1",
+        )
+    )
+    return plan
+
+
+def _supervisor(repo: InMemoryPlanRepository, **kwargs: Any) -> WorkspaceSupervisor:
+    async def agent_pool(_wid: str) -> list[WorkspaceAgent]:
+        return []
+
+    async def dispatcher(_wid: str, _alloc: Any, _node: PlanNode) -> str | None:
+        return None
+
+    async def attempt_ctx(wid: str, node: PlanNode) -> VerificationContext:
+        return VerificationContext(workspace_id=wid, node=node, attempt_id=node.current_attempt_id)
+
+    return WorkspaceSupervisor(
+        plan_repo=repo,
+        allocator=CapabilityAllocator(),
+        verifier=AcceptanceCriterionVerifier(),
+        projector=ProgressProjector(),
+        planner=LLMGoalPlanner(decomposer=None),
+        agent_pool=agent_pool,
+        dispatcher=dispatcher,
+        attempt_context=attempt_ctx,
+        heartbeat_seconds=0.05,
+        **kwargs,
+    )
+
+
+def test_shard_ring_is_stable_and_moves_few_workspaces() -> None:
+    workspaces = [f"ws-{index}" for index in range(2000)]
+    three = WorkspaceShardRing(["s1", "s2", "s3"])
+    four = WorkspaceShardRing(["s1", "s2", "s3", "s4"])
+
+    owners = Counter(three.owner(wid) for wid in workspaces)
+    moved = sum(1 for wid in workspaces if three.owner(wid) != four.owner(wid))
+
+    assert set(owners) == {"s1", "s2", "s3"}
+    assert min(owners.values()) > 400
+    assert moved < len(workspaces) / 2
+    assert WorkspaceShardRing(["s3", "s1", "s2"]).owner("ws-7") == three.owner("ws-7")
+
+
+async def test_scheduler_never_services_a_workspace_concurrently() -> None:
+    active: set[str] = set()
+    overlaps = 0
+    visits: Counter[str] = Counter()
+
+    async def service(workspace_id: str) -> float:
+        nonlocal overlaps
+        if workspace_id in active:
+            overlaps += 1
+        active.add(workspace_id)
+        await asyncio.sleep(0.01)
+        active.discard(workspace_id)
+        visits[workspace_id] += 1
+        return 0.0
+
+    scheduler = WorkspaceTickScheduler(service, max_workers=4)
+    for index in range(3):
+        scheduler.register(f"ws-{index}")
+    for _ in range(10):
+        scheduler.wake("ws-0")
+        await asyncio.sleep(0.005)
+    await scheduler.close()
+
+    assert overlaps == 0
+    assert all(visits[f"ws-{index}"] > 1 for index in range(3))
+
+
+async def test_scheduler_wake_preempts_a_long_delay() -> None:
+    visits: list[float] = []
+
+    async def service(_workspace_id: str) -> float:
+        visits.append(asyncio.get_running_loop().time())
+        return 60.0
+
+    scheduler = WorkspaceTickScheduler(service, max_workers=1)
+    scheduler.register("ws-1")
+    await asyncio.sleep(0.02)
+    scheduler.wake("ws-1")
+    await asyncio.sleep(0.02)
+    await scheduler.unregister("ws-1")
+    scheduler.wake("ws-1")
+    await asyncio.sleep(0.02)
+    await scheduler.close()
+
+    assert len(visits) == 2
+
+
+async def test_settled_plan_gets_quiet_ticks_until_a_node_changes() -> None:
+    repo = InMemoryPlanRepository()
+    await repo.save(_running_plan())
+    sup = _supervisor(repo)
+
+    assert await sup._service_workspace("ws-1") > 0.05  # first visit ticks and settles
+    quiet_before = sup.get_stats()["quiet_ticks"]
+    await sup._service_workspace("ws-1")
+    assert sup.get_stats()["quiet_ticks"] == quiet_before + 1
+
+    plan = await repo.get_by_workspace("ws-1")
+    assert plan is not None
+    node = plan.nodes[PlanNodeId("a")]
+    plan.replace_node(replace(node, execution=TaskExecution.REPORTED))
+    await repo.save(plan)
+    sup.kick("ws-1", "a")
+    assert await sup._service_workspace("ws-1") == pytest.approx(0.05)
+
+    stats = sup.get_stats()
+    assert stats["quiet_ticks"] == quiet_before + 1
+    assert stats["nodes_touched"] >= 1
+    await sup.close()
+
+
+async def test_settled_plan_is_not_loaded_until_dirty_or_resync() -> None:
+    repo = InMemoryPlanRepository()
+    await repo.save(_running_plan())
+    loads = 0
+    get_by_workspace = repo.get_by_workspace
+
+    async def counting_get(workspace_id: str) -> Plan | None:
+        nonlocal loads
+        loads += 1
+        return await get_by_workspace(workspace_id)
+
+    repo.get_by_workspace = counting_get  # type: ignore[method-assign]
+    sup = _supervisor(repo)
+
+    await sup._service_workspace("ws-1")
+    await sup._service_workspace("ws-1")
+    await sup._service_workspace("ws-1")
+    assert loads == 1
+    assert sup.get_stats()["skipped_loads"] == 2
+
+    await sup._service_workspace("ws-1")  # periodic resync
+    assert loads == 2
+    sup.kick("ws-1", "a")
+    await sup._service_workspace("ws-1")
+    assert loads == 3
+    await sup.close()
+
+
+def test_tick_scope_covers_dependents_and_repaired_nodes() -> None:
+    plan = _running_plan()
+    goal_id = PlanNodeId("goal-1")
+    for node_id, depends_on, metadata in (
+        ("b", frozenset({PlanNodeId("a")}), {}),
+        ("c", frozenset({PlanNodeId("b")}), {}),
+        ("d", frozenset(), {}),
+        ("r", frozenset(), {"repair_for_node_id": "d"}),
+    ):
+        plan.add_node(
+            PlanNode(
+                id=node_id,
+                plan_id=plan.id,
+                parent_id=goal_id,
+                kind=PlanNodeKind.TASK,
+                title=f"task {node_id}",
+                depends_on=depends_on,
+                metadata=metadata,
+            )
+        )
+
+    def ids(*values: str) -> set[PlanNodeId]:
+        return {PlanNodeId(value) for value in values}
+
+    assert _tick_scope(plan, ids("a")) == ids("a", "b", "c")
+    assert _tick_scope(plan, ids("r", "gone")) == ids("r", "d")
+
+
+async def test_goal_started_on_another_shard_ticks_on_its_owner() -> None:
+    ring = WorkspaceShardRing(["s1", "s2"])
+    workspace_id = next(f"ws-{i}" for i in range(100) if ring.owner(f"ws-{i}") == "s2")
+    repo = InMemoryPlanRepository()
+    owner = _supervisor(repo, shard_ring=ring, shard_id="s2")
+    other = _supervisor(repo, shard_ring=ring, shard_id="s1")
+    owner.start_claiming()
+
+    await repo.save(_running_plan(workspace_id))
+    await other.start(workspace_id)
+    other.kick(workspace_id, "a")
+    await asyncio.sleep(0.2)
+
+    assert not await other.is_running(workspace_id)
+    assert await owner.is_running(workspace_id)
+    assert owner.get_stats()["ticks"] >= 1
+    assert other.get_stats()["foreign_kicks"] == 1
+    await owner.close()
+    await other.close()
+
+
+async def test_supervisor_only_starts_workspaces_its_shard_owns() -> None:
+    ring = WorkspaceShardRing(["s1", "s2"])
+    owned = next(f"ws-{i}" for i in range(100) if ring.owner(f"ws-{i}") == "s1")
+    foreign = next(f"ws-{i}" for i in range(100) if ring.owner(f"ws-{i}") == "s2")
+    sup = _supervisor(InMemoryPlanRepository(), shard_ring=ring, shard_id="s1")
+
+    await sup.start(owned)
+    await sup.start(foreign)
+
+    assert await sup.is_running(owned)
+    assert not await sup.is_running(foreign)
+    await sup.close()
+    with pytest.raises(ValueError):
+        _supervisor(InMemoryPlanRepository(), shard_ring=ring, shard_id="s9")
@@ -102,6 +102,8 @@ export class WebSocketConnection {
 
       const wsUrl = createWebSocketUrl('/agent/ws', {
         session_id: this.sessionId,
+        // This client unpacks JSON-array frames of several events.
+        frames: 'batch',
       });
 
       try {
@@ -133,10 +135,14 @@ export class WebSocketConnection {
             if (typeof event.data !== 'string') {
               throw new Error('Expected text WebSocket message');
             }
-            const message = JSON.parse(event.data) as ServerMessage;
-            this.messageListeners.forEach((listener) => {
-              listener(message);
-            });
+            // The server may pack several events into one frame as a JSON array.
+            const parsed = JSON.parse(event.data) as ServerMessage | ServerMessage[];
+            const messages = Array.isArray(parsed) ? parsed : [parsed];
+            for (const message of messages) {
+              this.messageListeners.forEach((listener) => {
+                listener(message);
+              });
+            }
           } catch (err) {
             logger.error('[AgentWS] Failed to parse message:', err);
           }
@@ -188,6 +188,8 @@ class UnifiedEventServiceImpl {
 
       const wsUrl = createWebSocketUrl('/agent/ws', {
         session_id: this.sessionId,
+        // This client unpacks JSON-array frames of several events.
+        frames: 'batch',
       });
 
       try {
@@ -223,8 +225,12 @@ class UnifiedEventServiceImpl {
             if (typeof event.data !== 'string') {
               throw new Error('Expected text WebSocket message');
             }
-            const message = JSON.parse(event.data) as ServerMessage;
-            this.handleMessage(message);
+            // The server may pack several events into one frame as a JSON array.
+            const parsed = JSON.parse(event.data) as ServerMessage | ServerMessage[];
+            const messages = Array.isArray(parsed) ? parsed : [parsed];
+            for (const message of messages) {
+              this.handleMessage(message);
+            }
           } catch (err) {
             logger.error('[UnifiedWS] Failed to parse message:', err);
           }